@@ -6,7 +6,7 @@ a = Analysis(
     pathex=['src'],
     binaries=[],
     datas=[('assets', 'assets'), ('src/config', 'src/config'), ('src/domain', 'src/domain'), ('src/infrastructure', 'src/infrastructure'), ('src/interface_adapters', 'src/interface_adapters'), ('src/interface_adapters/ui/themes', 'src/interface_adapters/ui/themes'), ('src/interface_adapters/ui/views', 'src/interface_adapters/ui/views'), ('src/application', 'src/application'), ('src/utils', 'src/utils'), ('src/translation', 'src/translation'), ('src/main.py', 'src/main.py')],
-    hiddenimports=['PySide6', 'shiboken6', 'translation.es.all_keys', 'translation.en.all_keys'],
+    hiddenimports=['PySide6', 'shiboken6', 'translation.es.all_keys', 'translation.en.all_keys', 'application.use_cases.export_log', 'application.use_cases.import_adif', 'application.use_cases.update_operators_from_csv', 'application.use_cases.update_operators_from_excel', 'application.use_cases.update_operators_from_pdf', 'markdown'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
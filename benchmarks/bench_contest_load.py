@@ -0,0 +1,323 @@
+"""
+Prueba de carga de una sesión de concurso simulada.
+
+Abre la ventana principal con la plataforma ``offscreen`` de Qt y una
+carpeta de usuario temporal, crea un log de concurso y simula al operador
+con ``benchmarks/qso_driver.py``: escribe cada indicativo tecla por tecla
+con el debounce real de las sugerencias, deja algunos en la cola de espera
+(Enter) y los retoma más tarde (F3 y Enter), agrega los contactos con
+Ctrl+Enter y de vez en cuando edita o elimina uno de los últimos. Los QSOs
+llegan a ``--rate`` por hora (llegadas de Poisson; 0 = uno tras otro).
+
+Cada ``--report-every`` segundos muestra el ritmo alcanzado, los
+percentiles de latencia de cada interacción (``utils.latency_monitor``) y
+la memoria (``utils.memory_profiler``), para ver si la captura se vuelve
+lenta a lo largo de la sesión.
+
+Uso:
+    python benchmarks/bench_contest_load.py --minutes 180 --rate 120
+    python benchmarks/bench_contest_load.py --qsos 2000 --rate 0 --report-every 60
+        [--queue-ratio 0.15 --edit-ratio 0.02 --delete-ratio 0.01]
+        [--json carga.json --latency-csv latencias.csv]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+for _path in (ROOT, SRC):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# Columnas del reporte: interacción y título
+REPORT_COLUMNS = (
+    ("add_contact", "agregar"),
+    ("duplicate_alert", "tecla"),
+    ("suggestion_refresh", "sugerencias"),
+    ("operator_summary", "resumen"),
+)
+
+
+def latency_stats(samples) -> dict:
+    """
+    Cantidad, p50, p95, p99 y máximo (ms) por interacción de una lista de
+    muestras ``(hora, interacción, ms)``.
+    """
+    from utils.latency_monitor import percentile
+
+    grouped = defaultdict(list)
+    for _, interaction, elapsed_ms in samples:
+        grouped[interaction].append(elapsed_ms)
+    stats = {}
+    for interaction, values in grouped.items():
+        values.sort()
+        stats[interaction] = {
+            "count": len(values),
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "p99": percentile(values, 0.99),
+            "max": values[-1],
+        }
+    return stats
+
+
+def simulate_qso(driver, args, rng):
+    """
+    Un QSO del operador: a veces otra estación llama y queda en la cola; el
+    contacto se trabaja desde la cola o con un indicativo nuevo, y a veces
+    se corrige o elimina uno de los últimos contactos.
+    """
+    from utils.latency_monitor import latency_monitor
+
+    if rng.random() < args.queue_ratio:
+        driver.queue_callsign(key_interval_ms=args.key_interval)
+    if driver.queue_size() and rng.random() < 0.5:
+        driver.take_from_queue(rng.randrange(driver.queue_size()))
+    else:
+        driver.type_callsign(driver.next_callsign(), args.key_interval)
+    driver.add_contact()
+    for ratio, name, action in (
+        (args.edit_ratio, "edit_contact", driver.edit_contact),
+        (args.delete_ratio, "delete_contact", driver.delete_contact),
+    ):
+        rows = min(driver.contact_count(), 20)
+        if rows and rng.random() < ratio:
+            started = time.perf_counter()
+            if action(rng.randrange(rows)):
+                latency_monitor.record(name, (time.perf_counter() - started) * 1000)
+
+
+def run_session(driver, args, profiler):
+    """
+    Carga QSOs hasta ``--qsos`` o ``--minutes``. Devuelve un registro por
+    intervalo de reporte y la duración de la sesión en segundos.
+    """
+    from utils.latency_monitor import latency_monitor
+
+    rng = random.Random(args.seed)
+    latency_monitor.reset()
+    latency_monitor.set_enabled(True)
+    started = time.perf_counter()
+    limit = args.minutes * 60 if args.minutes else None
+    next_arrival = 0.0
+    intervals = []
+    interval_start, interval_qsos, interval_wall = 0.0, 0, time.time()
+    qsos = 0
+    while (not args.qsos or qsos < args.qsos) and (
+        limit is None or time.perf_counter() - started < limit
+    ):
+        if args.rate:
+            wait = next_arrival - (time.perf_counter() - started)
+            if limit is not None:
+                wait = min(wait, limit - (time.perf_counter() - started))
+            if wait > 0:
+                driver.process_events(int(wait * 1000))
+            next_arrival += rng.expovariate(args.rate / 3600)
+            if limit is not None and time.perf_counter() - started >= limit:
+                break
+        simulate_qso(driver, args, rng)
+        qsos += 1
+        interval_qsos += 1
+        elapsed = time.perf_counter() - started
+        if args.report_every and elapsed - interval_start >= args.report_every:
+            intervals.append(
+                _interval_record(
+                    driver,
+                    profiler,
+                    interval_wall,
+                    qsos,
+                    interval_qsos,
+                    elapsed,
+                    elapsed - interval_start,
+                )
+            )
+            interval_start, interval_qsos, interval_wall = elapsed, 0, time.time()
+    if interval_qsos:
+        elapsed = time.perf_counter() - started
+        intervals.append(
+            _interval_record(
+                driver,
+                profiler,
+                interval_wall,
+                qsos,
+                interval_qsos,
+                elapsed,
+                elapsed - interval_start,
+            )
+        )
+    return intervals, time.perf_counter() - started
+
+
+def _interval_record(driver, profiler, since, qsos, count, elapsed, seconds):
+    """
+    Ritmo, latencias (muestras desde ``since``) y memoria del intervalo; lo
+    muestra como una fila del reporte.
+    """
+    from utils.latency_monitor import latency_monitor
+
+    snapshot = profiler.snapshot(f"{elapsed / 60:.1f} min", qsos)
+    record = {
+        "elapsed": elapsed,
+        "qsos": qsos,
+        "contacts": driver.contact_count(),
+        "queue": driver.queue_size(),
+        "rate_per_hour": count * 3600 / seconds if seconds > 0 else 0.0,
+        "latency": latency_stats(latency_monitor.samples(since)),
+        "rss_bytes": snapshot.rss_bytes,
+        "traced_bytes": snapshot.traced_bytes,
+        "qt_objects": sum(snapshot.qt_objects.values()),
+    }
+    print(format_interval(record), flush=True)
+    return record
+
+
+def format_header() -> str:
+    titles = "".join(f"{title + ' p50/p95':>22}" for _, title in REPORT_COLUMNS)
+    return f"{'min':>7}{'QSOs':>7}{'QSO/h':>8}{titles}{'RSS MiB':>9}{'Qt':>6}"
+
+
+def format_interval(record: dict) -> str:
+    cells = []
+    for interaction, _ in REPORT_COLUMNS:
+        stats = record["latency"].get(interaction)
+        cell = f"{stats['p50']:.1f}/{stats['p95']:.1f}" if stats else "-"
+        cells.append(f"{cell:>22}")
+    rss = record["rss_bytes"]
+    rss = f"{rss / 2**20:.1f}" if rss is not None else "-"
+    return (
+        f"{record['elapsed'] / 60:>7.1f}{record['qsos']:>7}"
+        f"{record['rate_per_hour']:>8.0f}{''.join(cells)}{rss:>9}"
+        f"{record['qt_objects']:>6}"
+    )
+
+
+def format_summary(stats: dict) -> str:
+    lines = [
+        f"{'interacción':<20}{'n':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'máx':>9}  (ms)"
+    ]
+    for interaction in sorted(stats):
+        s = stats[interaction]
+        lines.append(
+            f"{interaction:<20}{s['count']:>8}{s['p50']:>9.1f}{s['p95']:>9.1f}"
+            f"{s['p99']:>9.1f}{s['max']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--qsos", type=int, default=0, help="QSOs a cargar")
+    parser.add_argument(
+        "--minutes", type=float, default=0, help="Duración de la sesión"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=120, help="QSOs por hora (0 = sin pausas)"
+    )
+    parser.add_argument(
+        "--key-interval", type=int, default=90, help="ms entre teclas (±50%%)"
+    )
+    parser.add_argument(
+        "--queue-ratio",
+        type=float,
+        default=0.15,
+        help="Probabilidad de dejar un indicativo en la cola en cada QSO",
+    )
+    parser.add_argument("--edit-ratio", type=float, default=0.02)
+    parser.add_argument("--delete-ratio", type=float, default=0.01)
+    parser.add_argument(
+        "--report-every", type=float, default=300, help="Segundos entre reportes"
+    )
+    parser.add_argument(
+        "--log-type",
+        choices=("contest_log", "operation_log"),
+        default="contest_log",
+    )
+    parser.add_argument("--operators", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Mide también la memoria de Python (hace más lenta la captura)",
+    )
+    parser.add_argument("--json", default=None, help="Guarda el reporte en este JSON")
+    parser.add_argument("--latency-csv", default=None, help="Guarda las muestras")
+    args = parser.parse_args(argv)
+    if not args.qsos and not args.minutes:
+        parser.error("indique --qsos o --minutes")
+
+    # Antes de importar la app: config.paths fija ~/LoggerOA al importarse
+    from benchmarks.qso_driver import (
+        QsoDriver,
+        pyside_none_leak_message,
+        use_temporary_home,
+    )
+
+    home = use_temporary_home("loggeroa-load-home-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from utils.latency_monitor import latency_monitor
+        from utils.memory_profiler import MemoryProfiler
+
+        # Debounce real de las sugerencias (debounce_ms=None)
+        driver = QsoDriver(
+            args.log_type, operators=args.operators, seed=args.seed, debounce_ms=None
+        )
+        leak_message = pyside_none_leak_message()
+        if leak_message:
+            print(leak_message)
+            return 2
+        driver.start()
+        profiler = MemoryProfiler()
+        if args.tracemalloc:
+            profiler.start()
+        print(format_header(), flush=True)
+        intervals, elapsed = run_session(driver, args, profiler)
+        samples = latency_monitor.samples()
+        driver.close()
+        profiler.stop()
+        latency_monitor.set_enabled(False)
+
+        overall = latency_stats(samples)
+        print("\n" + format_summary(overall))
+        rate = driver.added * 3600 / elapsed if elapsed else 0.0
+        print(
+            f"\n{driver.added} QSOs agregados ({rate:.0f}/h), "
+            f"{driver.rejected} rechazados, {driver.queued} a la cola, "
+            f"{driver.edited} editados, {driver.deleted} eliminados, "
+            f"{len(driver.dialogs)} diálogos, {elapsed / 60:.1f} min"
+        )
+        if args.latency_csv:
+            print(f"Latencias: {latency_monitor.export_csv(args.latency_csv)}")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "parameters": vars(args),
+                        "added": driver.added,
+                        "rejected": driver.rejected,
+                        "queued": driver.queued,
+                        "edited": driver.edited,
+                        "deleted": driver.deleted,
+                        "dialogs": driver.dialogs,
+                        "elapsed": elapsed,
+                        "latency": overall,
+                        "intervals": intervals,
+                    },
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
+        return 0
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
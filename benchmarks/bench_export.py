@@ -0,0 +1,154 @@
+"""
+Benchmark de exportación de logs: genera un log sintético y mide tiempo y
+memoria pico de cada formato (TXT, CSV, ADIF, Cabrillo y PDF).
+
+Uso:
+    python benchmarks/bench_export.py [--contacts 50000] [--formats txt,csv,adi,cbr,pdf] [--no-memory] [--keep]
+    python benchmarks/bench_export.py --contacts 1000,10000,50000 --formats pdf
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+COUNTRIES = ["PER", "USA", "ARG", "CHL", "BRA", "ESP", ""]
+
+
+def create_synthetic_log(db_path: str, contacts: int, log_type: str) -> None:
+    """
+    Crea un log en el formato actual con ``contacts`` QSOs sintéticos.
+    """
+    from application.use_cases.log_file_format import CURRENT_LOG_FILE_FORMAT_VERSION
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        metadata = {
+            "frequency_band": "band_vhf",
+            "mode_key": "mode_fm",
+            "contest_name_key": "contest_national_day",
+        }
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            ("bench", log_type, "OA4BENCH", 1_700_000_000, 0, json.dumps(metadata)),
+        )
+        base_ts = 1_700_000_000
+        rows = []
+        for i in range(contacts):
+            contact = {
+                "callsign": f"OA{i % 10}A{i:05d}",
+                "name": f"Operador {i}",
+                "country": COUNTRIES[i % len(COUNTRIES)],
+                "region": "LIM",
+                "station": "station_base" if i % 2 else "station_mobile",
+                "energy": "energy_autonomous",
+                "power": str(5 + i % 100),
+                "rs_rx": "59",
+                "rs_tx": "59",
+                "exchange_received": str(i % 999 + 1),
+                "exchange_sent": str(i + 1),
+                "obs": "",
+                "timestamp": base_ts + i * 20,
+            }
+            rows.append((f"c{i:07d}", "bench", json.dumps(contact)))
+        conn.executemany("INSERT INTO contacts VALUES (?, ?, ?)", rows)
+        conn.execute(f"PRAGMA user_version = {CURRENT_LOG_FILE_FORMAT_VERSION}")
+        conn.commit()
+
+
+def run_benchmark(
+    contacts: int, formats, workdir: str, measure_memory: bool = True
+) -> list:
+    from application.use_cases.batch_export import CONTEST_ONLY_FORMATS
+    from application.use_cases.export_engine import EXPORT_WRITERS, run_export
+
+    writers = EXPORT_WRITERS
+    results = []
+    for log_type in ("operation_log", "contest_log"):
+        db_path = os.path.join(workdir, f"{log_type}.sqlite")
+        create_synthetic_log(db_path, contacts, log_type)
+        for fmt in formats:
+            if fmt in CONTEST_ONLY_FORMATS and log_type != "contest_log":
+                continue
+            export_path = os.path.join(workdir, f"{log_type}.{fmt}")
+            start = time.perf_counter()
+            run_export(db_path, writers[fmt](export_path))
+            elapsed = time.perf_counter() - start
+            peak = 0
+            if measure_memory:
+                # Segunda pasada: tracemalloc distorsiona el tiempo medido
+                tracemalloc.start()
+                run_export(db_path, writers[fmt](export_path))
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            results.append(
+                {
+                    "log_type": log_type,
+                    "format": fmt,
+                    "contacts": contacts,
+                    "seconds": round(elapsed, 3),
+                    "peak_mb": round(peak / (1024 * 1024), 2),
+                    "size_kb": round(os.path.getsize(export_path) / 1024, 1),
+                }
+            )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--contacts",
+        default="50000",
+        help="Cantidad de QSOs; varias separadas por coma (p. ej. 1000,10000,50000)",
+    )
+    parser.add_argument("--formats", default="txt,csv,adi,cbr,pdf")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="No mide la memoria pico (más rápido)"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Conserva los archivos generados"
+    )
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="loggeroa-bench-export-")
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    results = []
+    try:
+        for contacts in [int(c) for c in args.contacts.split(",") if c.strip()]:
+            size_dir = os.path.join(workdir, str(contacts))
+            os.makedirs(size_dir)
+            results += run_benchmark(
+                contacts, formats, size_dir, measure_memory=not args.no_memory
+            )
+    finally:
+        if args.keep:
+            print(f"Archivos en {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+    print(f"{'Tipo':<14}{'Formato':<9}{'QSOs':>8}{'Seg':>9}{'Pico MB':>10}{'KB':>10}")
+    for r in results:
+        print(
+            f"{r['log_type']:<14}{r['format']:<9}{r['contacts']:>8}"
+            f"{r['seconds']:>9.3f}{r['peak_mb']:>10.2f}{r['size_kb']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Benchmark de exportación de la base de operadores a CSV: genera una base
+sintética y mide tiempo, memoria pico y tamaño del archivo (CSV y CSV.gz).
+
+Uso:
+    python benchmarks/bench_operators_export.py [--operators 300000] [--no-gzip] [--no-memory] [--keep]
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+COUNTRIES = ["PER", "USA", "ARG", "CHL", "BRA", "ESP", ""]
+CATEGORIES = ["NOVICIO", "INTERMEDIO", "SUPERIOR"]
+
+
+def create_synthetic_operators_db(db_path: str, operators: int) -> None:
+    """
+    Crea una base con ``operators`` operadores sintéticos. Como en las bases
+    reales, muchos operadores comparten fechas de vencimiento y de corte.
+    """
+    from infrastructure.db.schema import init_radioamateur_table
+
+    base_ts = 1_700_000_000
+    with sqlite3.connect(db_path) as conn:
+        init_radioamateur_table(conn)
+        rows = []
+        for i in range(operators):
+            rows.append(
+                (
+                    f"OA{i % 10}{chr(65 + i % 26)}{i:06d}",
+                    f"Operador {i}",
+                    CATEGORIES[i % len(CATEGORIES)],
+                    "TITULAR",
+                    "LIMA",
+                    "MIRAFLORES",
+                    "LIMA",
+                    "LIMA",
+                    f"LIC-{i % 5000}",
+                    f"RD-{i % 300}",
+                    str(base_ts + (i % 365) * 86400),
+                    str(base_ts + (i % 12) * 30 * 86400),
+                    i % 7 != 0,
+                    COUNTRIES[i % len(COUNTRIES)],
+                    str(base_ts + (i % 50) * 3600),
+                )
+            )
+        conn.executemany(
+            "INSERT INTO radio_operators VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+
+
+def run_benchmark(
+    operators: int, workdir: str, gzip_output: bool = True, measure_memory=True
+) -> list:
+    from interface_adapters.controllers.database_controller import (
+        DatabaseController,
+    )
+    from translation.translation_service import translation_service
+
+    db_path = os.path.join(workdir, "operators.db")
+    create_synthetic_operators_db(db_path, operators)
+    results = []
+    for suffix in (".csv", ".csv.gz") if gzip_output else (".csv",):
+        csv_path = os.path.join(workdir, f"operadores{suffix}")
+        start = time.perf_counter()
+        DatabaseController.export_database_to_csv(
+            csv_path, translation_service, db_path=db_path
+        )
+        elapsed = time.perf_counter() - start
+        peak = 0
+        if measure_memory:
+            # Segunda pasada: tracemalloc distorsiona el tiempo medido
+            tracemalloc.start()
+            DatabaseController.export_database_to_csv(
+                csv_path, translation_service, db_path=db_path
+            )
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        results.append(
+            {
+                "file": os.path.basename(csv_path),
+                "operators": operators,
+                "seconds": round(elapsed, 3),
+                "peak_mb": round(peak / (1024 * 1024), 2),
+                "size_kb": round(os.path.getsize(csv_path) / 1024, 1),
+            }
+        )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--operators", type=int, default=300000)
+    parser.add_argument(
+        "--no-gzip", action="store_true", help="No mide la salida comprimida"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="No mide la memoria pico (más rápido)"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Conserva los archivos generados"
+    )
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="loggeroa-bench-operators-")
+    try:
+        results = run_benchmark(
+            args.operators,
+            workdir,
+            gzip_output=not args.no_gzip,
+            measure_memory=not args.no_memory,
+        )
+    finally:
+        if args.keep:
+            print(f"Archivos en {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+    print(f"{'Archivo':<18}{'Operadores':>11}{'Seg':>9}{'Pico MB':>10}{'KB':>10}")
+    for r in results:
+        print(
+            f"{r['file']:<18}{r['operators']:>11}"
+            f"{r['seconds']:>9.3f}{r['peak_mb']:>10.2f}{r['size_kb']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Micro-benchmark del formateo de QTR: compara el formateo con ``datetime`` y
+``strftime`` por contacto con el formateador compartido con caché por minuto
+(``utils.datetime.format_qtr``), para timestamps epoch y textos legacy.
+
+Uso:
+    python benchmarks/bench_qtr_format.py [--contacts 100000] [--spacing 20] [--repeat 3]
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+BASE_TS = 1_700_000_000
+
+
+def make_timestamps(contacts: int, spacing: int, legacy: bool = False) -> list:
+    """
+    Timestamps de ``contacts`` QSOs separados ``spacing`` segundos. Con
+    ``legacy`` se devuelven como texto en hora de Perú, como en logs antiguos.
+    """
+    timestamps = [BASE_TS + i * spacing for i in range(contacts)]
+    if not legacy:
+        return timestamps
+    peru = datetime.timezone(datetime.timedelta(hours=-5))
+    return [
+        datetime.datetime.fromtimestamp(ts, peru).strftime("%Y-%m-%d_%H-%M-%S")
+        for ts in timestamps
+    ]
+
+
+def format_with_datetime(timestamps) -> list:
+    """
+    Formateo anterior: objetos ``datetime`` y dos ``strftime`` por contacto.
+    """
+    from utils.datetime import _strptime_legacy_timestamp
+
+    rows = []
+    for ts in timestamps:
+        # Los textos legacy se parseaban con strptime
+        epoch = _strptime_legacy_timestamp(ts) if isinstance(ts, str) else ts
+        dt_utc = datetime.datetime.fromtimestamp(epoch, tz=datetime.timezone.utc)
+        dt_oa = dt_utc - datetime.timedelta(hours=5)
+        utc = dt_utc.strftime("%H:%M")
+        if dt_oa.date() != dt_utc.date():
+            utc += "*"
+        rows.append((dt_oa.strftime("%H:%M"), utc))
+    return rows
+
+
+def format_with_cache(timestamps) -> list:
+    from utils.datetime import format_qtr
+
+    rows = []
+    for ts in timestamps:
+        qtr = format_qtr(ts)
+        utc = qtr.utc_time + "*" if qtr.date_rollover else qtr.utc_time
+        rows.append((qtr.oa_time, utc))
+    return rows
+
+
+def _best_of(func, timestamps, repeat: int, clear=None) -> float:
+    best = None
+    for _ in range(repeat):
+        if clear:
+            clear()
+        start = time.perf_counter()
+        func(timestamps)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(contacts: int, spacing: int, repeat: int = 3) -> list:
+    from utils.datetime import qtr_from_minute
+
+    def clear_caches():
+        qtr_from_minute.cache_clear()
+
+    results = []
+    for legacy in (False, True):
+        timestamps = make_timestamps(contacts, spacing, legacy)
+        assert format_with_datetime(timestamps) == format_with_cache(timestamps)
+        runs = (
+            ("datetime", format_with_datetime, None),
+            ("cache (frío)", format_with_cache, clear_caches),
+            ("cache (caliente)", format_with_cache, None),
+        )
+        for name, func, clear in runs:
+            seconds = _best_of(func, timestamps, repeat, clear)
+            results.append(
+                {
+                    "input": "legacy" if legacy else "epoch",
+                    "method": name,
+                    "contacts": contacts,
+                    "seconds": round(seconds, 4),
+                    "us_per_contact": round(seconds / contacts * 1e6, 3),
+                }
+            )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=100000)
+    parser.add_argument(
+        "--spacing", type=int, default=20, help="Segundos entre QSOs consecutivos"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.contacts, args.spacing, args.repeat)
+    print(f"{'Entrada':<9}{'Método':<18}{'QSOs':>9}{'Seg':>10}{'µs/QSO':>10}")
+    for r in results:
+        print(
+            f"{r['input']:<9}{r['method']:<18}{r['contacts']:>9}"
+            f"{r['seconds']:>10.4f}{r['us_per_contact']:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Benchmark de arranque en frío: lanza la aplicación varias veces con
+``LOGGEROA_EXIT_AFTER_STARTUP=1`` (sale tras pintar la ventana principal) y
+mide el tiempo total de cada proceso. Con ``--exe`` se mide un ejecutable
+compilado (p. ej. el onefile de PyInstaller en ``dist/``); si no, se ejecuta
+``src/main.py`` con el intérprete actual.
+
+Con ``--modules`` se listan, vía ``python -X importtime``, los módulos de
+terceros más costosos importados durante el arranque, y con ``--idle`` se mide
+el CPU que consume la ventana principal en reposo (vista de bienvenida).
+
+Uso:
+    python benchmarks/bench_startup.py [--runs 10] [--exe dist/LoggerOA] [--modules 15]
+    python benchmarks/bench_startup.py --runs 0 --idle 30
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+MAIN = os.path.join(SRC, "main.py")
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+
+# Ventana principal en reposo: CPU del proceso durante ``seconds`` segundos
+_IDLE_SCRIPT = """
+import sys, time
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+from interface_adapters.ui.main_window import MainWindow
+window = MainWindow()
+window.show()
+app.processEvents()
+seconds = float(sys.argv[1])
+start_cpu, start = time.process_time(), time.perf_counter()
+QTimer.singleShot(int(seconds * 1000), app.quit)
+app.exec()
+print(time.process_time() - start_cpu, time.perf_counter() - start)
+"""
+
+
+def _startup_env() -> dict:
+    env = dict(os.environ)
+    env["LOGGEROA_EXIT_AFTER_STARTUP"] = "1"
+    return env
+
+
+def measure_startup(command, runs: int) -> list:
+    """
+    Ejecuta ``command`` ``runs`` veces y devuelve los segundos de cada una.
+    """
+    env = _startup_env()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, check=True, cwd=ROOT)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def top_level_imports(limit: int) -> list:
+    """
+    Devuelve (módulo, ms acumulados) de los paquetes de primer nivel más
+    costosos importados al arrancar ``src/main.py``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN],
+        env=_startup_env(),
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        # Solo los paquetes importados directamente (sin puntos en el nombre)
+        if match and "." not in match.group(3):
+            name = match.group(3)
+            totals[name] = max(totals.get(name, 0), int(match.group(1)) / 1000)
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def measure_idle_cpu(seconds: float) -> tuple:
+    """
+    Devuelve (segundos de CPU, segundos transcurridos) de la ventana principal
+    en reposo durante ``seconds`` segundos.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (SRC, env.get("PYTHONPATH")) if p)
+    result = subprocess.run(
+        [sys.executable, "-c", _IDLE_SCRIPT, str(seconds)],
+        env=env,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cpu, elapsed = result.stdout.split()[-2:]
+    return float(cpu), float(elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--exe", help="Ejecutable compilado a medir (por defecto, src/main.py)"
+    )
+    parser.add_argument(
+        "--modules",
+        type=int,
+        default=0,
+        help="Cantidad de módulos más costosos a listar (python -X importtime)",
+    )
+    parser.add_argument(
+        "--idle",
+        type=float,
+        default=0,
+        help="Segundos de reposo en los que medir el CPU de la ventana principal",
+    )
+    args = parser.parse_args(argv)
+
+    command = [args.exe] if args.exe else [sys.executable, MAIN]
+    if args.runs:
+        # Primera ejecución descartada: crea la base y calienta la caché de disco
+        measure_startup(command, 1)
+        timings = measure_startup(command, args.runs)
+        print(f"Arranque de {' '.join(command)} ({args.runs} ejecuciones)")
+        print(
+            f"  mediana {statistics.median(timings):.3f} s  "
+            f"mín {min(timings):.3f} s  máx {max(timings):.3f} s"
+        )
+    if args.modules:
+        print(f"{'Módulo':<32}{'ms':>10}")
+        for name, ms in top_level_imports(args.modules):
+            print(f"{name:<32}{ms:>10.1f}")
+    if args.idle:
+        cpu, elapsed = measure_idle_cpu(args.idle)
+        print(
+            f"CPU en reposo: {cpu * 1000:.1f} ms en {elapsed:.1f} s "
+            f"({cpu / elapsed * 100:.2f} %)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
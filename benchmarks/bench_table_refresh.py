@@ -0,0 +1,206 @@
+"""
+Benchmark del refresco de tablas y listas con el tema aplicado: mide por
+refresco (carga y pintado de las filas visibles) el tiempo, el pico de
+memoria de Python (tracemalloc) y la memoria nativa que retiene la vista
+cargada (heap de C/C++ de Qt: items, fuentes; solo con glibc).
+
+- ``contactos``: ``ContactTableWidget.set_contacts`` con un log sintético.
+- ``operadores``: una página (500 filas) de la tabla de la base de operadores.
+- ``sugerencias``: la lista de sugerencias del indicativo (40 items).
+
+Abre los widgets con la plataforma ``offscreen`` de Qt y una carpeta de
+usuario temporal.
+
+Uso:
+    python benchmarks/bench_table_refresh.py [--contacts 5000] [--operators 5000] [--repeat 20]
+"""
+
+import argparse
+import ctypes
+import gc
+import os
+import shutil
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+for _path in (ROOT, SRC):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+class _MallInfo2(ctypes.Structure):
+    _fields_ = [
+        (name, ctypes.c_size_t)
+        for name in (
+            "arena",
+            "ordblks",
+            "smblks",
+            "hblks",
+            "hblkhd",
+            "usmblks",
+            "fsmblks",
+            "uordblks",
+            "fordblks",
+            "keepcost",
+        )
+    ]
+
+
+def _native_heap_bytes():
+    """
+    Bytes en uso del heap de C (``mallinfo2`` de glibc 2.33+), o None.
+    """
+    try:
+        libc = ctypes.CDLL("libc.so.6")
+        mallinfo2 = libc.mallinfo2
+    except (OSError, AttributeError):
+        return None
+    mallinfo2.restype = _MallInfo2
+    info = mallinfo2()
+    return info.uordblks + info.hblkhd
+
+
+def _measure(app, refresh, clear, repeat: int) -> dict:
+    """
+    Mediana de ms por refresco (sin tracemalloc), pico de memoria de Python
+    de un refresco y memoria nativa de la vista cargada respecto de la vacía.
+    """
+    refresh()  # calentamiento: cachés de traducción, QTR y fuentes
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        refresh()
+        timings.append((time.perf_counter() - start) * 1000)
+    native = []
+    for _ in range(3):
+        clear()
+        gc.collect()
+        app.processEvents()
+        empty = _native_heap_bytes()
+        refresh()
+        gc.collect()
+        app.processEvents()
+        loaded = _native_heap_bytes()
+        if empty is not None and loaded is not None:
+            native.append(loaded - empty)
+    tracemalloc.start()
+    try:
+        refresh()
+        before = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        refresh()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "ms": statistics.median(timings),
+        "python_peak_kib": (peak - before) / 1024,
+        "native_kib": statistics.median(native) / 1024 if native else None,
+    }
+
+
+def run_benchmark(contacts: int, operators: int, repeat: int) -> list:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+
+    from benchmarks import generators
+    from config.paths import get_database_path
+    from config.settings_service import ThemeValue
+    from interface_adapters.ui.themes.theme_manager import ThemeManager
+    from interface_adapters.ui.view_manager import LogType
+    from interface_adapters.ui.views.callsign_info_widget import CallsignInfoWidget
+    from interface_adapters.ui.views.contact_table_widget import ContactTableWidget
+    from interface_adapters.ui.views.db_table_window import DBTableWindow
+    from utils.fonts import ensure_roboto_mono_registered
+
+    db_path = get_database_path()
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    generators.create_operators_db(db_path, operators)
+    ensure_roboto_mono_registered()
+    # Con la hoja de estilos aplicada, como en la app
+    ThemeManager().apply_theme(ThemeValue.LIGHT)
+
+    table = ContactTableWidget(log_type=LogType.CONTEST_LOG)
+    table.resize(1200, 700)
+    table.show()
+    log = list(generators.generate_contacts("contest_log", contacts))
+
+    window = DBTableWindow()
+    window.show()
+
+    info = CallsignInfoWidget()
+    info.resize(900, 200)
+    info.show()
+    app.processEvents()
+
+    def refresh_contacts():
+        table.set_contacts(log)
+        table.table.viewport().grab()
+
+    def refresh_operators():
+        window.load_data()
+        window.table.viewport().grab()
+
+    def refresh_suggestions():
+        info.show_suggestions("OA")
+        info.suggestion_list.viewport().grab()
+
+    results = []
+    for name, refresh, clear, rows in (
+        ("contactos", refresh_contacts, lambda: table.set_contacts([]), contacts),
+        (
+            "operadores",
+            refresh_operators,
+            lambda: window.table.setRowCount(0),
+            window._page_size,
+        ),
+        ("sugerencias", refresh_suggestions, info.suggestion_list.clear, 40),
+    ):
+        result = _measure(app, refresh, clear, repeat)
+        result.update(table=name, rows=rows)
+        results.append(result)
+    info.teardown()
+    for widget in (table, window, info):
+        widget.close()
+        widget.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=5000)
+    parser.add_argument("--operators", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    # Antes de importar la app: config.paths fija ~/LoggerOA al importarse
+    from benchmarks.qso_driver import use_temporary_home
+
+    home = use_temporary_home("loggeroa-table-home-")
+    try:
+        results = run_benchmark(args.contacts, args.operators, args.repeat)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+    print(
+        f"{'Tabla':<13}{'Filas':>7}{'ms':>10}"
+        f"{'Pico Python KiB':>17}{'Nativa KiB':>12}"
+    )
+    for r in results:
+        native = f"{r['native_kib']:.1f}" if r["native_kib"] is not None else "-"
+        print(
+            f"{r['table']:<13}{r['rows']:>7}{r['ms']:>10.2f}"
+            f"{r['python_peak_kib']:>17.1f}{native:>12}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compara dos resultados de la suite de benchmarks (``--bench-json``) entre commits.
+
+Uso:
+    python -m pytest benchmarks --bench-json antes.json
+    python -m pytest benchmarks --bench-json despues.json
+    python benchmarks/compare_results.py antes.json despues.json [--stat median]
+        [--threshold 1.10] [--fail]
+
+Muestra el valor de cada benchmark en ambos archivos y la razón
+después/antes; las filas por encima de ``--threshold`` se marcan con "!" y,
+con ``--fail``, el script termina con código 1 (p. ej. para CI). Los
+benchmarks que están en un solo archivo se marcan con "-".
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.harness import (  # noqa: E402
+    compare_results,
+    format_seconds,
+    load_results,
+)
+
+
+def format_comparison(rows, threshold: float = 1.10) -> str:
+    width = max([len(row[0]) for row in rows] + [len("Benchmark")]) + 2
+    lines = [f"{'Benchmark':<{width}}{'Antes':>12}{'Después':>12}{'Razón':>9}"]
+    for name, before, after, ratio in rows:
+        ratio_text = "-" if ratio is None else f"{ratio:.2f}x"
+        mark = " !" if ratio is not None and ratio > threshold else ""
+        lines.append(
+            f"{name:<{width}}{format_seconds(before):>12}"
+            f"{format_seconds(after):>12}{ratio_text:>9}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("before", help="Resultados de referencia")
+    parser.add_argument("after", help="Resultados a comparar")
+    parser.add_argument(
+        "--stat",
+        default="median",
+        choices=["min", "median", "mean", "max"],
+        help="Estadística a comparar",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.10,
+        help="Razón después/antes a partir de la cual se marca una regresión",
+    )
+    parser.add_argument(
+        "--fail",
+        action="store_true",
+        help="Termina con código 1 si hay alguna regresión",
+    )
+    args = parser.parse_args(argv)
+
+    rows = compare_results(
+        load_results(args.before), load_results(args.after), args.stat
+    )
+    print(format_comparison(rows, args.threshold))
+    regressions = [
+        row for row in rows if row[3] is not None and row[3] > args.threshold
+    ]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) por encima de {args.threshold:.2f}x")
+    return 1 if args.fail and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
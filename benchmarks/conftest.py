@@ -0,0 +1,176 @@
+"""
+Configuración de la suite de benchmarks.
+
+Uso:
+    python -m pytest benchmarks [--bench-size small|medium|large]
+        [--bench-rounds 5] [--bench-json resultados.json] [-k exporters]
+
+La suite corre sin red y con una carpeta de usuario temporal (``HOME``), de
+modo que la base y los logs del usuario no se tocan. Los datos se generan al
+inicio de la sesión con ``benchmarks/generators.py`` (siempre los mismos para
+un tamaño dado).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Antes de importar la app: config.paths fija ~/LoggerOA al importarse
+_BENCH_HOME = tempfile.mkdtemp(prefix="loggeroa-bench-home-")
+os.environ["HOME"] = _BENCH_HOME
+os.environ["USERPROFILE"] = _BENCH_HOME
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+for _path in (ROOT, SRC):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import pytest  # noqa: E402
+
+from benchmarks import generators  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    Benchmark,
+    build_results,
+    format_table,
+    save_results,
+)
+
+# Cantidad de filas/QSOs por tamaño de la suite
+BENCH_SIZES = {
+    "small": {
+        "operators": 10_000,
+        "contacts": 1_000,
+        "import_operators": 1_000,
+        "pdf_operators": 200,
+    },
+    "medium": {
+        "operators": 100_000,
+        "contacts": 10_000,
+        "import_operators": 10_000,
+        "pdf_operators": 1_000,
+    },
+    "large": {
+        "operators": 500_000,
+        "contacts": 100_000,
+        "import_operators": 50_000,
+        "pdf_operators": 5_000,
+    },
+}
+LOG_TYPES = ("operation_log", "contest_log")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("loggeroa-bench", "Benchmarks de Logger OA")
+    group.addoption(
+        "--bench-size",
+        choices=sorted(BENCH_SIZES),
+        default="small",
+        help="Tamaño de los datos sintéticos",
+    )
+    group.addoption(
+        "--bench-rounds", type=int, default=5, help="Rondas medidas por benchmark"
+    )
+    group.addoption(
+        "--bench-json", default=None, help="Guarda los resultados en este JSON"
+    )
+
+
+def pytest_configure(config):
+    config._bench_results = []
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config._bench_results:
+        terminalreporter.write_sep("-", f"benchmarks ({config.option.bench_size})")
+        terminalreporter.write_line(format_table(config._bench_results))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    path = config.option.bench_json
+    if path and config._bench_results:
+        results = build_results(config._bench_results, config.option.bench_size, ROOT)
+        save_results(results, path)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_BENCH_HOME, ignore_errors=True)
+
+
+@pytest.fixture
+def benchmark(request):
+    config = request.config
+    module = request.node.module.__name__.rsplit(".", 1)[-1]
+    group = module.replace("test_bench_", "")
+    bench = Benchmark(
+        f"{group}::{request.node.name}", group, config.option.bench_rounds
+    )
+    yield bench
+    config._bench_results.append(bench)
+
+
+@pytest.fixture(scope="session")
+def bench_size(request):
+    return BENCH_SIZES[request.config.option.bench_size]
+
+
+@pytest.fixture(scope="session")
+def bench_data(tmp_path_factory):
+    return tmp_path_factory.mktemp("data")
+
+
+@pytest.fixture(scope="session")
+def operators_source(bench_size, bench_data):
+    """
+    Base de operadores generada (copia de referencia, no se modifica).
+    """
+    path = str(bench_data / "operators.db")
+    generators.create_operators_db(path, bench_size["operators"])
+    return path
+
+
+@pytest.fixture(scope="session")
+def restore_operators_db(operators_source):
+    """
+    Devuelve una función que reemplaza la base de la app por la generada.
+    """
+    from config.paths import get_database_path
+
+    def restore():
+        shutil.copyfile(operators_source, get_database_path())
+
+    restore()
+    return restore
+
+
+@pytest.fixture(scope="session")
+def log_sources(bench_size, bench_data):
+    """
+    Logs generados por (tipo de log, formato de archivo): copias de referencia.
+    """
+    paths = {}
+    for log_type in LOG_TYPES:
+        for file_format in generators.LOG_FILE_FORMATS:
+            path = str(bench_data / f"{log_type}-{file_format}.sqlite")
+            generators.create_log_file(
+                path, log_type, bench_size["contacts"], file_format
+            )
+            paths[(log_type, file_format)] = path
+    return paths
+
+
+@pytest.fixture
+def log_copy(tmp_path, log_sources):
+    """
+    Devuelve una función que copia un log de referencia a ``tmp_path``
+    (abrir un log de formato anterior lo migra en el lugar).
+    """
+
+    def copy(log_type, file_format="v2"):
+        target = str(tmp_path / f"{log_type}-{file_format}.sqlite")
+        shutil.copyfile(log_sources[(log_type, file_format)], target)
+        return target
+
+    return copy
@@ -0,0 +1,393 @@
+"""
+Generadores deterministas de datos sintéticos para los benchmarks.
+
+Con la misma semilla producen siempre los mismos datos, de modo que los
+resultados de distintos commits son comparables:
+
+- Base de operadores (10k–500k filas) con indicativos de varios países.
+- Logs operativos y de concurso (1k–100k QSOs) en los tres formatos de
+  archivo soportados: ``v2`` (actual), ``v1`` (timestamps enteros sin versión
+  de formato en la cabecera) y ``legacy`` (timestamps como texto local).
+- Archivos de importación: CSV exportado por la app, Excel chileno, PDF con
+  la tabla peruana y ADIF.
+"""
+
+import csv
+import json
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+# (prefijos, país ITU, peso): la base real es mayormente peruana
+OPERATOR_COUNTRIES = [
+    (("OA", "OB", "OC"), "PER", 60),
+    (("CE", "CA", "XQ"), "CHL", 10),
+    (("LU", "LW"), "ARG", 8),
+    (("PY", "PU"), "BRA", 5),
+    (("K", "W", "N"), "USA", 5),
+    (("EA",), "ESP", 3),
+    (("CX",), "URY", 3),
+    (("HK",), "COL", 2),
+    (("XE",), "MEX", 2),
+    (("HC",), "ECU", 2),
+]
+CATEGORIES = ["NOVICIO", "INTERMEDIO", "SUPERIOR", "NO_APLICA"]
+FIRST_NAMES = [
+    "JUAN",
+    "MARIA",
+    "CARLOS",
+    "ROSA",
+    "LUIS",
+    "ANA",
+    "JORGE",
+    "CARMEN",
+    "PEDRO",
+    "ELENA",
+]
+LAST_NAMES = [
+    "QUISPE",
+    "FLORES",
+    "SANCHEZ",
+    "RODRIGUEZ",
+    "GARCIA",
+    "ROJAS",
+    "MENDOZA",
+    "TORRES",
+    "HUAMAN",
+    "CASTILLO",
+]
+DEPARTMENTS = ["LIMA", "AREQUIPA", "CUSCO", "PIURA", "JUNIN", "PUNO"]
+LOG_FILE_FORMATS = ("v2", "v1", "legacy")
+# Fecha de referencia fija (no la actual) para que los datos no cambien
+BASE_TIMESTAMP = 1_760_000_000
+DAY = 86400
+
+_PREFIX_WEIGHTS = [weight for _, _, weight in OPERATOR_COUNTRIES]
+
+
+def _letters(n: int, width: int = 2) -> str:
+    text = ""
+    while n or len(text) < width:
+        n, rest = divmod(n, 26)
+        text = chr(65 + rest) + text
+    return text
+
+
+def make_callsign(index: int, prefix: str = "OA") -> str:
+    """
+    Indicativo único para ``index`` dentro de un prefijo (dígito + sufijo).
+    """
+    return f"{prefix}{index % 10}{_letters(index // 10)}"
+
+
+def _name(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}, {rng.choice(FIRST_NAMES)}"
+    )
+
+
+def generate_operators(count: int, seed: int = 0):
+    """
+    Genera ``count`` filas de ``radio_operators`` (en el orden de columnas de
+    la tabla). Muchas fechas se repiten, como en las bases reales.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        prefixes, country, _ = rng.choices(OPERATOR_COUNTRIES, _PREFIX_WEIGHTS)[0]
+        department = rng.choice(DEPARTMENTS) if country == "PER" else ""
+        yield (
+            make_callsign(i, rng.choice(prefixes)),
+            _name(rng),
+            rng.choice(CATEGORIES),
+            "TITULAR",
+            department,
+            department,
+            department,
+            department,
+            f"LIC-{rng.randrange(5000)}",
+            f"RD-{rng.randrange(300)}",
+            str(BASE_TIMESTAMP + rng.randrange(-365, 3 * 365) * DAY),
+            str(BASE_TIMESTAMP - rng.randrange(12) * 30 * DAY),
+            int(rng.random() > 0.1),
+            country,
+            str(BASE_TIMESTAMP - rng.randrange(50) * 3600),
+        )
+
+
+def create_operators_db(db_path: str, count: int, seed: int = 0) -> None:
+    """
+    Crea una base de operadores con el esquema de la app y ``count`` filas.
+    """
+    from infrastructure.db.schema import init_radioamateur_table
+
+    with sqlite3.connect(db_path) as conn:
+        init_radioamateur_table(conn)
+        conn.executemany(
+            "INSERT INTO radio_operators VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            generate_operators(count, seed),
+        )
+        conn.commit()
+
+
+def generate_contacts(log_type: str, count: int, seed: int = 0):
+    """
+    Genera ``count`` contactos en orden cronológico (timestamps enteros UTC).
+    """
+    from application.use_cases.contact_management import get_oa_block_from_utc
+
+    rng = random.Random(seed)
+    timestamp = BASE_TIMESTAMP
+    for i in range(count):
+        prefixes, country, _ = rng.choices(OPERATOR_COUNTRIES, _PREFIX_WEIGHTS)[0]
+        timestamp += rng.randint(10, 90)
+        contact = {
+            "callsign": make_callsign(rng.randrange(100_000), rng.choice(prefixes)),
+            "name": _name(rng),
+            "region": rng.choice(DEPARTMENTS),
+            "rs_rx": rng.choice(("59", "57", "55")),
+            "rs_tx": "59",
+            "obs": "",
+            "timestamp": timestamp,
+        }
+        if log_type == "contest_log":
+            contact["exchange_received"] = str(rng.randint(1, 999))
+            contact["exchange_sent"] = str(i + 1)
+            contact["block"] = get_oa_block_from_utc(timestamp)[0]
+            contact["points"] = 1
+        else:
+            contact["country"] = country
+            contact["station"] = rng.choice(("station_base", "station_mobile"))
+            contact["energy"] = rng.choice(("energy_autonomous", "energy_commercial"))
+            contact["power"] = str(rng.choice((5, 10, 25, 50, 100)))
+        yield contact
+
+
+def _legacy_timestamp(timestamp: int) -> str:
+    # Los logs antiguos guardaban la hora local de Perú como texto
+    local = datetime.fromtimestamp(timestamp, tz=timezone.utc) - timedelta(hours=5)
+    return local.strftime("%Y-%m-%d_%H-%M-%S")
+
+
+def create_log_file(
+    db_path: str,
+    log_type: str,
+    contacts: int,
+    file_format: str = "v2",
+    seed: int = 0,
+) -> str:
+    """
+    Crea un log ``log_type`` con ``contacts`` QSOs en el formato de archivo
+    ``file_format`` (``v2``, ``v1`` o ``legacy``). Devuelve el id del log.
+    """
+    if file_format not in LOG_FILE_FORMATS:
+        raise ValueError(f"Formato de log desconocido: {file_format}")
+    log_id = f"bench-{log_type}"
+    if log_type == "contest_log":
+        metadata = {"contest_name_key": "contest_world_radio_day"}
+    else:
+        metadata = {
+            "operation_type": "generic_operation",
+            "frequency_band": "band_vhf",
+            "mode_key": "mode_fm",
+            "frequency": "146.520",
+            "repeater_key": "rep_simplex",
+        }
+    if file_format == "v2":
+        metadata["file_format_version"] = 2
+    rows = []
+    last = BASE_TIMESTAMP
+    for i, contact in enumerate(generate_contacts(log_type, contacts, seed)):
+        contact_id = f"{log_id}-{i:07d}"
+        last = contact["timestamp"]
+        if file_format == "v2":
+            contact["id"] = contact_id
+        elif file_format == "legacy":
+            contact["timestamp"] = _legacy_timestamp(last)
+        rows.append((contact_id, log_id, json.dumps(contact)))
+    start, end = BASE_TIMESTAMP, last
+    if file_format == "legacy":
+        start, end = _legacy_timestamp(start), _legacy_timestamp(end)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            (log_id, log_type, "OA4BENCH", start, end, json.dumps(metadata)),
+        )
+        conn.executemany("INSERT INTO contacts VALUES (?, ?, ?)", rows)
+        version = {"v2": 2, "v1": 1, "legacy": 0}[file_format]
+        conn.execute(f"PRAGMA user_version = {version}")
+        conn.commit()
+    return log_id
+
+
+def _date_text(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%d/%m/%Y")
+
+
+def write_operators_csv(path: str, count: int, seed: int = 0) -> None:
+    """
+    Escribe un CSV con los encabezados en español de la exportación de la app.
+    """
+    headers = [
+        "Indicativo",
+        "Nombre",
+        "Categoría",
+        "Tipo",
+        "Región",
+        "Distrito",
+        "Provincia",
+        "Departamento",
+        "Licencia",
+        "Resolución",
+        "Vencimiento",
+        "Fecha corte",
+        "Habilitado",
+        "País",
+        "Actualizado",
+    ]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        for row in generate_operators(count, seed):
+            row = list(row)
+            row[10] = _date_text(int(row[10]))
+            row[11] = _date_text(int(row[11]))
+            row[12] = "SÍ" if row[12] else "NO"
+            updated = datetime.fromtimestamp(int(row[14]), tz=timezone.utc)
+            row[14] = updated.strftime("%H:%M %d/%m/%Y")
+            writer.writerow(row)
+
+
+def write_operators_xlsx(path: str, count: int, seed: int = 0) -> None:
+    """
+    Escribe un Excel con el formato de la lista chilena de radioaficionados.
+    La fecha de corte se toma del nombre del archivo (p. ej. ``_03-15-2026``).
+    """
+    import openpyxl
+
+    rng = random.Random(seed)
+    # Sin write_only: el extractor necesita la dimensión de la hoja
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(
+        [
+            "Licencia",
+            "Señal Distintiva",
+            "Nombre",
+            "RUT",
+            "Región",
+            "Comuna",
+            "Fecha Vencimiento",
+        ]
+    )
+    for i in range(count):
+        expiration = BASE_TIMESTAMP + rng.randrange(-365, 3 * 365) * DAY
+        sheet.append(
+            [
+                f"{rng.randrange(100000):06d}",
+                make_callsign(i, rng.choice(("CE", "CA", "XQ"))),
+                _name(rng),
+                f"{rng.randrange(5_000_000, 25_000_000)}-{rng.randrange(10)}",
+                "METROPOLITANA",
+                "SANTIAGO",
+                datetime.fromtimestamp(expiration, tz=timezone.utc).replace(
+                    tzinfo=None
+                ),
+            ]
+        )
+    workbook.save(path)
+
+
+def write_operators_pdf(path: str, count: int, seed: int = 0) -> None:
+    """
+    Escribe un PDF con la tabla peruana de radioaficionados (con líneas, como
+    el documento oficial) y la fecha de corte en la primera página.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
+
+    rng = random.Random(seed)
+    rows = [
+        [
+            "INDICATIVO",
+            "NOMBRE",
+            "CATEGORIA",
+            "TIPO",
+            "DISTRITO",
+            "PROVINCIA",
+            "DEPARTAMENTO",
+            "LICENCIA",
+            "RESOLUCION",
+            "FECHA VENCIMIENTO",
+        ]
+    ]
+    for i in range(count):
+        department = rng.choice(DEPARTMENTS)
+        rows.append(
+            [
+                make_callsign(i, rng.choice(("OA", "OB", "OC"))),
+                _name(rng),
+                rng.choice(CATEGORIES[:3]),
+                "TITULAR",
+                department,
+                department,
+                department,
+                f"{rng.randrange(10000)}",
+                f"RD-{rng.randrange(300)}",
+                _date_text(BASE_TIMESTAMP + rng.randrange(-365, 3 * 365) * DAY),
+            ]
+        )
+    table = Table(rows, repeatRows=1)
+    table.setStyle(
+        TableStyle(
+            [
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                ("FONTSIZE", (0, 0), (-1, -1), 7),
+            ]
+        )
+    )
+    title = Paragraph(
+        "RELACIÓN DE RADIOAFICIONADOS HABILITADOS AL 15 MARZO 2026",
+        getSampleStyleSheet()["Title"],
+    )
+    SimpleDocTemplate(path, pagesize=landscape(A4)).build([title, table])
+
+
+def write_adif(path: str, count: int, seed: int = 0, log_type="operation_log") -> None:
+    """
+    Escribe un archivo ADI con ``count`` QSOs (sin duplicados).
+    """
+    from infrastructure.adif.adif_writer import format_adif_datetime
+    from infrastructure.adif.adif_writer import format_adif_field as field
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("Logger OA benchmark\n")
+        f.write(field("ADIF_VER", "3.1.4") + field("STATION_CALLSIGN", "OA4BENCH"))
+        f.write("<EOH>\n")
+        for contact in generate_contacts(log_type, count, seed):
+            qso_date, time_on = format_adif_datetime(contact["timestamp"])
+            record = [
+                field("CALL", contact["callsign"]),
+                field("QSO_DATE", qso_date),
+                field("TIME_ON", time_on),
+                field("BAND", "2m"),
+                field("MODE", "FM"),
+                field("NAME", contact["name"]),
+                field("RST_RCVD", contact["rs_rx"]),
+                field("RST_SENT", contact["rs_tx"]),
+            ]
+            if log_type == "contest_log":
+                record.append(field("SRX", contact["exchange_received"]))
+                record.append(field("STX", contact["exchange_sent"]))
+            else:
+                record.append(field("TX_PWR", contact["power"]))
+            f.write("".join(record) + "<EOR>\n")
@@ -0,0 +1,181 @@
+"""
+Medición y resultados de la suite de benchmarks (``python -m pytest benchmarks``).
+
+``Benchmark`` sigue la interfaz de pytest-benchmark (``benchmark(fn, *args)``
+y ``benchmark.pedantic(...)``) sin depender del plugin, y los resultados se
+guardan en JSON con la misma forma general (``benchmarks`` con ``stats`` de
+cada uno), de modo que se pueden comparar entre commits con
+``benchmarks/compare_results.py``.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+RESULTS_VERSION = 1
+
+
+class Benchmark:
+    """
+    Mide una función en ``rounds`` rondas de ``iterations`` llamadas cada una
+    y guarda los segundos por llamada de cada ronda.
+    """
+
+    def __init__(self, name: str, group: str, rounds: int = 5):
+        self.name = name
+        self.group = group
+        self.rounds = rounds
+        self.timings: List[float] = []
+        self.extra_info: Dict[str, object] = {}
+
+    def __call__(self, fn: Callable, *args, **kwargs):
+        return self.pedantic(fn, args=args, kwargs=kwargs)
+
+    def pedantic(
+        self,
+        fn: Callable,
+        args=(),
+        kwargs=None,
+        setup: Optional[Callable] = None,
+        rounds: Optional[int] = None,
+        iterations: int = 1,
+        warmup_rounds: int = 1,
+    ):
+        """
+        Como ``pytest-benchmark``: ``setup`` corre antes de cada ronda (fuera
+        de la medición) y puede devolver ``(args, kwargs)`` para esa ronda.
+        """
+        kwargs = kwargs or {}
+        rounds = rounds or self.rounds
+        result = None
+        for round_number in range(warmup_rounds + rounds):
+            round_args, round_kwargs = args, kwargs
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    round_args, round_kwargs = prepared
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = fn(*round_args, **round_kwargs)
+            elapsed = time.perf_counter() - start
+            if round_number >= warmup_rounds:
+                self.timings.append(elapsed / iterations)
+        return result
+
+    @property
+    def stats(self) -> dict:
+        timings = self.timings
+        return {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": statistics.fmean(timings),
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": len(timings),
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "group": self.group,
+            "stats": self.stats,
+            "extra_info": self.extra_info,
+        }
+
+
+def _commit_info(root: str) -> dict:
+    def git(*args):
+        try:
+            return subprocess.run(
+                ["git", *args],
+                cwd=root,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {
+        "id": git("rev-parse", "HEAD"),
+        "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def build_results(benchmarks: List[Benchmark], size: str, root: str) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "datetime": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "size": size,
+        "machine_info": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "commit_info": _commit_info(root),
+        "benchmarks": [b.as_dict() for b in benchmarks if b.timings],
+    }
+
+
+def save_results(results: dict, path: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    """
+    Devuelve los benchmarks de un archivo de resultados por nombre.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {b["name"]: b for b in data.get("benchmarks", [])}
+
+
+def compare_results(before: Dict[str, dict], after: Dict[str, dict], stat="median"):
+    """
+    Devuelve filas (nombre, antes, después, razón después/antes) en segundos;
+    los benchmarks que están en un solo archivo tienen el otro valor en None.
+    """
+    rows = []
+    for name in list(before) + [n for n in after if n not in before]:
+        old = before.get(name, {}).get("stats", {}).get(stat)
+        new = after.get(name, {}).get("stats", {}).get(stat)
+        ratio = new / old if old and new is not None else None
+        rows.append((name, old, new, ratio))
+    return rows
+
+
+def format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f} µs"
+    if value < 1:
+        return f"{value * 1e3:.2f} ms"
+    return f"{value:.3f} s"
+
+
+def format_table(benchmarks: List[Benchmark]) -> str:
+    width = max([len(b.name) for b in benchmarks] + [len("Benchmark")]) + 2
+    lines = [
+        f"{'Benchmark':<{width}}{'Mín':>12}{'Mediana':>12}{'Máx':>12}{'Rondas':>8}"
+    ]
+    for b in benchmarks:
+        if not b.timings:
+            continue
+        s = b.stats
+        lines.append(
+            f"{b.name:<{width}}{format_seconds(s['min']):>12}"
+            f"{format_seconds(s['median']):>12}{format_seconds(s['max']):>12}"
+            f"{s['rounds']:>8}"
+        )
+    return "\n".join(lines)
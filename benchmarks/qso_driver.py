@@ -0,0 +1,435 @@
+"""
+Conductor headless de la captura de QSOs.
+
+Levanta la ventana principal real con la plataforma ``offscreen`` de Qt,
+crea un log (operativo o de concurso) sobre una base de operadores
+sintética (``benchmarks/generators.py``) y carga QSOs como un operador:
+escribe el indicativo tecla por tecla en el campo de ingreso (con lo que
+corren las sugerencias, el resumen del operador y la alerta de duplicado)
+y lo agrega con Ctrl+Enter. También deja indicativos en la cola de espera
+(Enter) y los retoma (F3 y Enter), y edita (doble clic) o elimina (Supr)
+contactos de la tabla respondiendo los diálogos como el operador.
+
+``config.paths`` fija ``~/LoggerOA`` al importarse: hay que llamar a
+``use_temporary_home()`` (o apuntar ``HOME`` a otra carpeta) antes de crear
+el conductor, para no tocar la base ni los logs del usuario.
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+LOG_TYPES = ("operation_log", "contest_log")
+OWN_CALLSIGN = "OA4BAU"
+
+
+def use_temporary_home(prefix: str = "loggeroa-driver-home-") -> str:
+    """
+    Apunta ``HOME`` a una carpeta temporal nueva y la devuelve. Debe
+    llamarse antes de importar módulos de la app.
+    """
+    home = tempfile.mkdtemp(prefix=prefix)
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    return home
+
+
+def pyside_none_leak_message() -> Optional[str]:
+    """
+    Mensaje de error si la versión instalada de PySide6 descuenta
+    referencias a ``None`` (una sesión larga abortaría el intérprete).
+    """
+    import sys
+
+    from utils.memory_profiler import detect_none_leak
+
+    leak = detect_none_leak()
+    if not leak:
+        return None
+    import PySide6
+
+    return (
+        f"PySide6 {PySide6.__version__} descuenta referencias a None "
+        f"({leak:g} por llamada) en Python {sys.version.split()[0]}: una sesión "
+        "larga termina abortando el intérprete. Use otra versión de "
+        "PySide6 (requirements-modern.txt excluye 6.12.0) o Python 3.12+."
+    )
+
+
+class QsoDriver:
+    """
+    Carga QSOs en la vista de log de la ventana principal sin intervención
+    humana. ``debounce_ms`` reemplaza la espera de las sugerencias (120 ms
+    en la app; ``None`` la deja como está, ``0`` la reduce a un ciclo del
+    bucle de eventos). Los diálogos modales que aparezcan (duplicados,
+    validación) se responden con "No"/cancelar y se cuentan en ``dialogs``,
+    salvo los que espera la propia acción (confirmar la eliminación, aceptar
+    la edición).
+    """
+
+    def __init__(
+        self,
+        log_type: str = "operation_log",
+        operators: int = 5000,
+        seed: int = 0,
+        debounce_ms: Optional[int] = 0,
+    ):
+        if log_type not in LOG_TYPES:
+            raise ValueError(f"Tipo de log desconocido: {log_type}")
+        self.log_type = log_type
+        self.operators = operators
+        self.seed = seed
+        self.debounce_ms = debounce_ms
+        self.rng = random.Random(seed)
+        self.app = None
+        self.window = None
+        self.view = None
+        self.added = 0
+        self.rejected = 0
+        self.queued = 0
+        self.edited = 0
+        self.deleted = 0
+        self.dialogs: List[str] = []
+        self._answers = deque()
+        self._callsigns: List[str] = []
+        self._next = 0
+
+    # --- Ciclo de vida ---
+
+    def start(self):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtCore import QTimer
+        from PySide6.QtWidgets import QApplication
+
+        self.app = QApplication.instance() or QApplication([])
+        self._create_operators_db()
+
+        from application.use_cases.create_log import create_log
+        from interface_adapters.ui.main_window import MainWindow
+        from interface_adapters.ui.view_manager import LogType, ViewID
+
+        self.window = MainWindow()
+        self.window.show()
+        self.process_events()
+        if self.log_type == "contest_log":
+            contest_key = "contest_world_radio_day"
+            _, log = create_log(
+                LogType.CONTEST_LOG,
+                OWN_CALLSIGN,
+                contest_key=contest_key,
+                name=contest_key,
+                metadata={"contest_name_key": contest_key},
+            )
+            log_type, view_id = LogType.CONTEST_LOG, ViewID.LOG_CONTEST_VIEW
+        else:
+            _, log = create_log(
+                LogType.OPERATION_LOG,
+                OWN_CALLSIGN,
+                operation_type="type",
+                frequency_band="band",
+                repeater_key=None,
+                metadata={},
+            )
+            log_type, view_id = LogType.OPERATION_LOG, ViewID.LOG_OPS_VIEW
+        self.window.current_log = log
+        self.window.current_log_type = log_type
+        self.window.show_view(view_id)
+        self.view = self.window.view_manager.views[view_id]
+        if self.debounce_ms is not None:
+            self.view.callsign_info._debounce.setInterval(self.debounce_ms)
+        # Los diálogos modales corren su propio bucle: se responden desde un timer
+        self._dialog_timer = QTimer(self.window)
+        self._dialog_timer.setInterval(50)
+        self._dialog_timer.timeout.connect(self._dismiss_dialog)
+        self._dialog_timer.start()
+        self.process_events()
+        return self
+
+    def close(self):
+        """
+        Cierra el log (persistiendo los contactos pendientes) y la ventana.
+        """
+        if self.window is None:
+            return
+        from interface_adapters.ui.main_window_actions import action_log_close
+
+        self._dialog_timer.stop()
+        action_log_close(self.window)
+        self.window.close()
+        self.process_events()
+        self.window.deleteLater()
+        self.window = None
+        self.view = None
+
+    def _create_operators_db(self):
+        from benchmarks import generators
+        from config.paths import get_database_path
+
+        db_path = get_database_path()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        generators.create_operators_db(db_path, self.operators, self.seed)
+        with sqlite3.connect(db_path) as conn:
+            self._callsigns = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT callsign FROM radio_operators WHERE enabled = 1"
+                )
+            ]
+        self.rng.shuffle(self._callsigns)
+
+    # --- Captura ---
+
+    def next_callsign(self) -> str:
+        """
+        Siguiente indicativo de la base (se repiten al agotarse).
+        """
+        callsign = self._callsigns[self._next % len(self._callsigns)]
+        self._next += 1
+        return callsign
+
+    def contact_count(self) -> int:
+        return self.view.table_widget.contact_count()
+
+    def type_callsign(self, callsign: str, key_interval_ms: int = 0):
+        """
+        Escribe el indicativo tecla por tecla en el campo de ingreso, con
+        ``key_interval_ms`` (±50 %) entre teclas.
+        """
+        field = self.view.callsign_input.input
+        field.setFocus()
+        field.clear()
+        for char in callsign:
+            # Para letras, dígitos y "/" el código de tecla de Qt es el ASCII
+            self.press_key(field, ord(char.upper()), text=char)
+            if key_interval_ms:
+                self.process_events(int(key_interval_ms * self.rng.uniform(0.5, 1.5)))
+            else:
+                self.process_events()
+        # Deja correr el debounce de las sugerencias y el resumen
+        self.wait_for_debounce()
+
+    def wait_for_debounce(self, timeout_ms: int = 2000):
+        """
+        Espera a que corran las sugerencias y el resumen, y a que se pinten.
+        """
+        debounce = self.view.callsign_info._debounce
+        deadline = time.perf_counter() + timeout_ms / 1000
+        while debounce.isActive() and time.perf_counter() < deadline:
+            self.process_events(1)
+        # Un ciclo para el repintado y otro para cerrar la medición de latencia
+        self.process_events()
+        self.process_events()
+
+    def add_contact(self) -> bool:
+        """
+        Agrega el indicativo escrito con Ctrl+Enter. Devuelve True si el
+        contacto llegó a la tabla.
+        """
+        from PySide6.QtCore import Qt
+
+        if self.log_type == "contest_log":
+            form = self.view.form_widget
+            form.exchange_received_input.setText(str(self.rng.randint(1, 999)))
+        before = self.contact_count()
+        self.press_key(
+            self.view.callsign_input.input,
+            Qt.Key.Key_Return,
+            Qt.KeyboardModifier.ControlModifier,
+        )
+        self.process_events()
+        if self.contact_count() > before:
+            self.added += 1
+            return True
+        self.rejected += 1
+        self.view.callsign_input.input.clear()
+        return False
+
+    def enter_qso(self, callsign: Optional[str] = None, key_interval_ms=0) -> bool:
+        self.type_callsign(callsign or self.next_callsign(), key_interval_ms)
+        return self.add_contact()
+
+    # --- Cola de espera ---
+
+    def queue_size(self) -> int:
+        return self.view.queue_widget.queue_list.count()
+
+    def queue_callsign(self, callsign: Optional[str] = None, key_interval_ms=0):
+        """
+        Escribe un indicativo y lo deja en la cola de espera con Enter.
+        """
+        from PySide6.QtCore import Qt
+
+        callsign = callsign or self.next_callsign()
+        self.type_callsign(callsign, key_interval_ms)
+        self.press_key(self.view.callsign_input.input, Qt.Key.Key_Return)
+        self.wait_for_debounce()
+        self.queued += 1
+        return callsign
+
+    def take_from_queue(self, row: int = 0) -> Optional[str]:
+        """
+        Pasa al campo de ingreso el indicativo ``row`` de la cola: F3 (foco
+        en la cola), se elige el item y Enter.
+        """
+        from PySide6.QtCore import Qt
+
+        queue_list = self.view.queue_widget.queue_list
+        if row >= queue_list.count():
+            return None
+        self.press_key(self.view.callsign_input.input, Qt.Key.Key_F3)
+        queue_list.setCurrentRow(row)
+        callsign = queue_list.currentItem().text()
+        self.press_key(queue_list, Qt.Key.Key_Return)
+        self.wait_for_debounce()
+        return callsign
+
+    # --- Edición y eliminación ---
+
+    def edit_contact(self, row: int = 0, obs: str = "QSB") -> bool:
+        """
+        Abre la edición del contacto de la fila ``row`` con doble clic, cambia
+        las observaciones y acepta. Devuelve True si el cambio llegó a la tabla.
+        """
+        from PySide6.QtCore import QEvent
+
+        table = self.view.table_widget.table
+        index = table.model().index(row, 0)
+        if not index.isValid():
+            return False
+        table.scrollTo(index)
+        self.process_events()
+        center = table.visualRect(index).center()
+
+        def accept(dialog):
+            dialog.inputs["obs"].setText(obs)
+            dialog.accept()
+
+        self._expect_dialog(accept)
+        for event_type in (
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.MouseButtonRelease,
+            QEvent.Type.MouseButtonDblClick,
+            QEvent.Type.MouseButtonRelease,
+        ):
+            self.send_mouse(table.viewport(), event_type, center)
+        self.process_events()
+        # Si no se abrió el diálogo, la respuesta no debe quedar para otro
+        self._answers.clear()
+        self.view.callsign_input.input.setFocus()
+        contact = self.view.table_widget.model.contact_at_row(row)
+        if contact is not None and contact.get("obs") == obs:
+            self.edited += 1
+            return True
+        return False
+
+    def delete_contact(self, row: int = 0) -> bool:
+        """
+        Selecciona la fila ``row``, presiona Supr y confirma la eliminación.
+        """
+        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QMessageBox
+
+        table = self.view.table_widget.table
+        if row >= table.model().rowCount():
+            return False
+        before = self.contact_count()
+        table.setFocus()
+        table.selectRow(row)
+        self.process_events()
+        self._expect_dialog(
+            lambda dialog: dialog.button(QMessageBox.StandardButton.Yes).click()
+        )
+        self.press_key(table, Qt.Key.Key_Delete)
+        self.process_events()
+        self._answers.clear()
+        self.view.callsign_input.input.setFocus()
+        if self.contact_count() < before:
+            self.deleted += 1
+            return True
+        return False
+
+    # --- Eventos ---
+
+    def press_key(self, widget, key, modifiers=None, text: str = ""):
+        """
+        Envía pulsación y liberación de ``key`` a ``widget``, como el teclado
+        (pasan por los filtros de eventos de la vista). Si la tecla abre un
+        diálogo modal, vuelve cuando el diálogo se responde.
+        """
+        from PySide6.QtCore import QEvent, Qt
+        from PySide6.QtGui import QKeyEvent
+
+        if modifiers is None:
+            modifiers = Qt.KeyboardModifier.NoModifier
+        for event_type in (QEvent.Type.KeyPress, QEvent.Type.KeyRelease):
+            self.app.sendEvent(widget, QKeyEvent(event_type, key, modifiers, text))
+
+    def send_mouse(self, widget, event_type, pos):
+        """
+        Envía a ``widget`` un evento del botón izquierdo del mouse en ``pos``.
+        """
+        from PySide6.QtCore import QEvent, QPointF, Qt
+        from PySide6.QtGui import QMouseEvent
+
+        buttons = (
+            Qt.MouseButton.NoButton
+            if event_type == QEvent.Type.MouseButtonRelease
+            else Qt.MouseButton.LeftButton
+        )
+        event = QMouseEvent(
+            event_type,
+            QPointF(pos),
+            QPointF(widget.mapToGlobal(pos)),
+            Qt.MouseButton.LeftButton,
+            buttons,
+            Qt.KeyboardModifier.NoModifier,
+        )
+        self.app.sendEvent(widget, event)
+
+    def process_events(self, ms: int = 0):
+        """
+        Procesa los eventos pendientes (pintado incluido) durante ``ms``.
+        """
+        self.app.processEvents()
+        if ms:
+            deadline = time.perf_counter() + ms / 1000
+            while time.perf_counter() < deadline:
+                time.sleep(0.001)
+                self.app.processEvents()
+
+    def _expect_dialog(self, answer: Callable):
+        """
+        Responde con ``answer(dialog)`` el próximo diálogo modal, apenas se
+        abra (sin esperar al timer de diálogos inesperados).
+        """
+        from PySide6.QtCore import QTimer
+
+        self._answers.append(answer)
+        QTimer.singleShot(0, self._dismiss_dialog)
+
+    def _dismiss_dialog(self):
+        from PySide6.QtWidgets import QApplication, QMessageBox
+
+        dialog = QApplication.activeModalWidget()
+        if dialog is None:
+            return
+        if self._answers:
+            self._answers.popleft()(dialog)
+            return
+        if isinstance(dialog, QMessageBox):
+            self.dialogs.append(dialog.text())
+            button = dialog.button(QMessageBox.StandardButton.No)
+            if button is None:
+                button = dialog.escapeButton()
+            if button is not None:
+                button.click()
+                return
+        else:
+            self.dialogs.append(dialog.windowTitle())
+        dialog.reject()
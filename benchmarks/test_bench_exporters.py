@@ -0,0 +1,60 @@
+"""
+Exportadores: todos los formatos del motor de exportación, el texto simple
+del log abierto y el CSV de la base de operadores.
+"""
+
+import pytest
+
+from benchmarks.conftest import LOG_TYPES
+
+
+def _export_cases():
+    from application.use_cases.batch_export import CONTEST_ONLY_FORMATS
+    from application.use_cases.export_engine import EXPORT_WRITERS
+
+    for log_type in LOG_TYPES:
+        for fmt in sorted(EXPORT_WRITERS):
+            if fmt in CONTEST_ONLY_FORMATS and log_type != "contest_log":
+                continue
+            yield log_type, fmt
+
+
+@pytest.mark.parametrize("log_type, fmt", list(_export_cases()))
+def test_run_export(benchmark, restore_operators_db, log_copy, tmp_path, log_type, fmt):
+    # Cabrillo y PDF leen los datos de la estación de la base de operadores
+    from application.use_cases.export_engine import EXPORT_WRITERS, run_export
+
+    db_path = log_copy(log_type)
+    export_path = str(tmp_path / f"export.{fmt}")
+
+    def setup():
+        return (db_path, EXPORT_WRITERS[fmt](export_path)), {}
+
+    assert benchmark.pedantic(run_export, setup=setup) == export_path
+
+
+@pytest.mark.parametrize("log_type", LOG_TYPES)
+def test_export_simple_text(benchmark, log_copy, tmp_path, log_type):
+    from application.use_cases.export_log import export_log_to_simple_text
+    from application.use_cases.open_log import open_log
+
+    log = open_log(log_copy(log_type))
+    benchmark(export_log_to_simple_text, log, str(tmp_path / "log.txt"))
+
+
+@pytest.mark.parametrize("extension", ["csv", "csv.gz"])
+def test_export_operators_csv(
+    benchmark, restore_operators_db, bench_size, tmp_path, extension
+):
+    from interface_adapters.controllers.database_controller import (
+        DatabaseController,
+    )
+    from translation.translation_service import translation_service
+
+    restore_operators_db()
+    exported = benchmark(
+        DatabaseController.export_database_to_csv,
+        str(tmp_path / f"operators.{extension}"),
+        translation_service,
+    )
+    assert exported == bench_size["operators"]
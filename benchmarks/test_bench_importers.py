@@ -0,0 +1,70 @@
+"""
+Importadores: actualización de la base de operadores desde CSV, Excel y PDF,
+e importación de ADIF a un log existente.
+"""
+
+import pytest
+
+from benchmarks import generators
+from benchmarks.conftest import LOG_TYPES
+
+# Generador del archivo y cantidad de operadores (clave de BENCH_SIZES)
+OPERATOR_FILES = {
+    "csv": (generators.write_operators_csv, "import_operators"),
+    # El nombre lleva la fecha de corte, como los archivos publicados
+    "xlsx": (generators.write_operators_xlsx, "import_operators"),
+    "pdf": (generators.write_operators_pdf, "pdf_operators"),
+}
+
+
+@pytest.fixture(scope="module")
+def import_files(bench_data, bench_size):
+    paths = {}
+    for fmt, (write, size_key) in OPERATOR_FILES.items():
+        path = str(bench_data / f"operadores_03-15-2026.{fmt}")
+        # Semilla distinta a la base: el archivo trae altas y cambios
+        write(path, bench_size[size_key], seed=1)
+        paths[fmt] = path
+    for log_type in LOG_TYPES:
+        path = str(bench_data / f"{log_type}.adi")
+        generators.write_adif(path, bench_size["contacts"], seed=1, log_type=log_type)
+        paths[log_type] = path
+    return paths
+
+
+@pytest.mark.parametrize("fmt", sorted(OPERATOR_FILES))
+def test_update_operators(benchmark, restore_operators_db, import_files, fmt):
+    from application.use_cases.update_operators_from_csv import (
+        update_operators_from_csv,
+    )
+    from application.use_cases.update_operators_from_excel import (
+        update_operators_from_excel,
+    )
+    from application.use_cases.update_operators_from_pdf import (
+        update_operators_from_pdf,
+    )
+
+    update = {
+        "csv": update_operators_from_csv,
+        "xlsx": update_operators_from_excel,
+        "pdf": update_operators_from_pdf,
+    }[fmt]
+
+    # Cada ronda parte de la misma base
+    def setup():
+        restore_operators_db()
+        return (import_files[fmt],), {}
+
+    result = benchmark.pedantic(update, setup=setup)
+    assert result
+
+
+@pytest.mark.parametrize("log_type", LOG_TYPES)
+def test_import_adif(benchmark, log_copy, bench_size, import_files, log_type):
+    from application.use_cases.import_adif import import_adif_file
+
+    def setup():
+        return (import_files[log_type],), {"db_path": log_copy(log_type)}
+
+    summary = benchmark.pedantic(import_adif_file, setup=setup)
+    assert summary["imported"] == bench_size["contacts"]
@@ -0,0 +1,69 @@
+"""
+Apertura de logs en los tres formatos de archivo (los anteriores a ``v2`` se
+migran al abrirse) y registro de contactos con el log abierto.
+"""
+
+import pytest
+
+from benchmarks import generators
+from benchmarks.conftest import LOG_TYPES
+
+
+@pytest.mark.parametrize("file_format", generators.LOG_FILE_FORMATS)
+@pytest.mark.parametrize("log_type", LOG_TYPES)
+def test_open_log(benchmark, log_copy, bench_size, log_type, file_format):
+    from application.use_cases.open_log import open_log
+
+    # Cada ronda abre una copia nueva: la migración modifica el archivo
+    def setup():
+        return (log_copy(log_type, file_format),), {}
+
+    log = benchmark.pedantic(open_log, setup=setup)
+    assert len(log.contacts) == bench_size["contacts"]
+
+
+@pytest.mark.parametrize("log_type", LOG_TYPES)
+def test_open_log_recent(benchmark, log_copy, log_type):
+    from application.use_cases.open_log import open_log
+
+    db_path = log_copy(log_type)
+    log = benchmark(open_log, db_path, recent_limit=200)
+    assert len(log.contacts) <= 200
+
+
+def _new_contact(log_type, index):
+    contact = next(generators.generate_contacts(log_type, 1, seed=index + 1))
+    contact["callsign"] = generators.make_callsign(index, "OC")
+    contact["timestamp"] += 400 * generators.DAY
+    if log_type == "contest_log":
+        contact["id"] = f"bench-new-{index:07d}"
+    return contact
+
+
+@pytest.mark.parametrize("log_type", LOG_TYPES)
+def test_add_contact_to_log(benchmark, log_copy, log_type):
+    from application.use_cases.contact_management import (
+        add_contact_to_log,
+        close_contact_writer,
+        open_contact_writer,
+    )
+    from domain.contact_type import ContactType
+
+    db_path = log_copy(log_type)
+    log_id = f"bench-{log_type}"
+    contact_type = (
+        ContactType.CONTEST if log_type == "contest_log" else ContactType.OPERATION
+    )
+    counter = iter(range(1_000_000))
+
+    def setup():
+        return (db_path, log_id, _new_contact(log_type, next(counter))), {
+            "contact_type": contact_type
+        }
+
+    # Como en la app: el log abierto usa la escritura diferida
+    open_contact_writer(db_path)
+    try:
+        benchmark.pedantic(add_contact_to_log, setup=setup, rounds=benchmark.rounds * 4)
+    finally:
+        close_contact_writer(db_path)
@@ -0,0 +1,93 @@
+"""
+Consultas a la base de operadores: búsqueda del operador ingresado,
+sugerencias del campo de indicativo y paginación de la tabla.
+"""
+
+import sqlite3
+
+import pytest
+
+# Posición relativa del indicativo buscado dentro de la base
+LOOKUP_POSITIONS = {"first": 0.0, "middle": 0.5, "last": 1.0}
+
+
+@pytest.fixture(scope="module")
+def operators_db(restore_operators_db, operators_source):
+    # Los importadores modifican la base de la app
+    restore_operators_db()
+    with sqlite3.connect(operators_source) as conn:
+        callsigns = [
+            row[0] for row in conn.execute("SELECT callsign FROM radio_operators")
+        ]
+    return callsigns
+
+
+def _callsign_at(callsigns, position):
+    return callsigns[int(position * (len(callsigns) - 1))]
+
+
+@pytest.mark.parametrize("position", sorted(LOOKUP_POSITIONS))
+@pytest.mark.parametrize("form", ["plain", "portable", "missing"])
+def test_find_operator_for_input(benchmark, operators_db, position, form):
+    from application.use_cases.operator_management import find_operator_for_input
+
+    callsign = _callsign_at(operators_db, LOOKUP_POSITIONS[position])
+    if form == "portable":
+        callsign = f"{callsign}/M"
+    elif form == "missing":
+        callsign = f"{callsign}ZZ"
+    operator = benchmark.pedantic(
+        find_operator_for_input, args=(callsign,), iterations=50
+    )
+    assert (operator is None) == (form == "missing")
+
+
+@pytest.mark.parametrize("text", ["OA", "OA4", "CE*A", "LU1A", "*Z"])
+def test_search_suggestions(benchmark, operators_db, text):
+    from infrastructure.repositories.sqlite_radio_operator_repository import (
+        SqliteRadioOperatorRepository,
+    )
+
+    repo = SqliteRadioOperatorRepository()
+    benchmark.pedantic(repo.search_suggestions, args=(text, 40), iterations=10)
+
+
+@pytest.mark.parametrize("text", ["OA4", "CE*A"])
+def test_filtered_operators_full_scan(benchmark, operators_db, text):
+    from utils.text import get_filtered_operators
+
+    benchmark(get_filtered_operators, text)
+
+
+@pytest.mark.parametrize("page", ["first", "middle", "last"])
+def test_list_paged(benchmark, operators_db, page):
+    from infrastructure.repositories.sqlite_radio_operator_repository import (
+        SqliteRadioOperatorRepository,
+    )
+
+    repo = SqliteRadioOperatorRepository()
+    page_size = 100
+    pages = (len(operators_db) + page_size - 1) // page_size
+    # Las páginas se numeran desde 0
+    number = {"first": 0, "middle": pages // 2, "last": pages - 1}[page]
+    rows, total = benchmark(repo.list_paged, number, page_size)
+    assert total == len(operators_db) and rows
+
+
+@pytest.mark.parametrize(
+    "order_by, filter_col, filter_text",
+    [
+        ("name", None, None),
+        ("callsign", "callsign", "OA4"),
+        ("expiration_date", "name", "QUISPE"),
+    ],
+)
+def test_list_paged_sorted_filtered(
+    benchmark, operators_db, order_by, filter_col, filter_text
+):
+    from infrastructure.repositories.sqlite_radio_operator_repository import (
+        SqliteRadioOperatorRepository,
+    )
+
+    repo = SqliteRadioOperatorRepository()
+    benchmark(repo.list_paged, 0, 100, order_by, True, filter_col, filter_text)
@@ -0,0 +1,60 @@
+"""
+Compara dos trazas de arranque de Logger OA (``--trace-startup``) fase por fase.
+
+Uso:
+    python scripts/compare_startup_traces.py ANTES.json DESPUES.json [--min-ms 1]
+
+Muestra la duración de cada fase en ambas trazas y la diferencia; las fases
+que solo están en una traza se marcan con "-". ``startup_done`` es el
+instante en que terminó el primer pintado (arranque total).
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+def _ms(value) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def format_comparison(rows, min_ms: float = 0.0) -> str:
+    lines = [f"{'Fase':<42}{'Antes':>10}{'Después':>10}{'Dif.':>10}{'%':>8}"]
+    for name, before, after, diff in rows:
+        if max(before or 0, after or 0) < min_ms:
+            continue
+        percent = ""
+        if diff is not None and before:
+            percent = f"{diff / before * 100:+.0f}%"
+        diff_text = "-" if diff is None else f"{diff:+.1f}"
+        lines.append(
+            f"{name:<42}{_ms(before):>10}{_ms(after):>10}{diff_text:>10}{percent:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from utils.startup_trace import compare_traces
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("before", help="Traza de referencia")
+    parser.add_argument("after", help="Traza a comparar")
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=0.0,
+        help="Oculta las fases que duran menos en ambas trazas",
+    )
+    args = parser.parse_args(argv)
+
+    print(format_comparison(compare_traces(args.before, args.after), args.min_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
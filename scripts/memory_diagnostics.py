@@ -0,0 +1,204 @@
+"""
+Diagnóstico de memoria de una sesión de captura simulada.
+
+Uso:
+    python scripts/memory_diagnostics.py [--qsos 2000] [--every 250]
+        [--log-type operation_log|contest_log] [--json reporte.json]
+        [--max-kib-per-qso 16 --max-qt-growth 0 --fail]
+
+Abre la ventana principal con la plataforma ``offscreen`` de Qt y una
+carpeta de usuario temporal, carga ``--qsos`` QSOs en un log nuevo con
+``benchmarks/qso_driver.py`` (tecla por tecla y Ctrl+Enter) y cada
+``--every`` QSOs toma una instantánea de tracemalloc por módulo, de los
+objetos Qt vivos por clase y de los objetos de Python por tipo. Al final
+muestra lo que más creció por cada 1000 QSOs y marca con "!" lo que crece
+en forma sostenida (los contactos del log en memoria crecen con cada QSO;
+el resto debería mantenerse estable). Con ``--fail`` termina con código 1
+si se superan los topes indicados.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+for _path in (ROOT, SRC):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+KIND_TITLES = {
+    "module": "Memoria de Python por módulo (tracemalloc)",
+    "qt": "Objetos Qt por clase",
+    "python": "Objetos de Python por tipo",
+    "none_refs": "Referencias a None perdidas (extensión C)",
+}
+
+
+def _format_value(kind: str, value: float) -> str:
+    if kind == "module":
+        return f"{value / 1024:.1f} KiB"
+    return f"{value:.0f}"
+
+
+def format_report(snapshots, entries, top: int = 10) -> str:
+    lines = [f"{'QSOs':>7}{'Python (MiB)':>15}{'RSS (MiB)':>12}{'Qt':>8}{'s':>9}"]
+    for s in snapshots:
+        rss = f"{s.rss_bytes / 2**20:.1f}" if s.rss_bytes is not None else "-"
+        lines.append(
+            f"{s.qsos:>7}{s.traced_bytes / 2**20:>15.1f}{rss:>12}"
+            f"{sum(s.qt_objects.values()):>8}{s.elapsed:>9.1f}"
+        )
+    for kind, title in KIND_TITLES.items():
+        rows = [e for e in entries if e.kind == kind][:top]
+        if not rows:
+            continue
+        lines.append("")
+        lines.append(f"{title} — crecimiento cada 1000 QSOs:")
+        for e in rows:
+            mark = "!" if e.flagged else " "
+            lines.append(
+                f" {mark} {_format_value(kind, e.per_1000_qsos):>12}  {e.name}"
+                f"  ({_format_value(kind, e.start)} -> {_format_value(kind, e.end)})"
+            )
+    return "\n".join(lines)
+
+
+def check_budget(snapshots, entries, max_kib_per_qso=None, max_qt_growth=None):
+    """
+    Devuelve la lista de topes superados: memoria de Python por QSO, objetos
+    Qt agregados (desde la primera instantánea posterior al calentamiento) y
+    referencias a None perdidas.
+    """
+    problems = [
+        f"referencias a None: se pierden {e.per_1000_qsos:.0f} cada 1000 QSOs"
+        for e in entries
+        if e.kind == "none_refs" and e.flagged
+    ]
+    window = snapshots[1:] if len(snapshots) > 2 else snapshots
+    first, last = window[0], window[-1]
+    qsos = last.qsos - first.qsos
+    if max_kib_per_qso is not None and qsos > 0:
+        per_qso = (last.traced_bytes - first.traced_bytes) / qsos / 1024
+        if per_qso > max_kib_per_qso:
+            problems.append(
+                f"memoria de Python: {per_qso:.2f} KiB por QSO "
+                f"(tope {max_kib_per_qso} KiB)"
+            )
+    if max_qt_growth is not None:
+        growth = sum(last.qt_objects.values()) - sum(first.qt_objects.values())
+        if growth > max_qt_growth:
+            problems.append(f"objetos Qt: {growth:+d} (tope {max_qt_growth:+d})")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--qsos", type=int, default=2000, help="QSOs a cargar")
+    parser.add_argument(
+        "--every", type=int, default=250, help="QSOs entre instantáneas"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=50, help="QSOs antes de la primera instantánea"
+    )
+    parser.add_argument(
+        "--log-type",
+        choices=("operation_log", "contest_log"),
+        default="operation_log",
+    )
+    parser.add_argument(
+        "--operators",
+        type=int,
+        default=None,
+        help="Operadores de la base sintética (por defecto, QSOs + 1000)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--frames", type=int, default=1, help="Marcos de tracemalloc por asignación"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Filas por sección")
+    parser.add_argument("--json", default=None, help="Guarda el reporte en este JSON")
+    parser.add_argument("--max-kib-per-qso", type=float, default=None)
+    parser.add_argument("--max-qt-growth", type=int, default=None)
+    parser.add_argument(
+        "--fail",
+        action="store_true",
+        help="Código de salida 1 si se superan los topes",
+    )
+    args = parser.parse_args(argv)
+
+    # Antes de importar la app: config.paths fija ~/LoggerOA al importarse
+    from benchmarks.qso_driver import (
+        QsoDriver,
+        pyside_none_leak_message,
+        use_temporary_home,
+    )
+
+    home = use_temporary_home("loggeroa-memory-home-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from utils.memory_profiler import MemoryProfiler, memory_growth
+
+        driver = QsoDriver(
+            args.log_type,
+            operators=args.operators or args.qsos + 1000,
+            seed=args.seed,
+        )
+        leak_message = pyside_none_leak_message()
+        if leak_message:
+            print(leak_message)
+            return 2
+        driver.start()
+        profiler = MemoryProfiler(frames=args.frames).start()
+        started = time.perf_counter()
+        for number in range(1, args.qsos + 1):
+            driver.enter_qso()
+            if number == args.warmup or (
+                number > args.warmup and (number - args.warmup) % args.every == 0
+            ):
+                profiler.snapshot(f"{number} QSOs", number)
+        if profiler.snapshots[-1].qsos != args.qsos:
+            profiler.snapshot(f"{args.qsos} QSOs", args.qsos)
+        elapsed = time.perf_counter() - started
+        driver.close()
+        profiler.stop()
+
+        entries = memory_growth(profiler.snapshots)
+        print(format_report(profiler.snapshots, entries, args.top))
+        print(
+            f"\n{driver.added} QSOs agregados, {driver.rejected} rechazados, "
+            f"{len(driver.dialogs)} diálogos, {elapsed:.1f} s"
+        )
+        problems = check_budget(
+            profiler.snapshots, entries, args.max_kib_per_qso, args.max_qt_growth
+        )
+        for problem in problems:
+            print(f"! {problem}")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "log_type": args.log_type,
+                        "qsos": args.qsos,
+                        "added": driver.added,
+                        "rejected": driver.rejected,
+                        "dialogs": driver.dialogs,
+                        "elapsed": elapsed,
+                        "snapshots": [s.as_dict() for s in profiler.snapshots],
+                        "growth": [e.__dict__ for e in entries],
+                        "problems": problems,
+                    },
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
+        return 1 if args.fail and problems else 0
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
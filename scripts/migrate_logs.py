@@ -0,0 +1,53 @@
+"""
+Migra y valida en lote todos los logs de Logger OA, sin abrir la interfaz.
+
+Uso:
+    python scripts/migrate_logs.py [--root CARPETA] [--workers N] [--dry-run] [--json REPORTE.json]
+
+Por defecto recorre ~/LoggerOA y actualiza cada log al formato actual.
+Devuelve código 1 si algún archivo falló.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+def main(argv=None):
+    from application.use_cases.migrate_logs import (
+        format_migration_report,
+        migrate_log_archive,
+    )
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", help="Carpeta a recorrer (por defecto ~/LoggerOA)")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Procesos en paralelo"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Valida sin escribir cambios"
+    )
+    parser.add_argument("--json", dest="json_path", help="Guarda el resumen en JSON")
+    args = parser.parse_args(argv)
+
+    summary = migrate_log_archive(
+        root=args.root, max_workers=args.workers, dry_run=args.dry_run
+    )
+    print(format_migration_report(summary))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()
+    sys.exit(main())
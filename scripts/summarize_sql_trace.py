@@ -0,0 +1,54 @@
+"""
+Resume una traza SQL de Logger OA (``--trace-sql``) agrupando por consulta.
+
+Uso:
+    python scripts/summarize_sql_trace.py ~/LoggerOA/traces/sql-FECHA.jsonl [--top 20]
+
+Muestra las consultas con más tiempo total: ejecuciones, tiempo total y
+máximo, filas, si recorren la tabla completa ("SCAN") y los casos de uso que
+las originaron. El plan de cada consulta que recorre una tabla completa está
+en el ``.slow.log`` junto a la traza.
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+def format_summary(rows, top: int = 20, width: int = 70) -> str:
+    lines = [
+        f"{'Consulta':<{width}}{'Veces':>8}{'Total ms':>11}{'Máx ms':>9}"
+        f"{'Filas':>9}{'Scan':>6}"
+    ]
+    for sql, count, total, longest, row_count, full_scan, use_cases in rows[:top]:
+        text = sql if len(sql) <= width - 2 else sql[: width - 5] + "..."
+        lines.append(
+            f"{text:<{width}}{count:>8}{total:>11.1f}{longest:>9.1f}"
+            f"{row_count:>9}{'sí' if full_scan else '':>6}"
+        )
+        for use_case in use_cases:
+            lines.append(f"    {use_case}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from infrastructure.db.query_trace import summarize_trace
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("trace", help="Archivo .jsonl de la traza SQL")
+    parser.add_argument(
+        "--top", type=int, default=20, help="Cantidad de consultas a mostrar"
+    )
+    args = parser.parse_args(argv)
+
+    print(format_summary(summarize_trace(args.trace), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
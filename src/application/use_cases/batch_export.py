@@ -0,0 +1,164 @@
+"""
+Caso de uso: Exportación en lote de varios logs y formatos.
+
+Recibe una selección de logs (p. ej. los concursos de una temporada obtenidos
+del catálogo) y un conjunto de formatos, y ejecuta cada exportación en un pool
+de procesos (hilos en el build legacy), escribiendo en la carpeta de
+exportación. Devuelve un resumen con el tiempo y el resultado de cada archivo.
+
+Este módulo y la cadena de exportación no importan Qt: los procesos del pool
+(iniciados con ``spawn``) solo cargan lo necesario para formatear.
+"""
+
+import os
+import time
+from typing import Callable, Iterable, List, Optional
+
+from application.use_cases.export_engine import (
+    EXPORT_WRITERS,
+    read_export_header,
+    run_export,
+)
+from config.paths import get_export_dir
+from domain.log_type import LogType
+from utils.parallel import create_executor
+
+# Formatos disponibles, en el orden en que se muestran
+BATCH_EXPORT_FORMATS = ("txt", "csv", "adi", "cbr", "pdf")
+# Formatos que solo aplican a logs de concurso
+CONTEST_ONLY_FORMATS = ("cbr", "pdf")
+
+
+def get_batch_export_path(db_path: str, export_format: str, export_dir: str) -> str:
+    """
+    Ruta de salida para un log y formato: ``<export_dir>/<nombre_del_log>.<formato>``.
+    """
+    base_name = os.path.splitext(os.path.basename(db_path))[0]
+    return os.path.join(export_dir, f"{base_name}.{export_format}")
+
+
+def export_log_file(
+    db_path: str, export_format: str, export_path: str, language: Optional[str] = None
+) -> dict:
+    """
+    Exporta un log a un formato. No lanza excepciones: el error queda en el
+    resultado. Los formatos que no aplican al tipo de log (PDF y Cabrillo en
+    operativos) se marcan como omitidos.
+
+    Devuelve dict con: path, format, export_path, log_type, skipped, error, elapsed.
+    """
+    started = time.perf_counter()
+    result = {
+        "path": db_path,
+        "format": export_format,
+        "export_path": export_path,
+        "log_type": "",
+        "skipped": False,
+        "error": None,
+        "elapsed": 0.0,
+    }
+    try:
+        if language:
+            from config.settings_values import LanguageValue
+            from translation.translation_service import translation_service
+
+            if translation_service.get_language().value != language:
+                translation_service.set_language(LanguageValue(language))
+        writer_class = EXPORT_WRITERS.get(export_format)
+        if writer_class is None:
+            raise ValueError(f"Formato de exportación no soportado: {export_format}")
+        header = read_export_header(db_path)
+        result["log_type"] = header["log_type"]
+        if (
+            export_format in CONTEST_ONLY_FORMATS
+            and header["log_type"] != LogType.CONTEST_LOG.value
+        ):
+            result["skipped"] = True
+        else:
+            run_export(db_path, writer_class(export_path))
+    except Exception as e:
+        result["error"] = str(e) or e.__class__.__name__
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def _export_worker(args) -> dict:
+    return export_log_file(*args)
+
+
+def export_logs_batch(
+    db_paths: Iterable[str],
+    formats: Iterable[str],
+    export_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    language: Optional[str] = None,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Exporta en paralelo cada log de ``db_paths`` a cada formato de ``formats``.
+    ``progress_callback`` recibe el resultado de cada archivo a medida que termina.
+    Sin ``language`` se usa el idioma actual de la aplicación (los procesos
+    del pool arrancan con el idioma por defecto).
+
+    Devuelve dict con: jobs, exported, skipped, failed, elapsed y results.
+    """
+    from application.use_cases.contact_management import flush_contact_writer
+    from translation.translation_service import translation_service
+
+    started = time.perf_counter()
+    db_paths = list(db_paths)
+    formats = [f for f in BATCH_EXPORT_FORMATS if f in set(formats)]
+    export_dir = export_dir or get_export_dir()
+    os.makedirs(export_dir, exist_ok=True)
+    language = language or translation_service.get_language().value
+    # El log abierto puede tener contactos aún en escritura diferida
+    for db_path in db_paths:
+        flush_contact_writer(db_path)
+    jobs = [
+        (db_path, fmt, get_batch_export_path(db_path, fmt, export_dir), language)
+        for db_path in db_paths
+        for fmt in formats
+    ]
+    results: List[dict] = []
+    if jobs:
+        with create_executor(max_workers) as executor:
+            for result in executor.map(_export_worker, jobs):
+                results.append(result)
+                if progress_callback:
+                    progress_callback(result)
+    return {
+        "jobs": len(results),
+        "exported": sum(1 for r in results if not r["error"] and not r["skipped"]),
+        "skipped": sum(1 for r in results if r["skipped"]),
+        "failed": sum(1 for r in results if r["error"]),
+        "export_dir": export_dir,
+        "elapsed": time.perf_counter() - started,
+        "results": results,
+    }
+
+
+def format_batch_export_report(summary: dict) -> str:
+    """
+    Genera un reporte de texto plano con el resumen y el detalle por archivo.
+    """
+    lines = [
+        "Exportación en lote",
+        f"Carpeta: {summary['export_dir']}",
+        f"Archivos: {summary['jobs']}",
+        f"Exportados: {summary['exported']}",
+        f"Omitidos: {summary['skipped']}",
+        f"Fallidos: {summary['failed']}",
+        f"Tiempo total: {summary['elapsed']:.2f} s",
+        "",
+    ]
+    for r in summary["results"]:
+        if r["error"]:
+            status = f"ERROR {r['error']}"
+        elif r["skipped"]:
+            status = "OMITIDO"
+        else:
+            status = "OK"
+        lines.append(
+            f"{r['elapsed'] * 1000:8.1f} ms  {r['format']:<4} {status}  {r['path']}"
+        )
+    return "\n".join(lines)
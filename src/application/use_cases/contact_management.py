@@ -1,4 +1,9 @@
+import os
+
 from domain.repositories.contact_log_repository import ContactLogRepository
+from infrastructure.repositories.write_behind_contact_log_repository import (
+    WriteBehindContactLogRepository,
+)
 from domain.entities.operation_contact import OperationContact
 from domain.entities.contest_contact import ContestContact
 from domain.entities.contact_log import ContactLog
@@ -6,6 +11,89 @@ from domain.validators import LogValidator
 from domain.contest_rules import ContestRules
 from domain.operation_rules import OperationRules
 from domain.contact_type import ContactType
+from utils.datetime import parse_utc_timestamp, qtr_from_minute
+from application.use_cases import qso_index
+
+# Repositorios con escritura diferida de los logs abiertos, por ruta absoluta
+_contact_writers = {}
+
+
+def open_contact_writer(db_path: str) -> ContactLogRepository:
+    """
+    Activa la escritura diferida de contactos para el log abierto.
+    Como solo hay un log abierto a la vez, cierra (persistiendo) los demás.
+    Recupera del journal los contactos que no alcanzaron a guardarse.
+    """
+    key = os.path.abspath(db_path)
+    for other in [k for k in _contact_writers if k != key]:
+        close_contact_writer(other)
+    if key not in _contact_writers:
+        _contact_writers[key] = WriteBehindContactLogRepository(db_path)
+    return _contact_writers[key]
+
+
+def close_contact_writer(db_path: str) -> None:
+    """
+    Persiste los contactos pendientes del log y desactiva su escritura diferida.
+    """
+    repo = _contact_writers.pop(os.path.abspath(db_path), None)
+    if repo is not None:
+        repo.close()
+
+
+def close_all_contact_writers() -> None:
+    """
+    Persiste y cierra todos los logs con escritura diferida (al salir de la app).
+    """
+    for key in list(_contact_writers):
+        close_contact_writer(key)
+
+
+def flush_contact_writer(db_path: str) -> None:
+    """
+    Garantiza que los contactos pendientes del log estén en disco,
+    p. ej. antes de exportar el archivo.
+    """
+    repo = _contact_writers.get(os.path.abspath(db_path))
+    if repo is not None:
+        repo.flush()
+
+
+def get_contact_repository(db_path: str) -> ContactLogRepository:
+    """
+    Repositorio de contactos del log: el de escritura diferida si el log está
+    abierto, o uno directo sobre el archivo.
+    """
+    return _contact_writers.get(os.path.abspath(db_path)) or ContactLogRepository(
+        db_path
+    )
+
+
+def get_log_contacts(db_path: str, log_id: str) -> list:
+    """
+    Devuelve los contactos del log, incluidos los aún no persistidos.
+    """
+    return get_contact_repository(db_path).get_contacts(log_id)
+
+
+def _apply_qso_index_change(action, *args):
+    try:
+        action(*args)
+    except Exception as e:
+        print(f"No se pudo actualizar el índice de QSOs: {e}")
+
+
+def _sync_qso_index(db_path: str, action, *args):
+    """
+    Aplica un cambio al índice global de QSOs sin afectar la operación principal.
+    Con el log abierto (escritura diferida) lo aplica el hilo escritor, fuera
+    del hilo de la interfaz.
+    """
+    repo = _contact_writers.get(os.path.abspath(db_path))
+    if repo is not None:
+        repo.run_after_write(_apply_qso_index_change, action, *args)
+    else:
+        _apply_qso_index_change(action, *args)
 
 
 def add_contact_to_log(
@@ -19,7 +107,7 @@ def add_contact_to_log(
     contact_data: diccionario con los datos del contacto.
     contact_type: 'operativo' u 'concurso'.
     """
-    repo = ContactLogRepository(db_path)
+    repo = get_contact_repository(db_path)
     # Cargar contactos existentes para validación
     contacts = repo.get_contacts(log_id)
     if contact_type == ContactType.OPERATION:
@@ -39,6 +127,7 @@ def add_contact_to_log(
         raise ValueError("; ".join(errors))
     # Si todo es válido, guardar
     repo.save_contact(log_id, contact)
+    _sync_qso_index(db_path, qso_index.index_contact, db_path, log_id, contact)
     return contact
 
 
@@ -46,8 +135,9 @@ def delete_contact_from_log(db_path: str, contact_id: str):
     """
     Elimina un contacto de un log por su id.
     """
-    repo = ContactLogRepository(db_path)
+    repo = get_contact_repository(db_path)
     repo.delete_contact(contact_id)
+    _sync_qso_index(db_path, qso_index.unindex_contact, db_path, contact_id)
 
 
 def update_contact_in_log(
@@ -60,7 +150,7 @@ def update_contact_in_log(
     """
     Actualiza un contacto existente en un log, validando antes de guardar.
     """
-    repo = ContactLogRepository(db_path)
+    repo = get_contact_repository(db_path)
     contacts = repo.get_contacts(log_id)
     # Crear y validar el nuevo contacto actualizado
     if contact_type == ContactType.OPERATION:
@@ -80,6 +170,7 @@ def update_contact_in_log(
         raise ValueError("; ".join(errors))
     # Si todo es válido, actualizar el registro directamente
     repo.update_contact(contact_id, contact)
+    _sync_qso_index(db_path, qso_index.index_contact, db_path, log_id, contact)
     return contact
 
 
@@ -190,14 +281,9 @@ def get_oa_block_from_utc(timestamp_utc):
     Calcula el bloque horario OA (1 o 2) a partir de un timestamp UTC.
     Retorna (bloque, hora_oa_str)
     """
-    import datetime
-
-    dt_utc = datetime.datetime.fromtimestamp(timestamp_utc, datetime.timezone.utc)
-    dt_oa = dt_utc - datetime.timedelta(hours=5)
-    minute = dt_oa.minute
-    block = 1 if 0 <= minute < 30 else 2
-    hora_oa_str = dt_oa.strftime("%H:%M")
-    return block, hora_oa_str
+    qtr = qtr_from_minute(parse_utc_timestamp(timestamp_utc) // 60)
+    block = 1 if qtr.oa_minute < 30 else 2
+    return block, qtr.oa_time
 
 
 def find_duplicate_in_block(callsign, timestamp, contacts):
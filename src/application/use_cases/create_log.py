@@ -1,4 +1,5 @@
 from datetime import datetime
+from application.use_cases.log_catalog import catalog_log_file
 from application.use_cases.log_file_format import (
     CURRENT_LOG_FILE_FORMAT_VERSION,
     normalize_log_metadata,
@@ -7,7 +8,7 @@ from domain.entities.operation import OperationLog
 from domain.entities.contest import ContestLog
 from domain.repositories.contact_log_repository import ContactLogRepository
 from config.paths import get_log_file_path
-from interface_adapters.ui.view_manager import LogType
+from domain.log_type import LogType
 
 
 def create_log(log_type: LogType, operator_callsign: str, **kwargs):
@@ -66,4 +67,9 @@ def create_log(log_type: LogType, operator_callsign: str, **kwargs):
     repo = ContactLogRepository(db_path)
     repo.save_log(log, log_type.value)
     repo.set_file_format_version(CURRENT_LOG_FILE_FORMAT_VERSION)
+    try:
+        catalog_log_file(db_path)
+    except Exception as e:
+        # El catálogo es un índice auxiliar: nunca debe impedir crear el log
+        print(f"No se pudo indexar el log en el catálogo: {e}")
     return db_path, log
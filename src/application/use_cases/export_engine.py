@@ -0,0 +1,919 @@
+"""
+Motor de exportación de logs.
+
+Lee la cabecera del log una sola vez, recorre los contactos en bloques (sin
+cargarlos todos en memoria) y los entrega a un escritor de formato (TXT, CSV,
+ADIF, Cabrillo, PDF o texto simple). Los formateadores de cada columna se
+preparan una vez por exportación: el idioma, las traducciones y los nombres
+de país se resuelven al inicio o se guardan en caché, en lugar de
+recalcularse en cada celda.
+"""
+
+import csv
+import functools
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+# Locales
+from domain.repositories.contact_log_repository import ContactLogRepository
+from config.paths import format_timestamp_local
+from domain.log_type import LogType
+from domain.callsign_utils import get_country_full_name
+from utils.datetime import format_qtr, parse_utc_timestamp
+from utils.text import normalize_ascii
+from infrastructure.db.connection import open_connection
+from infrastructure.db.queries import get_radio_operator_by_callsign
+from infrastructure.adif.adif_writer import (
+    AdifWriter,
+    format_adif_datetime,
+    format_adif_field,
+    format_adif_fields,
+)
+
+# Contactos leídos por bloque durante la exportación
+EXPORT_CHUNK_SIZE = 1000
+
+# Columnas de las exportaciones tabulares (TXT y CSV); ``{fmt}`` se reemplaza
+# por el formato para obtener la clave de traducción de la cabecera.
+EXPORT_CONTEST_FIELDS = [
+    {"key": "callsign", "translation": "log_contest_export_{fmt}_header_callsign"},
+    {"key": "name", "translation": "log_contest_export_{fmt}_header_name"},
+    {"key": "region", "translation": "log_contest_export_{fmt}_header_region"},
+    {"key": "qtr_oa", "translation": "log_contest_export_{fmt}_header_qtr_oa"},
+    {"key": "rs_rx", "translation": "log_contest_export_{fmt}_header_rs_rx"},
+    {
+        "key": "exchange_received",
+        "translation": "log_contest_export_{fmt}_header_exchange_received",
+    },
+    {"key": "rs_tx", "translation": "log_contest_export_{fmt}_header_rs_tx"},
+    {
+        "key": "exchange_sent",
+        "translation": "log_contest_export_{fmt}_header_exchange_sent",
+    },
+    {"key": "obs", "translation": "log_contest_export_{fmt}_header_observations"},
+]
+EXPORT_OPERATIVE_FIELDS = [
+    {"key": "callsign", "translation": "log_operative_export_{fmt}_header_callsign"},
+    {"key": "name", "translation": "log_operative_export_{fmt}_header_name"},
+    {"key": "country", "translation": "log_operative_export_{fmt}_header_country"},
+    {"key": "region", "translation": "log_operative_export_{fmt}_header_region"},
+    {"key": "station", "translation": "log_operative_export_{fmt}_header_station"},
+    {"key": "energy", "translation": "log_operative_export_{fmt}_header_energy"},
+    {"key": "power", "translation": "log_operative_export_{fmt}_header_power"},
+    {"key": "rs_rx", "translation": "log_operative_export_{fmt}_header_rs_rx"},
+    {"key": "rs_tx", "translation": "log_operative_export_{fmt}_header_rs_tx"},
+    {"key": "qtr_oa", "translation": "log_operative_export_{fmt}_header_qtr_oa"},
+    {"key": "qtr_utc", "translation": "log_operative_export_{fmt}_header_qtr_utc"},
+    {"key": "obs", "translation": "log_operative_export_{fmt}_header_obs"},
+]
+
+# Mapeo de metadata de operativos a banda/modo ADIF
+ADIF_BANDS = {"band_hf": "40M", "band_vhf": "2M", "band_uhf": "70CM"}
+ADIF_MODES = {"mode_lsb": "LSB", "mode_usb": "USB", "mode_fm": "FM"}
+ADIF_CONTEST_FREQUENCIES = {"40M": "7100", "2M": "146000", "70CM": "435000"}
+
+# Cabrillo 3.0: los concursos OA se corren en 40 m, fonía
+CABRILLO_VERSION = "3.0"
+CABRILLO_BAND = "40M"
+CABRILLO_MODE = "SSB"
+CABRILLO_QSO_MODE = "PH"
+CABRILLO_FREQUENCY = ADIF_CONTEST_FREQUENCIES[CABRILLO_BAND]
+
+
+def _get_translation_service(translation_service=None):
+    if translation_service is None:
+        from translation.translation_service import translation_service as ts
+
+        translation_service = ts
+    return translation_service
+
+
+def read_export_header(db_path: str) -> dict:
+    """
+    Lee la cabecera del log (id, tipo, operador, inicio y metadata).
+    """
+    with open_connection(db_path) as conn:
+        c = conn.cursor()
+        c.execute(
+            "SELECT id, type, operator, start_time, end_time, metadata FROM logs LIMIT 1"
+        )
+        row = c.fetchone()
+    if not row:
+        raise FileNotFoundError("No se encontró ningún log en la base de datos.")
+    metadata = {}
+    if row[5]:
+        try:
+            metadata = json.loads(row[5]) or {}
+        except Exception:
+            metadata = {}
+    return {
+        "id": row[0],
+        "log_type": row[1],
+        "operator": row[2] or "",
+        "start_time": row[3],
+        "end_time": row[4],
+        "metadata": metadata if isinstance(metadata, dict) else {},
+    }
+
+
+def build_table_formatters(log_type: str, keys, translation_service=None):
+    """
+    Devuelve una función por columna que convierte un contacto en el texto
+    de esa celda, con el mismo formato que la tabla de la UI.
+    """
+    translation_service = _get_translation_service(translation_service)
+    lang_enum = translation_service.get_language()
+    lang = getattr(lang_enum, "value", str(lang_enum))
+    is_contest = log_type == LogType.CONTEST_LOG.value
+    translated = {}
+    countries = {}
+
+    def qtr_oa(contact):
+        qtr = format_qtr(contact.get("timestamp", None))
+        if not qtr:
+            return ""
+        return qtr.oa_time if is_contest else f"{qtr.oa_time} {qtr.oa_date}"
+
+    def qtr_utc(contact):
+        qtr = format_qtr(contact.get("timestamp", None))
+        return f"{qtr.utc_time} {qtr.utc_date}" if qtr else ""
+
+    def translated_value(key):
+        def formatter(contact):
+            value = contact.get(key, "")
+            text = translated.get(value)
+            if text is None:
+                text = translation_service.tr(value)
+                translated[value] = text
+            return text
+
+        return formatter
+
+    def power(contact):
+        val = contact.get("power", "")
+        return f"{val} W" if val else ""
+
+    def exchange(key):
+        def formatter(contact):
+            val = contact.get(key, "")
+            return str(val).zfill(3) if val else ""
+
+        return formatter
+
+    def country(contact):
+        itu_code = str(contact.get("country", ""))
+        name = countries.get(itu_code)
+        if name is None:
+            name = normalize_ascii(get_country_full_name(itu_code, lang) or itu_code)
+            countries[itu_code] = name
+        return name
+
+    def plain(key):
+        return lambda contact: str(contact.get(key, ""))
+
+    formatters = []
+    for key in keys:
+        if key == "qtr_oa":
+            formatters.append(qtr_oa)
+        elif key == "qtr_utc":
+            formatters.append(qtr_utc)
+        elif key in ("station", "energy"):
+            formatters.append(translated_value(key))
+        elif key == "power":
+            formatters.append(power)
+        elif is_contest and key in ("exchange_received", "exchange_sent"):
+            formatters.append(exchange(key))
+        elif key == "country":
+            formatters.append(country)
+        else:
+            formatters.append(plain(key))
+    return formatters
+
+
+class ExportWriter(ABC):
+    """
+    Escritor de un formato de exportación. El motor llama a ``validate`` y
+    ``begin`` con la cabecera del log, a ``write_contacts`` por cada bloque
+    de contactos y a ``finish`` al terminar (o ``abort`` si hubo un error).
+    Cada formato debe implementar ``begin`` y ``write_contacts``.
+    """
+
+    def __init__(self, export_path: str):
+        self.export_path = export_path
+        self._file = None
+
+    def validate(self, header: dict):
+        pass
+
+    @abstractmethod
+    def begin(self, header: dict):
+        pass
+
+    @abstractmethod
+    def write_contacts(self, contacts):
+        pass
+
+    def finish(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def abort(self):
+        """
+        Cierra y elimina el archivo incompleto.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.export_path):
+            os.remove(self.export_path)
+
+
+class _TableExportWriter(ExportWriter):
+    format_key = ""
+
+    def __init__(self, export_path: str, translation_service=None):
+        super().__init__(export_path)
+        self.translation_service = _get_translation_service(translation_service)
+        self._formatters = []
+
+    def validate(self, header: dict):
+        log_type = header["log_type"]
+        if log_type == LogType.CONTEST_LOG.value:
+            self._fields = EXPORT_CONTEST_FIELDS
+        elif log_type == LogType.OPERATION_LOG.value:
+            self._fields = EXPORT_OPERATIVE_FIELDS
+        else:
+            raise ValueError(f"Tipo de log no soportado para exportación: {log_type}")
+
+    def begin(self, header: dict):
+        self.headers = [
+            self.translation_service.tr(f["translation"].format(fmt=self.format_key))
+            for f in self._fields
+        ]
+        self._formatters = build_table_formatters(
+            header["log_type"],
+            [f["key"] for f in self._fields],
+            self.translation_service,
+        )
+
+    def _format_rows(self, contacts):
+        formatters = self._formatters
+        return [[fmt(contact) for fmt in formatters] for contact in contacts]
+
+
+class TxtExportWriter(_TableExportWriter):
+    """
+    Exportación TXT separada por tabulaciones.
+    """
+
+    format_key = "txt"
+
+    def begin(self, header: dict):
+        super().begin(header)
+        self._file = open(self.export_path, "w", encoding="utf-8")
+        self._file.write("\t".join(self.headers) + "\n")
+
+    def write_contacts(self, contacts):
+        self._file.writelines(
+            "\t".join(row) + "\n" for row in self._format_rows(contacts)
+        )
+
+
+class CsvExportWriter(_TableExportWriter):
+    """
+    Exportación CSV con cabeceras traducidas.
+    """
+
+    format_key = "csv"
+
+    def begin(self, header: dict):
+        super().begin(header)
+        self._file = open(self.export_path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, delimiter=",")
+        self._writer.writerow(self.headers)
+
+    def write_contacts(self, contacts):
+        self._writer.writerows(self._format_rows(contacts))
+
+
+def simple_text_title(metadata: dict, translation_service=None) -> str:
+    """
+    Título del texto simple: tipo de operación, banda, modo y repetidora (o
+    la frecuencia si es simplex o no hay repetidora).
+    """
+    tr = _get_translation_service(translation_service).tr
+    metadata = metadata or {}
+    repeater = tr(metadata["repeater_key"]) if metadata.get("repeater_key") else ""
+    parts = [
+        tr(metadata.get("operation_type", "")),
+        tr(metadata.get("frequency_band", "")),
+        tr(metadata.get("mode_key", "")),
+        (
+            repeater
+            if repeater and repeater != tr("rep_simplex")
+            else metadata.get("frequency", "")
+        ),
+    ]
+    return " ".join(filter(None, parts))
+
+
+def simple_text_callsign_width(contacts) -> int:
+    """
+    Ancho de la columna de indicativo del texto simple, calculado sobre los
+    contactos en memoria. No se toma del índice de QSOs: se actualiza después
+    de la escritura diferida y puede no reflejar ediciones recientes.
+    """
+    return max(
+        (len(str(_contact_data(c).get("callsign", "-"))) for c in contacts),
+        default=10,
+    )
+
+
+def _contact_data(contact) -> dict:
+    # Los contactos en memoria pueden ser dicts o entidades
+    return contact if isinstance(contact, dict) else contact.__dict__
+
+
+class SimpleTextExportWriter(ExportWriter):
+    """
+    Texto simple para copiar o guardar: título, operador y una fila por
+    contacto con número, indicativo y nombre en columnas alineadas. El ancho
+    del indicativo se fija antes de empezar (``callsign_width``), así las
+    filas se escriben en una sola pasada. Con ``output`` se escribe en ese
+    objeto (p. ej. ``io.StringIO``) en lugar de abrir ``export_path``.
+    """
+
+    def __init__(
+        self,
+        export_path: Optional[str] = None,
+        translation_service=None,
+        callsign_width: int = 10,
+        output=None,
+    ):
+        super().__init__(export_path)
+        self.translation_service = _get_translation_service(translation_service)
+        self.callsign_width = callsign_width
+        self._output = output
+        self._number = 0
+
+    def format_header(self, header: dict) -> str:
+        tr = self.translation_service.tr
+        width = self.callsign_width
+        self._number = 0
+        callsign_label = tr("log_operative_table_header_callsign")
+        return "\n".join(
+            [
+                simple_text_title(header.get("metadata"), self.translation_service),
+                f"{tr('operator_label')}: {header.get('operator', '-')}",
+                f"{'Nº':>2}  {callsign_label:<{width}}  "
+                f"{tr('log_operative_table_header_name')}",
+            ]
+        )
+
+    def format_contacts(self, contacts) -> str:
+        """
+        Filas de un bloque de contactos, cada una precedida de salto de línea.
+        """
+        width = self.callsign_width
+        lines = []
+        number = self._number
+        for contact in contacts:
+            data = _contact_data(contact)
+            number += 1
+            lines.append(
+                f"\n{number:2d}  {data.get('callsign', '-'):<{width}}  "
+                f"{data.get('name', '-')}"
+            )
+        self._number = number
+        return "".join(lines)
+
+    def begin(self, header: dict):
+        if self._output is None:
+            self._file = open(self.export_path, "w", encoding="utf-8")
+        self._stream().write(self.format_header(header))
+
+    def write_contacts(self, contacts):
+        self._stream().write(self.format_contacts(contacts))
+
+    def _stream(self):
+        return self._output if self._output is not None else self._file
+
+    def abort(self):
+        if self._output is None:
+            super().abort()
+
+
+def iter_simple_text(
+    header: dict,
+    contacts,
+    translation_service=None,
+    callsign_width: Optional[int] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+):
+    """
+    Genera el texto simple por partes: primero la cabecera y luego las filas
+    de ``chunk_size`` contactos. Unidas forman el texto completo.
+    """
+    if callsign_width is None:
+        callsign_width = simple_text_callsign_width(contacts)
+    writer = SimpleTextExportWriter(
+        translation_service=translation_service, callsign_width=callsign_width
+    )
+    yield writer.format_header(header)
+    for start in range(0, len(contacts), chunk_size):
+        yield writer.format_contacts(contacts[start : start + chunk_size])
+
+
+class AdifExportWriter(ExportWriter):
+    """
+    Exportación ADIF (ADI) con los campos mínimos recomendados.
+    """
+
+    def begin(self, header: dict):
+        self.operator = header["operator"]
+        self.is_contest = header["log_type"] == LogType.CONTEST_LOG.value
+        meta = header["metadata"]
+        if self.is_contest:
+            self.band = "40M"
+            self.mode = "SSB"
+        else:
+            self.band = ADIF_BANDS.get(
+                meta.get("frequency_band", "") or meta.get("band", ""), ""
+            )
+            self.mode = ADIF_MODES.get(
+                meta.get("mode_key", "") or meta.get("mode", ""), ""
+            )
+        # Campos fijos de cada registro, precalculados una vez
+        self._fixed_fields = format_adif_fields(
+            (("BAND", self.band), ("MODE", self.mode), ("OPERATOR", self.operator))
+        )
+        freq = ADIF_CONTEST_FREQUENCIES.get(self.band, "") if self.is_contest else ""
+        self._freq_field = format_adif_field("FREQ", freq) if freq else ""
+        self._file = AdifWriter(self.export_path)
+        self._file.write_header(
+            (("ADIF_VER", "3.1.6"), ("STATION_CALLSIGN", self.operator))
+        )
+
+    def format_record(self, contact) -> str:
+        """
+        Campos de un registro, sin ``<EOR>``.
+        """
+        ts = contact.get("timestamp", None)
+        if ts:
+            qso_date, time_on = format_adif_datetime(parse_utc_timestamp(ts))
+        else:
+            qso_date = ""
+            time_on = ""
+        rst_sent = contact.get("rs_tx", "") or contact.get("exchange_sent", "")
+        rst_rcvd = contact.get("rs_rx", "") or contact.get("exchange_received", "")
+        # Registro ADIF con OPERATOR y, si es concurso, STX_STRING/SRX_STRING
+        entry = (
+            format_adif_field("CALL", contact.get("callsign", ""))
+            + format_adif_field("QSO_DATE", qso_date)
+            + format_adif_field("TIME_ON", time_on)
+            + self._fixed_fields
+            + format_adif_field("RST_SENT", rst_sent)
+            + format_adif_field("RST_RCVD", rst_rcvd)
+        )
+        if self.is_contest:
+            stx_string = str(contact.get("rs_tx", "")).zfill(2) + str(
+                contact.get("exchange_sent", "")
+            ).zfill(3)
+            srx_string = str(contact.get("rs_rx", "")).zfill(2) + str(
+                contact.get("exchange_received", "")
+            ).zfill(3)
+            entry += (
+                self._freq_field
+                + format_adif_field("STX_STRING", stx_string)
+                + format_adif_field("SRX_STRING", srx_string)
+            )
+        return entry
+
+    def write_contacts(self, contacts):
+        self._file.write_records(self.format_record(c) for c in contacts)
+
+
+def cabrillo_contest_id(contest_key: str) -> str:
+    """
+    Identificador CONTEST de Cabrillo a partir de la clave del concurso
+    (``contest_world_radio_day`` -> ``WORLD-RADIO-DAY``), independiente del
+    idioma de la interfaz.
+    """
+    key = contest_key or ""
+    if key.startswith("contest_"):
+        key = key[len("contest_") :]
+    return re.sub(r"[^A-Z0-9]+", "-", normalize_ascii(key)).strip("-")
+
+
+class CabrilloExportWriter(ExportWriter):
+    """
+    Exportación Cabrillo 3.0 para envío de logs de concurso. La cabecera se
+    arma con la metadata del log y los datos del operador; la parte fija de
+    cada línea ``QSO:`` (frecuencia, modo e indicativo propio) se prepara una
+    vez y las líneas se escriben por bloques a medida que se leen. Si algún
+    contacto no tiene fecha y hora válidas la exportación falla al terminar,
+    con la lista de esos contactos, y no deja el archivo.
+    """
+
+    # Indicativos de contactos sin hora listados en el error
+    MAX_REPORTED_INVALID = 10
+
+    def __init__(self, export_path: str, translation_service=None):
+        super().__init__(export_path)
+        self.translation_service = _get_translation_service(translation_service)
+        self.invalid_contacts = []
+
+    def validate(self, header: dict):
+        if header["log_type"] != LogType.CONTEST_LOG.value:
+            raise ValueError(
+                "Exportación a Cabrillo solo soportada para logs de concurso."
+            )
+
+    def build_header(self, header: dict) -> list:
+        """
+        Líneas de cabecera de Cabrillo (sin ``QSO:``), en ASCII.
+        """
+        try:
+            from version import APP_VERSION, APP_NAME
+
+            created_by = f"{APP_NAME} v{str(APP_VERSION).lstrip().lstrip('vV')}"
+        except Exception:
+            created_by = "Logger OA"
+        operator = header["operator"]
+        op_data = get_radio_operator_by_callsign(operator)
+        contest_key = header["metadata"].get("contest_name_key", "")
+        fields = [
+            ("START-OF-LOG", CABRILLO_VERSION),
+            ("CREATED-BY", created_by),
+            ("CONTEST", cabrillo_contest_id(contest_key)),
+            ("CALLSIGN", operator),
+            ("CATEGORY-OPERATOR", "SINGLE-OP"),
+            ("CATEGORY-TRANSMITTER", "ONE"),
+            ("CATEGORY-BAND", CABRILLO_BAND),
+            ("CATEGORY-MODE", CABRILLO_MODE),
+            ("OPERATORS", operator),
+        ]
+        if op_data:
+            fields += [
+                ("NAME", normalize_ascii(op_data[1] or "")),
+                ("LOCATION", normalize_ascii(op_data[4] or "")),
+                # Categoría de licencia OA (NOVICIO, INTERMEDIO, SUPERIOR)
+                ("X-OA-CATEGORY", normalize_ascii(op_data[2] or "")),
+            ]
+        return [f"{tag}: {value}".rstrip() for tag, value in fields]
+
+    def begin(self, header: dict):
+        self.operator = header["operator"]
+        # Parte fija de cada QSO: frecuencia, modo e indicativo propio
+        self._qso_prefix = f"QSO: {CABRILLO_FREQUENCY:>5} {CABRILLO_QSO_MODE} "
+        self._sent_call = f"{self.operator:<13}"
+        # Cabrillo exige fin de línea CR/LF
+        self._file = open(
+            self.export_path, "w", encoding="ascii", errors="replace", newline="\r\n"
+        )
+        self._file.writelines(line + "\n" for line in self.build_header(header))
+
+    @staticmethod
+    def _exchange(contact, key):
+        val = contact.get(key, "")
+        return str(val).zfill(3) if val else ""
+
+    def format_qso(self, contact) -> str:
+        """
+        Línea ``QSO:`` de un contacto, con las columnas del modelo Cabrillo:
+        frecuencia, modo, fecha, hora UTC, indicativo, RS e intercambio
+        enviados y recibidos. Devuelve None si el contacto no tiene fecha y
+        hora válidas (los validadores de Cabrillo rechazan esas columnas vacías).
+        """
+        try:
+            qtr = format_qtr(contact.get("timestamp", None))
+        except (TypeError, ValueError):
+            qtr = None
+        if not qtr:
+            return None
+        when = f"{qtr.utc_iso_date} {qtr.utc_time.replace(':', '')}"
+        call = normalize_ascii(contact.get("callsign", ""))
+        rs_tx = str(contact.get("rs_tx", ""))
+        rs_rx = str(contact.get("rs_rx", ""))
+        sent = self._exchange(contact, "exchange_sent")
+        received = self._exchange(contact, "exchange_received")
+        return (
+            f"{self._qso_prefix}{when:<15} {self._sent_call} {rs_tx:<3} {sent:<6} "
+            f"{call:<13} {rs_rx:<3} {received}"
+        ).rstrip()
+
+    def write_contacts(self, contacts):
+        format_qso = self.format_qso
+        lines = []
+        for contact in contacts:
+            line = format_qso(contact)
+            if line is None:
+                self.invalid_contacts.append(contact)
+            else:
+                lines.append(line + "\n")
+        self._file.writelines(lines)
+
+    def finish(self):
+        if self.invalid_contacts:
+            calls = [
+                str(c.get("callsign", "") or "?")
+                for c in self.invalid_contacts[: self.MAX_REPORTED_INVALID]
+            ]
+            extra = len(self.invalid_contacts) - len(calls)
+            if extra > 0:
+                calls.append(f"y {extra} más")
+            raise ValueError(
+                "Hay contactos sin fecha u hora válidas; Cabrillo las exige: "
+                + ", ".join(calls)
+            )
+        if self._file is not None:
+            self._file.write("END-OF-LOG:\n")
+        super().finish()
+
+
+# Geometría de la planilla PDF (puntos). La cabecera y cada página de
+# contactos se dibujan en la misma posición que tenía el documento original
+# de una sola tabla: márgenes de 20 mm más el relleno del marco de reportlab.
+PDF_MARGIN_MM = 20
+PDF_FRAME_PADDING = 6
+PDF_HEADER_SPACER = 12
+PDF_ROW_HEIGHT = 18  # Helvetica 10 (interlineado 12) + relleno 3 + 3
+PDF_LINE_HEIGHT = 12  # Cada línea extra de observaciones agranda la fila
+PDF_COLUMNS = ["Nº", "QTR", "ESTACIÓN", "ENVIADO", "RECIBIDO", "OBSERVACIONES"]
+PDF_COLUMN_RATIOS = [0.07, 0.15, 0.18, 0.18, 0.18, 0.24]
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_table_styles():
+    """
+    Estilos de la cabecera y de las tablas de contactos. Se crean una vez por
+    proceso y se comparten entre todas las páginas (y exportaciones).
+    """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    header_style = TableStyle(
+        [
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 0), (-1, -1), 11),
+        ]
+    )
+    contacts_style = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ]
+    )
+    return header_style, contacts_style
+
+
+class PdfExportWriter(ExportWriter):
+    """
+    Exportación PDF con formato de planilla de concursos OA-HF.
+    Los contactos se dibujan por páginas: cada página es una tabla pequeña
+    con su fila de títulos, que se dibuja y libera en cuanto se completa, de
+    modo que el costo de maquetación es lineal y la memoria no crece con el
+    tamaño del log. reportlab se importa solo al exportar.
+    """
+
+    def __init__(self, export_path: str, translation_service=None):
+        super().__init__(export_path)
+        self.translation_service = _get_translation_service(translation_service)
+
+    def validate(self, header: dict):
+        # Solo soporta logs de concurso
+        if header["log_type"] != LogType.CONTEST_LOG.value:
+            raise ValueError("Exportación a PDF solo soportada para logs de concurso.")
+
+    def begin(self, header: dict):
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import mm
+        from reportlab.pdfgen.canvas import Canvas
+        from reportlab.platypus import Table
+
+        self._table_class = Table
+        self.operator = header["operator"]
+        op_data = get_radio_operator_by_callsign(self.operator)
+        op_name = op_data[1] if op_data else ""
+        op_category = op_data[2] if op_data else ""
+        op_region = op_data[4] if op_data else ""
+        contest_key = header["metadata"].get("contest_name_key", "")
+        contest_name = self.translation_service.tr(contest_key) if contest_key else ""
+        fecha = format_timestamp_local(header["start_time"])
+        cabecera_labels = [
+            "CONCURSO:",
+            "Fecha:",
+            "Indicativo:",
+            "Categoría:",
+            "Nombre:",
+            "QTH:",
+        ]
+        cabecera_values = [
+            contest_name,
+            fecha,
+            self.operator,
+            op_category,
+            op_name,
+            op_region,
+        ]
+        cabecera_table = [
+            [label, value] for label, value in zip(cabecera_labels, cabecera_values)
+        ]
+        header_style, self._contacts_style = _pdf_table_styles()
+
+        margin = PDF_MARGIN_MM * mm
+        page_width = A4[0] - 2 * margin
+        self._col_widths = [page_width * r for r in PDF_COLUMN_RATIOS]
+        self._x = margin
+        self._top = A4[1] - margin - PDF_FRAME_PADDING
+        frame_height = A4[1] - 2 * margin - 2 * PDF_FRAME_PADDING
+
+        self._file = Canvas(self.export_path, pagesize=A4)
+        # Cabecera con cuadrícula, solo en la primera página
+        t_cabecera = Table(
+            cabecera_table,
+            colWidths=[page_width * 0.25, page_width * 0.75],
+            style=header_style,
+        )
+        _, cabecera_height = t_cabecera.wrapOn(self._file, page_width, frame_height)
+        t_cabecera.drawOn(self._file, self._x, self._top - cabecera_height)
+        first_offset = cabecera_height + PDF_HEADER_SPACER
+        # Alto para filas de contactos por página (sin la fila de títulos)
+        first_space = frame_height - first_offset - PDF_ROW_HEIGHT
+        self._page_space = frame_height - PDF_ROW_HEIGHT
+        # Filas de una línea que entran en cada página
+        self._first_page_rows = max(1, int(first_space // PDF_ROW_HEIGHT))
+        self._page_rows_capacity = int(self._page_space // PDF_ROW_HEIGHT)
+        # Una fila no puede ser más alta que una página
+        self._max_obs_lines = 1 + int(
+            (self._page_space - PDF_ROW_HEIGHT) // PDF_LINE_HEIGHT
+        )
+        self._page_top = self._top - first_offset
+        self._space = first_space
+        self._page = []
+        self._row_heights = []
+        self._pages_drawn = 0
+        self._index = 1
+
+    @staticmethod
+    def _exchange(contact, rs_key, exchange_key):
+        try:
+            exchange_num = int(contact.get(exchange_key, 0))
+        except Exception:
+            exchange_num = 0
+        return str(contact.get(rs_key, "")).zfill(2) + str(exchange_num).zfill(3)
+
+    def _draw_page(self):
+        """
+        Dibuja la tabla de la página en curso. Las páginas siguientes a la
+        primera empiezan en el borde superior del marco.
+        """
+        if self._pages_drawn:
+            self._file.showPage()
+            self._page_top = self._top
+        rows = [PDF_COLUMNS] + self._page
+        row_heights = [PDF_ROW_HEIGHT] + self._row_heights
+        table = self._table_class(
+            rows,
+            colWidths=self._col_widths,
+            rowHeights=row_heights,
+            style=self._contacts_style,
+        )
+        height = sum(row_heights)
+        table.wrapOn(self._file, sum(self._col_widths), height)
+        table.drawOn(self._file, self._x, self._page_top - height)
+        self._page = []
+        self._row_heights = []
+        self._pages_drawn += 1
+        self._space = self._page_space
+
+    def _obs_lines(self, contact):
+        lines = str(contact.get("obs", "")).splitlines() or [""]
+        if len(lines) > self._max_obs_lines:
+            # La fila no entraría en una página: se recortan las últimas líneas
+            lines = lines[: self._max_obs_lines - 1] + ["…"]
+        return lines
+
+    def write_contacts(self, contacts):
+        idx = self._index
+        for contact in contacts:
+            qtr = format_qtr(contact.get("timestamp", None))
+            obs_lines = self._obs_lines(contact)
+            height = PDF_ROW_HEIGHT + PDF_LINE_HEIGHT * (len(obs_lines) - 1)
+            if self._page and height > self._space:
+                self._draw_page()
+            self._page.append(
+                [
+                    str(idx),
+                    qtr.oa_time if qtr else "",
+                    contact.get("callsign", self.operator),
+                    self._exchange(contact, "rs_tx", "exchange_sent"),
+                    self._exchange(contact, "rs_rx", "exchange_received"),
+                    "\n".join(obs_lines),
+                ]
+            )
+            self._row_heights.append(height)
+            self._space -= height
+            idx += 1
+        self._index = idx
+
+    def finish(self):
+        if self._file is None:
+            return
+        if self._page or not self._pages_drawn:
+            self._draw_page()
+        self._file.save()
+        self._file = None
+
+    def abort(self):
+        # El canvas solo crea el archivo al guardarse
+        self._file = None
+        super().abort()
+
+
+# Escritores por extensión de archivo
+EXPORT_WRITERS = {
+    "txt": TxtExportWriter,
+    "csv": CsvExportWriter,
+    "adi": AdifExportWriter,
+    "cbr": CabrilloExportWriter,
+    "pdf": PdfExportWriter,
+}
+
+
+def run_export(
+    db_path: str,
+    writer: ExportWriter,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> str:
+    """
+    Exporta el log con el escritor indicado, en una sola pasada sobre los
+    contactos. ``progress_callback`` recibe (contactos escritos, total) tras
+    cada bloque. Devuelve la ruta del archivo generado.
+    """
+    from application.use_cases.contact_management import flush_contact_writer
+
+    # Los contactos aún pendientes del log abierto deben estar en disco
+    flush_contact_writer(db_path)
+    header = read_export_header(db_path)
+    writer.validate(header)
+    repo = ContactLogRepository(db_path)
+    total = repo.count_contacts(header["id"])
+    if total == 0:
+        raise ValueError("No hay contactos para exportar.")
+    return _write_export(
+        writer,
+        header,
+        repo.iter_contacts(header["id"], chunk_size),
+        total,
+        progress_callback,
+    )
+
+
+def export_contacts(
+    header: dict,
+    contacts,
+    writer: ExportWriter,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> str:
+    """
+    Igual que ``run_export`` pero a partir de contactos ya en memoria (p. ej.
+    los del log abierto), recorridos en bloques de ``chunk_size``.
+    """
+    writer.validate(header)
+    chunks = (
+        contacts[start : start + chunk_size]
+        for start in range(0, len(contacts), chunk_size)
+    )
+    return _write_export(writer, header, chunks, len(contacts), progress_callback)
+
+
+def _write_export(writer, header, chunks, total, progress_callback):
+    writer.begin(header)
+    written = 0
+    try:
+        for contacts in chunks:
+            writer.write_contacts(contacts)
+            written += len(contacts)
+            if progress_callback is not None:
+                # Los contactos guardados durante la exportación también se incluyen
+                total = max(total, written)
+                progress_callback(written, total)
+        writer.finish()
+    except Exception:
+        writer.abort()
+        raise
+    return writer.export_path
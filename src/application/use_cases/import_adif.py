@@ -0,0 +1,205 @@
+"""
+Caso de uso: Importar un archivo ADIF (ADI) a un log nuevo o existente.
+
+El archivo se recorre en streaming (ver ``infrastructure.adif.adif_reader``) y
+los contactos se guardan por bloques con ``save_contacts_bulk``, en una
+transacción por bloque, de modo que archivos de 100k+ QSOs se importan sin
+cargarlos completos en memoria. Los contactos ya presentes en el log (mismo
+indicativo y hora) se omiten.
+"""
+
+import itertools
+import time
+from typing import Callable, Dict, Optional
+
+from application.use_cases.contact_management import (
+    flush_contact_writer,
+    get_contact_repository,
+    get_oa_block_from_utc,
+)
+from application.use_cases.create_log import create_log
+from application.use_cases.export_engine import read_export_header
+from application.use_cases.log_file_format import normalize_contact
+from application.use_cases.qso_index import index_log_file
+from domain.callsign_utils import callsign_to_country
+from infrastructure.adif.adif_reader import AdifReader
+from infrastructure.adif.adif_writer import parse_adif_datetime
+from domain.log_type import LogType
+from utils.datetime import parse_utc_timestamp
+
+# Contactos guardados por transacción durante la importación
+ADIF_IMPORT_CHUNK_SIZE = 2000
+
+
+def _split_exchange(value: str):
+    """
+    Separa un STX_STRING/SRX_STRING exportado por la app (RS + intercambio de
+    3 dígitos, p. ej. ``59012``) en (rs, intercambio).
+    """
+    value = (value or "").strip()
+    if len(value) > 3 and value.isdigit():
+        return value[:-3], value[-3:].lstrip("0") or "0"
+    return "", value
+
+
+def adif_record_to_contact(
+    record: Dict[str, str], log_type: str, country_cache: Optional[dict] = None
+) -> Optional[dict]:
+    """
+    Convierte un registro ADIF en un contacto del log (sin normalizar).
+    Devuelve None si el registro no tiene indicativo o fecha válidos.
+    """
+    callsign = record.get("CALL", "").strip().upper()
+    timestamp = parse_adif_datetime(
+        record.get("QSO_DATE", ""), record.get("TIME_ON", "")
+    )
+    if not callsign or timestamp is None:
+        return None
+    contact = {"callsign": callsign, "timestamp": timestamp}
+    name = record.get("NAME", "").strip()
+    if name:
+        contact["name"] = name
+    obs = (record.get("COMMENT") or record.get("NOTES") or "").strip()
+    if obs:
+        contact["obs"] = obs
+    rs_rx = record.get("RST_RCVD", "").strip()
+    rs_tx = record.get("RST_SENT", "").strip()
+    if log_type == LogType.CONTEST_LOG.value:
+        if record.get("SRX_STRING"):
+            rs, exchange = _split_exchange(record["SRX_STRING"])
+            rs_rx = rs or rs_rx
+        else:
+            exchange = record.get("SRX", "").strip()
+        contact["exchange_received"] = exchange
+        if record.get("STX_STRING"):
+            rs, exchange = _split_exchange(record["STX_STRING"])
+            rs_tx = rs or rs_tx
+        else:
+            exchange = record.get("STX", "").strip()
+        contact["exchange_sent"] = exchange
+        contact["block"] = get_oa_block_from_utc(timestamp)[0]
+    else:
+        power = record.get("TX_PWR", "").strip()
+        if power:
+            try:
+                power = str(int(float(power)))
+            except ValueError:
+                pass
+            contact["power"] = power
+        if country_cache is None:
+            country_cache = {}
+        if callsign not in country_cache:
+            country_cache[callsign] = callsign_to_country(callsign) or "-"
+        contact["country"] = country_cache[callsign]
+        region = record.get("STATE", "").strip()
+        if region:
+            contact["region"] = region
+    contact["rs_rx"] = rs_rx
+    contact["rs_tx"] = rs_tx
+    return contact
+
+
+def _operator_from_adif(reader: AdifReader, record: Dict[str, str]) -> str:
+    for source in (reader.header, record):
+        for field in ("STATION_CALLSIGN", "OPERATOR"):
+            value = source.get(field, "").strip().upper()
+            if value:
+                return value
+    return ""
+
+
+def import_adif_file(
+    adif_path: str,
+    db_path: Optional[str] = None,
+    log_type: LogType = LogType.OPERATION_LOG,
+    operator: Optional[str] = None,
+    chunk_size: int = ADIF_IMPORT_CHUNK_SIZE,
+    catalog_path: Optional[str] = None,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    **log_kwargs,
+) -> dict:
+    """
+    Importa un archivo ADI.
+
+    Si ``db_path`` es None se crea un log nuevo del tipo ``log_type`` (con
+    ``log_kwargs`` para ``create_log``); el operador se toma de ``operator``
+    o de STATION_CALLSIGN/OPERATOR del archivo. Si se indica ``db_path``, los
+    contactos se agregan a ese log. ``progress_callback`` recibe la cantidad
+    de registros leídos después de cada bloque.
+
+    Devuelve dict con: db_path, log_id, records, imported, duplicates,
+    invalid y elapsed.
+    """
+    started = time.perf_counter()
+    reader = AdifReader(adif_path)
+    records = iter(reader)
+    first = next(records, None)
+    seen = set()
+    if db_path is None:
+        operator = (operator or "").strip().upper()
+        if not operator and first is not None:
+            operator = _operator_from_adif(reader, first)
+        if not operator:
+            raise ValueError("No se pudo determinar el operador del archivo ADIF.")
+        db_path, log = create_log(log_type, operator, **log_kwargs)
+        log_id = log.id
+        log_type_value = log_type.value
+    else:
+        # Los contactos en escritura diferida deben contar como duplicados
+        flush_contact_writer(db_path)
+        header = read_export_header(db_path)
+        log_id = header["id"]
+        log_type_value = header["log_type"]
+    repo = get_contact_repository(db_path)
+    if first is not None:
+        for contacts in repo.iter_contacts(log_id):
+            for c in contacts:
+                try:
+                    timestamp = parse_utc_timestamp(c.get("timestamp"))
+                except ValueError:
+                    continue
+                seen.add((str(c.get("callsign", "")).upper(), timestamp))
+
+    summary = {
+        "db_path": db_path,
+        "log_id": log_id,
+        "records": 0,
+        "imported": 0,
+        "duplicates": 0,
+        "invalid": 0,
+        "elapsed": 0.0,
+    }
+    country_cache = {}
+    batch = []
+
+    def _flush_batch():
+        summary["imported"] += repo.save_contacts_bulk(log_id, batch)
+        batch.clear()
+        if progress_callback:
+            progress_callback(summary["records"])
+
+    if first is not None:
+        for record in itertools.chain((first,), records):
+            summary["records"] += 1
+            contact = adif_record_to_contact(record, log_type_value, country_cache)
+            if contact is None:
+                summary["invalid"] += 1
+                continue
+            key = (contact["callsign"], contact["timestamp"])
+            if key in seen:
+                summary["duplicates"] += 1
+                continue
+            seen.add(key)
+            batch.append(normalize_contact(log_type_value, contact))
+            if len(batch) >= chunk_size:
+                _flush_batch()
+        _flush_batch()
+
+    if summary["imported"]:
+        try:
+            index_log_file(db_path, catalog_path)
+        except Exception as e:
+            # El índice es auxiliar: nunca debe impedir la importación
+            print(f"No se pudo actualizar el índice de QSOs: {e}")
+    summary["elapsed"] = time.perf_counter() - started
+    return summary
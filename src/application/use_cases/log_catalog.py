@@ -0,0 +1,148 @@
+"""
+Caso de uso: Catálogo de logs.
+
+Mantiene actualizado el índice de archivos de log y expone consultas rápidas
+por operador, tipo, concurso y rango de fechas. La actualización es
+incremental: solo se vuelven a leer los archivos cuyo mtime o tamaño cambió.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from config.defaults import CONTESTS_DIR, OPERATIONS_DIR
+from config.paths import get_log_dir
+from domain.entities.log_catalog_entry import LogCatalogEntry
+from infrastructure.db import log_catalog
+from domain.log_type import LogType
+
+LOG_TYPE_FOLDERS = {
+    LogType.OPERATION_LOG: OPERATIONS_DIR,
+    LogType.CONTEST_LOG: CONTESTS_DIR,
+}
+
+
+def get_log_folders(log_type: Optional[LogType] = None) -> List[str]:
+    """
+    Devuelve las carpetas donde se guardan los logs del tipo indicado
+    (o de todos los tipos si no se indica).
+    """
+    if log_type is None:
+        return [os.path.join(get_log_dir(), f) for f in LOG_TYPE_FOLDERS.values()]
+    if log_type not in LOG_TYPE_FOLDERS:
+        raise ValueError(f"Tipo de log no soportado: {log_type}")
+    return [os.path.join(get_log_dir(), LOG_TYPE_FOLDERS[log_type])]
+
+
+def _scan_folders(folders: List[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Lista los archivos .sqlite de las carpetas con su firma (mtime_ns, tamaño).
+    """
+    files = {}
+    for folder in folders:
+        if not os.path.isdir(folder):
+            continue
+        with os.scandir(folder) as it:
+            for entry in it:
+                if not entry.name.endswith(log_catalog.LOG_FILE_EXTENSION):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def refresh_log_catalog(
+    folders: Optional[List[str]] = None, catalog_path: Optional[str] = None
+) -> dict:
+    """
+    Sincroniza el catálogo con los archivos presentes en las carpetas de logs.
+    Devuelve un resumen con las claves: scanned, updated, removed, unchanged.
+    """
+    folders = [os.path.abspath(f) for f in (folders or get_log_folders())]
+    files = _scan_folders(folders)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        known = log_catalog.get_signatures(conn)
+        changed = [
+            log_catalog.read_log_summary(path, mtime_ns, size)
+            for path, (mtime_ns, size) in files.items()
+            if known.get(path) != (mtime_ns, size)
+        ]
+        prefixes = tuple(os.path.join(folder, "") for folder in folders)
+        stale = [
+            path for path in known if path.startswith(prefixes) and path not in files
+        ]
+        log_catalog.upsert_entries(conn, changed)
+        log_catalog.delete_entries(conn, stale)
+        conn.commit()
+    finally:
+        conn.close()
+    return {
+        "scanned": len(files),
+        "updated": len(changed),
+        "removed": len(stale),
+        "unchanged": len(files) - len(changed),
+    }
+
+
+def catalog_log_file(
+    db_path: str, catalog_path: Optional[str] = None
+) -> Optional[LogCatalogEntry]:
+    """
+    Indexa (o reindexa) un único archivo de log, p. ej. al crearlo o cerrarlo.
+    Si el archivo ya no existe, elimina su entrada y devuelve None.
+    """
+    db_path = os.path.abspath(db_path)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        try:
+            stat = os.stat(db_path)
+        except FileNotFoundError:
+            log_catalog.delete_entries(conn, [db_path])
+            conn.commit()
+            return None
+        entry = log_catalog.read_log_summary(db_path, stat.st_mtime_ns, stat.st_size)
+        log_catalog.upsert_entries(conn, [entry])
+        conn.commit()
+        return entry
+    finally:
+        conn.close()
+
+
+def find_logs(
+    log_type: Optional[LogType] = None,
+    operator: Optional[str] = None,
+    contest_key: Optional[str] = None,
+    start_from: Optional[int] = None,
+    start_to: Optional[int] = None,
+    refresh: bool = True,
+    folders: Optional[List[str]] = None,
+    catalog_path: Optional[str] = None,
+) -> List[LogCatalogEntry]:
+    """
+    Busca logs en el catálogo. Por defecto refresca antes de consultar
+    (solo se leen los archivos modificados).
+    Los logs más recientes se devuelven primero.
+    """
+    if folders is None:
+        folders = get_log_folders(log_type)
+    folders = [os.path.abspath(f) for f in folders]
+    if refresh:
+        refresh_log_catalog(folders, catalog_path)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        return log_catalog.query_entries(
+            conn,
+            log_type=log_type.value if log_type else None,
+            operator=operator,
+            contest_key=contest_key,
+            start_from=start_from,
+            start_to=start_to,
+            paths_under=folders,
+        )
+    finally:
+        conn.close()
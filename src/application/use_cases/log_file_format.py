@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, Dict, Tuple
 
-from interface_adapters.ui.view_manager import LogType
+from domain.log_type import LogType
 from utils.datetime import parse_utc_timestamp
 
 
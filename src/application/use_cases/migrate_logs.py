@@ -0,0 +1,199 @@
+"""
+Caso de uso: Migración y validación masiva de archivos de log.
+
+``open_log`` migra cada log de forma perezosa al abrirlo. Este módulo permite
+actualizar de una vez todo un archivo histórico de logs: recorre los
+``.sqlite`` bajo ``BASE_PATH``, aplica ``normalize_log_payload`` y
+``normalize_contact`` en un pool de procesos y escribe cada archivo en una
+única transacción, devolviendo un resumen por archivo.
+"""
+
+import json
+import os
+import time
+from typing import Callable, Iterable, List, Optional
+
+from application.use_cases.log_file_format import (
+    CURRENT_LOG_FILE_FORMAT_VERSION,
+    normalize_contact,
+    normalize_log_payload,
+)
+from config.paths import BASE_PATH
+from infrastructure.db.connection import connect
+from domain.log_type import LogType
+from utils.parallel import create_executor
+
+LOG_FILE_EXTENSION = ".sqlite"
+SUPPORTED_LOG_TYPES = {LogType.OPERATION_LOG.value, LogType.CONTEST_LOG.value}
+
+
+def find_log_files(root: Optional[str] = None) -> List[str]:
+    """
+    Busca recursivamente archivos de log ``.sqlite`` bajo ``root`` (por defecto BASE_PATH).
+    """
+    root = root or BASE_PATH
+    found = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith(LOG_FILE_EXTENSION):
+                found.append(os.path.join(dirpath, filename))
+    return sorted(found)
+
+
+def migrate_log_file(db_path: str, dry_run: bool = False) -> dict:
+    """
+    Valida y migra un archivo de log al formato actual en una sola transacción.
+    Si ocurre cualquier error, el archivo queda sin cambios.
+
+    Devuelve dict con: path, log_type, contacts, rewritten, invalid,
+    header_updated, version_before, error, elapsed.
+    """
+    started = time.perf_counter()
+    result = {
+        "path": db_path,
+        "log_type": "",
+        "contacts": 0,
+        "rewritten": 0,
+        "invalid": 0,
+        "header_updated": False,
+        "version_before": 0,
+        "error": None,
+        "elapsed": 0.0,
+    }
+    conn = None
+    try:
+        if not os.path.isfile(db_path):
+            raise FileNotFoundError(f"No existe el archivo de log: {db_path}")
+        conn = connect(db_path, isolation_level=None)
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute("PRAGMA user_version").fetchone()
+        version_before = int(row[0]) if row and row[0] is not None else 0
+        result["version_before"] = version_before
+        row = conn.execute(
+            "SELECT id, type, operator, start_time, end_time, metadata FROM logs LIMIT 1"
+        ).fetchone()
+        if not row:
+            raise ValueError("No se encontró ningún log en la base de datos.")
+        log_id, log_type = row[0], row[1]
+        result["log_type"] = log_type
+        if log_type not in SUPPORTED_LOG_TYPES:
+            raise ValueError(f"Tipo de log no soportado: {log_type}")
+        original_metadata = json.loads(row[5]) if row[5] else {}
+        start_time, end_time, metadata = normalize_log_payload(
+            log_type, row[3], row[4], original_metadata
+        )
+        if row[3] != start_time or row[4] != end_time or metadata != original_metadata:
+            conn.execute(
+                "UPDATE logs SET start_time = ?, end_time = ?, metadata = ? WHERE id = ?",
+                (start_time, end_time, json.dumps(metadata), log_id),
+            )
+            result["header_updated"] = True
+
+        updates = []
+        for contact_id, data in conn.execute(
+            "SELECT id, data FROM contacts WHERE log_id = ?", (log_id,)
+        ).fetchall():
+            result["contacts"] += 1
+            try:
+                contact = json.loads(data)
+            except (TypeError, ValueError):
+                result["invalid"] += 1
+                continue
+            if not isinstance(contact, dict):
+                result["invalid"] += 1
+                continue
+            if not contact.get("id"):
+                contact["id"] = contact_id
+            try:
+                migrated = normalize_contact(log_type, contact)
+            except ValueError:
+                result["invalid"] += 1
+                continue
+            if migrated != contact:
+                updates.append((json.dumps(migrated), contact_id))
+        if updates:
+            conn.executemany("UPDATE contacts SET data = ? WHERE id = ?", updates)
+        result["rewritten"] = len(updates)
+
+        if version_before < CURRENT_LOG_FILE_FORMAT_VERSION:
+            conn.execute(
+                f"PRAGMA user_version = {int(CURRENT_LOG_FILE_FORMAT_VERSION)}"
+            )
+            result["header_updated"] = True
+
+        conn.execute("ROLLBACK" if dry_run else "COMMIT")
+    except Exception as e:
+        if conn is not None and conn.in_transaction:
+            conn.execute("ROLLBACK")
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if conn is not None:
+            conn.close()
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def _migrate_worker(args):
+    db_path, dry_run = args
+    return migrate_log_file(db_path, dry_run)
+
+
+def migrate_log_archive(
+    root: Optional[str] = None,
+    paths: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Migra en paralelo todos los logs bajo ``root`` (o la lista ``paths``).
+    ``progress_callback`` recibe el resultado de cada archivo a medida que termina.
+
+    Devuelve dict con: files, contacts, rewritten, invalid, failed,
+    elapsed y results (lista por archivo).
+    """
+    started = time.perf_counter()
+    paths = list(paths) if paths is not None else find_log_files(root)
+    results = []
+    if paths:
+        with create_executor(max_workers) as executor:
+            for result in executor.map(
+                _migrate_worker, [(p, dry_run) for p in paths], chunksize=4
+            ):
+                results.append(result)
+                if progress_callback:
+                    progress_callback(result)
+    return {
+        "files": len(results),
+        "contacts": sum(r["contacts"] for r in results),
+        "rewritten": sum(r["rewritten"] for r in results),
+        "invalid": sum(r["invalid"] for r in results),
+        "failed": sum(1 for r in results if r["error"]),
+        "dry_run": dry_run,
+        "elapsed": time.perf_counter() - started,
+        "results": results,
+    }
+
+
+def format_migration_report(summary: dict) -> str:
+    """
+    Genera un reporte de texto plano con el resumen y el detalle por archivo.
+    """
+    lines = [
+        "Migración de logs" + (" (simulación)" if summary.get("dry_run") else ""),
+        f"Archivos: {summary['files']}",
+        f"Contactos: {summary['contacts']}",
+        f"Reescritos: {summary['rewritten']}",
+        f"Inválidos: {summary['invalid']}",
+        f"Fallidos: {summary['failed']}",
+        f"Tiempo total: {summary['elapsed']:.2f} s",
+        "",
+    ]
+    for r in summary["results"]:
+        status = f"ERROR {r['error']}" if r["error"] else "OK"
+        lines.append(
+            f"{r['elapsed'] * 1000:8.1f} ms  v{r['version_before']}  "
+            f"{r['contacts']:6d} contactos  {r['rewritten']:6d} reescritos  "
+            f"{status}  {r['path']}"
+        )
+    return "\n".join(lines)
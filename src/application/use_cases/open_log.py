@@ -1,44 +1,71 @@
-import os
 import json
-import sqlite3
+from typing import Optional
 from application.use_cases.log_file_format import (
     CURRENT_LOG_FILE_FORMAT_VERSION,
     normalize_contact,
     normalize_log_payload,
 )
 from domain.repositories.contact_log_repository import ContactLogRepository
+from infrastructure.repositories.write_behind_contact_log_repository import (
+    recover_journal,
+)
 from domain.entities.operation import OperationLog
 from domain.entities.contest import ContestLog
-from config.defaults import OPERATIONS_DIR, CONTESTS_DIR
-from config.paths import BASE_PATH
-from interface_adapters.ui.view_manager import LogType
+from application.use_cases.log_catalog import find_logs
+from application.use_cases.contact_management import close_contact_writer
+from domain.log_type import LogType
+from infrastructure.db.connection import open_connection
 
 
 def list_log_files(log_type: LogType) -> list:
     """
     Lista los archivos de logs disponibles para el tipo dado (LogType Enum).
+    Usa el catálogo indexado: solo se releen los archivos modificados.
+    """
+    return [entry.path for entry in find_logs(log_type=log_type)]
+
+
+# Contactos que se cargan de forma síncrona en la apertura progresiva
+OPEN_LOG_FIRST_PAGE_SIZE = 200
+# Tamaño de los bloques que se cargan luego en segundo plano
+OPEN_LOG_STREAM_CHUNK_SIZE = 500
+
+
+def _normalize_contacts(repo, log_type: str, contacts: list) -> list:
     """
-    if log_type == LogType.OPERATION_LOG:
-        folder = os.path.join(BASE_PATH, OPERATIONS_DIR)
-    elif log_type == LogType.CONTEST_LOG:
-        folder = os.path.join(BASE_PATH, CONTESTS_DIR)
-    else:
-        raise ValueError(f"Tipo de log no soportado: {log_type}")
-    if not os.path.exists(folder):
-        return []
-    return [
-        os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".sqlite")
-    ]
+    Normaliza contactos al formato actual, reescribiendo los que cambian.
+    """
+    normalized_contacts = []
+    for contact in contacts:
+        normalized_contact = contact.copy() if isinstance(contact, dict) else contact
+        if isinstance(normalized_contact, dict):
+            migrated_contact = normalize_contact(log_type, normalized_contact)
+            if migrated_contact != normalized_contact:
+                repo.update_contact_data(migrated_contact["id"], migrated_contact)
+            normalized_contact = migrated_contact
+        normalized_contacts.append(normalized_contact)
+    return normalized_contacts
 
 
-def open_log(db_path: str):
+def open_log(db_path: str, recent_limit: Optional[int] = None):
     """
     Abre y carga un log existente desde su archivo SQLite.
     Devuelve una instancia de OperationLog o ContestLog según corresponda.
+
+    Si se indica ``recent_limit`` y el archivo ya está en el formato actual,
+    solo se cargan los ``recent_limit`` contactos más recientes; el resto se
+    obtiene luego con ``iter_remaining_contacts``. En el log devuelto,
+    ``contact_total`` indica el total de contactos y ``contacts_complete``
+    si ya están todos cargados. Los logs que requieren migración se cargan
+    siempre completos.
     """
+    # Si el log ya estaba abierto, persistir sus pendientes; luego recuperar
+    # contactos que quedaron en el journal tras un cierre abrupto
+    close_contact_writer(db_path)
+    recover_journal(db_path)
     repo = ContactLogRepository(db_path)
     file_format_version = repo.get_file_format_version()
-    with sqlite3.connect(db_path) as conn:
+    with open_connection(db_path) as conn:
         c = conn.cursor()
         c.execute(
             "SELECT id, type, operator, start_time, end_time, metadata FROM logs LIMIT 1"
@@ -86,17 +113,36 @@ def open_log(db_path: str):
         if header_needs_update:
             repo.save_log(log, log_type)
             repo.set_file_format_version(CURRENT_LOG_FILE_FORMAT_VERSION)
-    # Obtener contactos
-    contacts = repo.get_contacts(log.id)
-    normalized_contacts = []
-    for contact in contacts:
-        normalized_contact = contact.copy() if isinstance(contact, dict) else contact
-        if isinstance(normalized_contact, dict):
-            migrated_contact = normalize_contact(log_type, normalized_contact)
-            if migrated_contact != normalized_contact:
-                repo.update_contact_data(migrated_contact["id"], migrated_contact)
-            normalized_contact = migrated_contact
-        normalized_contacts.append(normalized_contact)
-    log.contacts = normalized_contacts
     log.db_path = db_path
+    log.contacts_before_rowid = None
+    if (
+        recent_limit is not None
+        and file_format_version >= CURRENT_LOG_FILE_FORMAT_VERSION
+    ):
+        contacts, oldest_rowid = repo.get_recent_contacts(log.id, recent_limit)
+        log.contact_total = repo.count_contacts(log.id)
+        log.contacts = _normalize_contacts(repo, log_type, contacts)
+        log.contacts_complete = len(contacts) >= log.contact_total
+        if not log.contacts_complete:
+            log.contacts_before_rowid = oldest_rowid
+        return log
+    # Obtener contactos
+    log.contacts = _normalize_contacts(repo, log_type, repo.get_contacts(log.id))
+    log.contact_total = len(log.contacts)
+    log.contacts_complete = True
     return log
+
+
+def iter_remaining_contacts(log, chunk_size: int = OPEN_LOG_STREAM_CHUNK_SIZE):
+    """
+    Recorre los contactos que ``open_log`` no cargó en la apertura progresiva,
+    del más reciente al más antiguo, en bloques normalizados (cada bloque en
+    orden cronológico). Pensado para ejecutarse fuera del hilo de la UI.
+    """
+    before_rowid = getattr(log, "contacts_before_rowid", None)
+    if before_rowid is None:
+        return
+    log_type = log.log_type.value if log.log_type else ""
+    repo = ContactLogRepository(log.db_path)
+    for chunk in repo.iter_contacts_before(log.id, before_rowid, chunk_size):
+        yield _normalize_contacts(repo, log_type, chunk)
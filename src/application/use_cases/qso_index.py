@@ -0,0 +1,221 @@
+"""
+Caso de uso: Índice global de QSOs.
+
+Permite responder "¿ya trabajé este indicativo y en qué logs?" sin abrir cada
+archivo de log. El índice vive en el catálogo de logs y se mantiene:
+- de forma incremental al agregar, editar o eliminar contactos
+  (ver ``contact_management``);
+- reconstruyéndolo en paralelo (pool de hilos: se ejecuta dentro de la
+  aplicación) desde los archivos existentes, releyendo solo los archivos
+  modificados desde la última extracción.
+"""
+
+import os
+import threading
+import time
+from typing import Any, List, Optional
+
+from application.use_cases.log_catalog import (
+    catalog_log_file,
+    get_log_folders,
+    refresh_log_catalog,
+)
+from infrastructure.db import log_catalog
+from utils.datetime import parse_utc_timestamp
+from utils.parallel import create_executor
+
+_rebuild_lock = threading.Lock()
+
+
+def _extract_log_qsos(db_path: str):
+    """
+    Worker del pool: devuelve (path, filas, error).
+    """
+    try:
+        return db_path, log_catalog.read_log_qsos(db_path), None
+    except Exception as e:
+        return db_path, [], str(e)
+
+
+def rebuild_qso_index(
+    folders: Optional[List[str]] = None,
+    catalog_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    full: bool = False,
+) -> dict:
+    """
+    Reconstruye el índice de QSOs desde los archivos de log.
+    Solo se extraen los archivos cuya firma cambió (o todos si ``full``).
+    Devuelve un resumen con las claves: files, extracted, qsos, failed, elapsed.
+    """
+    started = time.perf_counter()
+    folders = [os.path.abspath(f) for f in (folders or get_log_folders())]
+    refresh_log_catalog(folders, catalog_path)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        entries = log_catalog.query_entries(conn, paths_under=folders)
+        indexed = {} if full else log_catalog.get_qso_signatures(conn)
+        pending = {
+            e.path: (e.file_mtime_ns, e.file_size)
+            for e in entries
+            if indexed.get(e.path) != (e.file_mtime_ns, e.file_size)
+        }
+        qso_count = 0
+        failed = []
+        if pending:
+            with create_executor(max_workers, prefer_processes=False) as executor:
+                results = executor.map(_extract_log_qsos, list(pending))
+                for path, rows, error in results:
+                    if error:
+                        failed.append((path, error))
+                        continue
+                    mtime_ns, size = pending[path]
+                    log_catalog.replace_log_qsos(conn, path, rows, mtime_ns, size)
+                    qso_count += len(rows)
+        log_catalog.delete_orphan_qsos(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    return {
+        "files": len(entries),
+        "extracted": len(pending) - len(failed),
+        "qsos": qso_count,
+        "failed": failed,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def rebuild_qso_index_in_background(**kwargs) -> threading.Thread:
+    """
+    Lanza ``rebuild_qso_index`` en un hilo daemon sin bloquear la UI.
+    Si ya hay una reconstrucción en curso, no lanza otra.
+    """
+
+    def _run():
+        if not _rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            rebuild_qso_index(**kwargs)
+        except Exception as e:
+            print(f"No se pudo reconstruir el índice de QSOs: {e}")
+        finally:
+            _rebuild_lock.release()
+
+    thread = threading.Thread(target=_run, name="qso-index-rebuild", daemon=True)
+    thread.start()
+    return thread
+
+
+def _ensure_cataloged(conn, db_path: str, catalog_path: Optional[str]) -> None:
+    row = conn.execute("SELECT 1 FROM log_files WHERE path = ?", (db_path,)).fetchone()
+    if not row:
+        catalog_log_file(db_path, catalog_path)
+
+
+def index_contact(
+    db_path: str,
+    log_id: str,
+    contact: Any,
+    catalog_path: Optional[str] = None,
+) -> None:
+    """
+    Agrega o actualiza un contacto en el índice global.
+    ``contact`` puede ser un dict o una entidad de contacto.
+    """
+    data = contact if isinstance(contact, dict) else getattr(contact, "__dict__", {})
+    contact_id = data.get("id")
+    if not contact_id:
+        return
+    db_path = os.path.abspath(db_path)
+    try:
+        timestamp = parse_utc_timestamp(data.get("timestamp"))
+    except ValueError:
+        timestamp = 0
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        _ensure_cataloged(conn, db_path, catalog_path)
+        log_catalog.upsert_qso(
+            conn, db_path, contact_id, log_id, data.get("callsign"), timestamp
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def unindex_contact(
+    db_path: str, contact_id: str, catalog_path: Optional[str] = None
+) -> None:
+    """
+    Elimina un contacto del índice global.
+    """
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        log_catalog.delete_qso(conn, os.path.abspath(db_path), contact_id)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def index_log_file(db_path: str, catalog_path: Optional[str] = None) -> int:
+    """
+    Cataloga un archivo de log y reemplaza todos sus QSOs en el índice,
+    p. ej. después de una importación masiva. Devuelve la cantidad indexada.
+    """
+    db_path = os.path.abspath(db_path)
+    entry = catalog_log_file(db_path, catalog_path)
+    if entry is None:
+        return 0
+    rows = log_catalog.read_log_qsos(db_path)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        log_catalog.replace_log_qsos(
+            conn, db_path, rows, entry.file_mtime_ns, entry.file_size
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def get_worked_before(
+    callsign: str,
+    exclude_log_path: Optional[str] = None,
+    catalog_path: Optional[str] = None,
+) -> dict:
+    """
+    Resume los QSOs previos con un indicativo en todos los logs.
+    Devuelve dict con: qso_count, log_count, last_timestamp.
+    """
+    if exclude_log_path:
+        exclude_log_path = os.path.abspath(exclude_log_path)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        qso_count, log_count, last_timestamp = log_catalog.get_worked_summary(
+            conn, callsign, exclude_log_path
+        )
+    finally:
+        conn.close()
+    return {
+        "qso_count": qso_count,
+        "log_count": log_count,
+        "last_timestamp": last_timestamp,
+    }
+
+
+def search_worked_qsos(
+    callsign: str,
+    exclude_log_path: Optional[str] = None,
+    limit: int = 100,
+    catalog_path: Optional[str] = None,
+) -> List[dict]:
+    """
+    Lista los QSOs previos con un indicativo (más recientes primero), con la
+    metadata del log (tipo, operador, banda, modo, concurso) y su ruta.
+    """
+    if exclude_log_path:
+        exclude_log_path = os.path.abspath(exclude_log_path)
+    conn = log_catalog.connect_catalog(catalog_path)
+    try:
+        return log_catalog.search_qsos(conn, callsign, exclude_log_path, limit)
+    finally:
+        conn.close()
@@ -0,0 +1,34 @@
+"""
+Mantenimiento diario de la base de operadores al iniciar la aplicación.
+
+La deshabilitación de operadores vencidos corre en segundo plano después del
+primer pintado de la ventana, y como mucho una vez por día: la última
+ejecución queda registrada en la tabla ``maintenance_runs``.
+"""
+
+import time
+from typing import Optional
+
+from infrastructure.db import queries
+
+DISABLE_EXPIRED_TASK = "disable_expired_operators"
+
+
+def run_daily_maintenance(
+    db_path: Optional[str] = None, today: Optional[str] = None
+) -> Optional[int]:
+    """
+    Deshabilita los operadores vencidos si la tarea no corrió hoy.
+    :param today: Fecha local ``AAAA-MM-DD`` (por defecto, la actual).
+    :return: Cantidad de operadores deshabilitados, o None si ya había
+        corrido en el día.
+    """
+    today = today or time.strftime("%Y-%m-%d")
+    last_run = queries.get_maintenance_run(DISABLE_EXPIRED_TASK, db_path)
+    if last_run and last_run["run_date"] == today:
+        return None
+    affected = queries.disable_expired_operators(db_path)
+    queries.record_maintenance_run(
+        DISABLE_EXPIRED_TASK, today, int(time.time()), affected, db_path
+    )
+    return affected
@@ -19,7 +19,7 @@ Funciones utilitarias para obtener rutas relevantes según el entorno.
 import os
 from .defaults import DATA_DIR, EXPORT_DIR, LOG_DIR
 from pathlib import Path
-from interface_adapters.ui.view_manager import LogType
+from domain.log_type import LogType
 
 # BASE_PATH apunta a la carpeta de usuario (~) para almacenar archivos generados por la app
 BASE_PATH = str(Path.home() / "LoggerOA")
@@ -4,14 +4,20 @@ settings_service.py
 Servicio centralizado para la gestión de configuraciones de la aplicación usando QSettings.
 """
 
-from enum import Enum
 import qt_compat_bootstrap
 
-
 qt_compat_bootstrap.bootstrap()
 
 from PySide6.QtCore import QSettings, QObject, Signal
 
+# Reexportados: los enums viven en settings_values (sin Qt)
+from .settings_values import (  # noqa: F401
+    CallsignMode,
+    LanguageValue,
+    SettingsKey,
+    ThemeValue,
+)
+
 
 class SettingsSignals(QObject):
     callsign_changed = Signal()
@@ -69,36 +75,6 @@ class SettingsService:
         self.signal.callsign_mode_changed.emit()
 
 
-# Enum para las claves de configuración
-class SettingsKey(Enum):
-    THEME = "theme"
-    LANGUAGE = "language"
-    CALLSIGN = "callsign"
-    CALLSIGN_MODE = "callsign_mode"
-    # Agrega aquí otras claves según sea necesario
-
-
-# Enum para los valores posibles de tema
-class ThemeValue(Enum):
-    LIGHT = "light"
-    DARK = "dark"
-    AUTO = "auto"
-    # Agrega aquí otros valores de tema si existen
-
-
-# Enum para los valores posibles de idioma
-class LanguageValue(Enum):
-    ES = "es"
-    EN = "en"
-    AUTO = "auto"  # Nuevo valor para idioma automático
-
-
-# Enum para los modos de indicativo
-class CallsignMode(Enum):
-    SAVED = "saved"
-    ALWAYS_ASK = "always_ask"
-
-
 # Instancia global para acceso centralizado
 settings_service = SettingsService()
 
@@ -0,0 +1,39 @@
+"""
+settings_values.py
+
+Claves y valores de configuración. No depende de Qt, para que los módulos
+que se ejecutan fuera de la interfaz (p. ej. los procesos de exportación en
+lote) puedan usarlos sin cargar PySide6.
+"""
+
+from enum import Enum
+
+
+# Enum para las claves de configuración
+class SettingsKey(Enum):
+    THEME = "theme"
+    LANGUAGE = "language"
+    CALLSIGN = "callsign"
+    CALLSIGN_MODE = "callsign_mode"
+    # Agrega aquí otras claves según sea necesario
+
+
+# Enum para los valores posibles de tema
+class ThemeValue(Enum):
+    LIGHT = "light"
+    DARK = "dark"
+    AUTO = "auto"
+    # Agrega aquí otros valores de tema si existen
+
+
+# Enum para los valores posibles de idioma
+class LanguageValue(Enum):
+    ES = "es"
+    EN = "en"
+    AUTO = "auto"  # Nuevo valor para idioma automático
+
+
+# Enum para los modos de indicativo
+class CallsignMode(Enum):
+    SAVED = "saved"
+    ALWAYS_ASK = "always_ask"
@@ -3,6 +3,7 @@ from .operation_contact import OperationContact
 from .operation import OperationLog
 from .contest_contact import ContestContact
 from .contest import ContestLog
+from .log_catalog_entry import LogCatalogEntry
 
 __all__ = [
     "RadioOperator",
@@ -10,4 +11,5 @@ __all__ = [
     "OperationLog",
     "ContestContact",
     "ContestLog",
+    "LogCatalogEntry",
 ]
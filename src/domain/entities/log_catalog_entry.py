@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class LogCatalogEntry:
+    """
+    Resumen indexado de un archivo de log SQLite.
+
+    Refleja los campos del encabezado que la UI y las funciones entre logs
+    necesitan sin abrir el archivo completo.
+    """
+
+    path: str
+    log_id: str = ""
+    log_type: str = ""
+    operator: str = ""
+    contest_key: str = ""
+    operation_type: str = ""
+    band: str = ""
+    mode: str = ""
+    start_time: int = 0  # timestamp UTC
+    end_time: int = 0  # timestamp UTC
+    contact_count: int = 0
+    file_mtime_ns: int = 0
+    file_size: int = 0
+    file_format_version: int = 0
+    error: Optional[str] = None  # Motivo si el archivo no pudo indexarse
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class LogType(Enum):
+    OPERATION_LOG = "operation_log"
+    CONTEST_LOG = "contest_log"
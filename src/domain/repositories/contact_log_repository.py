@@ -1,6 +1,6 @@
-import sqlite3
 from typing import Any, List, Optional
 from ..entities.contact_log import ContactLog
+from infrastructure.db.connection import open_connection
 
 
 class ContactLogRepository:
@@ -9,7 +9,7 @@ class ContactLogRepository:
         self._ensure_tables()
 
     def _ensure_tables(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(
                 """
@@ -38,7 +38,7 @@ class ContactLogRepository:
     def save_log(self, log: ContactLog, log_type_str: str):
         import json
 
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(
                 """
@@ -57,14 +57,14 @@ class ContactLogRepository:
             conn.commit()
 
     def get_file_format_version(self) -> int:
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute("PRAGMA user_version")
             row = c.fetchone()
             return int(row[0]) if row and row[0] is not None else 0
 
     def set_file_format_version(self, version: int):
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(f"PRAGMA user_version = {int(version)}")
             conn.commit()
@@ -72,7 +72,7 @@ class ContactLogRepository:
     def update_log_metadata(self, log_id: str, metadata: dict):
         import json
 
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(
                 """
@@ -83,7 +83,7 @@ class ContactLogRepository:
             conn.commit()
 
     def update_log_timestamps(self, log_id: str, start_time: int, end_time: int):
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(
                 """
@@ -98,7 +98,7 @@ class ContactLogRepository:
         pass
 
     def delete_log(self, log_id: str):
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute("DELETE FROM logs WHERE id = ?", (log_id,))
             c.execute("DELETE FROM contacts WHERE log_id = ?", (log_id,))
@@ -107,7 +107,7 @@ class ContactLogRepository:
     def save_contact(self, log_id: str, contact: Any):
         import json, uuid
 
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             contact_id = getattr(contact, "id", str(uuid.uuid4()))
             c.execute(
@@ -119,11 +119,32 @@ class ContactLogRepository:
             )
             conn.commit()
 
+    def save_contacts_bulk(self, log_id: str, contacts: List[Any]) -> int:
+        """
+        Guarda varios contactos en una sola transacción (p. ej. al importar).
+        Acepta dicts o entidades; devuelve la cantidad guardada.
+        """
+        import json, uuid
+
+        rows = []
+        for contact in contacts:
+            data = contact if isinstance(contact, dict) else contact.__dict__
+            rows.append((data.get("id") or str(uuid.uuid4()), log_id, json.dumps(data)))
+        if not rows:
+            return 0
+        with open_connection(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO contacts (id, log_id, data) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
     def get_contacts(self, log_id: str) -> List[Any]:
         import json
 
         contacts = []
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute("SELECT id, data FROM contacts WHERE log_id = ?", (log_id,))
             rows = c.fetchall()
@@ -138,8 +159,92 @@ class ContactLogRepository:
                     continue
         return contacts
 
+    @staticmethod
+    def _decode_contact_rows(rows) -> List[Any]:
+        import json
+
+        contacts = []
+        for contact_id, data in rows:
+            try:
+                contact_dict = json.loads(data)
+                if isinstance(contact_dict, dict) and not contact_dict.get("id"):
+                    contact_dict["id"] = contact_id
+                contacts.append(contact_dict)
+            except Exception:
+                continue
+        return contacts
+
+    def iter_contacts(self, log_id: str, chunk_size: int = 500):
+        """
+        Recorre los contactos del log en orden de inserción, en bloques de
+        ``chunk_size``, sin cargarlos todos en memoria. Cada bloque es una
+        consulta propia (a partir del último rowid leído), de modo que la
+        lectura no bloquea el guardado de contactos entre bloques.
+        """
+        last_rowid = 0
+        with open_connection(self.db_path) as conn:
+            c = conn.cursor()
+            while True:
+                c.execute(
+                    "SELECT rowid, id, data FROM contacts "
+                    "WHERE log_id = ? AND rowid > ? ORDER BY rowid LIMIT ?",
+                    (log_id, last_rowid, int(chunk_size)),
+                )
+                rows = c.fetchall()
+                if not rows:
+                    break
+                last_rowid = rows[-1][0]
+                yield self._decode_contact_rows([(r[1], r[2]) for r in rows])
+
+    def count_contacts(self, log_id: str) -> int:
+        with open_connection(self.db_path) as conn:
+            c = conn.cursor()
+            c.execute("SELECT COUNT(*) FROM contacts WHERE log_id = ?", (log_id,))
+            return int(c.fetchone()[0])
+
+    def get_recent_contacts(self, log_id: str, limit: int):
+        """
+        Devuelve (contactos, rowid_mas_antiguo) con los ``limit`` contactos más
+        recientes en orden cronológico de inserción. El rowid permite continuar
+        la lectura hacia atrás con ``iter_contacts_before``.
+        """
+        with open_connection(self.db_path) as conn:
+            c = conn.cursor()
+            c.execute(
+                "SELECT rowid, id, data FROM contacts WHERE log_id = ? "
+                "ORDER BY rowid DESC LIMIT ?",
+                (log_id, int(limit)),
+            )
+            rows = c.fetchall()
+        rows.reverse()
+        oldest_rowid = rows[0][0] if rows else None
+        return self._decode_contact_rows([(r[1], r[2]) for r in rows]), oldest_rowid
+
+    def iter_contacts_before(self, log_id: str, before_rowid: int, chunk_size: int = 500):
+        """
+        Recorre hacia atrás los contactos anteriores a ``before_rowid``.
+        Cada bloque se entrega en orden cronológico; los bloques van del más
+        reciente al más antiguo. Como en ``iter_contacts``, cada bloque es una
+        consulta propia: entre bloques no queda ninguna lectura abierta que
+        bloquee el guardado de contactos.
+        """
+        with open_connection(self.db_path) as conn:
+            c = conn.cursor()
+            while True:
+                c.execute(
+                    "SELECT rowid, id, data FROM contacts WHERE log_id = ? "
+                    "AND rowid < ? ORDER BY rowid DESC LIMIT ?",
+                    (log_id, before_rowid, int(chunk_size)),
+                )
+                rows = c.fetchall()
+                if not rows:
+                    break
+                before_rowid = rows[-1][0]
+                rows.reverse()
+                yield self._decode_contact_rows([(r[1], r[2]) for r in rows])
+
     def delete_contact(self, contact_id: str):
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
             conn.commit()
@@ -147,7 +252,7 @@ class ContactLogRepository:
     def update_contact(self, contact_id: str, contact: Any):
         import json
 
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(
                 """
@@ -160,7 +265,7 @@ class ContactLogRepository:
     def update_contact_data(self, contact_id: str, contact_data: dict):
         import json
 
-        with sqlite3.connect(self.db_path) as conn:
+        with open_connection(self.db_path) as conn:
             c = conn.cursor()
             c.execute(
                 """
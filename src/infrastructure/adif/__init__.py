@@ -0,0 +1,3 @@
+"""
+Lectura y escritura de archivos ADIF (formato ADI).
+"""
@@ -0,0 +1,94 @@
+"""
+Lector ADIF (ADI) en streaming.
+
+Recorre el archivo en bloques con un tokenizador de etiquetas
+``<NOMBRE:LARGO[:TIPO]>valor`` y entrega un registro a la vez, de modo que
+archivos de cientos de miles de QSOs se importan sin cargarlos en memoria.
+Los largos se cuentan en caracteres sobre el texto decodificado (UTF-8).
+"""
+
+from typing import Dict, Iterator
+
+# Caracteres leídos por bloque
+ADIF_READ_CHUNK_SIZE = 1 << 20
+
+
+class AdifReader:
+    """
+    Iterador de registros de un archivo ADI. Cada registro es un dict con los
+    nombres de campo en mayúsculas. Los campos anteriores a ``<EOH>`` quedan
+    en ``header`` (disponible al obtener el primer registro); el texto libre
+    de la cabecera se ignora. Si el archivo no tiene ``<EOH>``, ``header``
+    queda vacío.
+    """
+
+    def __init__(self, path: str, chunk_size: int = ADIF_READ_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.header: Dict[str, str] = {}
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        with open(self.path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            yield from self._iter_records(f)
+
+    def _iter_records(self, f) -> Iterator[Dict[str, str]]:
+        chunk_size = self.chunk_size
+        buf = f.read(chunk_size)
+        eof = not buf
+        pos = 0
+        record: Dict[str, str] = {}
+        while True:
+            lt = buf.find("<", pos)
+            gt = buf.find(">", lt) if lt != -1 else -1
+            if gt == -1:
+                if eof:
+                    break
+                # Etiqueta incompleta: conservar desde "<" y leer más
+                buf = buf[lt:] if lt != -1 else ""
+                pos = 0
+                more = f.read(chunk_size)
+                eof = not more
+                buf += more
+                continue
+            spec = buf[lt + 1 : gt]
+            name, _, rest = spec.partition(":")
+            name = name.strip().upper()
+            if not rest:
+                pos = gt + 1
+                if name == "EOR":
+                    if record:
+                        yield record
+                    record = {}
+                elif name == "EOH":
+                    self.header = record
+                    record = {}
+                continue
+            try:
+                length = int(rest.partition(":")[0])
+            except ValueError:
+                # No es una etiqueta ADIF válida: seguir buscando
+                pos = lt + 1
+                continue
+            start = gt + 1
+            end = start + length
+            while end > len(buf) and not eof:
+                buf = buf[lt:]
+                start -= lt
+                end -= lt
+                gt -= lt
+                lt = 0
+                more = f.read(max(chunk_size, end - len(buf)))
+                eof = not more
+                buf += more
+            record[name] = buf[start:end]
+            pos = end
+        if record:
+            # Último registro sin <EOR>
+            yield record
+
+
+def iter_adif_records(path: str, chunk_size: int = ADIF_READ_CHUNK_SIZE):
+    """
+    Recorre los registros de un archivo ADI (ver ``AdifReader``).
+    """
+    return iter(AdifReader(path, chunk_size))
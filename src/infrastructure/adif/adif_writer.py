@@ -0,0 +1,111 @@
+"""
+Escritor ADIF (ADI) con búfer.
+
+Los campos fijos (cabecera y los que se repiten en cada registro, como banda,
+modo u operador) se formatean una sola vez; los registros se escriben en
+bloques a un archivo con búfer, sin acumular el log completo en memoria.
+"""
+
+import calendar
+from typing import Iterable, Optional, Tuple
+
+from utils.datetime import qtr_from_minute
+
+# Búfer de escritura del archivo (bytes)
+ADIF_WRITE_BUFFER_SIZE = 1 << 16
+
+AdifFields = Iterable[Tuple[str, object]]
+
+
+def format_adif_field(name: str, value) -> str:
+    """
+    Devuelve ``<NAME:LEN>valor `` (el largo se cuenta en caracteres).
+    """
+    value = "" if value is None else str(value)
+    return f"<{name}:{len(value)}>{value} "
+
+
+def format_adif_fields(fields: AdifFields) -> str:
+    return "".join(format_adif_field(name, value) for name, value in fields)
+
+
+def format_adif_datetime(timestamp_utc: int) -> Tuple[str, str]:
+    """
+    Convierte un epoch UTC en (QSO_DATE ``YYYYMMDD``, TIME_ON ``HHMMSS``).
+    """
+    minute, second = divmod(timestamp_utc, 60)
+    qtr = qtr_from_minute(minute)
+    return (
+        qtr.utc_iso_date.replace("-", ""),
+        f"{qtr.utc_time.replace(':', '')}{second:02d}",
+    )
+
+
+def parse_adif_datetime(qso_date: str, time_on: str = "") -> Optional[int]:
+    """
+    Convierte QSO_DATE (``YYYYMMDD``) y TIME_ON (``HHMM`` o ``HHMMSS``) en un
+    epoch UTC. Devuelve None si la fecha no es válida.
+    """
+    qso_date = (qso_date or "").strip()
+    time_on = (time_on or "").strip()
+    if len(qso_date) != 8 or not qso_date.isdigit():
+        return None
+    if not time_on.isdigit() or len(time_on) not in (4, 6):
+        time_on = "0000"
+    try:
+        return calendar.timegm(
+            (
+                int(qso_date[0:4]),
+                int(qso_date[4:6]),
+                int(qso_date[6:8]),
+                int(time_on[0:2]),
+                int(time_on[2:4]),
+                int(time_on[4:6] or 0),
+                0,
+                0,
+                0,
+            )
+        )
+    except (ValueError, OverflowError):
+        return None
+
+
+class AdifWriter:
+    """
+    Escribe un archivo ADI: ``write_header`` una vez y luego
+    ``write_records`` por cada bloque de registros. Cada registro va en su
+    propia línea.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encoding: str = "utf-8",
+        buffer_size: int = ADIF_WRITE_BUFFER_SIZE,
+    ):
+        self.path = path
+        self._file = open(path, "w", encoding=encoding, buffering=buffer_size)
+
+    def write_header(self, fields: AdifFields, text: str = ""):
+        """
+        Escribe la cabecera (texto libre opcional, campos y ``<EOH>``).
+        """
+        self._file.write(f"{text}{format_adif_fields(fields)}<EOH>")
+
+    def write_records(self, records: Iterable[str]):
+        """
+        Escribe registros cuyos campos ya están formateados (ver
+        ``format_adif_field``); agrega ``<EOR>`` a cada uno.
+        """
+        self._file.writelines(f"\n{record}<EOR>" for record in records)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
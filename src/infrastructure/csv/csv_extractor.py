@@ -4,6 +4,7 @@ Lee y normaliza datos de operadores desde CSV con headers traducidos.
 """
 
 import csv
+import gzip
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from domain.itu_country_names import ITU_COUNTRY_NAMES
@@ -23,7 +24,9 @@ def extract_operators_from_csv(csv_path: str) -> List[Dict[str, Any]]:
     operators = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
+        # Los CSV exportados con compresión (.csv.gz) se leen directamente
+        opener = gzip.open if str(csv_path).lower().endswith(".gz") else open
+        with opener(csv_path, "rt", encoding="utf-8") as f:
             # Detectar automáticamente el dialecto del CSV
             sample = f.read(1024)
             f.seek(0)
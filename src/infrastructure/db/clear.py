@@ -3,11 +3,11 @@ def clear_database():
     Borra todos los registros de todas las tablas y deja la estructura intacta.
     Resetea los contadores de autoincremento y compacta el archivo.
     """
-    import sqlite3
     from config.paths import get_database_path
+    from .connection import connect
 
     db_path = get_database_path()
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
     # Listado de tablas principales
     tables = ["radio_operators", "logs", "contacts"]
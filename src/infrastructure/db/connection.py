@@ -6,7 +6,38 @@ Permite abrir conexiones tanto a la base principal como a bases auxiliares.
 """
 
 import sqlite3
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator
+
+from .query_trace import TracedConnection, query_tracer
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """
+    ``sqlite3.connect`` de la aplicación: con el trazado SQL activo
+    (``query_tracer``) la conexión registra cada sentencia.
+    Todo acceso a SQLite debe abrir sus conexiones con esta función.
+    """
+    if query_tracer.enabled:
+        kwargs.setdefault("factory", TracedConnection)
+    return sqlite3.connect(db_path, **kwargs)
+
+
+@contextmanager
+def open_connection(db_path: str, **kwargs) -> Iterator[sqlite3.Connection]:
+    """
+    Conexión para un bloque ``with``: confirma (o revierte si hay error) y
+    la cierra al salir. ``with connect(...)`` solo confirma; la conexión
+    queda en un ciclo de referencias con su caché de sentencias y retiene
+    la caché de páginas de SQLite hasta que pasa el recolector, lo que en
+    una sesión de captura larga hace crecer la memoria con cada QSO.
+    """
+    conn = connect(db_path, **kwargs)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
 
 
 def get_connection(db_path: str) -> sqlite3.Connection:
@@ -18,7 +49,7 @@ def get_connection(db_path: str) -> sqlite3.Connection:
         sqlite3.Connection: Objeto de conexión a la base de datos.
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = connect(db_path)
         return conn
     except sqlite3.Error as e:
         raise RuntimeError(f"Error al conectar a la base de datos {db_path}: {e}")
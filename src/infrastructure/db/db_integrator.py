@@ -2,9 +2,9 @@
 Funciones para integrar los datos normalizados a la base de datos.
 """
 
-import sqlite3
 from datetime import datetime
 from config.paths import get_database_path
+from .connection import connect
 
 
 def integrate_operators_to_db(operators):
@@ -13,7 +13,7 @@ def integrate_operators_to_db(operators):
     Usa UPSERT para evitar duplicados y mantener actualizados los datos.
     """
     db_path = get_database_path()
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cur = conn.cursor()
     # Crear tabla si no existe
     cur.execute(
@@ -0,0 +1,454 @@
+"""
+log_catalog.py
+
+Catálogo indexado de archivos de log SQLite (operativos y concursos).
+
+Cada archivo de log es una base independiente; este módulo mantiene una base
+auxiliar (``~/LoggerOA/log_catalog.db``) con los campos del encabezado de cada
+log, el número de contactos y la firma del archivo (mtime/tamaño). Así, listar
+o filtrar logs no requiere abrir cada archivo, y solo se vuelven a leer los
+archivos que cambiaron desde la última indexación.
+
+La misma base guarda el índice global de QSOs (tabla ``qsos``): indicativo,
+timestamp y log de cada contacto, para búsquedas entre logs por indicativo.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .connection import connect, get_connection
+from config.paths import get_database_path
+from domain.entities.log_catalog_entry import LogCatalogEntry
+from utils.datetime import parse_utc_timestamp
+
+CATALOG_FILENAME = "log_catalog.db"
+LOG_FILE_EXTENSION = ".sqlite"
+
+# Rutas de catálogo cuyo esquema ya fue verificado en este proceso
+_schema_ready = set()
+
+_ENTRY_COLUMNS = (
+    "path",
+    "log_id",
+    "log_type",
+    "operator",
+    "contest_key",
+    "operation_type",
+    "band",
+    "mode",
+    "start_time",
+    "end_time",
+    "contact_count",
+    "file_mtime_ns",
+    "file_size",
+    "file_format_version",
+    "error",
+)
+
+
+def get_catalog_path() -> str:
+    """
+    Devuelve la ruta del catálogo de logs (junto a la base principal).
+    """
+    return get_database_path(CATALOG_FILENAME)
+
+
+def connect_catalog(catalog_path: Optional[str] = None) -> sqlite3.Connection:
+    """
+    Abre el catálogo asegurando que su esquema exista.
+    """
+    path = catalog_path or get_catalog_path()
+    # Antes de conectar: la conexión crea el archivo (catálogo borrado en uso)
+    missing = not os.path.exists(path)
+    conn = get_connection(path)
+    if missing or path not in _schema_ready:
+        ensure_catalog_schema(conn)
+        _schema_ready.add(path)
+    return conn
+
+
+def ensure_catalog_schema(conn: sqlite3.Connection) -> None:
+    """
+    Crea las tablas e índices del catálogo si no existen.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS log_files (
+            path TEXT PRIMARY KEY,
+            log_id TEXT,
+            log_type TEXT,
+            operator TEXT,
+            contest_key TEXT,
+            operation_type TEXT,
+            band TEXT,
+            mode TEXT,
+            start_time INTEGER,
+            end_time INTEGER,
+            contact_count INTEGER,
+            file_mtime_ns INTEGER,
+            file_size INTEGER,
+            file_format_version INTEGER,
+            error TEXT,
+            indexed_at INTEGER
+        )
+        """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_log_files_operator ON log_files(operator COLLATE NOCASE)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_log_files_type_start ON log_files(log_type, start_time)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_log_files_contest ON log_files(contest_key)"
+    )
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS qsos (
+            log_path TEXT NOT NULL,
+            contact_id TEXT NOT NULL,
+            log_id TEXT,
+            callsign TEXT NOT NULL,
+            timestamp INTEGER,
+            PRIMARY KEY (log_path, contact_id)
+        ) WITHOUT ROWID
+        """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_qsos_callsign ON qsos(callsign, timestamp)"
+    )
+    # Firma del archivo al momento de extraer sus QSOs (para reconstrucción incremental)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS qso_index_files (
+            path TEXT PRIMARY KEY,
+            file_mtime_ns INTEGER,
+            file_size INTEGER
+        )
+        """)
+    conn.commit()
+
+
+def _open_log_read_only(db_path: str) -> sqlite3.Connection:
+    """
+    Abre un archivo de log en modo solo lectura para no alterar su mtime.
+    """
+    uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+    return connect(uri, uri=True)
+
+
+def read_log_summary(
+    db_path: str, file_mtime_ns: int = 0, file_size: int = 0
+) -> LogCatalogEntry:
+    """
+    Lee el encabezado y el conteo de contactos de un archivo de log.
+    Si el archivo no es un log válido, devuelve una entrada con ``error``.
+    """
+    entry = LogCatalogEntry(
+        path=db_path, file_mtime_ns=file_mtime_ns, file_size=file_size
+    )
+    try:
+        conn = _open_log_read_only(db_path)
+    except sqlite3.Error as e:
+        entry.error = str(e)
+        return entry
+    try:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        version_row = cursor.fetchone()
+        entry.file_format_version = int(version_row[0]) if version_row else 0
+        cursor.execute(
+            "SELECT id, type, operator, start_time, end_time, metadata FROM logs LIMIT 1"
+        )
+        row = cursor.fetchone()
+        if not row:
+            entry.error = "No se encontró ningún log en la base de datos."
+            return entry
+        try:
+            metadata = json.loads(row[5]) if row[5] else {}
+        except (TypeError, ValueError):
+            metadata = {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+        entry.log_id = row[0] or ""
+        entry.log_type = row[1] or ""
+        entry.operator = (row[2] or "").upper()
+        try:
+            entry.start_time = parse_utc_timestamp(row[3])
+            entry.end_time = parse_utc_timestamp(row[4])
+        except ValueError:
+            entry.start_time = 0
+            entry.end_time = 0
+        entry.contest_key = (
+            metadata.get("contest_name_key") or metadata.get("contest_key") or ""
+        )
+        entry.operation_type = (
+            metadata.get("operation_type") or metadata.get("type") or ""
+        )
+        entry.band = metadata.get("frequency_band") or metadata.get("band") or ""
+        entry.mode = metadata.get("mode_key") or metadata.get("mode") or ""
+        cursor.execute("SELECT COUNT(*) FROM contacts WHERE log_id = ?", (row[0],))
+        entry.contact_count = int(cursor.fetchone()[0])
+    except sqlite3.Error as e:
+        entry.error = str(e)
+    finally:
+        conn.close()
+    return entry
+
+
+def get_signatures(conn: sqlite3.Connection) -> dict:
+    """
+    Devuelve {path: (file_mtime_ns, file_size)} de todas las entradas indexadas.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT path, file_mtime_ns, file_size FROM log_files")
+    return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+
+def upsert_entries(conn: sqlite3.Connection, entries: Iterable[LogCatalogEntry]) -> int:
+    """
+    Inserta o reemplaza entradas del catálogo. No hace commit.
+    """
+    now = int(time.time())
+    placeholders = ", ".join("?" for _ in range(len(_ENTRY_COLUMNS) + 1))
+    rows = [
+        tuple(getattr(entry, col) for col in _ENTRY_COLUMNS) + (now,)
+        for entry in entries
+    ]
+    conn.executemany(
+        f"INSERT OR REPLACE INTO log_files ({', '.join(_ENTRY_COLUMNS)}, indexed_at) "
+        f"VALUES ({placeholders})",
+        rows,
+    )
+    return len(rows)
+
+
+def delete_entries(conn: sqlite3.Connection, paths: Iterable[str]) -> int:
+    """
+    Elimina del catálogo las entradas de los paths indicados. No hace commit.
+    """
+    rows = [(path,) for path in paths]
+    conn.executemany("DELETE FROM log_files WHERE path = ?", rows)
+    conn.executemany("DELETE FROM qsos WHERE log_path = ?", rows)
+    conn.executemany("DELETE FROM qso_index_files WHERE path = ?", rows)
+    return len(rows)
+
+
+def query_entries(
+    conn: sqlite3.Connection,
+    log_type: Optional[str] = None,
+    operator: Optional[str] = None,
+    contest_key: Optional[str] = None,
+    start_from: Optional[int] = None,
+    start_to: Optional[int] = None,
+    paths_under: Optional[List[str]] = None,
+    include_invalid: bool = False,
+) -> List[LogCatalogEntry]:
+    """
+    Consulta el catálogo con filtros opcionales, ordenado por inicio descendente.
+    ``start_from``/``start_to`` son timestamps UTC inclusivos sobre ``start_time``.
+    """
+    clauses = []
+    params: list = []
+    if not include_invalid:
+        clauses.append("error IS NULL")
+    if log_type:
+        clauses.append("log_type = ?")
+        params.append(log_type)
+    if operator:
+        clauses.append("operator = ? COLLATE NOCASE")
+        params.append(operator.strip())
+    if contest_key:
+        clauses.append("contest_key = ?")
+        params.append(contest_key)
+    if start_from is not None:
+        clauses.append("start_time >= ?")
+        params.append(int(start_from))
+    if start_to is not None:
+        clauses.append("start_time <= ?")
+        params.append(int(start_to))
+    if paths_under:
+        prefix_clauses = []
+        for folder in paths_under:
+            prefix_clauses.append("substr(path, 1, ?) = ?")
+            prefix = os.path.join(folder, "")
+            params.extend([len(prefix), prefix])
+        clauses.append("(" + " OR ".join(prefix_clauses) + ")")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT {', '.join(_ENTRY_COLUMNS)} FROM log_files {where} "
+        "ORDER BY start_time DESC, path",
+        params,
+    )
+    return [LogCatalogEntry(*row) for row in cursor.fetchall()]
+
+
+# --- Índice global de QSOs ---
+
+
+def normalize_index_callsign(callsign: Optional[str]) -> str:
+    """
+    Normaliza un indicativo para el índice (mayúsculas, sin espacios).
+    """
+    return (callsign or "").strip().upper()
+
+
+def read_log_qsos(db_path: str) -> List[tuple]:
+    """
+    Extrae (contact_id, log_id, callsign, timestamp) de todos los contactos
+    de un archivo de log, en modo solo lectura.
+    """
+    rows = []
+    conn = _open_log_read_only(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, log_id, data FROM contacts")
+        for contact_id, log_id, data in cursor:
+            try:
+                contact = json.loads(data) if data else {}
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(contact, dict):
+                continue
+            callsign = normalize_index_callsign(contact.get("callsign"))
+            if not callsign:
+                continue
+            try:
+                timestamp = parse_utc_timestamp(contact.get("timestamp"))
+            except ValueError:
+                timestamp = 0
+            rows.append((contact_id, log_id, callsign, timestamp))
+    finally:
+        conn.close()
+    return rows
+
+
+def get_qso_signatures(conn: sqlite3.Connection) -> dict:
+    """
+    Devuelve {path: (file_mtime_ns, file_size)} de los archivos ya extraídos al índice.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT path, file_mtime_ns, file_size FROM qso_index_files")
+    return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+
+def replace_log_qsos(
+    conn: sqlite3.Connection,
+    log_path: str,
+    rows: Iterable[tuple],
+    file_mtime_ns: int,
+    file_size: int,
+) -> None:
+    """
+    Reemplaza todos los QSOs indexados de un archivo. No hace commit.
+    ``rows`` contiene tuplas (contact_id, log_id, callsign, timestamp).
+    """
+    conn.execute("DELETE FROM qsos WHERE log_path = ?", (log_path,))
+    conn.executemany(
+        "INSERT OR REPLACE INTO qsos (log_path, contact_id, log_id, callsign, timestamp) "
+        "VALUES (?, ?, ?, ?, ?)",
+        ((log_path,) + tuple(row) for row in rows),
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO qso_index_files (path, file_mtime_ns, file_size) "
+        "VALUES (?, ?, ?)",
+        (log_path, file_mtime_ns, file_size),
+    )
+
+
+def delete_orphan_qsos(conn: sqlite3.Connection) -> None:
+    """
+    Elimina QSOs de archivos que ya no están en el catálogo. No hace commit.
+    """
+    conn.execute("DELETE FROM qsos WHERE log_path NOT IN (SELECT path FROM log_files)")
+    conn.execute(
+        "DELETE FROM qso_index_files WHERE path NOT IN (SELECT path FROM log_files)"
+    )
+
+
+def upsert_qso(
+    conn: sqlite3.Connection,
+    log_path: str,
+    contact_id: str,
+    log_id: str,
+    callsign: str,
+    timestamp: int,
+) -> None:
+    """
+    Inserta o actualiza un QSO del índice. No hace commit.
+    """
+    callsign = normalize_index_callsign(callsign)
+    if not callsign:
+        delete_qso(conn, log_path, contact_id)
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO qsos (log_path, contact_id, log_id, callsign, timestamp) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (log_path, contact_id, log_id, callsign, timestamp),
+    )
+
+
+def delete_qso(conn: sqlite3.Connection, log_path: str, contact_id: str) -> None:
+    """
+    Elimina un QSO del índice. No hace commit.
+    """
+    conn.execute(
+        "DELETE FROM qsos WHERE log_path = ? AND contact_id = ?",
+        (log_path, contact_id),
+    )
+
+
+def get_worked_summary(
+    conn: sqlite3.Connection, callsign: str, exclude_path: Optional[str] = None
+) -> Tuple[int, int, int]:
+    """
+    Devuelve (cantidad de QSOs, cantidad de logs, último timestamp) para un indicativo.
+    """
+    query = (
+        "SELECT COUNT(*), COUNT(DISTINCT log_path), MAX(timestamp) "
+        "FROM qsos WHERE callsign = ?"
+    )
+    params: list = [normalize_index_callsign(callsign)]
+    if exclude_path:
+        query += " AND log_path <> ?"
+        params.append(exclude_path)
+    row = conn.execute(query, params).fetchone()
+    return int(row[0] or 0), int(row[1] or 0), int(row[2] or 0)
+
+
+def search_qsos(
+    conn: sqlite3.Connection,
+    callsign: str,
+    exclude_path: Optional[str] = None,
+    limit: int = 100,
+) -> List[dict]:
+    """
+    Lista los QSOs de un indicativo (más recientes primero) con la metadata
+    del log al que pertenecen.
+    """
+    query = (
+        "SELECT q.callsign, q.timestamp, q.log_id, q.log_path, q.contact_id, "
+        "f.log_type, f.operator, f.band, f.mode, f.contest_key "
+        "FROM qsos q LEFT JOIN log_files f ON f.path = q.log_path "
+        "WHERE q.callsign = ?"
+    )
+    params: list = [normalize_index_callsign(callsign)]
+    if exclude_path:
+        query += " AND q.log_path <> ?"
+        params.append(exclude_path)
+    query += " ORDER BY q.timestamp DESC LIMIT ?"
+    params.append(int(limit))
+    keys = (
+        "callsign",
+        "timestamp",
+        "log_id",
+        "log_path",
+        "contact_id",
+        "log_type",
+        "operator",
+        "band",
+        "mode",
+        "contest_key",
+    )
+    return [dict(zip(keys, row)) for row in conn.execute(query, params).fetchall()]
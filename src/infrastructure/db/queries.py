@@ -127,6 +127,30 @@ def get_radio_operators():
     return results
 
 
+def iter_radio_operators(batch_size: int = 1000, db_path: Optional[str] = None):
+    """
+    Recorre todos los operadores de radio ordenados por indicativo, en bloques
+    de ``batch_size`` filas leídas de un cursor, sin cargarlos todos en memoria.
+    Las filas tienen las mismas columnas que ``get_radio_operators``.
+    """
+    conn = get_connection(db_path or get_database_path())
+    try:
+        _ensure_indexes(conn)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT callsign, name, category, type, region, district, province, department, "
+            "license, resolution, expiration_date, cutoff_date, enabled, country, updated_at "
+            "FROM radio_operators ORDER BY callsign ASC"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+
 def update_radio_operator(
     callsign,
     name,
@@ -306,7 +330,7 @@ def get_radio_operators_paged(
     return rows, int(total)
 
 
-def disable_expired_operators() -> int:
+def disable_expired_operators(db_path: Optional[str] = None) -> int:
     """
     Deshabilita TODOS los operadores con expiration_date vencida, independientemente del país.
     Retorna la cantidad de filas afectadas.
@@ -317,23 +341,21 @@ def disable_expired_operators() -> int:
     from datetime import datetime, timezone
 
     now_ts = int(datetime.now(timezone.utc).timestamp())
-    db_path = get_database_path()
-    conn = get_connection(db_path)
+    conn = get_connection(db_path or get_database_path())
     try:
         cur = conn.cursor()
-        # Actualizar enabled=0 solo cuando está actualmente en 1, la fecha existe (no vacía)
-        # y ya venció. Se castea expiration_date a INTEGER para bases donde está guardado como TEXT.
+        # Actualizar enabled=0 solo cuando está actualmente en 1 y la fecha (guardada
+        # como TEXT) es válida y ya venció. Las condiciones usan la misma expresión que
+        # idx_radio_operators_expiration, así la búsqueda es un rango en ese índice.
+        # Una fecha vacía o NULL castea a 0 o NULL y queda fuera del rango.
         sql = (
-            f"UPDATE radio_operators "
-            f"SET enabled = 0, updated_at = ? "
-            f"WHERE IFNULL(enabled,1) = 1 "
-            f"AND expiration_date IS NOT NULL "
-            f"AND TRIM(expiration_date) <> '' "
-            f"AND CAST(expiration_date AS INTEGER) > 0 "
-            f"AND CAST(expiration_date AS INTEGER) < ?"
+            "UPDATE radio_operators "
+            "SET enabled = 0, updated_at = ? "
+            "WHERE IFNULL(enabled, 1) = 1 "
+            "AND CAST(expiration_date AS INTEGER) > 0 "
+            "AND CAST(expiration_date AS INTEGER) < ?"
         )
-        params = [now_ts, now_ts]
-        cur.execute(sql, tuple(params))
+        cur.execute(sql, (now_ts, now_ts))
         affected = cur.rowcount or 0
         conn.commit()
         return int(affected)
@@ -341,6 +363,52 @@ def disable_expired_operators() -> int:
         conn.close()
 
 
+def get_maintenance_run(task: str, db_path: Optional[str] = None) -> Optional[dict]:
+    """
+    Devuelve la última ejecución registrada de una tarea de mantenimiento
+    (run_date, run_at, affected), o None si nunca corrió.
+    """
+    from .schema import init_maintenance_table
+
+    conn = get_connection(db_path or get_database_path())
+    try:
+        init_maintenance_table(conn)
+        row = conn.execute(
+            "SELECT run_date, run_at, affected FROM maintenance_runs WHERE task = ?",
+            (task,),
+        ).fetchone()
+    finally:
+        conn.close()
+    if not row:
+        return None
+    return {"run_date": row[0], "run_at": row[1], "affected": row[2]}
+
+
+def record_maintenance_run(
+    task: str,
+    run_date: str,
+    run_at: int,
+    affected: int,
+    db_path: Optional[str] = None,
+) -> None:
+    """
+    Registra la ejecución de una tarea de mantenimiento.
+    """
+    from .schema import init_maintenance_table
+
+    conn = get_connection(db_path or get_database_path())
+    try:
+        init_maintenance_table(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO maintenance_runs (task, run_date, run_at, affected) "
+            "VALUES (?, ?, ?, ?)",
+            (task, run_date, int(run_at), int(affected)),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def disable_expired_for_countries(countries: Tuple[str, ...]) -> int:
     """
     DEPRECATED: Usar disable_expired_operators() en su lugar.
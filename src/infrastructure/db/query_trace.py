@@ -0,0 +1,475 @@
+"""
+Trazado opcional de las consultas SQLite.
+
+Se activa con la variable de entorno ``LOGGEROA_SQL_TRACE`` (ruta del
+archivo, o ``1`` para la ruta por defecto), con ``--trace-sql[=RUTA]`` al
+lanzar ``main.py`` o en tiempo de ejecución con ``query_tracer.enable()``.
+Las conexiones abiertas con ``infrastructure.db.connection.connect`` mientras
+el trazado está activo usan ``TracedConnection``, que registra cada sentencia
+con su duración (ejecución y lectura de filas), filas devueltas o afectadas,
+el llamador y el caso de uso (``application.use_cases``) que la originó. El
+texto con los parámetros expandidos se toma de ``set_trace_callback``, que
+también muestra los BEGIN/COMMIT implícitos.
+
+Salida:
+
+- ``sql-<fecha>.jsonl``: un registro JSON por sentencia.
+- ``sql-<fecha>.slow.log``: sentencias por encima del umbral
+  (``LOGGEROA_SQL_SLOW_MS``, 50 ms por defecto) y, una vez por consulta, el
+  ``EXPLAIN QUERY PLAN`` de las que recorren una tabla completa.
+
+``scripts/summarize_sql_trace.py`` agrupa un archivo de traza por consulta.
+Sin trazado activo, ``connect`` abre conexiones normales: no hay costo.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+SQL_TRACE_ENV = "LOGGEROA_SQL_TRACE"
+SQL_TRACE_FLAG = "--trace-sql"
+SQL_SLOW_MS_ENV = "LOGGEROA_SQL_SLOW_MS"
+DEFAULT_SLOW_MS = 50.0
+
+# Sentencias para las que tiene sentido pedir el plan de consulta
+_PLANNED_STATEMENTS = ("SELECT", "WITH", "UPDATE", "DELETE")
+_WHITESPACE = re.compile(r"\s+")
+_THIS_MODULE = __name__
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Texto de la consulta en una sola línea (clave para agrupar).
+    """
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def is_full_scan(plan: List[str]) -> bool:
+    """
+    True si algún paso del plan recorre una tabla o índice completo
+    (``SCAN tabla``, con o sin ``USING INDEX``).
+    """
+    return any(step.startswith("SCAN ") and "CONSTANT ROW" not in step for step in plan)
+
+
+def _caller_info():
+    """
+    Devuelve (llamador, caso de uso) como ``modulo:funcion:linea``; el caso
+    de uso es el primer marco de ``application.use_cases`` en la pila.
+    """
+    caller = use_case = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != _THIS_MODULE and not module.startswith("sqlite3"):
+            where = f"{module}:{frame.f_code.co_name}:{frame.f_lineno}"
+            if caller is None:
+                caller = where
+            if module.startswith("application.use_cases."):
+                use_case = f"{module}:{frame.f_code.co_name}"
+                break
+        frame = frame.f_back
+    return caller, use_case
+
+
+class QueryTracer:
+    """
+    Recibe los registros de las conexiones trazadas y los escribe en el
+    archivo de traza y en el log de consultas lentas.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.slow_ms = DEFAULT_SLOW_MS
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._slow_file = None
+        # Planes ya consultados por (base, consulta)
+        self._plans = {}
+
+    def configure(self, argv: Optional[List[str]] = None, environ=None) -> bool:
+        """
+        Activa el trazado según ``--trace-sql[=RUTA]`` en ``argv`` (que se
+        quita de la lista, para que Qt no lo vea) o ``LOGGEROA_SQL_TRACE``.
+        """
+        environ = os.environ if environ is None else environ
+        path = environ.get(SQL_TRACE_ENV) or None
+        if argv is not None:
+            for arg in list(argv[1:]):
+                if arg == SQL_TRACE_FLAG or arg.startswith(SQL_TRACE_FLAG + "="):
+                    argv.remove(arg)
+                    path = arg.partition("=")[2] or path or "1"
+        if not path:
+            return False
+        slow_ms = environ.get(SQL_SLOW_MS_ENV)
+        try:
+            slow_ms = float(slow_ms) if slow_ms else None
+        except ValueError:
+            print(f"{SQL_SLOW_MS_ENV} inválido: {slow_ms}")
+            slow_ms = None
+        self.enable(None if path == "1" else path, slow_ms)
+        return True
+
+    def default_path(self) -> str:
+        from config.paths import BASE_PATH
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(BASE_PATH, "traces", f"sql-{stamp}.jsonl")
+
+    def enable(self, path: Optional[str] = None, slow_ms: Optional[float] = None):
+        """
+        Activa el trazado para las conexiones que se abran desde ahora.
+        Devuelve la ruta del archivo de traza.
+        """
+        with self._lock:
+            if self.enabled:
+                return self.path
+            self.path = path or self.default_path()
+            if slow_ms is not None:
+                self.slow_ms = slow_ms
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            base = self.path[:-6] if self.path.endswith(".jsonl") else self.path
+            self._slow_file = open(base + ".slow.log", "a", encoding="utf-8")
+            self._plans = {}
+            self.count = 0
+            self.enabled = True
+        print(f"Trazado SQL activo: {self.path}")
+        return self.path
+
+    def disable(self):
+        """
+        Desactiva el trazado y cierra los archivos. Las conexiones ya abiertas
+        dejan de registrar.
+        """
+        with self._lock:
+            if not self.enabled:
+                return
+            self.enabled = False
+            for f in (self._file, self._slow_file):
+                f.close()
+            self._file = self._slow_file = None
+
+    @property
+    def slow_log_path(self) -> Optional[str]:
+        return self._slow_file.name if self._slow_file else None
+
+    def known_plan(self, db: str, sql: str):
+        return self._plans.get((db, sql))
+
+    def add_plan(self, db: str, sql: str, plan: List[str]):
+        """
+        Guarda el plan de la consulta y, si recorre una tabla completa, lo
+        escribe en el log de consultas lentas (una vez por consulta).
+        """
+        with self._lock:
+            if not self.enabled or (db, sql) in self._plans:
+                return
+            self._plans[(db, sql)] = plan
+            if is_full_scan(plan):
+                lines = [f"[FULL SCAN] {db}", f"  {sql}"]
+                lines += [f"    {step}" for step in plan]
+                self._slow_file.write("\n".join(lines) + "\n")
+                self._slow_file.flush()
+
+    def record(self, record: dict):
+        with self._lock:
+            if not self.enabled:
+                return
+            self.count += 1
+            duration = record.get("duration_ms") or 0.0
+            record["slow"] = duration >= self.slow_ms
+            plan = self._plans.get((record["db"], record["sql"]))
+            if plan is not None:
+                record["full_scan"] = is_full_scan(plan)
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if record["slow"]:
+                lines = [
+                    f"[SLOW {duration:.1f} ms] {record['db']} rows={record['rows']}"
+                    f" caller={record['caller']} use_case={record['use_case']}",
+                    f"  {record['sql']}",
+                ]
+                lines += [f"    {step}" for step in plan or []]
+                self._slow_file.write("\n".join(lines) + "\n")
+                self._slow_file.flush()
+
+
+# Instancia global
+query_tracer = QueryTracer()
+
+
+class TracedCursor(sqlite3.Cursor):
+    """
+    Cursor que mide cada sentencia: el tiempo de ``execute`` más el de leer
+    sus filas. El registro se emite al ejecutar la siguiente sentencia, al
+    agotarse las filas o al cerrar/liberar el cursor.
+    """
+
+    _record = None
+
+    def _start(self, sql, statements, elapsed, rows=0):
+        caller, use_case = _caller_info()
+        self._record = {
+            "ts": round(time.time(), 3),
+            "db": self.connection.trace_name,
+            "sql": normalize_sql(sql),
+            "statements": statements,
+            "duration_ms": elapsed * 1000,
+            "rows": rows,
+            "caller": caller,
+            "use_case": use_case,
+            "thread": threading.current_thread().name,
+        }
+
+    def _finish(self):
+        record, self._record = self._record, None
+        if record is not None:
+            record["duration_ms"] = round(record["duration_ms"], 3)
+            query_tracer.record(record)
+
+    def _fetched(self, rows, elapsed, exhausted=False):
+        record = self._record
+        if record is not None:
+            record["rows"] += rows
+            record["duration_ms"] += elapsed * 1000
+            if exhausted:
+                self._finish()
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        connection = self.connection
+        start = time.perf_counter()
+        with connection.capture() as statements:
+            super().execute(sql, parameters)
+        elapsed = time.perf_counter() - start
+        # Sentencias de escritura: filas afectadas
+        rows = max(self.rowcount, 0)
+        self._start(sql, statements, elapsed, rows)
+        connection.explain(sql, parameters)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        start = time.perf_counter()
+        with self.connection.capture() as statements:
+            super().executemany(sql, seq_of_parameters)
+        elapsed = time.perf_counter() - start
+        # Con muchas filas solo se guardan las primeras sentencias expandidas
+        self._start(sql, statements[:5], elapsed, max(self.rowcount, 0))
+        self._finish()
+        return self
+
+    def executescript(self, sql_script):
+        self._finish()
+        start = time.perf_counter()
+        with self.connection.capture() as statements:
+            super().executescript(sql_script)
+        self._start(sql_script, statements, time.perf_counter() - start)
+        self._finish()
+        return self
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(row is not None, time.perf_counter() - start, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(len(rows), time.perf_counter() - start, not rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(len(rows), time.perf_counter() - start, True)
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(0, time.perf_counter() - start, True)
+            raise
+        self._fetched(1, time.perf_counter() - start)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+
+class TracedConnection(sqlite3.Connection):
+    """
+    Conexión que entrega ``TracedCursor`` (también para los atajos
+    ``execute``/``executemany``/``executescript``), mide ``commit`` y pide el
+    ``EXPLAIN QUERY PLAN`` de cada consulta nueva.
+    """
+
+    def __init__(self, database, *args, **kwargs):
+        super().__init__(database, *args, **kwargs)
+        name = str(database)
+        if name.startswith("file:"):
+            name = name[5:].partition("?")[0]
+        self.trace_name = os.path.basename(name) or name
+        self._captured = None
+        self.set_trace_callback(self._on_statement)
+
+    def _on_statement(self, statement):
+        captured = self._captured
+        if captured is not None:
+            captured.append(statement)
+        else:
+            # Sentencias fuera de un cursor trazado (p. ej. BEGIN implícito)
+            caller, use_case = _caller_info()
+            query_tracer.record(
+                {
+                    "ts": round(time.time(), 3),
+                    "db": self.trace_name,
+                    "sql": normalize_sql(statement),
+                    "statements": [],
+                    "duration_ms": None,
+                    "rows": 0,
+                    "caller": caller,
+                    "use_case": use_case,
+                    "thread": threading.current_thread().name,
+                }
+            )
+
+    def capture(self):
+        return _StatementCapture(self)
+
+    def explain(self, sql, parameters=()):
+        """
+        Consulta el plan la primera vez que se ve ``sql`` en esta base.
+        """
+        text = normalize_sql(sql)
+        if not text.upper().startswith(_PLANNED_STATEMENTS):
+            return
+        if query_tracer.known_plan(self.trace_name, text) is not None:
+            return
+        self.set_trace_callback(None)
+        try:
+            rows = sqlite3.Connection.execute(
+                self, f"EXPLAIN QUERY PLAN {sql}", parameters
+            ).fetchall()
+            plan = [row[-1] for row in rows]
+        except sqlite3.Error as e:
+            plan = [f"(sin plan: {e})"]
+        finally:
+            self.set_trace_callback(self._on_statement)
+        query_tracer.add_plan(self.trace_name, text, plan)
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+    def commit(self):
+        cursor = self.cursor()
+        start = time.perf_counter()
+        with self.capture() as statements:
+            super().commit()
+        if statements:
+            cursor._start("COMMIT", statements, time.perf_counter() - start)
+            cursor._finish()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Como sqlite3.Connection, pero el COMMIT de ``with conn:`` se mide
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+class _StatementCapture:
+    """
+    Junta las sentencias que SQLite informa mientras corre una llamada.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = []
+
+    def __enter__(self):
+        self.connection._captured = self.statements
+        return self.statements
+
+    def __exit__(self, *exc):
+        self.connection._captured = None
+        return False
+
+
+def summarize_trace(path: str):
+    """
+    Agrupa un archivo de traza por consulta y devuelve filas ordenadas por
+    tiempo total: (consulta, ejecuciones, total ms, máx ms, filas, recorrido
+    completo, casos de uso).
+    """
+    groups = OrderedDict()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("duration_ms") is None:
+                continue
+            key = (record.get("db"), record.get("sql"))
+            group = groups.setdefault(
+                key,
+                {
+                    "count": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "rows": 0,
+                    "full_scan": False,
+                    "use_cases": set(),
+                },
+            )
+            duration = record["duration_ms"]
+            group["count"] += 1
+            group["total"] += duration
+            group["max"] = max(group["max"], duration)
+            group["rows"] += record.get("rows") or 0
+            group["full_scan"] = group["full_scan"] or bool(record.get("full_scan"))
+            if record.get("use_case"):
+                group["use_cases"].add(record["use_case"])
+    rows = [
+        (
+            f"{db}: {sql}",
+            g["count"],
+            g["total"],
+            g["max"],
+            g["rows"],
+            g["full_scan"],
+            sorted(g["use_cases"]),
+        )
+        for (db, sql), g in groups.items()
+    ]
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
@@ -21,11 +21,11 @@ def clear_database():
     Borra todos los registros de todas las tablas y deja la estructura intacta.
     Resetea los contadores de autoincremento y compacta el archivo.
     """
-    import sqlite3
     from config.paths import get_database_path
+    from .connection import connect
 
     db_path = get_database_path()
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
     # Solo borrar la tabla de operadores
     cursor.execute("DELETE FROM radio_operators;")
@@ -23,4 +23,26 @@ def init_radioamateur_table(conn):
     """
     cursor = conn.cursor()
     cursor.execute(sql)
+    # Índice de vencimientos (entero) de operadores habilitados: la
+    # deshabilitación de vencidos es un recorrido por rango en este índice
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_radio_operators_expiration "
+        "ON radio_operators(CAST(expiration_date AS INTEGER)) "
+        "WHERE IFNULL(enabled, 1) = 1"
+    )
+    init_maintenance_table(conn)
     conn.commit()
+
+
+def init_maintenance_table(conn):
+    """
+    Crea la tabla con la última ejecución de cada tarea de mantenimiento.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS maintenance_runs (
+            task TEXT PRIMARY KEY,
+            run_date TEXT,
+            run_at INTEGER,
+            affected INTEGER
+        )
+        """)
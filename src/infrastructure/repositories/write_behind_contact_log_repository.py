@@ -0,0 +1,364 @@
+"""
+Repositorio de contactos con escritura diferida (write-behind).
+
+``save_contact`` confirma el contacto en memoria y lo agrega a un journal de
+solo anexado junto al archivo del log; un hilo escritor lo persiste en SQLite
+en transacciones agrupadas (cada ``flush_interval`` segundos o al acumular
+``batch_size`` contactos). Si la aplicación se cierra de forma abrupta, los
+contactos pendientes se recuperan del journal la próxima vez que se abre el log.
+Las tareas derivadas de cada cambio (p. ej. actualizar el índice de QSOs) se
+encolan con ``run_after_write`` y las ejecuta el mismo hilo escritor.
+"""
+
+import atexit
+import json
+import os
+import threading
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, List, Optional
+
+from domain.repositories.contact_log_repository import ContactLogRepository
+from infrastructure.db.connection import connect, open_connection
+
+JOURNAL_SUFFIX = ".qso-journal"
+
+_open_repositories = weakref.WeakSet()
+
+
+def get_journal_path(db_path: str) -> str:
+    """
+    Ruta del journal de contactos pendientes para un archivo de log.
+    (No usar ``-journal``: es el sufijo del journal propio de SQLite.)
+    """
+    return db_path + JOURNAL_SUFFIX
+
+
+def recover_journal(db_path: str) -> int:
+    """
+    Aplica al log los contactos del journal que no alcanzaron a persistirse
+    (y los borrados de contactos pendientes, marcados con ``deleted``) y
+    elimina el journal. Devuelve la cantidad de entradas recuperadas.
+    Las líneas incompletas (escritura interrumpida) se descartan.
+    """
+    journal_path = get_journal_path(db_path)
+    if not os.path.exists(journal_path):
+        return 0
+    rows = OrderedDict()
+    deleted = set()
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                if entry.get("deleted"):
+                    rows.pop(entry["id"], None)
+                    deleted.add(entry["id"])
+                    continue
+                rows[entry["id"]] = (entry["id"], entry["log_id"], entry["data"])
+                deleted.discard(entry["id"])
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+    if rows or deleted:
+        with open_connection(db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO contacts (id, log_id, data) VALUES (?, ?, ?)",
+                list(rows.values()),
+            )
+            conn.executemany(
+                "DELETE FROM contacts WHERE id = ?", [(cid,) for cid in deleted]
+            )
+            conn.commit()
+    os.remove(journal_path)
+    return len(rows) + len(deleted)
+
+
+class WriteBehindContactLogRepository(ContactLogRepository):
+    """
+    ``ContactLogRepository`` que difiere la escritura de contactos nuevos.
+    Las lecturas (``get_contacts``) incluyen los contactos aún pendientes, y
+    las ediciones/borrados vacían la cola antes de ejecutarse para respetar
+    el orden de las operaciones. Si un contacto sigue pendiente (el lote no se
+    pudo escribir), la edición reemplaza el pendiente y el borrado lo descarta,
+    para que un reintento del escritor no deshaga el cambio.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        flush_interval: float = 0.2,
+        batch_size: int = 50,
+        fsync_journal: bool = False,
+    ):
+        super().__init__(db_path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.fsync_journal = fsync_journal
+        self.journal_path = get_journal_path(db_path)
+        self.recovered = recover_journal(db_path)
+        self._pending = OrderedDict()  # id -> (log_id, data_json)
+        self._after_write = deque()  # (acción, args) a ejecutar en el escritor
+        self._cond = threading.Condition()
+        # Serializa los lotes del escritor con las ediciones/borrados directos
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._flush_requested = False
+        self._last_error = None
+        self._failed_writes = 0
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._writer = threading.Thread(
+            target=self._run_writer, name="contact-write-behind", daemon=True
+        )
+        self._writer.start()
+        _open_repositories.add(self)
+
+    # --- API de escritura ---
+
+    def save_contact(self, log_id: str, contact: Any):
+        data = contact if isinstance(contact, dict) else contact.__dict__
+        contact_id = data.get("id") or str(uuid.uuid4())
+        data_json = json.dumps(data)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("El repositorio de contactos ya fue cerrado.")
+            self._append_journal(
+                {"id": contact_id, "log_id": log_id, "data": data_json}
+            )
+            self._pending.pop(contact_id, None)
+            self._pending[contact_id] = (log_id, data_json)
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def save_contacts_bulk(self, log_id: str, contacts: List[Any]) -> int:
+        # Las importaciones masivas van directo a SQLite, después de lo pendiente
+        self.flush()
+        return super().save_contacts_bulk(log_id, contacts)
+
+    def delete_contact(self, contact_id: str):
+        self.flush()
+        with self._write_lock:
+            self._replace_pending(contact_id, None)
+            super().delete_contact(contact_id)
+
+    def update_contact(self, contact_id: str, contact: Any):
+        self.flush()
+        with self._write_lock:
+            if not self._replace_pending(contact_id, json.dumps(contact.__dict__)):
+                super().update_contact(contact_id, contact)
+
+    def update_contact_data(self, contact_id: str, contact_data: dict):
+        self.flush()
+        with self._write_lock:
+            if not self._replace_pending(contact_id, json.dumps(contact_data)):
+                super().update_contact_data(contact_id, contact_data)
+
+    def delete_log(self, log_id: str):
+        self.flush()
+        with self._write_lock:
+            with self._cond:
+                pending = [
+                    cid for cid, (lid, _) in self._pending.items() if lid == log_id
+                ]
+            for contact_id in pending:
+                self._replace_pending(contact_id, None)
+            super().delete_log(log_id)
+
+    def _replace_pending(self, contact_id: str, data_json: Optional[str]) -> bool:
+        """
+        Si el contacto sigue pendiente, reemplaza sus datos (o lo descarta si
+        ``data_json`` es None) y lo anota en el journal. Devuelve True si
+        estaba pendiente. Se llama con ``_write_lock`` tomado.
+        """
+        with self._cond:
+            entry = self._pending.get(contact_id)
+            if entry is None:
+                return False
+            log_id = entry[0]
+            if data_json is None:
+                del self._pending[contact_id]
+                line = {"id": contact_id, "log_id": log_id, "deleted": True}
+            else:
+                self._pending[contact_id] = (log_id, data_json)
+                line = {"id": contact_id, "log_id": log_id, "data": data_json}
+            if not self._journal.closed:
+                self._append_journal(line)
+            return True
+
+    def _append_journal(self, entry: dict):
+        # Llamar con ``_cond`` tomado
+        self._journal.write(json.dumps(entry) + "\n")
+        self._journal.flush()
+        if self.fsync_journal:
+            os.fsync(self._journal.fileno())
+
+    def run_after_write(self, action, *args):
+        """
+        Ejecuta ``action(*args)`` en el hilo escritor, después de persistir
+        los contactos pendientes, para no demorar al hilo que guarda. Si el
+        repositorio ya está cerrado, se ejecuta en el hilo actual.
+        """
+        with self._cond:
+            if not self._closed:
+                self._after_write.append((action, args))
+                return
+        action(*args)
+
+    # --- API de lectura ---
+
+    def get_contacts(self, log_id: str) -> List[Any]:
+        with self._cond:
+            pending = [
+                (cid, data)
+                for cid, (lid, data) in self._pending.items()
+                if lid == log_id
+            ]
+        contacts = super().get_contacts(log_id)
+        if not pending:
+            return contacts
+        positions = {
+            c.get("id"): i for i, c in enumerate(contacts) if isinstance(c, dict)
+        }
+        for contact_id, data in pending:
+            contact = json.loads(data)
+            if not contact.get("id"):
+                contact["id"] = contact_id
+            if contact_id in positions:
+                contacts[positions[contact_id]] = contact
+            else:
+                contacts.append(contact)
+        return contacts
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    # --- Persistencia ---
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Espera a que el escritor persista todos los contactos pendientes.
+        Si el escritor no está activo, los escribe en el hilo actual.
+        Devuelve True si no quedan pendientes.
+        """
+        with self._cond:
+            if not self._pending:
+                return True
+            if self._writer.is_alive() and not self._closed:
+                self._flush_requested = True
+                self._cond.notify_all()
+                # Sin esperar todo el timeout si el escritor no pudo escribir
+                failed = self._failed_writes
+                self._cond.wait_for(
+                    lambda: not self._pending or self._failed_writes != failed,
+                    timeout,
+                )
+                if not self._pending:
+                    return True
+        return self._write_pending()
+
+    def close(self):
+        """
+        Detiene el escritor, persiste lo pendiente y elimina el journal.
+        Se llama al cerrar el log y al salir de la aplicación.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+        self._write_pending()
+        self._run_after_write()
+        with self._cond:
+            self._journal.close()
+            if not self._pending and os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        _open_repositories.discard(self)
+
+    def _run_writer(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or self._flush_requested
+                    or len(self._pending) >= self.batch_size,
+                    self.flush_interval,
+                )
+                if self._closed:
+                    return
+                self._flush_requested = False
+                has_pending = bool(self._pending)
+                if not has_pending and not self._after_write:
+                    continue
+            if has_pending and not self._write_pending():
+                continue
+            self._run_after_write()
+
+    def _run_after_write(self):
+        while True:
+            with self._cond:
+                if not self._after_write:
+                    return
+                action, args = self._after_write.popleft()
+            try:
+                action(*args)
+            except Exception as e:
+                print(f"No se pudo completar una tarea posterior al guardado: {e}")
+
+    def _write_pending(self) -> bool:
+        with self._write_lock:
+            return self._write_pending_locked()
+
+    def _write_pending_locked(self) -> bool:
+        with self._cond:
+            batch = list(self._pending.items())
+        if not batch:
+            return True
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            # Los contactos siguen en memoria y en el journal; se reintentará
+            print(f"No se pudieron persistir contactos pendientes: {e}")
+            with self._cond:
+                self._last_error = e
+                self._failed_writes += 1
+                self._cond.notify_all()
+            return False
+        with self._cond:
+            for contact_id, value in batch:
+                if self._pending.get(contact_id) is value:
+                    del self._pending[contact_id]
+            if not self._pending and not self._journal.closed:
+                # Todo lo anotado en el journal ya está en la base
+                self._journal.seek(0)
+                self._journal.truncate()
+            self._cond.notify_all()
+            return not self._pending
+
+    def _write_batch(self, batch):
+        """
+        Persiste un lote de contactos en una única transacción.
+        """
+        conn = connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO contacts (id, log_id, data) VALUES (?, ?, ?)",
+                    [(cid, log_id, data) for cid, (log_id, data) in batch],
+                )
+        finally:
+            conn.close()
+
+
+@atexit.register
+def close_all_write_behind_repositories():
+    """
+    Garantiza que ningún contacto pendiente quede sin persistir al salir.
+    """
+    for repo in list(_open_repositories):
+        try:
+            repo.close()
+        except Exception as e:
+            print(f"No se pudo cerrar el repositorio de contactos: {e}")
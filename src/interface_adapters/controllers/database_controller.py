@@ -3,6 +3,8 @@ Controlador para operaciones de base de datos: backup, restaurar e importar.
 """
 
 import csv
+import functools
+import gzip
 from domain.callsign_utils import get_country_full_name
 from utils.text import normalize_ascii
 from utils.datetime import format_iso_date, format_iso_datetime
@@ -12,91 +14,136 @@ from infrastructure.db.backup_restore import (
     restore_backup,
     import_from_external_db,
 )
-from interface_adapters.controllers.radio_operator_controller import (
-    RadioOperatorController,
-)
+from infrastructure.db.queries import iter_radio_operators
+
+# Orden y claves de columna como en la tabla de la base de datos
+OPERATORS_CSV_COLUMNS = [
+    "callsign",
+    "name",
+    "category",
+    "type",
+    "region",
+    "district",
+    "province",
+    "department",
+    "license",
+    "resolution",
+    "expiration_date",
+    "cutoff_date",
+    "enabled",
+    "country",
+    "updated_at",
+]
+# Operadores leídos por bloque durante la exportación
+OPERATORS_EXPORT_BATCH_SIZE = 2000
+
+
+def _date_value(value):
+    # Mismo criterio que el repositorio: texto numérico a int, vacío a None
+    if isinstance(value, str):
+        if value.isdigit():
+            return int(value)
+        if value.strip() == "":
+            return None
+    return value
+
+
+@functools.lru_cache(maxsize=65536)
+def _csv_date(value) -> str:
+    """
+    Fecha ``DD/MM/YYYY``. Muchos operadores comparten vencimiento y fecha de
+    corte, por lo que el resultado se guarda en caché por valor.
+    """
+    date_str = format_iso_date(_date_value(value))
+    if not date_str:
+        return ""
+    y, m, d = date_str.split("-")
+    return f"{d}/{m}/{y}"
+
+
+@functools.lru_cache(maxsize=65536)
+def _csv_datetime(value) -> str:
+    """
+    Fecha y hora ``HH:MM:SS DD/MM/YYYY``, en caché por valor.
+    """
+    dt_str = format_iso_datetime(_date_value(value))
+    if not dt_str:
+        return ""
+    date_part, time_part = dt_str.split(" ")
+    y, m, d = date_part.split("-")
+    return f"{time_part} {d}/{m}/{y}"
 
 
 class DatabaseController:
     @staticmethod
-    def export_database_to_csv(csv_path, translation_service):
+    def export_database_to_csv(
+        csv_path,
+        translation_service,
+        compress=None,
+        db_path=None,
+        batch_size=OPERATORS_EXPORT_BATCH_SIZE,
+    ):
         """
         Exporta la base de datos de operadores a un archivo CSV, respetando el orden, formato y traducción visual de la tabla.
+        Los operadores se leen por bloques de un cursor ordenado por indicativo.
+        Si ``compress`` es None, la salida se comprime con gzip cuando la ruta
+        termina en ``.gz``. Devuelve la cantidad de operadores exportados.
         """
-
-        controller = RadioOperatorController()
-        operators = controller.list_operators()
-        # Orden y claves de columna como en la tabla
-        COLUMN_KEYS = [
-            "callsign",
-            "name",
-            "category",
-            "type",
-            "region",
-            "district",
-            "province",
-            "department",
-            "license",
-            "resolution",
-            "expiration_date",
-            "cutoff_date",
-            "enabled",
-            "country",
-            "updated_at",
-        ]
-        # Encabezados traducidos
+        if compress is None:
+            compress = str(csv_path).lower().endswith(".gz")
+        # Encabezados, idioma y textos fijos se resuelven una sola vez
         headers = [
-            translation_service.tr(f"db_table_header_{key}") for key in COLUMN_KEYS
+            translation_service.tr(f"db_table_header_{key}")
+            for key in OPERATORS_CSV_COLUMNS
         ]
+        lang_enum = (
+            translation_service.get_language()
+            if hasattr(translation_service, "get_language")
+            else "es"
+        )
+        lang = "es" if str(lang_enum).lower().endswith("es") else "en"
+        yes_text = translation_service.tr("yes")
+        no_text = translation_service.tr("no")
+        countries = {}
 
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        def country_text(itu_code):
+            text = countries.get(itu_code)
+            if text is None:
+                country_name = get_country_full_name(itu_code, lang) or itu_code
+                text = countries[itu_code] = str(normalize_ascii(country_name))
+            return text
+
+        if compress:
+            f = gzip.open(csv_path, "wt", compresslevel=6, newline="", encoding="utf-8")
+        else:
+            f = open(csv_path, "w", newline="", encoding="utf-8")
+        count = 0
+        with f:
             writer = csv.writer(f)
             writer.writerow(headers)
-            for op in operators:
-                row = []
-
-                lang_enum = (
-                    translation_service.get_language()
-                    if hasattr(translation_service, "get_language")
-                    else "es"
+            for rows in iter_radio_operators(batch_size, db_path):
+                writer.writerows(
+                    [
+                        str(r[0]),
+                        str(r[1]),
+                        str(r[2]),
+                        str(r[3]),
+                        str(r[4]),
+                        str(r[5]),
+                        str(r[6]),
+                        str(r[7]),
+                        str(r[8]),
+                        str(r[9]),
+                        _csv_date(r[10]),
+                        _csv_date(r[11]),
+                        yes_text if r[12] == 1 else no_text,
+                        country_text(r[13]),
+                        _csv_datetime(r[14]),
+                    ]
+                    for r in rows
                 )
-                lang = "es" if str(lang_enum).lower().endswith("es") else "en"
-
-                for key in COLUMN_KEYS:
-                    if key == "enabled":
-                        value = (
-                            translation_service.tr("yes")
-                            if getattr(op, key) == 1
-                            else translation_service.tr("no")
-                        )
-                    elif key == "country":
-                        itu_code = getattr(op, key, "")
-                        country_name = get_country_full_name(itu_code, lang) or itu_code
-                        value = normalize_ascii(country_name)
-                    elif key in ("expiration_date", "cutoff_date"):
-                        date_str = format_iso_date(getattr(op, key, ""))
-                        if date_str:
-                            parts = date_str.split("-")
-                            value = f"{parts[2]}/{parts[1]}/{parts[0]}"
-                        else:
-                            value = ""
-                    elif key == "updated_at":
-                        dt_str = format_iso_datetime(getattr(op, key, ""))
-                        if dt_str:
-                            date_part, time_part = dt_str.split(" ")
-                            y, m, d = date_part.split("-")
-                            value = f"{time_part} {d}/{m}/{y}"
-                        else:
-                            value = ""
-                    else:
-                        attr = (
-                            "type_"
-                            if key == "type"
-                            else ("license_" if key == "license" else key)
-                        )
-                        value = getattr(op, attr, "")
-                    row.append(str(value))
-                writer.writerow(row)
+                count += len(rows)
+        return count
 
     @staticmethod
     def backup_database():
@@ -0,0 +1,311 @@
+"""
+BatchExportDialog
+Diálogo para exportar varios logs a varios formatos en segundo plano.
+"""
+
+# --- Imports de la librería estándar ---
+import datetime
+
+# --- Imports de terceros ---
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QGridLayout,
+    QLabel,
+    QComboBox,
+    QDateEdit,
+    QPushButton,
+    QListWidget,
+    QListWidgetItem,
+    QCheckBox,
+    QProgressBar,
+    QPlainTextEdit,
+)
+from PySide6.QtCore import Qt, QDate, QThread, Signal, QUrl
+from PySide6.QtGui import QDesktopServices
+
+# --- Imports de la aplicación ---
+from translation.translation_service import translation_service
+from interface_adapters.ui.view_manager import LogType
+from application.use_cases.log_catalog import find_logs
+from application.use_cases.batch_export import (
+    BATCH_EXPORT_FORMATS,
+    export_logs_batch,
+    format_batch_export_report,
+)
+from utils.fonts import build_roboto_mono_font
+
+CONTEST_KEYS = [
+    "contest_world_radio_day",
+    "contest_independence_peru",
+    "contest_peruvian_ham_day",
+]
+
+
+class BatchExportThread(QThread):
+    """
+    Ejecuta la exportación en lote fuera del hilo de la UI.
+    """
+
+    jobFinished = Signal(object)
+    batchFinished = Signal(object)
+
+    def __init__(self, db_paths, formats, language=None, parent=None):
+        super().__init__(parent)
+        self.db_paths = db_paths
+        self.formats = formats
+        self.language = language
+
+    def run(self):
+        summary = export_logs_batch(
+            self.db_paths,
+            self.formats,
+            language=self.language,
+            progress_callback=self.jobFinished.emit,
+        )
+        self.batchFinished.emit(summary)
+
+
+def _qdate_to_timestamp(qdate: QDate, end_of_day: bool = False) -> int:
+    # Los logs guardan start_time en UTC; las fechas se eligen en hora OA (UTC-5)
+    day = datetime.datetime(qdate.year(), qdate.month(), qdate.day())
+    if end_of_day:
+        day += datetime.timedelta(days=1)
+    utc = day + datetime.timedelta(hours=5)
+    ts = int(utc.replace(tzinfo=datetime.timezone.utc).timestamp())
+    return ts - 1 if end_of_day else ts
+
+
+class BatchExportDialog(QDialog):
+    """
+    Permite filtrar logs del catálogo (tipo, concurso y rango de fechas),
+    elegir formatos y exportarlos en paralelo sin bloquear la aplicación.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el diálogo de exportación en lote.
+        Args:
+            parent (QWidget, opcional): Widget padre.
+        """
+        super().__init__(parent)
+        self.setWindowTitle(translation_service.tr("batch_export_title"))
+        self.setMinimumSize(640, 520)
+        self._thread = None
+        self._summary = None
+        layout = QVBoxLayout(self)
+
+        # --- Filtros ---
+        filters = QGridLayout()
+        filters.addWidget(QLabel(translation_service.tr("batch_export_log_type")), 0, 0)
+        self.type_box = QComboBox(self)
+        self.type_box.addItem(translation_service.tr("batch_export_all"), None)
+        self.type_box.addItem(
+            translation_service.tr("batch_export_operations"), LogType.OPERATION_LOG
+        )
+        self.type_box.addItem(
+            translation_service.tr("batch_export_contests"), LogType.CONTEST_LOG
+        )
+        self.type_box.setCurrentIndex(2)
+        filters.addWidget(self.type_box, 0, 1)
+        filters.addWidget(QLabel(translation_service.tr("batch_export_contest")), 0, 2)
+        self.contest_box = QComboBox(self)
+        self.contest_box.addItem(translation_service.tr("batch_export_all"), None)
+        for key in CONTEST_KEYS:
+            self.contest_box.addItem(translation_service.tr(key), key)
+        filters.addWidget(self.contest_box, 0, 3)
+        today = QDate.currentDate()
+        filters.addWidget(QLabel(translation_service.tr("batch_export_from")), 1, 0)
+        self.from_date = QDateEdit(QDate(today.year(), 1, 1), self)
+        self.from_date.setCalendarPopup(True)
+        filters.addWidget(self.from_date, 1, 1)
+        filters.addWidget(QLabel(translation_service.tr("batch_export_to")), 1, 2)
+        self.to_date = QDateEdit(today, self)
+        self.to_date.setCalendarPopup(True)
+        filters.addWidget(self.to_date, 1, 3)
+        self.search_btn = QPushButton(
+            translation_service.tr("batch_export_search"), self
+        )
+        filters.addWidget(self.search_btn, 1, 4)
+        layout.addLayout(filters)
+
+        # --- Logs encontrados ---
+        self.log_list = QListWidget(self)
+        self.log_list.setFont(build_roboto_mono_font(10, bold=False))
+        layout.addWidget(self.log_list)
+        select_row = QHBoxLayout()
+        self.select_all_btn = QPushButton(
+            translation_service.tr("batch_export_select_all"), self
+        )
+        self.select_none_btn = QPushButton(
+            translation_service.tr("batch_export_select_none"), self
+        )
+        select_row.addWidget(self.select_all_btn)
+        select_row.addWidget(self.select_none_btn)
+        select_row.addStretch(1)
+        layout.addLayout(select_row)
+
+        # --- Formatos ---
+        formats_row = QHBoxLayout()
+        formats_row.addWidget(QLabel(translation_service.tr("batch_export_formats")))
+        self.format_checks = {}
+        for fmt in BATCH_EXPORT_FORMATS:
+            check = QCheckBox(fmt.upper(), self)
+            check.setChecked(fmt in ("txt", "adi"))
+            self.format_checks[fmt] = check
+            formats_row.addWidget(check)
+        formats_row.addStretch(1)
+        layout.addLayout(formats_row)
+
+        # --- Progreso y reporte ---
+        self.progress = QProgressBar(self)
+        self.progress.setValue(0)
+        layout.addWidget(self.progress)
+        self.report = QPlainTextEdit(self)
+        self.report.setReadOnly(True)
+        self.report.setFont(build_roboto_mono_font(10, bold=False))
+        layout.addWidget(self.report)
+
+        buttons = QHBoxLayout()
+        self.open_folder_btn = QPushButton(
+            translation_service.tr("batch_export_open_folder"), self
+        )
+        self.open_folder_btn.setEnabled(False)
+        self.export_btn = QPushButton(
+            translation_service.tr("batch_export_start"), self
+        )
+        buttons.addWidget(self.open_folder_btn)
+        buttons.addStretch(1)
+        buttons.addWidget(self.export_btn)
+        layout.addLayout(buttons)
+
+        self.type_box.currentIndexChanged.connect(self._on_type_changed)
+        self.search_btn.clicked.connect(self.search_logs)
+        self.select_all_btn.clicked.connect(lambda: self._set_all_checked(True))
+        self.select_none_btn.clicked.connect(lambda: self._set_all_checked(False))
+        self.export_btn.clicked.connect(self.start_export)
+        self.open_folder_btn.clicked.connect(self._open_export_folder)
+        self._on_type_changed()
+        self.search_logs()
+
+    def _on_type_changed(self, *args):
+        self.contest_box.setEnabled(
+            self.type_box.currentData() != LogType.OPERATION_LOG
+        )
+
+    def _set_all_checked(self, checked: bool):
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        for i in range(self.log_list.count()):
+            self.log_list.item(i).setCheckState(state)
+
+    def search_logs(self):
+        """
+        Consulta el catálogo con los filtros actuales y lista los logs encontrados.
+        """
+        contest_key = (
+            self.contest_box.currentData() if self.contest_box.isEnabled() else None
+        )
+        try:
+            entries = find_logs(
+                log_type=self.type_box.currentData(),
+                contest_key=contest_key,
+                start_from=_qdate_to_timestamp(self.from_date.date()),
+                start_to=_qdate_to_timestamp(self.to_date.date(), end_of_day=True),
+            )
+        except Exception as e:
+            print(f"No se pudo consultar el catálogo de logs: {e}")
+            entries = []
+        self.log_list.clear()
+        for entry in entries:
+            start = ""
+            if entry.start_time:
+                start = (
+                    datetime.datetime.fromtimestamp(
+                        entry.start_time, tz=datetime.timezone.utc
+                    )
+                    - datetime.timedelta(hours=5)
+                ).strftime("%Y-%m-%d %H:%M")
+            label = (
+                f"{start:<16}  {entry.operator:<10}  {entry.contact_count:>6} QSO  "
+                f"{translation_service.tr(entry.contest_key or entry.operation_type or '')}"
+            )
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, entry.path)
+            item.setToolTip(entry.path)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.log_list.addItem(item)
+
+    def selected_paths(self):
+        return [
+            self.log_list.item(i).data(Qt.ItemDataRole.UserRole)
+            for i in range(self.log_list.count())
+            if self.log_list.item(i).checkState() == Qt.CheckState.Checked
+        ]
+
+    def selected_formats(self):
+        return [fmt for fmt, check in self.format_checks.items() if check.isChecked()]
+
+    def start_export(self):
+        """
+        Inicia la exportación en segundo plano de los logs y formatos marcados.
+        """
+        paths = self.selected_paths()
+        formats = self.selected_formats()
+        if not paths or not formats or self._thread is not None:
+            return
+        self._set_running(True)
+        self.progress.setRange(0, len(paths) * len(formats))
+        self.progress.setValue(0)
+        self.report.clear()
+        self._thread = BatchExportThread(
+            paths, formats, translation_service.get_language().value, self
+        )
+        self._thread.jobFinished.connect(self._on_job_finished)
+        self._thread.batchFinished.connect(self._on_batch_finished)
+        self._thread.start()
+
+    def _set_running(self, running: bool):
+        for widget in (
+            self.export_btn,
+            self.search_btn,
+            self.type_box,
+            self.contest_box,
+            self.from_date,
+            self.to_date,
+            self.log_list,
+        ):
+            widget.setEnabled(not running)
+        if not running:
+            self._on_type_changed()
+
+    def _on_job_finished(self, result):
+        self.progress.setValue(self.progress.value() + 1)
+        status = "ERROR" if result["error"] else ("-" if result["skipped"] else "OK")
+        self.report.appendPlainText(
+            f"{status:<5} {result['format']:<4} {result['path']}"
+        )
+
+    def _on_batch_finished(self, summary):
+        self._summary = summary
+        self._thread.wait()
+        self._thread = None
+        self._set_running(False)
+        self.report.setPlainText(format_batch_export_report(summary))
+        self.open_folder_btn.setEnabled(True)
+
+    def _open_export_folder(self):
+        if self._summary:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(self._summary["export_dir"]))
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def wait_for_export(self):
+        """
+        Espera a que termine la exportación en curso (p. ej. al salir de la app).
+        Cerrar el diálogo no la interrumpe.
+        """
+        if self._thread is not None:
+            self._thread.wait()
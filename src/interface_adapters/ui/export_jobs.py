@@ -0,0 +1,187 @@
+"""
+export_jobs.py
+Exportaciones de logs en segundo plano.
+
+Cada exportación corre en un ``QThreadPool`` (fuera del hilo de la UI) y
+reporta su avance en la barra de estado de la ventana principal, sin diálogos
+modales: el operador puede seguir registrando contactos mientras tanto. Al
+terminar se ofrece mostrar el archivo en su carpeta.
+"""
+
+import os
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import QLabel, QMessageBox, QProgressBar, QPushButton
+
+from translation.translation_service import translation_service
+
+
+class ExportJobSignals(QObject):
+    """
+    Señales de un trabajo de exportación. Se crean en el hilo de la UI, por
+    lo que las emisiones desde el pool llegan encoladas a ese hilo.
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(str)
+    failed = Signal(str)
+
+
+class ExportJob(QRunnable):
+    """
+    Ejecuta ``export_func(progress_callback=...)`` y emite el resultado.
+    ``export_func`` es una de las funciones de ``export_log`` ya ligada a la
+    ruta del log y del archivo de salida.
+    """
+
+    def __init__(self, export_func, export_path: str):
+        super().__init__()
+        self.export_func = export_func
+        self.export_path = export_path
+        self.signals = ExportJobSignals()
+
+    def run(self):
+        try:
+            path = self.export_func(progress_callback=self.signals.progress.emit)
+        except Exception as e:
+            print(f"No se pudo exportar el log: {e}")
+            self.signals.failed.emit(str(e) or e.__class__.__name__)
+            return
+        self.signals.finished.emit(path or self.export_path)
+
+
+class ExportJobRunner(QObject):
+    """
+    Encola exportaciones en un pool de un hilo (se ejecutan de a una, en
+    orden) y muestra en la barra de estado el archivo en curso, una barra de
+    progreso y, al terminar, un botón para abrir la carpeta del archivo.
+    """
+
+    jobFinished = Signal(str)
+    jobFailed = Signal(str, str)
+
+    def __init__(self, window, max_threads: int = 1):
+        super().__init__(window)
+        self.window = window
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._jobs = []  # Referencias hasta que cada trabajo termina
+        self._last_path = None
+
+        status_bar = window.statusBar()
+        self.label = QLabel(window)
+        self.progress_bar = QProgressBar(window)
+        self.progress_bar.setMaximumWidth(160)
+        self.progress_bar.setTextVisible(True)
+        self.open_button = QPushButton(
+            translation_service.tr("export_show_in_folder"), window
+        )
+        self.open_button.setFlat(True)
+        self.open_button.clicked.connect(self._open_last_export)
+        status_bar.addPermanentWidget(self.label)
+        status_bar.addPermanentWidget(self.progress_bar)
+        status_bar.addPermanentWidget(self.open_button)
+        self._set_idle()
+
+    # --- API ---
+
+    def start(self, export_func, export_path: str) -> ExportJob:
+        """
+        Encola la exportación y devuelve el trabajo creado.
+        """
+        job = ExportJob(export_func, export_path)
+        job.signals.progress.connect(
+            lambda done, total: self._on_progress(job, done, total)
+        )
+        job.signals.finished.connect(lambda path: self._on_finished(job, path))
+        job.signals.failed.connect(lambda error: self._on_failed(job, error))
+        self._jobs.append(job)
+        if len(self._jobs) == 1:
+            self._show_running()
+        else:
+            self._update_running_label()
+        self.pool.start(job)
+        return job
+
+    def is_running(self) -> bool:
+        return bool(self._jobs)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Espera a que terminen las exportaciones en curso (p. ej. al cerrar).
+        """
+        return self.pool.waitForDone(msecs)
+
+    def retranslate_ui(self):
+        self.open_button.setText(translation_service.tr("export_show_in_folder"))
+        if self._jobs:
+            self._update_running_label()
+        else:
+            self._set_idle()
+
+    # --- Estado en la barra ---
+
+    def _set_idle(self):
+        # Sin exportaciones en curso: queda a la vista la última completada
+        if self._last_path is not None:
+            self.label.setText(
+                translation_service.tr("export_done").format(
+                    file=os.path.basename(self._last_path)
+                )
+            )
+        self.label.setVisible(self._last_path is not None)
+        self.progress_bar.setVisible(False)
+        self.open_button.setVisible(self._last_path is not None)
+
+    def _update_running_label(self):
+        # Archivo en curso y cantidad de exportaciones en cola
+        pending = len(self._jobs) - 1
+        text = translation_service.tr("export_in_progress").format(
+            file=os.path.basename(self._jobs[0].export_path)
+        )
+        if pending:
+            text += f" (+{pending})"
+        self.label.setText(text)
+
+    def _show_running(self):
+        self._update_running_label()
+        self.label.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminado hasta el primer bloque
+        self.progress_bar.setVisible(True)
+        self.open_button.setVisible(False)
+
+    def _on_progress(self, job, done, total):
+        if not self._jobs or self._jobs[0] is not job:
+            return
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+
+    def _finish_job(self, job):
+        if job in self._jobs:
+            self._jobs.remove(job)
+        if self._jobs:
+            self._show_running()
+        else:
+            self._set_idle()
+
+    def _on_finished(self, job, path):
+        self._last_path = path
+        self._finish_job(job)
+        self.jobFinished.emit(path)
+
+    def _on_failed(self, job, error):
+        self._finish_job(job)
+        self.jobFailed.emit(job.export_path, error)
+        QMessageBox.critical(
+            self.window,
+            translation_service.tr("export_log"),
+            f"{translation_service.tr('export_failed')}: {error}",
+        )
+
+    def _open_last_export(self):
+        from interface_adapters.ui.main_window_actions import (
+            open_folder_and_select_file,
+        )
+
+        if self._last_path:
+            open_folder_and_select_file(self._last_path)
@@ -0,0 +1,38 @@
+"""
+log_loader.py
+Carga en segundo plano de los contactos anteriores de un log abierto de forma
+progresiva (ver ``open_log(..., recent_limit=...)``).
+"""
+
+from PySide6.QtCore import QThread, Signal
+
+from application.use_cases.open_log import (
+    OPEN_LOG_STREAM_CHUNK_SIZE,
+    iter_remaining_contacts,
+)
+
+
+class ContactStreamLoader(QThread):
+    """
+    Lee los contactos restantes del log en bloques y los emite con
+    ``chunkLoaded`` (cada bloque en orden cronológico, del más reciente al más
+    antiguo). La lectura se detiene con ``requestInterruption``.
+    """
+
+    chunkLoaded = Signal(object)
+    loadFailed = Signal(str)
+
+    def __init__(self, log, chunk_size=OPEN_LOG_STREAM_CHUNK_SIZE, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self.chunk_size = chunk_size
+
+    def run(self):
+        try:
+            for chunk in iter_remaining_contacts(self.log, self.chunk_size):
+                if self.isInterruptionRequested():
+                    return
+                self.chunkLoaded.emit(chunk)
+        except Exception as e:
+            print(f"No se pudieron cargar los contactos restantes del log: {e}")
+            self.loadFailed.emit(str(e))
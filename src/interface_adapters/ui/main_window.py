@@ -18,12 +18,19 @@ from config.settings_service import (
     CallsignMode,
 )
 from utils.resources import get_resource_path
+from utils.startup_trace import trace_phase
 from translation.translation_service import translation_service
+from application.use_cases.contact_management import (
+    open_contact_writer,
+    close_all_contact_writers,
+)
+from .log_loader import ContactStreamLoader
+from .export_jobs import ExportJobRunner
+from .perf_overlay import PerfOverlay
+from .maintenance_worker import StartupMaintenanceWorker
 from .themes.theme_manager import ThemeManager
 from .menu_bar import MainMenuBar
 from .views.welcome_view import WelcomeView
-from .views.log_ops_view import LogOpsView
-from .views.log_contest_view import LogContestView
 from .view_manager import ViewManager, ViewID, LogType
 from .main_window_actions import (
     action_log_new_operativo,
@@ -46,7 +53,10 @@ from .main_window_actions import (
     action_log_export_csv,
     action_log_export_adi,
     action_log_export_pdf,
+    action_log_export_cabrillo,
     action_log_export_simple_text,
+    action_log_export_batch,
+    action_log_import_adif,
 )
 from .main_window_dialogs import show_about_dialog, show_manual_dialog
 from .main_window_config import (
@@ -87,13 +97,21 @@ class MainWindow(QMainWindow):
             None  # Instancia única de ventana de tabla de base de datos
         )
         self.manual_window = None  # Instancia única de ventana de manual de ayuda
+        self.batch_export_dialog = None  # Instancia única de exportación en lote
+        self._contact_loader = None  # Carga en segundo plano de contactos anteriores
+        self._contact_loader_generation = None
+        # Bloques ya cargados que faltan agregar a current_log.contacts
+        self._loaded_chunks = []
+        self._loaded_chunks_target = None
+        self._maintenance_worker = None  # Mantenimiento de inicio en segundo plano
 
         # Configuración de idioma y título
         lang = settings_service.get_value(
             SettingsKey.LANGUAGE.value, LanguageValue.ES.value
         )
         lang_enum = LanguageValue(lang)
-        translation_service.set_language(lang_enum)
+        with trace_phase("translation.set_language", lang=lang):
+            translation_service.set_language(lang_enum)
         # Título con versión
         base_title = translation_service.tr("main_window_title")
         # Guardar versión y usar helper para setear el título
@@ -103,20 +121,31 @@ class MainWindow(QMainWindow):
         self.center()
 
         # Barra de menús
-        self.menu_bar = MainMenuBar(self)
-        self.setMenuBar(self.menu_bar)
+        with trace_phase("MainMenuBar"):
+            self.menu_bar = MainMenuBar(self)
+            self.setMenuBar(self.menu_bar)
+
+        # Exportaciones en segundo plano, con avance en la barra de estado
+        self.export_jobs = ExportJobRunner(self)
+        # Latencias de captura (herramienta de desarrollo, Ctrl+Shift+F12)
+        self.perf_overlay = PerfOverlay(self)
 
         # Gestor de temas
-        self.theme_manager = ThemeManager()
-        self.theme_manager.load_last_theme()
+        with trace_phase("theme.load_last_theme"):
+            self.theme_manager = ThemeManager()
+            self.theme_manager.load_last_theme()
 
-        # Gestor de vistas
+        # Gestor de vistas: las vistas de log se construyen al abrir un log
         self.view_manager = ViewManager(self)
-        self.log_ops_view = LogOpsView(self)
-        self.log_contest_view = LogContestView(self)
-        self.view_manager.register_view(ViewID.WELCOME_VIEW, WelcomeView(self))
-        self.view_manager.register_view(ViewID.LOG_OPS_VIEW, self.log_ops_view)
-        self.view_manager.register_view(ViewID.LOG_CONTEST_VIEW, self.log_contest_view)
+        with trace_phase("view.WelcomeView"):
+            welcome_view = WelcomeView(self)
+        self.view_manager.register_view(ViewID.WELCOME_VIEW, welcome_view)
+        self.view_manager.register_factory(
+            ViewID.LOG_OPS_VIEW, self._create_log_ops_view
+        )
+        self.view_manager.register_factory(
+            ViewID.LOG_CONTEST_VIEW, self._create_log_contest_view
+        )
         self.setCentralWidget(self.view_manager.get_widget())
         self.view_manager.show_view(ViewID.WELCOME_VIEW)
 
@@ -124,7 +153,8 @@ class MainWindow(QMainWindow):
         self._connect_menu_actions()
 
         # Aplicar tema e idioma guardados
-        set_initial_theme_and_language(self)
+        with trace_phase("theme.apply_initial_theme_and_language"):
+            set_initial_theme_and_language(self)
         self.update_menu_state()
 
         # Actualizar cabecera al cambiar idioma
@@ -134,30 +164,161 @@ class MainWindow(QMainWindow):
         self._set_initial_callsign_menu_state()
 
     # --- Gestión de vistas principales ---
+    def _create_log_ops_view(self):
+        from .views.log_ops_view import LogOpsView
+
+        with trace_phase("view.LogOpsView"):
+            return LogOpsView(self)
+
+    def _create_log_contest_view(self):
+        from .views.log_contest_view import LogContestView
+
+        with trace_phase("view.LogContestView"):
+            return LogContestView(self)
+
+    @property
+    def log_ops_view(self):
+        """
+        Vista de log operativo; se construye en el primer acceso.
+        """
+        return self.view_manager.get_view(ViewID.LOG_OPS_VIEW)
+
+    @property
+    def log_contest_view(self):
+        """
+        Vista de log de concurso; se construye en el primer acceso.
+        """
+        return self.view_manager.get_view(ViewID.LOG_CONTEST_VIEW)
+
+    def release_log_views(self) -> None:
+        """
+        Destruye las vistas de log construidas (relojes, timers y conexiones a
+        señales globales) al cerrar el log; se reconstruyen al abrir otro.
+        """
+        for view_id in (ViewID.LOG_OPS_VIEW, ViewID.LOG_CONTEST_VIEW):
+            self.view_manager.release_view(view_id)
+
     def show_view(self, view_id: ViewID) -> None:
         """
         Muestra la vista indicada y actualiza datos de contactos y cabecera si hay log abierto.
         """
+        if (
+            view_id in (ViewID.LOG_OPS_VIEW, ViewID.LOG_CONTEST_VIEW)
+            and self.current_log is not None
+            and getattr(self.current_log, "db_path", None)
+        ):
+            # Los contactos nuevos se confirman en memoria y se persisten en segundo plano
+            open_contact_writer(self.current_log.db_path)
         self.view_manager.show_view(view_id)
         # Al volver a la vista de bienvenida, restaurar el título base con versión
         if view_id == ViewID.WELCOME_VIEW:
             base_title = translation_service.tr("main_window_title")
             self.set_window_title(base_title)
         if self.current_log is not None:
+            self._merge_loaded_chunks(self.current_log)
             contacts = getattr(self.current_log, "contacts", [])
-            if view_id == ViewID.LOG_OPS_VIEW and hasattr(
-                self.log_ops_view, "table_widget"
-            ):
-                self.log_ops_view.table_widget.set_contacts(contacts)
-            elif view_id == ViewID.LOG_CONTEST_VIEW and hasattr(
-                self.log_contest_view, "table_widget"
-            ):
-                self.log_contest_view.table_widget.set_contacts(contacts)
+            total = getattr(self.current_log, "contact_total", None)
+            table_widget = self._get_log_table_widget(view_id)
+            if table_widget is not None:
+                table_widget.set_contacts(contacts, total)
+                if self._contact_loader is not None:
+                    self._contact_loader_generation = table_widget.contacts_generation
         if view_id == ViewID.LOG_CONTEST_VIEW and self.current_log:
             self.log_contest_view.set_log_data(self.current_log)
         elif view_id == ViewID.LOG_OPS_VIEW and self.current_log:
             self.log_ops_view.set_log_data(self.current_log)
 
+    def _get_log_table_widget(self, view_id: ViewID):
+        if view_id not in (ViewID.LOG_OPS_VIEW, ViewID.LOG_CONTEST_VIEW):
+            return None
+        # Sin construir la vista si todavía no se mostró
+        view = self.view_manager.get_view(view_id, create=False)
+        return getattr(view, "table_widget", None)
+
+    # --- Carga progresiva de contactos ---
+    def start_contact_stream(self) -> None:
+        """
+        Carga en segundo plano los contactos del log actual que no se leyeron
+        al abrirlo. Cada bloque se agrega al final de la tabla sin bloquear la
+        interfaz; a ``current_log.contacts`` se agregan todos juntos al terminar.
+        """
+        self.stop_contact_stream()
+        log = self.current_log
+        if log is None or getattr(log, "contacts_complete", True):
+            return
+        view_id = (
+            ViewID.LOG_CONTEST_VIEW
+            if self.current_log_type == LogType.CONTEST_LOG
+            else ViewID.LOG_OPS_VIEW
+        )
+        table_widget = self._get_log_table_widget(view_id)
+        if table_widget is None:
+            return
+        loader = ContactStreamLoader(log, parent=self)
+        self._contact_loader = loader
+        self._loaded_chunks = []
+        self._loaded_chunks_target = log.contacts
+        self._contact_loader_generation = table_widget.contacts_generation
+        loader.chunkLoaded.connect(
+            lambda chunk: self._on_contact_chunk_loaded(loader, table_widget, chunk)
+        )
+        loader.finished.connect(
+            lambda: self._on_contact_stream_finished(loader, view_id)
+        )
+        loader.start()
+
+    def stop_contact_stream(self) -> None:
+        """
+        Detiene la carga en segundo plano en curso, si la hay.
+        """
+        loader = self._contact_loader
+        self._contact_loader = None
+        self._contact_loader_generation = None
+        if loader is not None:
+            loader.requestInterruption()
+            loader.wait()
+            self._merge_loaded_chunks(loader.log)
+
+    def _merge_loaded_chunks(self, log) -> None:
+        """
+        Agrega a ``log.contacts`` los bloques cargados hasta ahora, con una
+        sola copia de la lista. Si la lista se reemplazó mientras tanto (se
+        recargó el log completo), los bloques se descartan.
+        """
+        chunks, self._loaded_chunks = self._loaded_chunks, []
+        if chunks and log.contacts is self._loaded_chunks_target:
+            # Los bloques llegan del más reciente al más antiguo
+            log.contacts[:0] = [c for chunk in reversed(chunks) for c in chunk]
+
+    def _on_contact_chunk_loaded(self, loader, table_widget, chunk) -> None:
+        if loader is not self._contact_loader or loader.log is not self.current_log:
+            return
+        if not table_widget.append_older_contacts(
+            chunk, self._contact_loader_generation
+        ):
+            # La tabla se recargó con todos los contactos (alta, edición o
+            # borrado); lo que falta por leer ya no hace falta
+            loader.requestInterruption()
+            loader.log.contacts_complete = True
+            self._loaded_chunks = []
+            return
+        self._loaded_chunks.append(chunk)
+
+    def _on_contact_stream_finished(self, loader, view_id: ViewID) -> None:
+        if loader is not self._contact_loader:
+            return
+        self._contact_loader = None
+        self._contact_loader_generation = None
+        log = loader.log
+        if log is not self.current_log:
+            self._loaded_chunks = []
+            return
+        self._merge_loaded_chunks(log)
+        log.contacts_complete = len(log.contacts) >= getattr(log, "contact_total", 0)
+        view = self.view_manager.views.get(view_id)
+        if view is not None and hasattr(view, "on_contacts_loaded"):
+            view.on_contacts_loaded()
+
     # --- Gestión de temas e idioma ---
     def set_language(self, lang: LanguageValue) -> None:
         """
@@ -224,6 +385,7 @@ class MainWindow(QMainWindow):
         # Exportar y cerrar solo si hay log abierto
         self.menu_bar.export_menu.setEnabled(log_open)
         self.menu_bar.log_close_action.setEnabled(log_open)
+        self.menu_bar.import_adif_action.setEnabled(log_open)
 
     def _connect_menu_actions(self) -> None:
         """
@@ -299,9 +461,18 @@ class MainWindow(QMainWindow):
         self.menu_bar.export_pdf_action.triggered.connect(
             lambda: action_log_export_pdf(self)
         )
+        self.menu_bar.export_cabrillo_action.triggered.connect(
+            lambda: action_log_export_cabrillo(self)
+        )
         self.menu_bar.export_whatsapp_action.triggered.connect(
             lambda: action_log_export_simple_text(self)
         )
+        self.menu_bar.export_batch_action.triggered.connect(
+            lambda: action_log_export_batch(self)
+        )
+        self.menu_bar.import_adif_action.triggered.connect(
+            lambda: action_log_import_adif(self)
+        )
 
     def _on_theme_selected(self, theme_key: str):
         from .main_window_config import (
@@ -349,6 +520,32 @@ class MainWindow(QMainWindow):
         window_geometry.moveCenter(screen_geometry.center())
         self.move(window_geometry.topLeft())
 
+    # --- Mantenimiento de inicio ---
+    def start_startup_maintenance(self) -> None:
+        """
+        Deshabilita en segundo plano los operadores vencidos (una vez por
+        día) e informa el resultado en la barra de estado. Se llama después
+        del primer pintado de la ventana.
+        """
+        if self._maintenance_worker is not None:
+            return
+        worker = StartupMaintenanceWorker(self)
+        worker.maintenanceDone.connect(self._on_startup_maintenance_done)
+        # Si la app termina sin cerrar la ventana, el hilo debe terminar antes
+        QApplication.instance().aboutToQuit.connect(worker.wait)
+        self._maintenance_worker = worker
+        worker.start()
+
+    def _on_startup_maintenance_done(self, affected) -> None:
+        if affected is None:
+            return  # Ya había corrido hoy
+        self.statusBar().showMessage(
+            translation_service.tr("maintenance_expired_disabled").format(
+                count=affected
+            ),
+            10000,
+        )
+
     def closeEvent(self, event):
         """
         Evento de cierre de la ventana principal. Cierra la ventana de tabla de base de datos si está abierta.
@@ -357,6 +554,17 @@ class MainWindow(QMainWindow):
             self.db_table_window.close()
         if hasattr(self, "manual_window") and self.manual_window is not None:
             self.manual_window.close()
+        if self.batch_export_dialog is not None:
+            # Una exportación en lote en curso debe terminar antes de salir
+            self.batch_export_dialog.wait_for_export()
+            self.batch_export_dialog.close()
+        # Las exportaciones en curso deben terminar antes de salir
+        self.export_jobs.wait_for_done()
+        if self._maintenance_worker is not None:
+            self._maintenance_worker.wait()
+        # Persistir contactos pendientes antes de salir
+        self.stop_contact_stream()
+        close_all_contact_writers()
         super().closeEvent(event)
 
     def set_window_title(self, base_title: str, include_version: bool = True) -> None:
@@ -14,13 +14,14 @@ from PySide6.QtWidgets import (
     QApplication,
     QDialog,
     QVBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
 )
 from PySide6.QtCore import QTimer, QUrl
-from PySide6.QtGui import QDesktopServices
+from PySide6.QtGui import QDesktopServices, QTextCursor
 
 # Imports estándar
+import functools
 import os
 from datetime import datetime
 
@@ -29,20 +30,38 @@ from config.paths import get_database_path, get_log_dir, BASE_PATH, get_export_d
 from config.defaults import OPERATIONS_DIR, CONTESTS_DIR
 from config.settings_service import settings_service, CallsignMode
 from translation.translation_service import translation_service
-from application.use_cases.update_operators_from_pdf import update_operators_from_pdf
 from application.use_cases.create_log import create_log
-from application.use_cases.open_log import open_log
-from application.use_cases import export_log
+from application.use_cases.open_log import OPEN_LOG_FIRST_PAGE_SIZE, open_log
+from application.use_cases.log_catalog import catalog_log_file
+from application.use_cases.contact_management import (
+    close_contact_writer,
+    flush_contact_writer,
+    get_log_contacts,
+)
 from interface_adapters.ui.dialogs.wait_dialog import WaitDialog
 from interface_adapters.ui.dialogs.select_contest_dialog import SelectContestDialog
 from interface_adapters.ui.dialogs.enter_callsign_dialog import EnterCallsignDialog
 from interface_adapters.ui.dialogs.operativo_config_dialog import OperativoConfigDialog
 from interface_adapters.controllers.database_controller import DatabaseController
 from infrastructure.db.reset import reset_database
+from utils.lazy_import import lazy_module
 
 from .view_manager import ViewID, LogType
 from .main_window_db_window import show_db_window, on_db_table_window_closed
 
+# Filas del texto simple que se insertan por ciclo de eventos
+SIMPLE_TEXT_BLOCK_SIZE = 500
+
+# Importadores y exportadores: se cargan al usar la acción del menú, no al
+# arrancar (pdfplumber, openpyxl y reportlab son pesados)
+export_log = lazy_module("application.use_cases.export_log")
+import_adif = lazy_module("application.use_cases.import_adif")
+operators_from_csv = lazy_module("application.use_cases.update_operators_from_csv")
+operators_from_excel = lazy_module(
+    "application.use_cases.update_operators_from_excel"
+)
+operators_from_pdf = lazy_module("application.use_cases.update_operators_from_pdf")
+
 
 # --- Acciones de Log ---
 
@@ -211,7 +230,8 @@ def action_log_open_operativo(self):
     )
     if file_path:
         try:
-            log = open_log(file_path)
+            # Se cargan los contactos más recientes; el resto llega en segundo plano
+            log = open_log(file_path, recent_limit=OPEN_LOG_FIRST_PAGE_SIZE)
             # Verificar tipo de log
             if getattr(log, "log_type", None) != LogType.OPERATION_LOG:
                 QMessageBox.critical(
@@ -227,6 +247,7 @@ def action_log_open_operativo(self):
             self.current_log = log
             self.current_log_type = LogType.OPERATION_LOG
             self.show_view(ViewID.LOG_OPS_VIEW)
+            self.start_contact_stream()
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -263,7 +284,8 @@ def action_log_open_concurso(self):
     )
     if file_path:
         try:
-            log = open_log(file_path)
+            # Se cargan los contactos más recientes; el resto llega en segundo plano
+            log = open_log(file_path, recent_limit=OPEN_LOG_FIRST_PAGE_SIZE)
             # Verificar tipo de log
             if getattr(log, "log_type", None) != LogType.CONTEST_LOG:
                 QMessageBox.critical(
@@ -279,6 +301,7 @@ def action_log_open_concurso(self):
             self.current_log = log
             self.current_log_type = LogType.CONTEST_LOG
             self.show_view(ViewID.LOG_CONTEST_VIEW)
+            self.start_contact_stream()
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -336,6 +359,16 @@ def open_folder_and_select_file(file_path):
         QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
 
 
+def _start_log_export(self, export_func, db_path, export_path):
+    """
+    Encola la exportación en segundo plano; el avance y el resultado se
+    muestran en la barra de estado (ver ``ExportJobRunner``).
+    """
+    self.export_jobs.start(
+        functools.partial(export_func, db_path, export_path), export_path
+    )
+
+
 def action_log_export_txt(self):
     """
     Exporta el log abierto en formato TXT.
@@ -355,6 +388,8 @@ def action_log_export_txt(self):
             translation_service.tr("no_db_path"),
         )
         return
+    # Los contactos recién ingresados pueden estar aún en escritura diferida
+    flush_contact_writer(db_path)
     base_name = os.path.splitext(os.path.basename(db_path))[0]
     default_filename = f"{base_name}.txt"
     export_dir = get_export_dir()
@@ -366,15 +401,7 @@ def action_log_export_txt(self):
     )
     if not export_path:
         return
-    try:
-        export_log.export_log_to_txt(db_path, export_path)
-        open_folder_and_select_file(export_path)
-    except Exception as e:
-        QMessageBox.critical(
-            self,
-            translation_service.tr("export_log"),
-            f"{translation_service.tr('export_failed')}: {e}",
-        )
+    _start_log_export(self, export_log.export_log_to_txt, db_path, export_path)
 
 
 def action_log_export_csv(self):
@@ -396,6 +423,8 @@ def action_log_export_csv(self):
             translation_service.tr("no_db_path"),
         )
         return
+    # Los contactos recién ingresados pueden estar aún en escritura diferida
+    flush_contact_writer(db_path)
     base_name = os.path.splitext(os.path.basename(db_path))[0]
     default_filename = f"{base_name}.csv"
     export_dir = get_export_dir()
@@ -407,15 +436,7 @@ def action_log_export_csv(self):
     )
     if not export_path:
         return
-    try:
-        export_log.export_log_to_csv(db_path, export_path)
-        open_folder_and_select_file(export_path)
-    except Exception as e:
-        QMessageBox.critical(
-            self,
-            translation_service.tr("export_log"),
-            f"{translation_service.tr('export_failed')}: {e}",
-        )
+    _start_log_export(self, export_log.export_log_to_csv, db_path, export_path)
 
 
 def action_log_export_adi(self):
@@ -437,6 +458,8 @@ def action_log_export_adi(self):
             translation_service.tr("no_db_path"),
         )
         return
+    # Los contactos recién ingresados pueden estar aún en escritura diferida
+    flush_contact_writer(db_path)
     base_name = os.path.splitext(os.path.basename(db_path))[0]
     default_filename = f"{base_name}.adi"
     export_dir = get_export_dir()
@@ -448,15 +471,7 @@ def action_log_export_adi(self):
     )
     if not export_path:
         return
-    try:
-        export_log.export_log_to_adi(db_path, export_path)
-        open_folder_and_select_file(export_path)
-    except Exception as e:
-        QMessageBox.critical(
-            self,
-            translation_service.tr("export_log"),
-            f"{translation_service.tr('export_failed')}: {e}",
-        )
+    _start_log_export(self, export_log.export_log_to_adi, db_path, export_path)
 
 
 def action_log_export_pdf(self):
@@ -478,6 +493,8 @@ def action_log_export_pdf(self):
             translation_service.tr("no_db_path"),
         )
         return
+    # Los contactos recién ingresados pueden estar aún en escritura diferida
+    flush_contact_writer(db_path)
     # Verificar tipo de log antes de abrir el selector de archivos
     log_type = getattr(self.current_log, "log_type", None)
     from interface_adapters.ui.view_manager import LogType
@@ -501,24 +518,153 @@ def action_log_export_pdf(self):
     )
     if not export_path:
         return
-    try:
-        export_log.export_log_to_pdf(db_path, export_path)
-        open_folder_and_select_file(export_path)
-    except Exception as e:
-        QMessageBox.critical(
+    _start_log_export(self, export_log.export_log_to_pdf, db_path, export_path)
+
+
+def action_log_export_cabrillo(self):
+    """
+    Exporta el log de concurso abierto en formato Cabrillo 3.0.
+    """
+    if not hasattr(self, "current_log") or self.current_log is None:
+        QMessageBox.warning(
+            self,
+            translation_service.tr("main_window_title"),
+            translation_service.tr("no_log_open"),
+        )
+        return
+    db_path = getattr(self.current_log, "db_path", None)
+    if not db_path:
+        QMessageBox.warning(
+            self,
+            translation_service.tr("main_window_title"),
+            translation_service.tr("no_db_path"),
+        )
+        return
+    # Los contactos recién ingresados pueden estar aún en escritura diferida
+    flush_contact_writer(db_path)
+    from interface_adapters.ui.view_manager import LogType
+
+    log_type = getattr(self.current_log, "log_type", None)
+    if str(log_type) not in (str(LogType.CONTEST_LOG), LogType.CONTEST_LOG.value):
+        QMessageBox.warning(
             self,
             translation_service.tr("export_log"),
-            f"{translation_service.tr('export_failed')}: {e}",
+            translation_service.tr("export_cabrillo_not_supported_for_log_type"),
+        )
+        return
+    base_name = os.path.splitext(os.path.basename(db_path))[0]
+    default_filename = f"{base_name}.cbr"
+    export_dir = get_export_dir()
+    export_path, _ = _get_save_file_name(
+        self,
+        translation_service.tr("export_log"),
+        os.path.join(export_dir, default_filename),
+        "Cabrillo (*.cbr *.log)",
+    )
+    if not export_path:
+        return
+    _start_log_export(self, export_log.export_log_to_cabrillo, db_path, export_path)
+
+
+def action_log_export_batch(self):
+    """
+    Muestra el diálogo de exportación en lote de varios logs y formatos.
+    La exportación corre en segundo plano; el diálogo se reutiliza.
+    """
+    from interface_adapters.ui.dialogs.batch_export_dialog import BatchExportDialog
+
+    if self.batch_export_dialog is None:
+        self.batch_export_dialog = BatchExportDialog(self)
+    elif not self.batch_export_dialog.is_running():
+        self.batch_export_dialog.search_logs()
+    self.batch_export_dialog.show()
+    self.batch_export_dialog.raise_()
+    self.batch_export_dialog.activateWindow()
+
+
+def action_log_import_adif(self):
+    """
+    Importa un archivo ADIF (ADI) al log abierto, omitiendo los contactos que
+    ya existen, y recarga la tabla de contactos.
+    """
+    if not hasattr(self, "current_log") or self.current_log is None:
+        QMessageBox.warning(
+            self,
+            translation_service.tr("main_window_title"),
+            translation_service.tr("no_log_open"),
         )
+        return
+    file_path, _ = _get_open_file_name(
+        self,
+        translation_service.tr("import_adif_title"),
+        "",
+        "ADIF (*.adi *.adif);;All Files (*)",
+    )
+    if not file_path:
+        return
+
+    def do_import():
+        log = self.current_log
+        wait_dialog = WaitDialog(
+            self,
+            translation_service.tr("wait_message"),
+        )
+        wait_dialog.show()
+        try:
+            summary = import_adif.import_adif_file(file_path, db_path=log.db_path)
+        except Exception as e:
+            wait_dialog.close()
+            QMessageBox.critical(
+                self,
+                translation_service.tr("import_adif_title"),
+                f"{translation_service.tr('import_adif_failed')}: {e}",
+            )
+            return
+        if summary["imported"]:
+            # La tabla se recarga con el log completo, incluida la carga en curso
+            self.stop_contact_stream()
+            contacts = get_log_contacts(log.db_path, log.id)
+            log.contacts = contacts
+            log.contacts_complete = True
+            view_id = (
+                ViewID.LOG_CONTEST_VIEW
+                if self.current_log_type == LogType.CONTEST_LOG
+                else ViewID.LOG_OPS_VIEW
+            )
+            table_widget = self._get_log_table_widget(view_id)
+            if table_widget is not None:
+                table_widget.set_contacts(contacts)
+            view = self.view_manager.views.get(view_id)
+            if view is not None and hasattr(view, "on_contacts_loaded"):
+                view.on_contacts_loaded()
+        wait_dialog.close()
+        QMessageBox.information(
+            self,
+            translation_service.tr("import_adif_title"),
+            translation_service.tr("import_adif_summary").format(**summary),
+        )
+
+    QTimer.singleShot(100, do_import)
 
 
 def action_log_close(self):
     """
     Cierra el log actual y vuelve a la vista de bienvenida.
     """
+    self.stop_contact_stream()
+    db_path = getattr(getattr(self, "current_log", None), "db_path", None)
+    if db_path:
+        close_contact_writer(db_path)
+        try:
+            # Actualiza conteo de contactos y fechas del log en el catálogo
+            catalog_log_file(db_path)
+        except Exception as e:
+            print(f"No se pudo actualizar el catálogo de logs: {e}")
     self.current_log = None
     self.current_log_type = None
     self.show_view(ViewID.WELCOME_VIEW)
+    # Las vistas de log se destruyen hasta que se abra otro log
+    self.release_log_views()
     if hasattr(self, "set_window_title"):
         self.set_window_title(translation_service.tr("main_window_title"))
     else:
@@ -538,6 +684,9 @@ def action_log_export_simple_text(self):
         )
         return
     contacts = getattr(self.current_log, "contacts", None)
+    if not getattr(self.current_log, "contacts_complete", True):
+        # Aún se están cargando contactos anteriores: leer el log completo
+        contacts = get_log_contacts(self.current_log.db_path, self.current_log.id)
     if not contacts:
         QMessageBox.warning(
             self,
@@ -545,68 +694,73 @@ def action_log_export_simple_text(self):
             "No hay contactos en el log actual.",
         )
         return
-    # --- NUEVO BLOQUE: encabezado con tipo, banda, modo y repetidora/frecuencia ---
-    meta = getattr(self.current_log, "metadata", {})
-    tipo = translation_service.tr(meta.get("operation_type", "")) if meta else ""
-    banda = translation_service.tr(meta.get("frequency_band", "")) if meta else ""
-    modo = translation_service.tr(meta.get("mode_key", "")) if meta else ""
-    repetidora = translation_service.tr(meta.get("repeater_key", "")) if meta and meta.get("repeater_key") else ""
-    frecuencia = meta.get("frequency", "") if meta else ""
-
-    # Construir encabezado: tipo, banda, modo, repetidora/frecuencia
-    encabezado = " ".join(
-        filter(
-            None,
-            [tipo, banda, modo, repetidora if repetidora and repetidora != translation_service.tr("rep_simplex") else frecuencia],
-        )
+    log = self.current_log
+    # El texto se genera por bloques y se inserta de a uno por ciclo de eventos
+    blocks = export_log.iter_log_simple_text(
+        log, contacts, chunk_size=SIMPLE_TEXT_BLOCK_SIZE
     )
-
-    # Calcular el ancho máximo del indicativo
-    indicativos = []
-    for contact in contacts:
-        if isinstance(contact, dict):
-            indicativos.append(contact.get("callsign", "-"))
-        else:
-            indicativos.append(getattr(contact, "callsign", "-"))
-    max_callsign_len = max(len(str(i)) for i in indicativos) if indicativos else 10
-
-    # Encabezado con columnas alineadas y operador en la segunda línea
-    header_num = "Nº"
-    header_callsign = translation_service.tr("log_operative_table_header_callsign")
-    header_name = translation_service.tr("log_operative_table_header_name")
-    operador = getattr(self.current_log, "operator", "-")
-    operador_label = translation_service.tr("operator_label") if hasattr(translation_service, 'tr') else "Operador"
-    operador_line = f"{operador_label}: {operador}"
-    lines = [encabezado, operador_line, f"{header_num:>2}  {header_callsign:<{max_callsign_len}}  {header_name}"]
-
-    # Filas alineadas
-    for idx, contact in enumerate(contacts, 1):
-        if isinstance(contact, dict):
-            indicativo = contact.get("callsign", "-")
-            nombre = contact.get("name", "-")
-        else:
-            indicativo = getattr(contact, "callsign", "-")
-            nombre = getattr(contact, "name", "-")
-        lines.append(f"{idx:2d}  {indicativo:<{max_callsign_len}}  {nombre}")
-    text = "\n".join(lines)
-    # Crear ventana con QTextEdit para copiar
     dialog = QDialog(self)
     dialog.setWindowTitle(translation_service.tr("export_simple_dialog_title"))
     layout = QVBoxLayout(dialog)
-    text_edit = QTextEdit(dialog)
-    text_edit.setPlainText(text)
-    text_edit.setReadOnly(False)  # Permite copiar y editar
+    text_edit = QPlainTextEdit(dialog)
+    text_edit.setReadOnly(True)  # Se puede seleccionar y copiar
+    text_edit.setUndoRedoEnabled(False)
+    text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
     layout.addWidget(text_edit)
     copy_btn = QPushButton(translation_service.tr("export_simple_copy_button"), dialog)
     layout.addWidget(copy_btn)
+    save_btn = QPushButton(translation_service.tr("export_simple_save_button"), dialog)
+    layout.addWidget(save_btn)
+    cursor = QTextCursor(text_edit.document())
+    timer = QTimer(dialog)
+    timer.setInterval(0)
+
+    def insert_next_block():
+        block = next(blocks, None)
+        if block is None:
+            timer.stop()
+            return False
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(block)
+        return True
 
     def copy_to_clipboard():
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text_edit.toPlainText())
+        # Completa el texto pendiente antes de copiarlo
+        while insert_next_block():
+            pass
+        QApplication.clipboard().setText(text_edit.toPlainText())
+
+    def save_to_file():
+        base_name = os.path.splitext(os.path.basename(log.db_path or "log"))[0]
+        export_path, _ = _get_save_file_name(
+            dialog,
+            translation_service.tr("export_simple_save_button"),
+            os.path.join(get_export_dir(), f"{base_name}_simple.txt"),
+            "TXT (*.txt)",
+        )
+        if not export_path:
+            return
+        try:
+            export_log.export_log_to_simple_text(log, export_path, contacts)
+        except Exception as e:
+            QMessageBox.critical(
+                dialog,
+                translation_service.tr("export_log"),
+                f"{translation_service.tr('export_failed')}: {e}",
+            )
+            return
+        open_folder_and_select_file(export_path)
 
     copy_btn.clicked.connect(copy_to_clipboard)
+    save_btn.clicked.connect(save_to_file)
+    timer.timeout.connect(insert_next_block)
+    # Cabecera y primeras filas visibles de inmediato; el resto, por bloques
+    insert_next_block()
+    insert_next_block()
+    timer.start()
     dialog.resize(400, 300)
     dialog.exec()
+    timer.stop()
 
 
 # --- Acciones de Base de Datos ---
@@ -627,7 +781,7 @@ def action_db_import_pdf(self):
 
         def do_import():
             try:
-                result = update_operators_from_pdf(file_path)
+                result = operators_from_pdf.update_operators_from_pdf(file_path)
             except Exception as e:
                 wait_dialog.close()
                 QMessageBox.critical(
@@ -704,11 +858,7 @@ def action_db_import_excel(self):
 
         def do_import():
             try:
-                from application.use_cases.update_operators_from_excel import (
-                    update_operators_from_excel,
-                )
-
-                result = update_operators_from_excel(file_path)
+                result = operators_from_excel.update_operators_from_excel(file_path)
             except Exception as e:
                 wait_dialog.close()
                 QMessageBox.critical(
@@ -779,7 +929,7 @@ def action_db_import_csv(self):
         self,
         translation_service.tr("import_from_csv"),
         "",
-        "Archivos CSV (*.csv)",
+        "Archivos CSV (*.csv *.csv.gz)",
     )
     if not file_path:
         return
@@ -791,11 +941,7 @@ def action_db_import_csv(self):
         )
         wait_dialog.show()
         try:
-            from application.use_cases.update_operators_from_csv import (
-                update_operators_from_csv,
-            )
-
-            result = update_operators_from_csv(file_path)
+            result = operators_from_csv.update_operators_from_csv(file_path)
         except Exception as e:
             wait_dialog.close()
             QMessageBox.critical(
@@ -864,14 +1010,17 @@ def action_db_export(self):
     """
     now_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     default_filename = f"operadores_export_{now_str}.csv"
-    export_path, _ = _get_save_file_name(
+    export_path, selected_filter = _get_save_file_name(
         self,
         translation_service.tr("export_db"),
         get_export_dir(default_filename),
-        "CSV Files (*.csv);;All Files (*)",
+        "CSV Files (*.csv);;CSV Files, gzip (*.csv.gz);;All Files (*)",
     )
     if not export_path:
         return
+    # Con el filtro comprimido se exporta con gzip aunque falte la extensión
+    if "*.csv.gz" in selected_filter and not export_path.lower().endswith(".gz"):
+        export_path += ".gz"
     try:
         DatabaseController.export_database_to_csv(export_path, translation_service)
         open_folder_and_select_file(export_path)
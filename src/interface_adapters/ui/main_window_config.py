@@ -70,6 +70,10 @@ def refresh_ui(self) -> None:
     for view in self.view_manager.views.values():
         if hasattr(view, "retranslate_ui"):
             view.retranslate_ui()
+    if getattr(self, "export_jobs", None) is not None:
+        self.export_jobs.retranslate_ui()
+    if getattr(self, "perf_overlay", None) is not None:
+        self.perf_overlay.retranslate_ui()
     if self.db_table_window is not None and hasattr(
         self.db_table_window, "retranslate_ui"
     ):
@@ -12,7 +12,10 @@ from PySide6.QtWidgets import (
 )
 from utils.resources import get_resource_path
 from translation.translation_service import translation_service
-import markdown
+from utils.lazy_import import lazy_module
+
+# Solo lo usa el manual: se importa al abrirlo
+markdown = lazy_module("markdown")
 
 # Importar versión perezosamente dentro del diálogo para permitir correr sin src/version.py
 
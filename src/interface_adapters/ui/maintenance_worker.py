@@ -0,0 +1,29 @@
+"""
+maintenance_worker.py
+Mantenimiento de inicio en segundo plano (ver
+``application.use_cases.startup_maintenance``).
+"""
+
+from PySide6.QtCore import QThread, Signal
+
+from application.use_cases.startup_maintenance import run_daily_maintenance
+
+
+class StartupMaintenanceWorker(QThread):
+    """
+    Ejecuta el mantenimiento diario fuera del hilo de la UI y emite
+    ``maintenanceDone`` con la cantidad de operadores deshabilitados, o None
+    si la tarea ya había corrido en el día.
+    """
+
+    maintenanceDone = Signal(object)
+    maintenanceFailed = Signal(str)
+
+    def run(self):
+        try:
+            affected = run_daily_maintenance()
+        except Exception as e:
+            print(f"No se pudo ejecutar el mantenimiento de inicio: {e}")
+            self.maintenanceFailed.emit(str(e))
+            return
+        self.maintenanceDone.emit(affected)
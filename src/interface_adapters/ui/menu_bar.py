@@ -47,6 +47,9 @@ class MainMenuBar(QMenuBar):
     log_export_csv_requested = Signal()
     log_export_adi_requested = Signal()
     log_export_pdf_requested = Signal()
+    log_export_cabrillo_requested = Signal()
+    log_export_batch_requested = Signal()
+    log_import_adif_requested = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -95,6 +98,9 @@ class MainMenuBar(QMenuBar):
         self.export_pdf_action = QAction(
             translation_service.tr("menu_export_pdf"), self
         )
+        self.export_cabrillo_action = QAction(
+            translation_service.tr("menu_export_cabrillo"), self
+        )
         self.export_whatsapp_action = QAction(
             translation_service.tr("menu_export_whatsapp"), self
         )
@@ -102,8 +108,19 @@ class MainMenuBar(QMenuBar):
         self.export_menu.addAction(self.export_csv_action)
         self.export_menu.addAction(self.export_adi_action)
         self.export_menu.addAction(self.export_pdf_action)
+        self.export_menu.addAction(self.export_cabrillo_action)
         self.export_menu.addAction(self.export_whatsapp_action)
         self.file_menu.addMenu(self.export_menu)
+        # Exportación en lote (no requiere un log abierto)
+        self.export_batch_action = QAction(
+            translation_service.tr("menu_export_batch"), self
+        )
+        self.file_menu.addAction(self.export_batch_action)
+        # Importar ADIF al log abierto
+        self.import_adif_action = QAction(
+            translation_service.tr("menu_import_adif"), self
+        )
+        self.file_menu.addAction(self.import_adif_action)
 
         self.log_close_action = QAction(translation_service.tr("menu_close"), self)
         self.file_menu.addAction(self.log_close_action)
@@ -297,6 +314,11 @@ class MainMenuBar(QMenuBar):
         self.export_csv_action.triggered.connect(self.log_export_csv_requested.emit)
         self.export_adi_action.triggered.connect(self.log_export_adi_requested.emit)
         self.export_pdf_action.triggered.connect(self.log_export_pdf_requested.emit)
+        self.export_cabrillo_action.triggered.connect(
+            self.log_export_cabrillo_requested.emit
+        )
+        self.export_batch_action.triggered.connect(self.log_export_batch_requested.emit)
+        self.import_adif_action.triggered.connect(self.log_import_adif_requested.emit)
 
     def retranslate_ui(self):
         self.file_menu.setTitle(translation_service.tr("menu_file_menu"))
@@ -324,9 +346,14 @@ class MainMenuBar(QMenuBar):
         self.export_csv_action.setText(translation_service.tr("menu_export_csv"))
         self.export_adi_action.setText(translation_service.tr("menu_export_adi"))
         self.export_pdf_action.setText(translation_service.tr("menu_export_pdf"))
+        self.export_cabrillo_action.setText(
+            translation_service.tr("menu_export_cabrillo")
+        )
         self.export_whatsapp_action.setText(
             translation_service.tr("menu_export_whatsapp")
         )
+        self.export_batch_action.setText(translation_service.tr("menu_export_batch"))
+        self.import_adif_action.setText(translation_service.tr("menu_import_adif"))
 
         self.database_menu.setTitle(translation_service.tr("menu_database_menu"))
         self.import_menu.setTitle(
@@ -0,0 +1,151 @@
+"""
+perf_overlay.py
+Panel de latencias de captura en la barra de estado (herramienta de desarrollo).
+
+Muestra p50/p95/máx de las interacciones medidas por ``latency_monitor``
+(agregar contacto, sugerencias, resumen del operador y alerta de duplicado)
+y permite exportar las muestras a CSV. Se muestra con ``--perf-overlay`` o
+``LOGGEROA_PERF_OVERLAY`` y se alterna con Ctrl+Shift+F12; oculto, el panel
+no tiene timers activos y los puntos de medición no hacen nada.
+"""
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QFileDialog, QLabel, QPushButton
+
+from translation.translation_service import translation_service
+from utils.latency_monitor import INTERACTIONS, WINDOW_SIZE, latency_monitor
+
+PERF_OVERLAY_SHORTCUT = "Ctrl+Shift+F12"
+REFRESH_INTERVAL_MS = 1000
+
+
+class _PaintWatcher(QObject):
+    """
+    Cierra un intervalo de ``latency_monitor`` cuando termina el siguiente
+    pintado del widget observado.
+    """
+
+    def __init__(self, widget, key, interaction, started):
+        super().__init__(widget)
+        self.key = key
+        self.interaction = interaction
+        self.started = started
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # Al volver al ciclo de eventos, el pintado ya terminó
+            QTimer.singleShot(0, self._finish)
+        return False
+
+    def _finish(self):
+        latency_monitor.end(self.key, self.interaction, self.started)
+        self.deleteLater()
+
+
+def end_after_repaint(key: str, widget, interaction: str = None) -> None:
+    """
+    Cierra el intervalo ``key`` (como ``interaction``) después del próximo
+    pintado de ``widget``. Se pide un repintado para que el intervalo termine
+    aunque el contenido no haya cambiado. Sin medición activa no hace nada.
+    """
+    if not latency_monitor.enabled:
+        return
+    started = latency_monitor.started(key)
+    if started is None:
+        return
+    _PaintWatcher(widget, key, interaction, started)
+    widget.update()
+
+
+class PerfOverlay(QObject):
+    """
+    Etiqueta con las latencias y botón de exportación en la barra de estado
+    de la ventana principal.
+    """
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        status_bar = window.statusBar()
+        self.label = QLabel(window)
+        self.label.setObjectName("PerfOverlayLabel")
+        self.export_button = QPushButton(window)
+        self.export_button.setFlat(True)
+        self.export_button.clicked.connect(self.export_csv)
+        status_bar.addPermanentWidget(self.label)
+        status_bar.addPermanentWidget(self.export_button)
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.shortcut = QShortcut(QKeySequence(PERF_OVERLAY_SHORTCUT), window)
+        self.shortcut.activated.connect(self.toggle)
+        self.retranslate_ui()
+        self.set_visible(latency_monitor.enabled)
+
+    def toggle(self):
+        self.set_visible(not latency_monitor.enabled)
+
+    def set_visible(self, visible: bool):
+        """
+        Activa o desactiva la medición junto con el panel.
+        """
+        latency_monitor.set_enabled(visible)
+        self.label.setVisible(visible)
+        self.export_button.setVisible(visible)
+        if visible:
+            self.refresh()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def format_stats(self) -> str:
+        stats = latency_monitor.stats()
+        parts = []
+        for name in INTERACTIONS:
+            label = translation_service.tr(f"perf_overlay_{name}")
+            values = stats.get(name)
+            if values is None:
+                parts.append(f"{label} -")
+            else:
+                parts.append(
+                    f"{label} {values['p50']:.0f}/{values['p95']:.0f}"
+                    f"/{values['max']:.0f}"
+                )
+        return " · ".join(parts) + " ms"
+
+    def refresh(self):
+        self.label.setText(self.format_stats())
+
+    def retranslate_ui(self):
+        self.label.setToolTip(
+            translation_service.tr("perf_overlay_tooltip").format(
+                count=WINDOW_SIZE, shortcut=PERF_OVERLAY_SHORTCUT
+            )
+        )
+        self.export_button.setText(translation_service.tr("perf_overlay_export"))
+        if latency_monitor.enabled:
+            self.refresh()
+
+    def export_csv(self):
+        """
+        Guarda las muestras de la sesión en el CSV elegido por el usuario.
+        """
+        path, _ = QFileDialog.getSaveFileName(
+            self.window,
+            translation_service.tr("perf_overlay_export"),
+            latency_monitor.default_path(),
+            "CSV (*.csv)",
+        )
+        if not path:
+            return
+        try:
+            latency_monitor.export_csv(path)
+        except OSError as e:
+            print(f"No se pudieron exportar las latencias: {e}")
+            return
+        self.window.statusBar().showMessage(
+            translation_service.tr("perf_overlay_exported").format(path=path), 10000
+        )
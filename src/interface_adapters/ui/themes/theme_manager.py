@@ -6,6 +6,7 @@ Utiliza settings_service para guardar y recuperar la preferencia del usuario.
 """
 
 import os
+from functools import lru_cache
 from PySide6.QtWidgets import QApplication
 from config.settings_service import settings_service, SettingsKey, ThemeValue
 from utils.resources import get_resource_path
@@ -16,7 +17,12 @@ def _read_qss_file(file_path: str) -> str:
         return qss_file.read()
 
 
+@lru_cache(maxsize=None)
 def _load_theme_stylesheet(theme_name: str) -> str:
+    """
+    Hoja de estilos del tema (base.qss + <tema>.qss). Se lee de disco una
+    sola vez por tema; los cambios de tema posteriores usan la copia en memoria.
+    """
     base_qss_path = get_resource_path("src/interface_adapters/ui/themes/base.qss")
     theme_qss_path = get_resource_path(
         f"src/interface_adapters/ui/themes/{theme_name}.qss"
@@ -61,7 +67,11 @@ class ThemeManager:
         try:
             qss = _load_theme_stylesheet(theme_to_apply.value)
             app_instance = QApplication.instance()
-            if isinstance(app_instance, QApplication):
+            # Volver a asignar la misma hoja de estilos re-pule todos los widgets
+            if (
+                isinstance(app_instance, QApplication)
+                and app_instance.styleSheet() != qss
+            ):
                 app_instance.setStyle("Fusion")
                 app_instance.setStyleSheet(qss)
             if self.current_theme != theme:
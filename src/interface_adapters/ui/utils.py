@@ -4,6 +4,7 @@ Módulo de utilidades para la interfaz gráfica de usuario.
 Contiene funciones auxiliares para la gestión de widgets en la aplicación Logger OA.
 """
 
+import warnings
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
@@ -29,3 +30,19 @@ def find_main_window(widget) -> "MainWindow | None":
             return cast("MainWindow", parent)
         parent = parent.parent()
     return None
+
+
+def disconnect_signal(signal, slot) -> None:
+    """
+    Desconecta ``slot`` de ``signal`` sin fallar si ya no estaba conectado.
+
+    Se usa al destruir vistas conectadas a señales globales (p. ej.
+    ``translation_service.signal.language_changed``), que viven más que ellas.
+    """
+    with warnings.catch_warnings():
+        # PySide6 avisa con RuntimeWarning si la conexión no existe
+        warnings.simplefilter("ignore", RuntimeWarning)
+        try:
+            signal.disconnect(slot)
+        except (RuntimeError, TypeError):
+            pass
@@ -1,6 +1,8 @@
 from enum import Enum
 from PySide6.QtWidgets import QStackedWidget
 
+from domain.log_type import LogType  # noqa: F401  (reexportado)
+
 
 class ViewID(Enum):
     WELCOME_VIEW = "welcome_view"
@@ -9,20 +11,21 @@ class ViewID(Enum):
     # Agrega aquí otros identificadores de vistas según sea necesario
 
 
-class LogType(Enum):
-    OPERATION_LOG = "operation_log"
-    CONTEST_LOG = "contest_log"
-
-
 class ViewManager:
     """
     Gestor centralizado de vistas para la aplicación.
     Permite registrar, mostrar y acceder a vistas de forma desacoplada.
+
+    Las vistas pueden registrarse ya construidas (``register_view``) o con una
+    fábrica (``register_factory``): en ese caso se construyen la primera vez
+    que se muestran y ``release_view`` las destruye para liberar sus relojes,
+    timers y conexiones hasta el próximo uso.
     """
 
     def __init__(self, parent=None):
         self.stacked_widget = QStackedWidget(parent)
-        self.views = {}
+        self.views = {}  # Vistas construidas
+        self._factories = {}
 
     def register_view(self, view_id: ViewID, view_instance):
         """
@@ -31,12 +34,52 @@ class ViewManager:
         self.views[view_id] = view_instance
         self.stacked_widget.addWidget(view_instance)
 
+    def register_factory(self, view_id: ViewID, factory):
+        """
+        Registra una fábrica (callable sin argumentos que devuelve la vista)
+        para construir la vista recién cuando se necesite.
+        """
+        self._factories[view_id] = factory
+
+    def is_registered(self, view_id: ViewID) -> bool:
+        return view_id in self.views or view_id in self._factories
+
+    def get_view(self, view_id: ViewID, create: bool = True):
+        """
+        Devuelve la vista indicada, construyéndola con su fábrica si todavía no
+        existe y ``create`` es True. Devuelve None si no está registrada.
+        """
+        view = self.views.get(view_id)
+        if view is None and create and view_id in self._factories:
+            view = self._factories[view_id]()
+            self.register_view(view_id, view)
+        return view
+
     def show_view(self, view_id: ViewID):
         """
         Muestra la vista correspondiente al identificador ViewID.
         """
-        if view_id in self.views:
-            self.stacked_widget.setCurrentWidget(self.views[view_id])
+        view = self.get_view(view_id)
+        if view is not None:
+            self.stacked_widget.setCurrentWidget(view)
+
+    def release_view(self, view_id: ViewID) -> bool:
+        """
+        Destruye una vista construida con fábrica: llama a su ``teardown`` (si
+        lo tiene) para detener timers y desconectar señales globales, la quita
+        del contenedor y la elimina. La fábrica queda registrada para volver a
+        construirla. Devuelve True si había una vista que liberar.
+        """
+        if view_id not in self._factories:
+            return False  # Las vistas sin fábrica no se pueden reconstruir
+        view = self.views.pop(view_id, None)
+        if view is None:
+            return False
+        if hasattr(view, "teardown"):
+            view.teardown()
+        self.stacked_widget.removeWidget(view)
+        view.deleteLater()
+        return True
 
     def get_widget(self):
         return self.stacked_widget
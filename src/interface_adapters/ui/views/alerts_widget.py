@@ -5,6 +5,8 @@ Widget de alertas para Logger OA: muestra dos labels de alerta/información.
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
 from PySide6.QtCore import Qt
 
+from interface_adapters.ui.utils import disconnect_signal
+
 
 class AlertsWidget(QWidget):
 
@@ -66,3 +68,12 @@ class AlertsWidget(QWidget):
     def clear_alerts(self):
         self.label1.setEnabled(False)
         self.label2.setEnabled(False)
+
+    def teardown(self):
+        """
+        Desconecta la señal global de idioma antes de destruir el widget.
+        """
+        disconnect_signal(
+            self._translation_service.signal.language_changed,
+            self._update_translations,
+        )
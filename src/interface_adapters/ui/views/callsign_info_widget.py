@@ -4,7 +4,14 @@ CallsignInfoWidget: Widget para mostrar información y sugerencias de indicativo
 - Permite selección de sugerencia y adaptación a idioma.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+)
 from PySide6.QtGui import QFont
 from utils.callsign_parser import parse_callsign
 from PySide6.QtCore import Signal, Qt, QTimer
@@ -16,6 +23,11 @@ from infrastructure.repositories.sqlite_radio_operator_repository import (
 from utils.datetime import format_iso_date
 from domain.callsign_utils import get_country_full_name
 from utils.fonts import build_roboto_mono_font
+from .font_delegate import FontDelegate
+from application.use_cases.qso_index import get_worked_before
+from interface_adapters.ui.utils import disconnect_signal
+from interface_adapters.ui.perf_overlay import end_after_repaint
+from utils.latency_monitor import latency_monitor
 
 
 class CallsignInfoWidget(QWidget):
@@ -49,6 +61,8 @@ class CallsignInfoWidget(QWidget):
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self._showing_suggestions = False
         self._current_callsign = ""
+        self._current_log_path = None
+        self._worked_info = None
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
@@ -58,7 +72,20 @@ class CallsignInfoWidget(QWidget):
         title_font.setPointSize(14)
         self.title_label.setFont(title_font)
         self.title_label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        layout.addWidget(self.title_label)
+        # Indicador "trabajado antes" (índice global de QSOs), junto al título
+        self.worked_label = QLabel("", self)
+        self.worked_label.setObjectName("callsignWorkedBefore")
+        self.worked_label.setAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        self.worked_label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.worked_label.hide()
+        title_row = QHBoxLayout()
+        title_row.setContentsMargins(0, 0, 0, 0)
+        title_row.addWidget(self.title_label)
+        title_row.addStretch(1)
+        title_row.addWidget(self.worked_label)
+        layout.addLayout(title_row)
         # Resumen
         self.summary_label = QLabel("", self)
         self.summary_label.setObjectName("callsignSummary")
@@ -80,6 +107,9 @@ class CallsignInfoWidget(QWidget):
         self.suggestion_list.setResizeMode(QListWidget.ResizeMode.Adjust)
         self.suggestion_list.setSpacing(5)
         self.suggestion_list.setObjectName("callsignSuggestionList")
+        self.suggestion_list.setItemDelegate(
+            FontDelegate(build_roboto_mono_font(20, bold=True), self.suggestion_list)
+        )
         self.suggestion_list.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
         self.suggestion_list.hide()
         self.suggestion_list.itemClicked.connect(self._on_suggestion_clicked)
@@ -95,6 +125,16 @@ class CallsignInfoWidget(QWidget):
         self._debounce.timeout.connect(self._do_update_info)
         self._pending_text = ""
 
+    def teardown(self):
+        """
+        Detiene el debounce pendiente y desconecta la señal global de idioma
+        antes de destruir el widget.
+        """
+        self._debounce.stop()
+        disconnect_signal(
+            translation_service.signal.language_changed, self.retranslate_ui
+        )
+
     def show_summary(self, text):
         """
         Muestra el resumen del indicativo en el área correspondiente.
@@ -133,8 +173,6 @@ class CallsignInfoWidget(QWidget):
                 operadores = get_filtered_operators(filtro)
         for op in operadores:
             item = QListWidgetItem(op.callsign)
-            font = build_roboto_mono_font(20, bold=True)
-            item.setFont(font)
             if op.name:
                 item.setToolTip(op.name)
             self.suggestion_list.addItem(item)
@@ -148,6 +186,47 @@ class CallsignInfoWidget(QWidget):
         """
         self.suggestionSelected.emit(item.text())
 
+    def set_current_log_path(self, db_path):
+        """
+        Define el log abierto, que se excluye del indicador "trabajado antes".
+        Args:
+            db_path (str): Ruta del archivo del log actual (o None).
+        """
+        self._current_log_path = db_path
+
+    def update_worked_before(self, callsign):
+        """
+        Consulta el índice global de QSOs y muestra si el indicativo ya fue
+        trabajado en otros logs.
+        Args:
+            callsign (str): Indicativo completo ingresado.
+        """
+        self._worked_info = None
+        if callsign and len(callsign) >= 3:
+            try:
+                info = get_worked_before(callsign, self._current_log_path)
+                if info["qso_count"]:
+                    self._worked_info = info
+            except Exception:
+                # El índice es auxiliar: nunca debe interrumpir la captura
+                self._worked_info = None
+        self._render_worked_before()
+
+    def _render_worked_before(self):
+        info = self._worked_info
+        if not info:
+            self.worked_label.clear()
+            self.worked_label.hide()
+            return
+        self.worked_label.setText(
+            translation_service.tr("worked_before_label").format(
+                qsos=info["qso_count"],
+                logs=info["log_count"],
+                date=format_iso_date(info["last_timestamp"]),
+            )
+        )
+        self.worked_label.show()
+
     def retranslate_ui(self):
         """
         Actualiza el título según el estado actual (sugerencias o resumen).
@@ -156,6 +235,7 @@ class CallsignInfoWidget(QWidget):
             self.title_label.setText(translation_service.tr("suggestions_label"))
         else:
             self.title_label.setText(translation_service.tr("callsign_summary"))
+        self._render_worked_before()
 
     def update_info(self, text):
         """
@@ -166,6 +246,7 @@ class CallsignInfoWidget(QWidget):
         """
 
         self._pending_text = text
+        latency_monitor.begin("callsign_info")
         # arrancar/reiniciar debounce
         self._debounce.start()
 
@@ -173,6 +254,7 @@ class CallsignInfoWidget(QWidget):
         text = self._pending_text
         filtro = text.strip().upper()
         base, prefijo, sufijo = parse_callsign(filtro)
+        self.update_worked_before(filtro)
         if len(filtro) < 2:
             self.show_suggestions("")
             self.operatorEnabledStatus.emit(True)  # No alerta
@@ -226,3 +308,10 @@ class CallsignInfoWidget(QWidget):
             else:
                 self.show_suggestions(base)
                 self.operatorEnabledStatus.emit(True)  # No alerta
+        # Latencia desde la última tecla hasta ver sugerencias o resumen
+        if self._showing_suggestions:
+            end_after_repaint(
+                "callsign_info", self.suggestion_list.viewport(), "suggestion_refresh"
+            )
+        else:
+            end_after_repaint("callsign_info", self.summary_label, "operator_summary")
@@ -9,6 +9,8 @@ from PySide6.QtGui import QFont
 from PySide6.QtCore import Signal, Qt
 from translation.translation_service import translation_service
 from utils.fonts import build_roboto_mono_font
+from interface_adapters.ui.utils import disconnect_signal
+from utils.latency_monitor import latency_monitor
 
 
 class CallsignInputWidget(QWidget):
@@ -84,6 +86,7 @@ class CallsignInputWidget(QWidget):
                     if (
                         event.modifiers() & Qt.KeyboardModifier.ControlModifier
                     ):  # Ctrl+Enter
+                        latency_monitor.begin("add_contact")
                         self.addContactRequested.emit(text)
                         return True
                     else:
@@ -113,3 +116,11 @@ class CallsignInputWidget(QWidget):
         Actualiza el label según el idioma actual.
         """
         self.label.setText(translation_service.tr("enter_callsign_label"))
+
+    def teardown(self):
+        """
+        Desconecta la señal global de idioma antes de destruir el widget.
+        """
+        disconnect_signal(
+            translation_service.signal.language_changed, self.retranslate_ui
+        )
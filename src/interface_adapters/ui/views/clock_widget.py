@@ -88,6 +88,12 @@ class ClockWidget(QFrame):
         self.date.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
+    def stop(self):
+        """
+        Detiene la actualización por segundo (al destruir la vista que lo contiene).
+        """
+        self.timer.stop()
+
     def update_clock(self):
         """
         Actualiza la hora y la fecha según el idioma y modo OA/UTC.
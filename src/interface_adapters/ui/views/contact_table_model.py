@@ -0,0 +1,201 @@
+"""
+ContactTableModel: modelo de tabla para los contactos del log actual.
+
+Los contactos se guardan en orden cronológico y se muestran invertidos (el más
+reciente arriba). Los textos de cada fila se calculan al pintarse y se guardan
+en caché, de modo que cargar o agregar contactos no formatea filas que no se
+ven. Los contactos más antiguos pueden agregarse al final de la tabla mientras
+se cargan en segundo plano; se guardan aparte, en el orden de la vista, para
+que cada bloque se agregue sin copiar los contactos ya cargados.
+"""
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from interface_adapters.ui.view_manager import LogType
+from translation.translation_service import CONTACT_VALUE_KEYS, translation_service
+from utils.datetime import format_qtr
+
+
+class ContactTableModel(QAbstractTableModel):
+    def __init__(self, columns, log_type=LogType.OPERATION_LOG, parent=None):
+        """
+        Args:
+            columns: Lista de dicts con "key" y "translation" por columna.
+            log_type: Tipo de log (Enum LogType).
+        """
+        super().__init__(parent)
+        self.columns = columns
+        self.log_type = log_type
+        self._keys = [col["key"] for col in columns]
+        self._contacts = []
+        # Contactos anteriores cargados en segundo plano, del más reciente al
+        # más antiguo (orden de la vista, debajo de ``_contacts``)
+        self._older = []
+        self._expected_total = 0
+        self._row_cache = {}
+        self._font = None
+        self._refresh_texts()
+        self._right_aligned = set()
+        if log_type == LogType.CONTEST_LOG:
+            self._right_aligned = {
+                i for i, key in enumerate(self._keys) if key in ("rs_rx", "rs_tx")
+            }
+
+    # --- Carga de datos ---
+
+    def set_font(self, font):
+        """
+        Fuente de la numeración de filas (las celdas la toman del delegate).
+        """
+        self._font = font
+
+    def set_contacts(self, contacts, total=None):
+        """
+        Reemplaza los contactos (orden cronológico).
+        ``total`` indica cuántos contactos tendrá el log cuando termine la carga
+        progresiva, para numerar las filas correctamente desde el inicio.
+        """
+        self.beginResetModel()
+        self._contacts = list(contacts)
+        self._older = []
+        self._expected_total = max(int(total or 0), len(self._contacts))
+        self._row_cache = {}
+        self.endResetModel()
+
+    def prepend_older_contacts(self, contacts):
+        """
+        Agrega contactos más antiguos que los cargados; se muestran al final.
+        """
+        if not contacts:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(contacts) - 1)
+        self._older.extend(reversed(contacts))
+        self._expected_total = max(self._expected_total, self.rowCount())
+        self.endInsertRows()
+
+    def contacts(self):
+        """
+        Contactos cargados en orden cronológico.
+        """
+        if self._older:
+            # Una sola copia por consulta, no una por bloque cargado
+            self._contacts[:0] = reversed(self._older)
+            self._older = []
+        return self._contacts
+
+    def total_count(self):
+        """
+        Total de contactos del log, incluidos los que aún se están cargando.
+        """
+        return max(self._expected_total, self.rowCount())
+
+    def contact_at_row(self, row):
+        recent = len(self._contacts)
+        if 0 <= row < recent:
+            return self._contacts[recent - 1 - row]
+        if recent <= row < recent + len(self._older):
+            return self._older[row - recent]
+        return None
+
+    def _refresh_texts(self):
+        # Cabeceras y valores traducibles del idioma actual, como dicts locales
+        keys = [c["translation"] for c in self.columns]
+        headers = translation_service.snapshot(keys)
+        self._header_texts = [headers[key] for key in keys]
+        self._value_texts = translation_service.snapshot(CONTACT_VALUE_KEYS)
+
+    def invalidate_texts(self):
+        """
+        Descarta los textos calculados (p. ej. al cambiar el idioma); solo se
+        recalculan las filas que la vista vuelva a pintar.
+        """
+        self._refresh_texts()
+        self._row_cache = {}
+        rows = self.rowCount()
+        if rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(rows - 1, len(self._keys) - 1),
+            )
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self._keys) - 1)
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._contacts) + len(self._older)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._row_texts(index.row())[index.column()]
+        if (
+            role == Qt.ItemDataRole.TextAlignmentRole
+            and index.column() in self._right_aligned
+        ):
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole and 0 <= section < len(self.columns):
+                return self._header_texts[section]
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Numeración invertida: la fila superior tiene el número más alto
+            return str(self.total_count() - section)
+        if role == Qt.ItemDataRole.FontRole:
+            return self._font
+        return None
+
+    # --- Formateo ---
+
+    def _row_texts(self, row):
+        texts = self._row_cache.get(row)
+        if texts is None:
+            texts = self.format_contact(self.contact_at_row(row) or {})
+            self._row_cache[row] = texts
+        return texts
+
+    def format_contact(self, contact):
+        """
+        Devuelve la lista de textos a mostrar para un contacto.
+        """
+        value_texts = self._value_texts
+        values = []
+        for key in self._keys:
+            value = None
+            if key == "qtr_oa":
+                qtr = format_qtr(contact.get("timestamp", None))
+                value = qtr.oa_time if qtr else ""
+            elif key == "qtr_utc":
+                qtr = format_qtr(contact.get("timestamp", None))
+                value = ""
+                if qtr:
+                    # Si la fecha en OA (UTC-5) difiere de la UTC, marcar con '*'
+                    value = qtr.utc_time + "*" if qtr.date_rollover else qtr.utc_time
+            elif key in ("station", "energy"):
+                val = contact.get(key, "")
+                if val == "no_data":  # Valor por defecto para "no data"
+                    value = ""
+                else:
+                    value = value_texts.get(val)
+                    if value is None:
+                        value = translation_service.tr(val)
+            elif key == "power":
+                val = contact.get(key, "")
+                value = f"{val} W" if val else ""
+            elif self.log_type == LogType.CONTEST_LOG and key in (
+                "exchange_received",
+                "exchange_sent",
+            ):
+                val = contact.get(key, "")
+                value = str(val).zfill(3) if val else ""
+            else:
+                value = contact.get(key, "")
+            values.append(str(value))
+        return values
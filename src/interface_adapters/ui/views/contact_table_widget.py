@@ -1,23 +1,18 @@
-# --- Imports de la librería estándar ---
-import datetime
-
 # --- Imports de terceros ---
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QAbstractItemView,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from utils.fonts import build_roboto_mono_font
-from utils.datetime import parse_utc_timestamp
 
 # --- Imports de la aplicación ---
-from translation.translation_service import translation_service
 from config.settings_service import settings_service
 from interface_adapters.ui.view_manager import LogType
-from config.settings_service import LanguageValue
+from .contact_table_model import ContactTableModel
+from .font_delegate import FontDelegate
 
 
 class ContactTableWidget(QWidget):
@@ -26,6 +21,9 @@ class ContactTableWidget(QWidget):
     Adaptable para operativos y concursos.
     """
 
+    # Se emite cuando cambia la fila seleccionada
+    selectionChanged = Signal()
+
     def __init__(self, parent=None, log_type=LogType.OPERATION_LOG):
         """
         Inicializa el widget de la tabla de contactos, configura la UI y la persistencia de columnas.
@@ -35,12 +33,20 @@ class ContactTableWidget(QWidget):
         """
         super().__init__(parent)
         self.log_type = log_type
+        # Se incrementa con cada set_contacts; permite descartar bloques de una
+        # carga en segundo plano que corresponden a un contenido ya reemplazado
+        self.contacts_generation = 0
         main_layout = QVBoxLayout(self)
-        self.table = QTableWidget(self)
-        self.table.setFont(build_roboto_mono_font(11, bold=False))
+        self.table = QTableView(self)
+        row_font = build_roboto_mono_font(11, bold=False)
+        self.table.setFont(row_font)
+        self.model = ContactTableModel(self._get_columns(), self.log_type, self)
+        # Numeración de filas; las celdas usan la fuente del delegate
+        self.model.set_font(row_font)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(FontDelegate(row_font, self.table))
         main_layout.addWidget(self.table)
         self.setLayout(main_layout)
-        self.set_columns()
         # Persistencia de anchos de columna diferenciada por tipo de log
         self._column_widths_key = f"contact_table_column_widths_{self.log_type.name}"
         self.table.horizontalHeader().sectionResized.connect(self.save_column_widths)
@@ -48,7 +54,10 @@ class ContactTableWidget(QWidget):
         # Deshabilitar edición directa
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         # Conectar doble clic a método personalizado
-        self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.table.doubleClicked.connect(self._on_item_double_clicked)
+        self.table.selectionModel().selectionChanged.connect(
+            lambda *args: self.selectionChanged.emit()
+        )
         # Evitar que la tabla reciba el foco por tabulación si no es interactiva
         self.table.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
         # Instalar eventFilter para detectar Tab
@@ -101,147 +110,99 @@ class ContactTableWidget(QWidget):
         {"key": "obs", "translation": "log_operative_table_header_obs"},
     ]
 
+    def _get_columns(self):
+        if self.log_type == LogType.CONTEST_LOG:
+            return self.LOG_CONTEST_COLUMNS
+        return self.LOG_OPERATIVE_COLUMNS
+
     def set_columns(self):
         """
-        Configura los headers de la tabla según el tipo de log (operativo o concurso).
+        Actualiza los headers de la tabla según el tipo de log (operativo o concurso).
         """
-        if self.log_type == LogType.CONTEST_LOG:
-            headers = [
-                translation_service.tr(col["translation"])
-                for col in self.LOG_CONTEST_COLUMNS
-            ]
-        else:
-            headers = [
-                translation_service.tr(col["translation"])
-                for col in self.LOG_OPERATIVE_COLUMNS
-            ]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
+        self.model.headerDataChanged.emit(
+            Qt.Orientation.Horizontal, 0, self.model.columnCount() - 1
+        )
 
-    def set_contacts(self, contacts):
+    @property
+    def _last_contacts(self):
+        # Contactos cargados en orden cronológico (la tabla los muestra invertidos)
+        return self.model.contacts()
+
+    def set_contacts(self, contacts, total=None):
         """
-        Carga los contactos en la tabla y adapta los valores según el tipo de log y el idioma.
+        Carga los contactos en la tabla. Los textos de cada fila se calculan
+        recién cuando la fila se pinta.
         Args:
             contacts: Lista de diccionarios con los datos de los contactos.
+            total: Total de contactos del log si aún se están cargando contactos
+                anteriores en segundo plano (para numerar las filas).
         """
-        # Guardar los contactos en el orden original
-        self._last_contacts = (
-            contacts.copy() if isinstance(contacts, list) else list(contacts)
-        )
-        # Solo invertir para mostrar en la tabla
-        display_contacts = list(reversed(contacts))
-        # Define las claves esperadas según el tipo de log
-        if self.log_type == LogType.CONTEST_LOG:
-            keys = [col["key"] for col in self.LOG_CONTEST_COLUMNS]
-        else:
-            keys = [col["key"] for col in self.LOG_OPERATIVE_COLUMNS]
-        self.table.setRowCount(len(display_contacts))
-        self.table.setColumnCount(len(keys))
+        self.contacts_generation += 1
+        self.model.set_contacts(contacts, total)
 
-        time_fmt = "%H:%M"
+    def append_older_contacts(self, contacts, generation=None):
+        """
+        Agrega al final de la tabla contactos anteriores a los ya cargados.
+        Si ``generation`` no coincide con la actual (la tabla se recargó
+        mientras tanto), el bloque se descarta. Devuelve True si se agregó.
+        """
+        if generation is not None and generation != self.contacts_generation:
+            return False
+        self.model.prepend_older_contacts(contacts)
+        return True
 
-        # Numeración invertida: la fila superior tiene el número más alto
-        total = len(display_contacts)
-        row_font = build_roboto_mono_font(11, bold=False)
-        for row, contact in enumerate(display_contacts):
-            # Establecer el número de orden invertido en la primera columna
-            item_num = QTableWidgetItem(str(total - row))
-            item_num.setFont(row_font)
-            self.table.setVerticalHeaderItem(row, item_num)
-            for col, key in enumerate(keys):
-                value = None
-                if key == "qtr_oa":
-                    ts = contact.get("timestamp", None)
-                    value = ""
-                    if ts:
-                        dt_utc = datetime.datetime.fromtimestamp(
-                            parse_utc_timestamp(ts), tz=datetime.timezone.utc
-                        )
-                        dt_oa = dt_utc - datetime.timedelta(hours=5)
-                        value = dt_oa.strftime(time_fmt)
-                elif key == "qtr_utc":
-                    ts = contact.get("timestamp", None)
-                    value = ""
-                    if ts:
-                        dt_utc = datetime.datetime.fromtimestamp(
-                            parse_utc_timestamp(ts), tz=datetime.timezone.utc
-                        )
-                        # Convertir a hora OA (UTC-5) para comparar fechas
-                        dt_oa = dt_utc - datetime.timedelta(hours=5)
-                        value = dt_utc.strftime(time_fmt)
-                        # Si la fecha en OA difiere de la UTC, marcar con '*'
-                        if dt_oa.date() != dt_utc.date():
-                            value += "*"
-                elif key in ("station", "energy"):
-                    val = contact.get(key, "")
-                    if val == "no_data":  # Valor por defecto para "no data"
-                        value = ""
-                    else:
-                        value = translation_service.tr(contact.get(key, ""))
-                elif key == "power":
-                    val = contact.get(key, "")
-                    value = f"{val} W" if val else ""
-                elif self.log_type == LogType.CONTEST_LOG and key in (
-                    "exchange_received",
-                    "exchange_sent",
-                ):
-                    val = contact.get(key, "")
-                    value = str(val).zfill(3) if val else ""
-                else:
-                    value = contact.get(key, "")
-                # --- Alineación derecha para RS_RX y RS_TX en concursos ---
-                if self.log_type == LogType.CONTEST_LOG and key in ("rs_rx", "rs_tx"):
-                    item = QTableWidgetItem(str(value))
-                    item.setFont(row_font)
-                    item.setTextAlignment(
-                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-                    )
-                    self.table.setItem(row, col, item)
-                else:
-                    item = QTableWidgetItem(str(value))
-                    item.setFont(row_font)
-                    self.table.setItem(row, col, item)
-        self.table.viewport().update()
-        self.table.repaint()
-        self.table.hide()
-        self.table.show()
+    def contact_count(self):
+        """
+        Total de contactos del log, incluidos los que aún se están cargando.
+        """
+        return self.model.total_count()
+
+    def selected_contact(self):
+        """
+        Devuelve el contacto de la fila seleccionada, o None.
+        """
+        indexes = self.table.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return self.model.contact_at_row(indexes[0].row())
 
     def retranslate_ui(self):
         """
         Actualiza los textos de la UI y refresca los datos de la tabla según el idioma actual.
         """
         self.set_columns()
-        # El refresco de datos debe hacerse solo si se requiere por cambio de idioma,
-        # y siempre con la lista actual de contactos.
-        if hasattr(self, "_last_contacts") and self._last_contacts:
-            self.set_contacts(self._last_contacts)
+        # Solo se recalculan las filas visibles, con la lista actual de contactos
+        self.model.invalidate_texts()
 
-    def _on_item_double_clicked(self, item):
+    def _on_item_double_clicked(self, index):
         """
         Abre el diálogo de edición para el contacto seleccionado, respetando traducción y tipos.
         """
-        row = item.row()
-        if not hasattr(self, "_last_contacts") or row >= len(self._last_contacts):
-            return
-            # La tabla muestra los contactos en orden invertido, así que el índice real es:
-        real_index = len(self._last_contacts) - 1 - row
-        if real_index < 0 or real_index >= len(self._last_contacts):
+        # La tabla muestra los contactos en orden invertido
+        contact = self.model.contact_at_row(index.row())
+        if contact is None:
             return
-        contact = self._last_contacts[real_index]
         # Importar y mostrar el diálogo de edición de contacto
         from interface_adapters.ui.dialogs.contact_edit_dialog import ContactEditDialog
         from PySide6.QtWidgets import QDialog
         from domain.contact_type import ContactType
 
         dlg = ContactEditDialog(contact, self.log_type, self)
-        if dlg.exec() == QDialog.DialogCode.Accepted and dlg.result_contact:
+        accepted = dlg.exec() == QDialog.DialogCode.Accepted
+        result_contact = dlg.result_contact
+        # El diálogo es hijo de la tabla: sin liberarlo, cada edición deja sus
+        # widgets vivos hasta que se cierra el log
+        dlg.deleteLater()
+        if accepted and result_contact:
             # Conservar id y timestamp originales
-            updated_data = dlg.result_contact.copy()
+            updated_data = result_contact.copy()
             if "id" in contact:
                 updated_data["id"] = contact["id"]
             # Actualizar el contacto usando caso de uso y refrescar tabla
-            from application.use_cases.contact_management import update_contact_in_log
-            from domain.repositories.contact_log_repository import ContactLogRepository
+            from application.use_cases.contact_management import (
+                get_log_contacts,
+                update_contact_in_log,
+            )
 
             main_window = self.parent()
             while main_window and main_window.__class__.__name__ != "MainWindow":
@@ -264,8 +225,7 @@ class ContactTableWidget(QWidget):
             update_contact_in_log(
                 db_path, log_id, contact_id, updated_data, contact_type
             )
-            repo = ContactLogRepository(db_path)
-            contacts = repo.get_contacts(log_id)
+            contacts = get_log_contacts(db_path, log_id)
             if hasattr(current_log, "contacts"):
                 current_log.contacts = contacts
             self.set_contacts(contacts)
@@ -278,9 +238,9 @@ class ContactTableWidget(QWidget):
         """
         prev_widths = settings_service.get_value(self._column_widths_key, None)
         if not isinstance(prev_widths, list):
-            prev_widths = [100] * self.table.columnCount()
+            prev_widths = [100] * self.model.columnCount()
         widths = []
-        for i in range(self.table.columnCount()):
+        for i in range(self.model.columnCount()):
             w = self.table.columnWidth(i)
             if w == 0:
                 if prev_widths and i < len(prev_widths):
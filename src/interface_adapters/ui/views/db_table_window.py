@@ -29,6 +29,7 @@ from translation.translation_service import translation_service
 from config.settings_service import settings_service
 from utils.text import filter_text_match
 from utils.fonts import build_roboto_mono_font
+from .font_delegate import FontDelegate
 
 
 class DBTableWindow(QWidget):
@@ -102,7 +103,9 @@ class DBTableWindow(QWidget):
 
         # Tabla
         self.table = QTableWidget()
-        self.table.setFont(build_roboto_mono_font(11, bold=False))
+        row_font = build_roboto_mono_font(11, bold=False)
+        self.table.setFont(row_font)
+        self.table.setItemDelegate(FontDelegate(row_font, self.table))
         main_layout.addWidget(self.table)
 
         # Controlador
@@ -364,14 +367,13 @@ class DBTableWindow(QWidget):
             lang_enum = translation_service.get_language()
             lang = getattr(lang_enum, "value", str(lang_enum))
 
+        yes_no = translation_service.snapshot(("yes", "no"))
+        yes_text, no_text = yes_no["yes"], yes_no["no"]
+
         for row_idx, op in enumerate(operators):
             for col_idx, key in enumerate(column_keys):
                 if key == "enabled":
-                    display = (
-                        translation_service.tr("yes")
-                        if op.enabled == 1
-                        else translation_service.tr("no")
-                    )
+                    display = yes_text if op.enabled == 1 else no_text
                     item = QTableWidgetItem(display)
                 elif key in ("expiration_date", "cutoff_date"):
                     value = getattr(op, key, "")
@@ -408,7 +410,6 @@ class DBTableWindow(QWidget):
                     )
                     value = getattr(op, attr, "")
                     item = QTableWidgetItem(str(value))
-                item.setFont(build_roboto_mono_font(11, bold=False))
                 self.table.setItem(row_idx, col_idx, item)
         self.apply_column_visibility()
         # Actualizar contador y paginación
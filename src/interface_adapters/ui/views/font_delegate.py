@@ -0,0 +1,25 @@
+"""
+FontDelegate
+
+Delegate que pinta todas las celdas de una tabla o lista con una fuente fija.
+La hoja de estilos global (``QWidget { font-family: ... }``) reemplaza la
+fuente asignada con ``setFont`` a la vista; en lugar de guardar la fuente en
+cada item (``setFont`` por item) o devolverla en cada ``data(FontRole)`` del
+modelo, el delegate la asigna a las opciones de estilo al pintar y medir.
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate
+
+
+class FontDelegate(QStyledItemDelegate):
+    """
+    Aplica ``font`` (p. ej. ``build_roboto_mono_font``) a cada celda.
+    """
+
+    def __init__(self, font, parent=None):
+        super().__init__(parent)
+        self._font = font
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.font = self._font
@@ -11,13 +11,17 @@ from PySide6.QtCore import QEvent, Qt
 # --- Imports de la aplicación ---
 from translation.translation_service import translation_service
 from config.settings_service import LanguageValue
-from interface_adapters.ui.utils import find_main_window
+from interface_adapters.ui.utils import disconnect_signal, find_main_window
+from interface_adapters.ui.perf_overlay import end_after_repaint
+from utils.latency_monitor import latency_monitor
 from interface_adapters.ui.view_manager import LogType
 from utils.datetime import parse_utc_timestamp
 
 # --- Imports de módulos locales (widgets) ---
-from application.use_cases.contact_management import delete_contact_from_log
-from domain.repositories.contact_log_repository import ContactLogRepository
+from application.use_cases.contact_management import (
+    delete_contact_from_log,
+    get_log_contacts,
+)
 from .callsign_input_widget import CallsignInputWidget
 from .callsign_info_widget import CallsignInfoWidget
 from .clock_widget import ClockWidget
@@ -193,9 +197,7 @@ class LogContestView(QWidget):
             QWidget.setTabOrder(self.add_contact_btn, self.delete_contact_btn)
         # Habilitar el botón de eliminar solo si hay una fila seleccionada (igual que LogOpsView)
         if hasattr(self.table_widget, "table"):
-            self.table_widget.table.itemSelectionChanged.connect(
-                self._on_selection_changed
-            )
+            self.table_widget.selectionChanged.connect(self._on_selection_changed)
         # Instalar eventFilter para F1 en toda la vista
         self.installEventFilter(self)
 
@@ -246,7 +248,7 @@ class LogContestView(QWidget):
                     return True
         return super().eventFilter(obj, event)
         # Habilitar el botón de eliminar solo si hay una fila seleccionada
-        self.table_widget.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table_widget.selectionChanged.connect(self._on_selection_changed)
 
     def set_log_data(self, log):
         """
@@ -254,10 +256,25 @@ class LogContestView(QWidget):
         Args:
             log: Objeto log con los datos a mostrar.
         """
+        self.callsign_info.set_current_log_path(getattr(log, "db_path", None))
         # Actualiza los datos del log y refresca la cabecera
         self._current_log = log
         self.retranslate_ui()
 
+    def teardown(self):
+        """
+        Libera la vista al cerrar el log: detiene los relojes y desconecta de
+        las señales globales de idioma a la vista y a sus widgets.
+        """
+        self.oa_clock.stop()
+        self.utc_clock.stop()
+        self.callsign_input.teardown()
+        self.callsign_info.teardown()
+        self.alerts_widget.teardown()
+        disconnect_signal(
+            translation_service.signal.language_changed, self.retranslate_ui
+        )
+
     def retranslate_ui(self):
         """
         Actualiza los textos de la UI según el idioma seleccionado y los datos del log, y refresca relojes.
@@ -284,9 +301,16 @@ class LogContestView(QWidget):
         if hasattr(self.form_widget, "exchange_sent_input") and hasattr(
             self.table_widget, "table"
         ):
-            num_contacts = self.table_widget.table.rowCount()
+            num_contacts = self.table_widget.contact_count()
             self.form_widget.exchange_sent_input.setText(str(num_contacts + 1).zfill(3))
 
+    def on_contacts_loaded(self):
+        """
+        Se llama al terminar la carga en segundo plano de los contactos del log;
+        revalúa la alerta de duplicado con la lista completa.
+        """
+        self._on_input_changed(self.callsign_input.get_callsign())
+
     def update_header(self):
         """
         Actualiza el texto del encabezado principal de la vista usando la lógica de traducción y formato de fecha.
@@ -364,9 +388,14 @@ class LogContestView(QWidget):
         """
         Agrega un nuevo contacto al log y actualiza la UI y la cola de contactos.
         """
+        # Con Ctrl+Enter el intervalo ya empezó al presionar la tecla
+        latency_monitor.begin("add_contact", restart=False)
         callsign = self.callsign_input.get_callsign().strip()
         result = self.form_widget._on_add_contact(callsign)
-        if result:  # Solo si el contacto se agregó correctamente
+        if not result:
+            latency_monitor.cancel("add_contact")
+        else:  # Solo si el contacto se agregó correctamente
+            end_after_repaint("add_contact", self.table_widget.table.viewport())
             self.callsign_input.input.clear()
             self.callsign_input.input.setFocus()
             # Eliminar de la cola si está presente
@@ -383,7 +412,7 @@ class LogContestView(QWidget):
             if hasattr(self.form_widget, "exchange_sent_input") and hasattr(
                 self.table_widget, "table"
             ):
-                num_contacts = self.table_widget.table.rowCount()
+                num_contacts = self.table_widget.contact_count()
                 self.form_widget.exchange_sent_input.setText(
                     str(num_contacts + 1).zfill(3)
                 )
@@ -393,20 +422,10 @@ class LogContestView(QWidget):
         Elimina el contacto seleccionado de la tabla, tras confirmación del usuario y actualización en la base de datos.
         """
         # Eliminar contacto seleccionado de la tabla solo si hay una fila seleccionada
-        selected_items = self.table_widget.table.selectedItems()
-        if not selected_items:
-            return
-        row = selected_items[0].row()
-        contact_list = (
-            self.table_widget._last_contacts
-            if hasattr(self.table_widget, "_last_contacts")
-            else []
-        )
-        # Sincronizar el índice visual con el real (por inversión en la tabla)
-        real_index = len(contact_list) - 1 - row
-        if real_index < 0 or real_index >= len(contact_list):
+        # El modelo resuelve la inversión entre la fila visual y el contacto
+        contact = self.table_widget.selected_contact()
+        if contact is None:
             return
-        contact = contact_list[real_index]
         contact_id = contact.get("id", None)
         callsign = contact.get("callsign", "")
         # Mostrar diálogo de confirmación
@@ -445,8 +464,7 @@ class LogContestView(QWidget):
         delete_contact_from_log(db_path, contact_id)
         # Actualizar la tabla
 
-        repo = ContactLogRepository(db_path)
-        contacts = repo.get_contacts(log_id)
+        contacts = get_log_contacts(db_path, log_id)
         if (
             hasattr(main_window, "current_log")
             and main_window.current_log is not None
@@ -458,7 +476,7 @@ class LogContestView(QWidget):
         if hasattr(self.form_widget, "exchange_sent_input") and hasattr(
             self.table_widget, "table"
         ):
-            num_contacts = self.table_widget.table.rowCount()
+            num_contacts = self.table_widget.contact_count()
             self.form_widget.exchange_sent_input.setText(str(num_contacts + 1).zfill(3))
 
     def _on_selection_changed(self):
@@ -486,6 +504,7 @@ class LogContestView(QWidget):
         """
         Habilita la alerta de duplicado en tiempo real si el indicativo ya está en el log (mismo bloque horario en concursos).
         """
+        latency_monitor.begin("duplicate_alert")
         from application.use_cases.contact_management import find_duplicate_in_block
 
         callsign = text.strip().upper()
@@ -503,6 +522,7 @@ class LogContestView(QWidget):
                     c.get("callsign", "").upper() == callsign for c in contacts
                 )
         self.alerts_widget.set_duplicate_alert(is_duplicate)
+        end_after_repaint("duplicate_alert", self.alerts_widget.label1)
         # La alerta de disabled se actualiza solo desde _on_operator_enabled_status
 
     def _on_operator_enabled_status(self, enabled):
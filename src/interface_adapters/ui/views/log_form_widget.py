@@ -34,9 +34,9 @@ from application.use_cases.contact_management import (
     validate_contact_for_log,
     add_contact_to_log,
     find_duplicate_in_block,
+    get_log_contacts,
 )
 from interface_adapters.ui.dialogs.operator_edit_dialog import OperatorEditDialog
-from domain.repositories.contact_log_repository import ContactLogRepository
 from interface_adapters.ui.utils import find_main_window
 from utils.callsign_parser import parse_callsign
 
@@ -589,8 +589,7 @@ class LogFormWidget(QWidget):
             if self.log_type == LogType.OPERATION_LOG
             else ContactType.CONTEST
         )
-        repo_log = ContactLogRepository(db_path)
-        contacts = repo_log.get_contacts(log_id)
+        contacts = get_log_contacts(db_path, log_id)
         validation = validate_contact_for_log(
             data, contacts, contact_type, translation_service
         )
@@ -655,7 +654,7 @@ class LogFormWidget(QWidget):
         if operator:
             try:
                 add_contact_to_log(db_path, log_id, data, contact_type)
-                contacts = repo_log.get_contacts(log_id)
+                contacts = get_log_contacts(db_path, log_id)
                 if (
                     main_window
                     and hasattr(main_window, "current_log")
@@ -745,7 +744,7 @@ class LogFormWidget(QWidget):
         # Agregar contacto con los datos actuales (faltantes en blanco si no existe operador)
         try:
             add_contact_to_log(db_path, log_id, data, contact_type)
-            contacts = repo_log.get_contacts(log_id)
+            contacts = get_log_contacts(db_path, log_id)
             if (
                 main_window
                 and hasattr(main_window, "current_log")
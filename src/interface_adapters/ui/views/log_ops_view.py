@@ -23,9 +23,11 @@ from .clock_widget import ClockWidget
 from interface_adapters.ui.view_manager import LogType
 from application.use_cases.contact_management import (
     delete_contact_from_log,
-    ContactLogRepository,
+    get_log_contacts,
 )
-from interface_adapters.ui.utils import find_main_window
+from interface_adapters.ui.utils import disconnect_signal, find_main_window
+from interface_adapters.ui.perf_overlay import end_after_repaint
+from utils.latency_monitor import latency_monitor
 from infrastructure.repositories.sqlite_radio_operator_repository import (
     SqliteRadioOperatorRepository,
 )
@@ -151,7 +153,7 @@ class LogOpsView(QWidget):
         )
         layout.addWidget(self.table_widget)
         # Habilitar el botón de eliminar solo si hay una fila seleccionada
-        self.table_widget.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table_widget.selectionChanged.connect(self._on_selection_changed)
         # Al seleccionar desde la cola, establecer el indicativo y devolver el foco al input
         self.queue_widget.setCallsign.connect(self._on_queue_set_callsign)
         self.callsign_input.addToQueue.connect(self.queue_widget.add_to_queue)
@@ -253,12 +255,34 @@ class LogOpsView(QWidget):
         Args:
             log: Objeto log con los datos a mostrar.
         """
+        self.callsign_info.set_current_log_path(getattr(log, "db_path", None))
         self._current_log = log
         # Actualizar valores por defecto del formulario según la banda
         if hasattr(self, "form_widget") and hasattr(self.form_widget, "_set_defaults_by_band"):
             self.form_widget._set_defaults_by_band()
         self.retranslate_ui()
 
+    def on_contacts_loaded(self):
+        """
+        Se llama al terminar la carga en segundo plano de los contactos del log;
+        revalúa la alerta de duplicado con la lista completa.
+        """
+        self._on_input_changed(self.callsign_input.get_callsign())
+
+    def teardown(self):
+        """
+        Libera la vista al cerrar el log: detiene los relojes y desconecta de
+        las señales globales de idioma a la vista y a sus widgets.
+        """
+        self.oa_clock.stop()
+        self.utc_clock.stop()
+        self.callsign_input.teardown()
+        self.callsign_info.teardown()
+        self.alerts_widget.teardown()
+        disconnect_signal(
+            translation_service.signal.language_changed, self.retranslate_ui
+        )
+
     def retranslate_ui(self):
         """
         Actualiza los textos de la UI según el idioma seleccionado y los datos del log, y refresca relojes.
@@ -371,9 +395,14 @@ class LogOpsView(QWidget):
         """
         Agrega un nuevo contacto al log y actualiza la UI y la cola de contactos.
         """
+        # Con Ctrl+Enter el intervalo ya empezó al presionar la tecla
+        latency_monitor.begin("add_contact", restart=False)
         callsign = self.callsign_input.get_callsign().strip()
         result = self.form_widget._on_add_contact(callsign)
-        if result:  # Solo si el contacto se agregó correctamente
+        if not result:
+            latency_monitor.cancel("add_contact")
+        else:  # Solo si el contacto se agregó correctamente
+            end_after_repaint("add_contact", self.table_widget.table.viewport())
             self.callsign_input.input.clear()
             self.callsign_input.input.setFocus()
             # Eliminar de la cola si está presente
@@ -392,20 +421,10 @@ class LogOpsView(QWidget):
         Elimina el contacto seleccionado de la tabla, tras confirmación del usuario y actualización en la base de datos.
         """
         # Eliminar contacto seleccionado de la tabla solo si hay una fila seleccionada
-        selected_items = self.table_widget.table.selectedItems()
-        if not selected_items:
-            return
-        row = selected_items[0].row()
-        contact_list = (
-            self.table_widget._last_contacts
-            if hasattr(self.table_widget, "_last_contacts")
-            else []
-        )
-        # Sincronizar el índice visual con el real (por inversión en la tabla)
-        real_index = len(contact_list) - 1 - row
-        if real_index < 0 or real_index >= len(contact_list):
+        # El modelo resuelve la inversión entre la fila visual y el contacto
+        contact = self.table_widget.selected_contact()
+        if contact is None:
             return
-        contact = contact_list[real_index]
         contact_id = contact.get("id", None)
         callsign = contact.get("callsign", "")
         name = contact.get("name", "")
@@ -441,8 +460,7 @@ class LogOpsView(QWidget):
             return
 
         delete_contact_from_log(db_path, contact_id)
-        repo = ContactLogRepository(db_path)
-        contacts = repo.get_contacts(log_id)
+        contacts = get_log_contacts(db_path, log_id)
         # Validar que current_log tiene atributo contacts
         if hasattr(current_log, "contacts"):
             current_log.contacts = contacts
@@ -471,6 +489,7 @@ class LogOpsView(QWidget):
         """
         Habilita la alerta de duplicado en tiempo real si el indicativo ya está en el log operativo.
         """
+        latency_monitor.begin("duplicate_alert")
         callsign = text.strip().upper()
         contacts = getattr(self.table_widget, "_last_contacts", [])
         is_duplicate = False
@@ -479,6 +498,7 @@ class LogOpsView(QWidget):
                 c.get("callsign", "").upper() == callsign for c in contacts
             )
         self.alerts_widget.set_duplicate_alert(is_duplicate)
+        end_after_repaint("duplicate_alert", self.alerts_widget.label1)
 
     def _on_operator_enabled_status(self, enabled):
         """
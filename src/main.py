@@ -10,24 +10,24 @@ Flujo principal:
 4. Maneja cualquier excepción global mostrando un mensaje crítico.
 """
 
+import os
 import sys
 import traceback
 
-# Compatibilidad Qt: en la variante legacy puede mapear PySide2 -> PySide6.
-import qt_compat_bootstrap
+# Trazado opcional del arranque (LOGGEROA_STARTUP_TRACE o --trace-startup)
+from utils.startup_trace import startup_tracer, trace_phase, watch_first_paint
 
-qt_compat_bootstrap.bootstrap()
+startup_tracer.configure(sys.argv)
 
-# Terceros
-from PySide6.QtWidgets import QApplication, QMessageBox
+# Trazado opcional de consultas SQLite (LOGGEROA_SQL_TRACE o --trace-sql)
+from infrastructure.db.query_trace import query_tracer
 
-# Locales
-from config.paths import get_database_path
-from infrastructure.db.connection import get_connection
-from infrastructure.db.schema import init_radioamateur_table
-from interface_adapters.ui.main_window import MainWindow
-from infrastructure.db import queries
-from utils.fonts import ensure_roboto_mono_registered
+query_tracer.configure(sys.argv)
+
+# Latencias de captura (LOGGEROA_PERF_OVERLAY o --perf-overlay)
+from utils.latency_monitor import latency_monitor
+
+latency_monitor.configure(sys.argv)
 
 
 def main():
@@ -36,27 +36,64 @@ def main():
 
     Inicializa la base de datos y lanza la ventana principal.
     Si ocurre una excepción no capturada, muestra un mensaje crítico al usuario.
+
+    Qt y la interfaz se importan aquí y no a nivel de módulo: los procesos
+    hijos de los pools (``spawn``) vuelven a importar este archivo y no deben
+    cargar PySide6 ni la ventana principal.
     """
+    # Compatibilidad Qt: en la variante legacy puede mapear PySide2 -> PySide6.
+    with trace_phase("qt_compat_bootstrap"):
+        import qt_compat_bootstrap
+
+        qt_compat_bootstrap.bootstrap()
+
+    # Terceros
+    with trace_phase("import PySide6"):
+        from PySide6.QtWidgets import QApplication, QMessageBox
+
+    # Locales
+    with trace_phase("import app modules"):
+        from config.paths import get_database_path
+        from infrastructure.db.connection import open_connection
+        from infrastructure.db.schema import init_radioamateur_table
+        from interface_adapters.ui.main_window import MainWindow
+        from utils.fonts import ensure_roboto_mono_registered
+        from application.use_cases.qso_index import rebuild_qso_index_in_background
+
     try:
         # Inicializar la tabla de radioaficionados en la base de datos usando context manager
-        with get_connection(get_database_path()) as conn:
-            init_radioamateur_table(conn)
+        with trace_phase("db.init_radioamateur_table"):
+            with open_connection(get_database_path()) as conn:
+                init_radioamateur_table(conn)
 
         # Crear la aplicación Qt y mostrar la ventana principal
-        app = QApplication(sys.argv)
-        ensure_roboto_mono_registered()
-
-        # Chequeo automático de vencimientos al arranque
-        try:
-            affected = queries.disable_expired_operators()
-            # Opcional: podríamos registrar 'affected' en el futuro
-        except Exception:
-            # No bloquear el arranque por este mantenimiento
-            pass
-
-        window = MainWindow()
-        window.show()
-        sys.exit(app.exec())
+        with trace_phase("QApplication"):
+            app = QApplication(sys.argv)
+        with trace_phase("fonts.register"):
+            ensure_roboto_mono_registered()
+
+        with trace_phase("MainWindow"):
+            window = MainWindow()
+        # Medición de arranque (benchmarks/bench_startup.py): salir tras el
+        # primer pintado de la ventana
+        exit_after_startup = bool(os.environ.get("LOGGEROA_EXIT_AFTER_STARTUP"))
+
+        def after_first_paint():
+            # Chequeo de vencimientos (una vez por día), sin demorar la ventana
+            window.start_startup_maintenance()
+            if exit_after_startup:
+                app.quit()
+
+        watch_first_paint(window, after_first_paint)
+        with trace_phase("MainWindow.show"):
+            window.show()
+
+        # Índice global de QSOs: solo relee logs modificados, en segundo plano
+        rebuild_qso_index_in_background()
+
+        exit_code = app.exec()
+        latency_monitor.save_on_exit()
+        sys.exit(exit_code)
     except Exception as e:
         # Manejo global de excepciones: muestra mensaje crítico y termina
         app = QApplication.instance() or QApplication(sys.argv)
@@ -68,4 +105,12 @@ def main():
 
 
 if __name__ == "__main__":
+    try:
+        # Requerido por los pools de procesos en ejecutables congelados
+        import multiprocessing
+
+        multiprocessing.freeze_support()
+    except ImportError:
+        # El build legacy excluye multiprocessing; se usan pools de hilos
+        pass
     main()
@@ -199,8 +199,10 @@ def _patch_qtwidgets(QtWidgets):
 
 
 def _patch_qtgui(QtGui, QtWidgets):
-    if not hasattr(QtGui, "QAction") and hasattr(QtWidgets, "QAction"):
-        QtGui.QAction = QtWidgets.QAction
+    # Clases que en Qt 6 pasaron de QtWidgets a QtGui
+    for name in ("QAction", "QShortcut"):
+        if not hasattr(QtGui, name) and hasattr(QtWidgets, name):
+            setattr(QtGui, name, getattr(QtWidgets, name))
 
 
 def _register_pyside6_aliases(QtCore, QtGui, QtWidgets):
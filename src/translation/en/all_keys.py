@@ -322,6 +322,40 @@ UI_TRANSLATIONS = {
     "export_pdf_not_supported_for_log_type": "PDF export is only available for contest logs.",
     # New
     "ui_set_expiration_date": "Set expiration",
+    "worked_before_label": "Worked before: {qsos} QSO in {logs} log(s), last {date}",
+    "menu_export_batch": "Batch export logs...",
+    "batch_export_title": "Batch export logs",
+    "batch_export_log_type": "Type:",
+    "batch_export_all": "All",
+    "batch_export_operations": "Operations",
+    "batch_export_contests": "Contests",
+    "batch_export_contest": "Contest:",
+    "batch_export_from": "From:",
+    "batch_export_to": "To:",
+    "batch_export_search": "Search",
+    "batch_export_select_all": "Select all",
+    "batch_export_select_none": "Select none",
+    "batch_export_formats": "Formats:",
+    "batch_export_start": "Export",
+    "batch_export_open_folder": "Open export folder",
+    "menu_import_adif": "Import ADIF...",
+    "import_adif_title": "Import ADIF into log",
+    "import_adif_failed": "Could not import the ADIF file",
+    "import_adif_summary": "Records read: {records}<br>Contacts imported: {imported}<br>Duplicates skipped: {duplicates}<br>Invalid records: {invalid}",
+    "menu_export_cabrillo": "Export as Cabrillo",
+    "export_cabrillo_not_supported_for_log_type": "Cabrillo export is only available for contest logs.",
+    "export_in_progress": "Exporting {file}...",
+    "export_done": "Exported: {file}",
+    "export_show_in_folder": "Show in folder",
+    "export_simple_save_button": "Save as text...",
+    "maintenance_expired_disabled": "Maintenance: {count} expired operators disabled",
+    "perf_overlay_add_contact": "Add",
+    "perf_overlay_suggestion_refresh": "Suggestions",
+    "perf_overlay_operator_summary": "Summary",
+    "perf_overlay_duplicate_alert": "Dupe",
+    "perf_overlay_export": "Export latencies (CSV)",
+    "perf_overlay_exported": "Latencies saved to {path}",
+    "perf_overlay_tooltip": "Entry latency p50/p95/max (ms) over the last {count} samples. {shortcut} to hide.",
 }
 
 ALL_KEYS_TRANSLATIONS = {}
@@ -322,6 +322,40 @@ UI_TRANSLATIONS = {
     "export_pdf_not_supported_for_log_type": "El formato PDF solo está disponible para logs de concurso.",
     # New
     "ui_set_expiration_date": "Definir vencimiento",
+    "worked_before_label": "Trabajado antes: {qsos} QSO en {logs} log(s), último {date}",
+    "menu_export_batch": "Exportar logs en lote...",
+    "batch_export_title": "Exportar logs en lote",
+    "batch_export_log_type": "Tipo:",
+    "batch_export_all": "Todos",
+    "batch_export_operations": "Operativos",
+    "batch_export_contests": "Concursos",
+    "batch_export_contest": "Concurso:",
+    "batch_export_from": "Desde:",
+    "batch_export_to": "Hasta:",
+    "batch_export_search": "Buscar",
+    "batch_export_select_all": "Marcar todos",
+    "batch_export_select_none": "Desmarcar todos",
+    "batch_export_formats": "Formatos:",
+    "batch_export_start": "Exportar",
+    "batch_export_open_folder": "Abrir carpeta de exportación",
+    "menu_import_adif": "Importar ADIF...",
+    "import_adif_title": "Importar ADIF al log",
+    "import_adif_failed": "No se pudo importar el archivo ADIF",
+    "import_adif_summary": "Registros leídos: {records}<br>Contactos importados: {imported}<br>Duplicados omitidos: {duplicates}<br>Registros inválidos: {invalid}",
+    "menu_export_cabrillo": "Exportar como Cabrillo",
+    "export_cabrillo_not_supported_for_log_type": "El formato Cabrillo solo está disponible para logs de concurso.",
+    "export_in_progress": "Exportando {file}...",
+    "export_done": "Exportado: {file}",
+    "export_show_in_folder": "Mostrar en carpeta",
+    "export_simple_save_button": "Guardar como texto...",
+    "maintenance_expired_disabled": "Mantenimiento: {count} operadores vencidos deshabilitados",
+    "perf_overlay_add_contact": "Alta",
+    "perf_overlay_suggestion_refresh": "Sugerencias",
+    "perf_overlay_operator_summary": "Resumen",
+    "perf_overlay_duplicate_alert": "Duplicado",
+    "perf_overlay_export": "Exportar latencias (CSV)",
+    "perf_overlay_exported": "Latencias guardadas en {path}",
+    "perf_overlay_tooltip": "Latencia de captura p50/p95/máx (ms) de las últimas {count} muestras. {shortcut} para ocultar.",
 }
 
 ALL_KEYS_TRANSLATIONS = {}
@@ -1,10 +1,27 @@
-from PySide6.QtCore import QObject, Signal
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
 from .translations import load_translations
-from config.settings_service import LanguageValue
+from config.settings_values import LanguageValue
+from utils.startup_trace import trace_phase
+
+# Grupos de claves que se traducen en celdas de tablas y exportaciones
+STATION_KEYS = ("no_data", "station_base", "station_mobile", "station_portable")
+ENERGY_KEYS = ("no_data", "energy_autonomous", "energy_battery", "energy_commercial")
+BAND_KEYS = ("band_hf", "band_vhf", "band_uhf")
+MODE_KEYS = ("mode_lsb", "mode_usb", "mode_fm", "mode_other")
+CONTACT_VALUE_KEYS = STATION_KEYS + ENERGY_KEYS[1:] + BAND_KEYS + MODE_KEYS
+
+
+def _create_translation_signal():
+    # Qt se importa al pedir la señal: los procesos de exportación en lote
+    # traducen sin cargar PySide6
+    from PySide6.QtCore import QObject, Signal
 
+    class TranslationSignal(QObject):
+        language_changed = Signal()
 
-class TranslationSignal(QObject):
-    language_changed = Signal()
+    return TranslationSignal()
 
 
 class TranslationService:
@@ -14,8 +31,22 @@ class TranslationService:
         :param default_lang: Enum LanguageValue inicial (por defecto LanguageValue.ES).
         """
         self._lang = default_lang
-        self._signal = TranslationSignal()
-        self._translations = load_translations(self._resolve_auto_language(self._lang))
+        self._signal = None  # Se crea con el primer acceso a ``signal``
+        self._loaded = {}  # Traducciones ya cargadas, por idioma resuelto
+        self._snapshots = {}  # Mapas precalculados, por (idioma, claves)
+        self._resolved_lang = self._resolve_auto_language(self._lang)
+        self._translations = self._load(self._resolved_lang)
+
+    def _load(self, resolved_lang):
+        translations = self._loaded.get(resolved_lang)
+        if translations is None:
+            with trace_phase(
+                "translation.load", lang=getattr(resolved_lang, "value", resolved_lang)
+            ):
+                translations = load_translations(resolved_lang)
+            if translations:
+                self._loaded[resolved_lang] = translations
+        return translations
 
     def _resolve_auto_language(self, lang):
         """
@@ -40,15 +71,19 @@ class TranslationService:
         :param lang: Enum LanguageValue a establecer.
         """
         resolved_lang = self._resolve_auto_language(lang)
-        translations = load_translations(resolved_lang)
+        translations = self._load(resolved_lang)
         if translations:
             self._lang = lang
+            self._resolved_lang = resolved_lang
             self._translations = translations
-            self._signal.language_changed.emit()
+            if self._signal is not None:
+                self._signal.language_changed.emit()
 
     @property
     def signal(self):
         """Permite acceder a la señal de cambio de idioma desde el servicio."""
+        if self._signal is None:
+            self._signal = _create_translation_signal()
         return self._signal
 
     def get_language(self) -> LanguageValue:
@@ -66,6 +101,33 @@ class TranslationService:
         """
         return self._translations.get(key, key)
 
+    def snapshot(
+        self, keys: Iterable[str], lang: Optional[LanguageValue] = None
+    ) -> Mapping[str, str]:
+        """
+        Devuelve un mapa inmutable clave -> texto para ``keys`` en ``lang`` (por
+        defecto el idioma actual). Se calcula una sola vez por idioma y
+        conjunto de claves, para que tablas y exportaciones traduzcan celdas
+        con un diccionario local en lugar de llamar a ``tr`` por celda.
+        :param keys: Claves a traducir (p. ej. ``CONTACT_VALUE_KEYS``).
+        :param lang: Enum LanguageValue; None para el idioma actual.
+        :return: Mapa de solo lectura; las claves sin traducción se mapean a sí mismas.
+        """
+        if lang is None:
+            resolved_lang = self._resolved_lang
+        else:
+            resolved_lang = self._resolve_auto_language(lang)
+        keys = tuple(keys)
+        cache_key = (resolved_lang, keys)
+        snapshot = self._snapshots.get(cache_key)
+        if snapshot is None:
+            translations = self._load(resolved_lang) or {}
+            snapshot = MappingProxyType(
+                {key: translations.get(key, key) for key in keys}
+            )
+            self._snapshots[cache_key] = snapshot
+        return snapshot
+
 
 # Instancia global para acceso centralizado
 default_lang = LanguageValue.ES
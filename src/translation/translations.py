@@ -1,7 +1,7 @@
 # Loader central de traducciones modularizadas
 import importlib
 from utils.resources import get_resource_path
-from config.settings_service import LanguageValue
+from config.settings_values import LanguageValue
 
 TRANSLATION_MODULES = [
     "all_keys",
@@ -3,9 +3,14 @@ Funciones utilitarias para formateo de fechas y horas en Logger OA.
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Union
+from functools import lru_cache
+from typing import NamedTuple, Optional, Union
 
 PERU_TZ = timezone(timedelta(hours=-5))
+# Hora OA = UTC-5, en minutos
+OA_OFFSET_MINUTES = 5 * 60
+# Minutos distintos recordados por el formateador de QTR (~45 días)
+QTR_CACHE_SIZE = 1 << 16
 
 
 def parse_utc_timestamp(ts: Optional[Union[int, float, str]]) -> int:
@@ -27,7 +32,48 @@ def parse_utc_timestamp(ts: Optional[Union[int, float, str]]) -> int:
         return 0
     if value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
         return int(value)
+    return _parse_legacy_timestamp(value)
 
+
+# Separadores de los formatos legacy ``YYYY-MM-DD_HH-MM-SS`` y ``YYYY-MM-DD HH:MM:SS``
+_LEGACY_SEPARATORS = (("-", "-", "_", "-", "-"), ("-", "-", " ", ":", ":"))
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _parse_legacy_timestamp(value: str) -> int:
+    # Camino rápido con aritmética entera para los formatos de ancho fijo;
+    # cualquier otro caso pasa por strptime, que valida y reporta el error.
+    if len(value) == 19 and (
+        (value[4], value[7], value[10], value[13], value[16]) in _LEGACY_SEPARATORS
+    ):
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13]
+        digits += value[14:16] + value[17:19]
+        if digits.isdigit():
+            year, month, day = int(value[0:4]), int(value[5:7]), int(value[8:10])
+            hour, minute, second = (
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+            )
+            leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            if (
+                1 <= month <= 12
+                and 1 <= day <= _DAYS_IN_MONTH[month - 1] + (month == 2 and leap)
+                and hour < 24
+                and minute < 60
+                and second < 62
+                and year >= 1
+            ):
+                if second >= 60:
+                    # strptime acepta 60 y 61 (segundos intercalares)
+                    return _strptime_legacy_timestamp(value)
+                days = _days_from_civil(year, month, day)
+                local = days * 86400 + hour * 3600 + minute * 60 + second
+                return local + OA_OFFSET_MINUTES * 60
+    return _strptime_legacy_timestamp(value)
+
+
+def _strptime_legacy_timestamp(value: str) -> int:
     for fmt in ("%Y-%m-%d_%H-%M-%S", "%Y-%m-%d %H:%M:%S"):
         try:
             dt_local = datetime.strptime(value, fmt).replace(tzinfo=PERU_TZ)
@@ -35,7 +81,84 @@ def parse_utc_timestamp(ts: Optional[Union[int, float, str]]) -> int:
         except ValueError:
             continue
 
-    raise ValueError(f"Formato de timestamp no soportado: {ts}")
+    raise ValueError(f"Formato de timestamp no soportado: {value}")
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Días desde 1970-01-01 hasta la fecha dada (inverso de ``_civil_from_days``).
+    """
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+class QtrTime(NamedTuple):
+    """
+    Textos de QTR de un minuto, en UTC y en hora OA (UTC-5).
+    """
+
+    utc_time: str  # HH:MM
+    utc_date: str  # DD/MM/YYYY
+    utc_iso_date: str  # YYYY-MM-DD
+    oa_time: str  # HH:MM
+    oa_date: str  # DD/MM/YYYY
+    oa_minute: int  # minuto de la hora OA (0-59)
+    date_rollover: bool  # la fecha OA es distinta de la fecha UTC
+
+
+def _civil_from_days(days: int):
+    """
+    Fecha (año, mes, día) del día ``days`` contado desde 1970-01-01, con
+    aritmética entera (algoritmo de calendario civil de H. Hinnant).
+    """
+    days += 719468
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (month <= 2), month, day
+
+
+@lru_cache(maxsize=QTR_CACHE_SIZE)
+def qtr_from_minute(epoch_minute: int) -> QtrTime:
+    """
+    QTR del minuto UTC ``epoch_minute`` (epoch // 60). Los contactos de un
+    log se concentran en pocos minutos, así que cada minuto se formatea una
+    sola vez y sin crear objetos ``datetime``.
+    """
+    utc_day, utc_min = divmod(epoch_minute, 1440)
+    oa_day, oa_min = divmod(epoch_minute - OA_OFFSET_MINUTES, 1440)
+    year, month, day = _civil_from_days(utc_day)
+    if oa_day == utc_day:
+        oa_year, oa_month, oa_mday = year, month, day
+    else:
+        oa_year, oa_month, oa_mday = _civil_from_days(oa_day)
+    return QtrTime(
+        utc_time=f"{utc_min // 60:02d}:{utc_min % 60:02d}",
+        utc_date=f"{day:02d}/{month:02d}/{year:04d}",
+        utc_iso_date=f"{year:04d}-{month:02d}-{day:02d}",
+        oa_time=f"{oa_min // 60:02d}:{oa_min % 60:02d}",
+        oa_date=f"{oa_mday:02d}/{oa_month:02d}/{oa_year:04d}",
+        oa_minute=oa_min % 60,
+        date_rollover=oa_day != utc_day,
+    )
+
+
+def format_qtr(ts) -> Optional[QtrTime]:
+    """
+    QTR de un timestamp de contacto (epoch UTC o texto legacy), o None si el
+    contacto no tiene hora.
+    """
+    if not ts:
+        return None
+    return qtr_from_minute(parse_utc_timestamp(ts) // 60)
 
 
 def format_iso_date(ts):
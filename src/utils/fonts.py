@@ -1,4 +1,5 @@
 import os
+from typing import Dict, Tuple
 
 from PySide6.QtGui import QFont, QFontDatabase
 
@@ -6,6 +7,8 @@ from utils.resources import get_resource_path
 
 
 _ROBOTO_MONO_FAMILY = None
+# Fuentes compartidas por (tamaño, negrita)
+_ROBOTO_MONO_FONTS: Dict[Tuple[int, bool], QFont] = {}
 
 
 def ensure_roboto_mono_registered() -> str:
@@ -35,11 +38,19 @@ def ensure_roboto_mono_registered() -> str:
 
 
 def build_roboto_mono_font(point_size: int, bold: bool = False) -> QFont:
-    """Construye una QFont basada en Roboto Mono, con fallback monoespaciado."""
-    font = QFont()
-    font.setFamily(ensure_roboto_mono_registered())
-    font.setPointSize(point_size)
-    font.setBold(bold)
-    if bold:
-        font.setWeight(QFont.Weight.Bold)
+    """
+    Devuelve la QFont Roboto Mono (con fallback monoespaciado) del tamaño y
+    peso indicados. Se construye una sola vez por (tamaño, negrita) y la
+    instancia se comparte: no modificarla (para variantes, ``QFont(font)``).
+    """
+    key = (point_size, bool(bold))
+    font = _ROBOTO_MONO_FONTS.get(key)
+    if font is None:
+        font = QFont()
+        font.setFamily(ensure_roboto_mono_registered())
+        font.setPointSize(point_size)
+        font.setBold(bold)
+        if bold:
+            font.setWeight(QFont.Weight.Bold)
+        _ROBOTO_MONO_FONTS[key] = font
     return font
\ No newline at end of file
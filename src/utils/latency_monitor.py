@@ -0,0 +1,229 @@
+"""
+Medición opcional de la latencia de captura de QSOs.
+
+Se activa con la variable de entorno ``LOGGEROA_PERF_OVERLAY`` (``1``, o la
+ruta de un CSV donde guardar las muestras al salir), con
+``--perf-overlay[=RUTA]`` al lanzar ``main.py`` o en tiempo de ejecución con
+Ctrl+Shift+F12 (panel de la barra de estado). Interacciones medidas:
+
+- ``add_contact``: Enter (o el botón de agregar) hasta que el contacto
+  aparece en la tabla.
+- ``suggestion_refresh``: última tecla hasta la lista de sugerencias.
+- ``operator_summary``: última tecla hasta el resumen del operador.
+- ``duplicate_alert``: tecla hasta la alerta de duplicado actualizada.
+
+Los puntos de medición en la UI llaman a ``begin``/``end``; sin medición
+activa cada llamada es una comparación. Las estadísticas (p50, p95, máximo)
+se calculan sobre las últimas ``WINDOW_SIZE`` muestras de cada interacción;
+``export_csv`` guarda todas las muestras de la sesión.
+"""
+
+import csv
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+LATENCY_MONITOR_ENV = "LOGGEROA_PERF_OVERLAY"
+LATENCY_MONITOR_FLAG = "--perf-overlay"
+INTERACTIONS = (
+    "add_contact",
+    "suggestion_refresh",
+    "operator_summary",
+    "duplicate_alert",
+)
+WINDOW_SIZE = 200
+# Tope de muestras guardadas para el CSV (una sesión de concurso completa)
+MAX_SAMPLES = 200_000
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Percentil por rango más cercano de una lista ya ordenada.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+class LatencyMonitor:
+    """
+    Registra intervalos con nombre (``begin``/``end``) y mantiene una ventana
+    móvil de latencias por interacción.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self._open = {}
+        self._windows: Dict[str, deque] = {}
+        self._totals: Dict[str, int] = {}
+        self._samples = deque(maxlen=MAX_SAMPLES)
+        self._lock = threading.Lock()
+
+    def configure(self, argv: Optional[List[str]] = None, environ=None) -> bool:
+        """
+        Activa la medición según ``--perf-overlay[=RUTA]`` en ``argv`` (que
+        se quita de la lista, para que Qt no lo vea) o ``LOGGEROA_PERF_OVERLAY``.
+        """
+        environ = os.environ if environ is None else environ
+        path = environ.get(LATENCY_MONITOR_ENV) or None
+        if argv is not None:
+            for arg in list(argv[1:]):
+                if arg == LATENCY_MONITOR_FLAG or arg.startswith(
+                    LATENCY_MONITOR_FLAG + "="
+                ):
+                    argv.remove(arg)
+                    path = arg.partition("=")[2] or path or "1"
+        if path:
+            self.enabled = True
+            self.path = None if path == "1" else path
+        return self.enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        if not enabled:
+            self._open.clear()
+
+    # --- Puntos de medición ---
+
+    def begin(self, key: str, restart: bool = True) -> None:
+        """
+        Marca el inicio del intervalo ``key``. Con ``restart=False`` se
+        conserva un inicio anterior aún abierto (p. ej. Enter y luego el
+        manejador del botón).
+        """
+        if not self.enabled:
+            return
+        if restart or key not in self._open:
+            self._open[key] = time.perf_counter()
+
+    def started(self, key: str) -> Optional[float]:
+        """
+        Inicio del intervalo ``key`` abierto (None si no hay).
+        """
+        return self._open.get(key)
+
+    def end(
+        self,
+        key: str,
+        interaction: Optional[str] = None,
+        started: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Cierra el intervalo ``key`` y lo registra como ``interaction`` (por
+        defecto, ``key``). Si se indica ``started``, solo lo cierra si sigue
+        siendo el mismo intervalo (no uno reiniciado por otra tecla).
+        Devuelve la latencia en ms, o None si no se registró.
+        """
+        if not self.enabled:
+            return None
+        start = self._open.get(key)
+        if start is None or (started is not None and start != started):
+            return None
+        del self._open[key]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.record(interaction or key, elapsed_ms)
+        return elapsed_ms
+
+    def cancel(self, key: str) -> None:
+        """
+        Descarta el intervalo ``key`` (p. ej. el contacto no se agregó).
+        """
+        self._open.pop(key, None)
+
+    def record(self, interaction: str, elapsed_ms: float) -> None:
+        with self._lock:
+            window = self._windows.get(interaction)
+            if window is None:
+                window = self._windows[interaction] = deque(maxlen=WINDOW_SIZE)
+            window.append(elapsed_ms)
+            self._totals[interaction] = self._totals.get(interaction, 0) + 1
+            self._samples.append((time.time(), interaction, elapsed_ms))
+
+    # --- Resultados ---
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Devuelve por interacción: muestras en la ventana, p50, p95 y máximo
+        (ms), y el total de muestras de la sesión.
+        """
+        with self._lock:
+            windows = {name: sorted(w) for name, w in self._windows.items()}
+            totals = dict(self._totals)
+        return {
+            name: {
+                "count": len(values),
+                "total": totals.get(name, len(values)),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "max": values[-1],
+            }
+            for name, values in windows.items()
+            if values
+        }
+
+    def sample_count(self) -> int:
+        return len(self._samples)
+
+    def samples(self, since: float = 0.0) -> List[tuple]:
+        """
+        Muestras de la sesión (hora ``time.time()``, interacción, latencia en
+        ms) registradas desde ``since``.
+        """
+        with self._lock:
+            return [sample for sample in self._samples if sample[0] >= since]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._open.clear()
+            self._windows.clear()
+            self._totals.clear()
+            self._samples.clear()
+
+    def default_path(self) -> str:
+        from config.paths import BASE_PATH
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(BASE_PATH, "traces", f"latency-{stamp}.csv")
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """
+        Guarda todas las muestras de la sesión (hora UTC, interacción,
+        latencia en ms) y devuelve la ruta.
+        """
+        path = path or self.path or self.default_path()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        samples = self.samples()
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["timestamp_utc", "interaction", "latency_ms"])
+            for timestamp, interaction, elapsed_ms in samples:
+                when = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                writer.writerow(
+                    [
+                        when.isoformat(timespec="milliseconds"),
+                        interaction,
+                        f"{elapsed_ms:.3f}",
+                    ]
+                )
+        return path
+
+    def save_on_exit(self) -> Optional[str]:
+        """
+        Si la medición se activó con una ruta, guarda allí las muestras.
+        """
+        if not self.path or not self._samples:
+            return None
+        path = self.export_csv(self.path)
+        print(f"Latencias guardadas en {path}")
+        return path
+
+
+# Instancia global
+latency_monitor = LatencyMonitor()
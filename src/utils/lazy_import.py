@@ -0,0 +1,70 @@
+"""
+Carga diferida de módulos pesados.
+
+Los importadores y exportadores (PDF, Excel, CSV, ADIF) dependen de
+librerías grandes (pdfplumber/pdfminer, openpyxl, reportlab) que la mayoría de
+las sesiones no usa, igual que ``markdown`` (solo para el manual).
+``lazy_module`` devuelve un proxy que importa el módulo real recién al acceder
+al primero de sus atributos (p. ej. al elegir la acción del menú), en lugar de
+hacerlo al arrancar la aplicación.
+
+Como el nombre del módulo es un texto, PyInstaller no lo detecta al analizar
+los imports: cada módulo diferido debe figurar en ``LAZY_MODULES`` y en los
+``hiddenimports`` de los .spec.
+"""
+
+import importlib
+from types import ModuleType
+
+# Módulos que la UI carga en diferido (deben estar en hiddenimports de los .spec)
+LAZY_MODULES = (
+    "application.use_cases.export_log",
+    "application.use_cases.import_adif",
+    "application.use_cases.update_operators_from_csv",
+    "application.use_cases.update_operators_from_excel",
+    "application.use_cases.update_operators_from_pdf",
+    "markdown",
+)
+
+
+class LazyModule:
+    """
+    Proxy de un módulo que se importa al acceder a su primer atributo.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            # import_module es seguro entre hilos y reutiliza sys.modules
+            module = importlib.import_module(self._name)
+            self.__dict__["_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        # Permite reemplazar atributos del módulo real (p. ej. en tests)
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "cargado" if self.is_loaded else "diferido"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """
+    Devuelve un proxy de ``name`` que lo importa en el primer uso.
+    """
+    return LazyModule(name)
@@ -0,0 +1,295 @@
+"""
+Diagnóstico de memoria para sesiones largas.
+
+``MemoryProfiler`` toma instantáneas de:
+
+- la memoria de Python asignada desde cada módulo (``tracemalloc``),
+- los objetos Qt vivos por clase (recorriendo los widgets de la aplicación
+  y sus hijos),
+- los objetos de Python por tipo (``gc``),
+- las referencias a ``None``: si una extensión C descuenta referencias que
+  no tomó (p. ej. PySide6 6.12.0 en Python < 3.12) el contador baja en cada
+  llamada hasta que el intérprete aborta con "deallocating None".
+
+``memory_growth`` compara las instantáneas tomadas a lo largo de una sesión
+(por ejemplo cada N QSOs) y marca lo que crece en forma sostenida. Lo usan
+``scripts/memory_diagnostics.py`` y el test de resistencia.
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+# Crecimiento por cada 1000 QSOs a partir del cual se marca una entrada
+DEFAULT_LIMITS = {
+    "module": 256 * 1024,  # bytes
+    "qt": 1,  # objetos
+    "python": 100,  # objetos
+    "none_refs": 1,  # referencias perdidas
+}
+# Proporción mínima de intervalos con crecimiento para considerarlo sostenido
+STEADY_RATIO = 0.75
+
+_module_names: Dict[str, str] = {}
+
+
+def module_name(filename: str) -> str:
+    """
+    Nombre de módulo (``interface_adapters.ui.views.log_ops_view``,
+    ``json.decoder``) para un archivo de código según ``sys.path``.
+    """
+    name = _module_names.get(filename)
+    if name is not None:
+        return name
+    path = os.path.abspath(filename)
+    base = ""
+    for entry in sys.path:
+        entry = os.path.abspath(entry or os.curdir)
+        if path.startswith(entry + os.sep) and len(entry) > len(base):
+            base = entry
+    if base:
+        relative = os.path.splitext(os.path.relpath(path, base))[0]
+        name = relative.replace(os.sep, ".")
+        if name.endswith(".__init__"):
+            name = name[: -len(".__init__")]
+    else:
+        name = filename
+    _module_names[filename] = name
+    return name
+
+
+def count_qt_objects(app=None) -> Dict[str, int]:
+    """
+    Cantidad de ``QObject`` vivos por clase, desde la aplicación y cada
+    ventana de nivel superior (widgets, modelos, timers, layouts...).
+    """
+    from PySide6.QtCore import QObject
+    from PySide6.QtWidgets import QApplication
+
+    app = app or QApplication.instance()
+    if app is None:
+        return {}
+    objects = {}
+    for root in [app] + list(app.topLevelWidgets()):
+        for obj in [root] + root.findChildren(QObject):
+            objects[id(obj)] = obj
+    return dict(Counter(obj.metaObject().className() for obj in objects.values()))
+
+
+def count_python_objects(exclude: Optional[str] = None) -> Dict[str, int]:
+    """
+    Cantidad de objetos seguidos por el recolector, por tipo (``módulo.Clase``),
+    sin los tipos del módulo ``exclude``.
+    """
+    counts = Counter()
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if cls.__module__ != exclude:
+            counts[f"{cls.__module__}.{cls.__qualname__}"] += 1
+    return dict(counts)
+
+
+def none_refcount() -> Optional[int]:
+    """
+    Referencias a ``None``; en Python 3.12+ ``None`` es inmortal y no aplica.
+    """
+    if sys.version_info >= (3, 12):
+        return None
+    return sys.getrefcount(None)
+
+
+def detect_none_leak(calls: int = 200) -> float:
+    """
+    Referencias a ``None`` que pierde cada llamada a un método de Qt sin
+    valor de retorno (0 si no hay pérdida o en Python 3.12+).
+    """
+    if none_refcount() is None:
+        return 0.0
+    from PySide6.QtCore import QObject
+
+    obj = QObject()
+    obj.setObjectName("probe")
+    before = sys.getrefcount(None)
+    for _ in range(calls):
+        obj.setObjectName("probe")
+    return max(before - sys.getrefcount(None), 0) / calls
+
+
+def rss_bytes() -> Optional[int]:
+    """
+    Memoria residente del proceso (solo donde existe ``/proc``).
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+@dataclass
+class MemorySnapshot:
+    label: str
+    qsos: int
+    elapsed: float
+    traced_bytes: int
+    rss_bytes: Optional[int]
+    none_refs: Optional[int]
+    modules: Dict[str, int] = field(default_factory=dict)
+    qt_objects: Dict[str, int] = field(default_factory=dict)
+    python_objects: Dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class GrowthEntry:
+    kind: str  # module, qt, python o none_refs
+    name: str
+    start: int
+    end: int
+    per_1000_qsos: float
+    steady: bool
+    flagged: bool
+
+
+class MemoryProfiler:
+    """
+    Toma instantáneas numeradas por QSOs cargados. ``start`` activa
+    ``tracemalloc`` (si no estaba activo) con ``frames`` marcos por asignación.
+    """
+
+    def __init__(self, frames: int = 1, qt: bool = True):
+        self.frames = frames
+        self.qt = qt
+        self.snapshots: List[MemorySnapshot] = []
+        self._started_tracing = False
+        self._origin = time.perf_counter()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._origin = time.perf_counter()
+        return self
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def snapshot(self, label: str, qsos: int = 0) -> MemorySnapshot:
+        """
+        Recolecta basura (y los borrados diferidos de Qt) y registra el estado.
+        """
+        if self.qt:
+            _process_deferred_deletes()
+        gc.collect()
+        modules = Counter()
+        if tracemalloc.is_tracing():
+            traces = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    # Las propias instantáneas no cuentan
+                    tracemalloc.Filter(False, __file__),
+                ]
+            )
+            for stat in traces.statistics("filename"):
+                modules[module_name(stat.traceback[0].filename)] += stat.size
+        snapshot = MemorySnapshot(
+            label=label,
+            qsos=qsos,
+            elapsed=time.perf_counter() - self._origin,
+            traced_bytes=sum(modules.values()),
+            rss_bytes=rss_bytes(),
+            none_refs=none_refcount(),
+            modules=dict(modules),
+            qt_objects=count_qt_objects() if self.qt else {},
+            python_objects=count_python_objects(exclude=__name__),
+        )
+        self.snapshots.append(snapshot)
+        return snapshot
+
+
+def _process_deferred_deletes():
+    from PySide6.QtCore import QCoreApplication, QEvent
+
+    if QCoreApplication.instance() is not None:
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _is_steady(values: List[int], sign: int = 1) -> bool:
+    steps = [b - a for a, b in zip(values, values[1:])]
+    if not steps:
+        return False
+    growing = sum(1 for step in steps if step * sign > 0)
+    return growing / len(steps) >= STEADY_RATIO
+
+
+def memory_growth(
+    snapshots: List[MemorySnapshot],
+    skip: int = 1,
+    limits: Optional[Dict[str, float]] = None,
+) -> List[GrowthEntry]:
+    """
+    Crecimiento de cada módulo, clase Qt y tipo de Python entre la instantánea
+    ``skip`` (las anteriores se consideran calentamiento: cachés, primeras
+    consultas) y la última, ordenado de mayor a menor por cada 1000 QSOs.
+    Se marca lo que crece en forma sostenida por encima de ``limits``.
+    """
+    limits = dict(DEFAULT_LIMITS, **(limits or {}))
+    window = snapshots[skip:] if len(snapshots) - skip >= 2 else snapshots
+    if len(window) < 2:
+        return []
+    qsos = window[-1].qsos - window[0].qsos
+    scale = 1000 / qsos if qsos > 0 else 0.0
+    entries = []
+    for kind, attr in (
+        ("module", "modules"),
+        ("qt", "qt_objects"),
+        ("python", "python_objects"),
+    ):
+        names = set()
+        for snapshot in window:
+            names.update(getattr(snapshot, attr))
+        for name in names:
+            values = [getattr(s, attr).get(name, 0) for s in window]
+            growth = (values[-1] - values[0]) * scale
+            if growth <= 0:
+                continue
+            steady = _is_steady(values)
+            entries.append(
+                GrowthEntry(
+                    kind,
+                    name,
+                    values[0],
+                    values[-1],
+                    growth,
+                    steady,
+                    steady and growth >= limits[kind],
+                )
+            )
+    refs = [s.none_refs for s in window]
+    if None not in refs:
+        # Las referencias a None bajan: se informa la pérdida como crecimiento
+        lost = (refs[0] - refs[-1]) * scale
+        if lost > 0:
+            steady = _is_steady(refs, sign=-1)
+            entries.append(
+                GrowthEntry(
+                    "none_refs",
+                    "None",
+                    refs[0],
+                    refs[-1],
+                    lost,
+                    steady,
+                    steady and lost >= limits["none_refs"],
+                )
+            )
+    entries.sort(key=lambda e: e.per_1000_qsos, reverse=True)
+    return entries
@@ -0,0 +1,50 @@
+"""
+Utilidades para ejecutar trabajo en paralelo de forma portable.
+
+El build legacy (Win7 x86) excluye ``multiprocessing`` del ejecutable, por lo
+que los pools de procesos deben degradarse a hilos cuando no están disponibles.
+
+Los pools de procesos son para los scripts de línea de comandos y para trabajo
+de CPU cuya cadena de imports no carga Qt (exportación en lote): el resto del
+trabajo dentro de la aplicación (hilos de Qt, escritor de contactos) usa pools
+de hilos.
+"""
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+
+
+def default_worker_count(max_workers: Optional[int] = None) -> int:
+    """
+    Cantidad de workers a usar: la indicada o CPUs disponibles (máx. 8).
+    """
+    if max_workers is not None:
+        return max(1, int(max_workers))
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def create_executor(
+    max_workers: Optional[int] = None, prefer_processes: bool = True
+) -> Executor:
+    """
+    Crea un pool de procesos si es posible; si ``multiprocessing`` no está
+    disponible (build legacy) o falla su inicialización, usa un pool de hilos.
+    Las funciones enviadas al pool deben ser de nivel de módulo (picklables).
+
+    Los procesos se inician siempre con ``spawn``: con ``fork`` (el default en
+    Linux) el hijo heredaría los locks tomados por otros hilos y los handlers
+    de ``atexit`` del proceso padre.
+    """
+    workers = default_worker_count(max_workers)
+    if prefer_processes and workers > 1:
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            return ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (ImportError, NotImplementedError, OSError, ValueError):
+            pass
+    return ThreadPoolExecutor(max_workers=workers)
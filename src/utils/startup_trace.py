@@ -0,0 +1,221 @@
+"""
+Trazado opcional del arranque de la aplicación.
+
+Se activa con la variable de entorno ``LOGGEROA_STARTUP_TRACE`` (ruta del
+archivo, o ``1`` para la ruta por defecto) o con ``--trace-startup[=RUTA]``
+al lanzar ``main.py``. Cada fase con nombre (imports, arranque de Qt,
+fuentes, mantenimiento de la base, temas, traducciones, constructores de
+vistas, primer pintado) se registra con su inicio y duración y, tras el
+primer pintado, se guarda como traza de Chrome (JSON ``traceEvents``), que
+se abre en ``chrome://tracing`` o https://ui.perfetto.dev y se compara con
+``scripts/compare_startup_traces.py``.
+
+Sin trazado activo, ``phase`` devuelve un contexto vacío compartido: el
+costo en el arranque normal es una comparación por fase.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+STARTUP_TRACE_ENV = "LOGGEROA_STARTUP_TRACE"
+STARTUP_TRACE_FLAG = "--trace-startup"
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+class StartupTracer:
+    """
+    Registra fases del arranque como eventos completos (``ph: "X"``) de una
+    traza de Chrome, con tiempos en microsegundos desde ``origin``.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.path = None
+        self.events = []
+        self._written = False
+
+    def configure(self, argv: Optional[List[str]] = None, environ=None) -> bool:
+        """
+        Activa el trazado según ``--trace-startup[=RUTA]`` en ``argv`` (que se
+        quita de la lista, para que Qt no lo vea) o ``LOGGEROA_STARTUP_TRACE``.
+        """
+        environ = os.environ if environ is None else environ
+        path = environ.get(STARTUP_TRACE_ENV) or None
+        if argv is not None:
+            for arg in list(argv[1:]):
+                if arg == STARTUP_TRACE_FLAG or arg.startswith(
+                    STARTUP_TRACE_FLAG + "="
+                ):
+                    argv.remove(arg)
+                    path = arg.partition("=")[2] or path or "1"
+        if path:
+            self.enabled = True
+            self.path = None if path == "1" else path
+        return self.enabled
+
+    def now_us(self) -> float:
+        """
+        Microsegundos desde ``origin`` (la importación de este módulo).
+        """
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def phase(self, name: str, **args):
+        """
+        Contexto que registra la duración de la fase ``name``.
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._phase(name, args)
+
+    @contextlib.contextmanager
+    def _phase(self, name, args):
+        start = self.now_us()
+        try:
+            yield
+        finally:
+            self.add_event(name, start, self.now_us() - start, args)
+
+    def add_event(self, name: str, start_us: float, duration_us: float, args=None):
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": "startup",
+            "ph": "X",
+            "ts": round(start_us, 1),
+            "dur": round(duration_us, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def mark(self, name: str):
+        """
+        Registra un instante (``ph: "i"``), p. ej. la ventana visible.
+        """
+        if not self.enabled:
+            return
+        self.events.append(
+            {
+                "name": name,
+                "cat": "startup",
+                "ph": "i",
+                "s": "p",
+                "ts": round(self.now_us(), 1),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def default_path(self) -> str:
+        from config.paths import BASE_PATH
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(BASE_PATH, "traces", f"startup-{stamp}.json")
+
+    def write(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Guarda la traza (una sola vez) y devuelve la ruta, o None si el
+        trazado no está activo.
+        """
+        if not self.enabled or self._written:
+            return None
+        path = path or self.path or self.default_path()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        trace = {
+            "traceEvents": sorted(self.events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"app": "Logger OA", "kind": "startup"},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, indent=1)
+        self._written = True
+        print(f"Traza de arranque guardada en {path}")
+        return path
+
+
+# Instancia global: se crea al importar, lo antes posible en main.py
+startup_tracer = StartupTracer()
+
+
+def trace_phase(name: str, **args):
+    """
+    Atajo de ``startup_tracer.phase``.
+    """
+    return startup_tracer.phase(name, **args)
+
+
+def watch_first_paint(widget, callback: Optional[Callable[[], None]] = None):
+    """
+    Registra la fase ``first_paint`` (desde ahora hasta terminar el primer
+    pintado de ``widget``), guarda la traza y luego llama a ``callback``. Si
+    la aplicación se cierra antes, la traza se guarda al salir.
+    """
+    from PySide6.QtCore import QCoreApplication, QEvent, QObject, QTimer
+
+    start = startup_tracer.now_us()
+
+    def finish():
+        startup_tracer.add_event("first_paint", start, startup_tracer.now_us() - start)
+        startup_tracer.mark("startup_done")
+        startup_tracer.write()
+        if callback is not None:
+            callback()
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                obj.removeEventFilter(self)
+                # Al volver al ciclo de eventos, el pintado ya terminó
+                QTimer.singleShot(0, finish)
+            return False
+
+    widget.installEventFilter(_FirstPaintFilter(widget))
+    app = QCoreApplication.instance()
+    if app is not None and startup_tracer.enabled:
+        app.aboutToQuit.connect(startup_tracer.write)
+
+
+def load_trace_phases(path: str) -> "OrderedDict[str, float]":
+    """
+    Lee una traza y devuelve la duración total en ms de cada fase, en orden
+    de inicio. Los instantes (``ph: "i"``) se devuelven como su tiempo desde
+    el inicio.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    events = data.get("traceEvents", data) if isinstance(data, dict) else data
+    phases = OrderedDict()
+    for event in sorted(events, key=lambda e: e.get("ts", 0)):
+        name = event.get("name")
+        if event.get("ph") == "X":
+            phases[name] = phases.get(name, 0.0) + event.get("dur", 0) / 1000
+        elif event.get("ph") == "i":
+            phases[name] = event.get("ts", 0) / 1000
+    return phases
+
+
+def compare_traces(before: str, after: str) -> list:
+    """
+    Compara dos trazas: devuelve (fase, ms antes, ms después, diferencia)
+    por fase, en el orden de la primera traza (las fases nuevas al final).
+    """
+    a = load_trace_phases(before)
+    b = load_trace_phases(after)
+    rows = []
+    for name in list(a) + [n for n in b if n not in a]:
+        ms_a = a.get(name)
+        ms_b = b.get(name)
+        diff = None if ms_a is None or ms_b is None else ms_b - ms_a
+        rows.append((name, ms_a, ms_b, diff))
+    return rows
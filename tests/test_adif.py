@@ -0,0 +1,111 @@
+import json
+import sqlite3
+import time
+
+from application.use_cases.export_engine import AdifExportWriter, run_export
+from application.use_cases.import_adif import import_adif_file
+from infrastructure.adif.adif_reader import AdifReader
+from infrastructure.adif.adif_writer import AdifWriter, format_adif_field
+
+
+def _create_log(db_path, log_type, contacts=()):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            ("log-1", log_type, "OA4T", 1_700_000_000, 0, "{}"),
+        )
+        conn.executemany(
+            "INSERT INTO contacts VALUES (?, ?, ?)",
+            [(f"c-{i}", "log-1", json.dumps(c)) for i, c in enumerate(contacts)],
+        )
+        conn.commit()
+
+
+def _read_contacts(db_path):
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT data FROM contacts ORDER BY rowid").fetchall()
+    return [json.loads(r[0]) for r in rows]
+
+
+def test_adif_contest_round_trip(tmp_path):
+    contacts = [
+        {
+            "callsign": f"OA4A{i}",
+            "timestamp": 1_700_000_000 + i * 61,
+            "name": "Ñandú",
+            "rs_rx": "59",
+            "rs_tx": "57",
+            "exchange_received": str(i + 1),
+            "exchange_sent": "14",
+        }
+        for i in range(50)
+    ]
+    source = str(tmp_path / "source.sqlite")
+    _create_log(source, "contest_log", contacts)
+    adi_path = str(tmp_path / "source.adi")
+    run_export(source, AdifExportWriter(adi_path))
+
+    reader = AdifReader(adi_path, chunk_size=64)
+    records = list(reader)
+    assert reader.header["STATION_CALLSIGN"] == "OA4T"
+    assert len(records) == 50
+
+    target = str(tmp_path / "target.sqlite")
+    _create_log(target, "contest_log")
+    catalog = str(tmp_path / "catalog.sqlite")
+    summary = import_adif_file(adi_path, db_path=target, catalog_path=catalog)
+    assert summary["imported"] == 50
+    assert summary["invalid"] == 0
+
+    keys = ("callsign", "timestamp", "rs_rx", "rs_tx")
+    keys += ("exchange_received", "exchange_sent")
+    imported = _read_contacts(target)
+    assert [{k: c[k] for k in keys} for c in imported] == [
+        {k: c[k] for k in keys} for c in contacts
+    ]
+    assert all(c["id"] and c["block"] in (1, 2) for c in imported)
+
+    # Reimportar el mismo archivo no duplica contactos
+    again = import_adif_file(adi_path, db_path=target, catalog_path=catalog)
+    assert again["imported"] == 0
+    assert again["duplicates"] == 50
+
+
+def test_adif_import_100k_records(tmp_path):
+    total = 100_000
+    adi_path = str(tmp_path / "big.adi")
+    with AdifWriter(adi_path) as writer:
+        writer.write_header((("ADIF_VER", "3.1.6"),), "Log de prueba\n")
+        writer.write_records(
+            format_adif_field("call", f"OA{i % 10}X{i:06d}")
+            + format_adif_field("QSO_DATE", "20240101")
+            + format_adif_field("TIME_ON", f"{(i // 60) % 24:02d}{i % 60:02d}")
+            + format_adif_field("RST_SENT", "59")
+            + format_adif_field("TX_PWR", "100.0")
+            for i in range(total)
+        )
+    db_path = str(tmp_path / "ops.sqlite")
+    _create_log(db_path, "operation_log")
+
+    started = time.perf_counter()
+    summary = import_adif_file(
+        adi_path, db_path=db_path, catalog_path=str(tmp_path / "catalog.sqlite")
+    )
+    elapsed = time.perf_counter() - started
+
+    assert summary["records"] == summary["imported"] == total
+    assert elapsed < 60, f"Importación ADIF demasiado lenta: {elapsed:.1f} s"
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0] == total
+        data = json.loads(conn.execute("SELECT data FROM contacts").fetchone()[0])
+    assert data["callsign"] == "OA0X000000"
+    assert data["power"] == "100"
+    assert data["rs_tx"] == "59"
+    assert data["country"] == "PER"
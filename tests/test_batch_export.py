@@ -0,0 +1,101 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+from application.use_cases.batch_export import (
+    export_logs_batch,
+    format_batch_export_report,
+)
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Lo que importa un proceso del pool para exportar (sin sitecustomize)
+_WORKER_SCRIPT = """
+import json, sys
+sys.path.insert(0, sys.argv[1])
+from application.use_cases.batch_export import _export_worker
+result = _export_worker((sys.argv[2], "txt", sys.argv[3], "en"))
+qt = sorted(m for m in sys.modules if m.startswith(("PySide", "qt_compat")))
+print(json.dumps({"error": result["error"], "qt": qt}))
+"""
+
+
+def _create_log(db_path, log_type, contacts=3):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            ("log-1", log_type, "OA4T", 1_700_000_000, 0, "{}"),
+        )
+        for i in range(contacts):
+            conn.execute(
+                "INSERT INTO contacts VALUES (?, ?, ?)",
+                (
+                    f"c-{i}",
+                    "log-1",
+                    json.dumps({"callsign": f"OA4A{i}", "timestamp": 1_700_000_000}),
+                ),
+            )
+        conn.commit()
+
+
+def test_batch_export_runs_every_log_and_format_in_parallel(tmp_path):
+    logs = []
+    for n in range(3):
+        path = str(tmp_path / f"ops_{n}.sqlite")
+        _create_log(path, "operation_log")
+        logs.append(path)
+    broken = str(tmp_path / "broken.sqlite")
+    open(broken, "wb").write(b"not sqlite")
+    logs.append(broken)
+    export_dir = str(tmp_path / "export")
+
+    seen = []
+    summary = export_logs_batch(
+        logs,
+        ["pdf", "txt", "adi"],
+        export_dir=export_dir,
+        max_workers=2,
+        progress_callback=seen.append,
+    )
+
+    assert summary["jobs"] == len(seen) == 12
+    assert summary["exported"] == 6
+    # PDF solo aplica a concursos: se omite en operativos
+    assert summary["skipped"] == 3
+    assert summary["failed"] == 3
+    assert sorted(os.listdir(export_dir)) == sorted(
+        f"ops_{n}.{ext}" for n in range(3) for ext in ("txt", "adi")
+    )
+    report = format_batch_export_report(summary)
+    assert "Fallidos: 3" in report
+    assert "OMITIDO" in report
+
+
+def test_export_worker_does_not_import_qt(tmp_path):
+    db_path = str(tmp_path / "ops.sqlite")
+    _create_log(db_path, "operation_log")
+    export_path = str(tmp_path / "ops.txt")
+    env = dict(os.environ, HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+    env.pop("PYTHONPATH", None)
+    output = subprocess.run(
+        [sys.executable, "-c", _WORKER_SCRIPT, SRC, db_path, export_path],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert output.returncode == 0, output.stderr[-2000:]
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert result == {"error": None, "qt": []}
+    assert "OA4A0" in open(export_path, encoding="utf-8").read()
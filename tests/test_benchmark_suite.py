@@ -0,0 +1,70 @@
+import itertools
+import json
+
+from benchmarks import generators
+from benchmarks.compare_results import main as compare_main
+from benchmarks.harness import Benchmark, build_results, compare_results
+
+
+def test_generators_are_deterministic():
+    first = list(generators.generate_operators(50, seed=3))
+    assert first == list(generators.generate_operators(50, seed=3))
+    assert first != list(generators.generate_operators(50, seed=4))
+    # Indicativos únicos dentro de la base
+    assert len({row[0] for row in generators.generate_operators(5000)}) == 5000
+    contacts = list(generators.generate_contacts("contest_log", 20, seed=3))
+    assert contacts == list(generators.generate_contacts("contest_log", 20, seed=3))
+
+
+def test_generated_logs_open_in_every_format(tmp_path):
+    from application.use_cases.open_log import open_log
+
+    for log_type, file_format in itertools.product(
+        ("operation_log", "contest_log"), generators.LOG_FILE_FORMATS
+    ):
+        db_path = str(tmp_path / f"{log_type}-{file_format}.sqlite")
+        generators.create_log_file(db_path, log_type, 30, file_format)
+        log = open_log(db_path)
+        assert len(log.contacts) == 30
+        assert all(isinstance(c["timestamp"], int) for c in log.contacts)
+
+
+def test_generated_import_files_are_accepted_by_extractors(tmp_path):
+    from infrastructure.csv.csv_extractor import extract_operators_from_csv
+    from infrastructure.excel.excel_extractor import extract_operators_from_excel
+    from infrastructure.pdf.pdf_extractor import extract_operators_from_pdf
+
+    csv_path = str(tmp_path / "operadores.csv")
+    generators.write_operators_csv(csv_path, 40)
+    assert len(extract_operators_from_csv(csv_path)) == 40
+    xlsx_path = str(tmp_path / "operadores_03-15-2026.xlsx")
+    generators.write_operators_xlsx(xlsx_path, 40)
+    assert len(extract_operators_from_excel(xlsx_path)) == 40
+    pdf_path = str(tmp_path / "operadores.pdf")
+    generators.write_operators_pdf(pdf_path, 40)
+    assert len(extract_operators_from_pdf(pdf_path)) == 40
+
+
+def test_benchmark_results_compare_between_runs(tmp_path, capsys):
+    bench = Benchmark("group::test_sum", "group", rounds=3)
+    assert bench.pedantic(sum, args=([1, 2],), iterations=10) == 3
+    assert bench.stats["rounds"] == 3
+    assert bench.stats["min"] <= bench.stats["median"] <= bench.stats["max"]
+
+    before = build_results([bench], "small", str(tmp_path))
+    after = json.loads(json.dumps(before))
+    after["benchmarks"][0]["stats"]["median"] *= 2
+    paths = []
+    for name, data in (("before", before), ("after", after)):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        paths.append(str(path))
+
+    rows = compare_results(
+        {b["name"]: b for b in before["benchmarks"]},
+        {b["name"]: b for b in after["benchmarks"]},
+    )
+    assert rows[0][0] == "group::test_sum" and abs(rows[0][3] - 2.0) < 1e-9
+    assert compare_main(paths) == 0
+    assert compare_main(paths + ["--fail"]) == 1
+    assert "!" in capsys.readouterr().out
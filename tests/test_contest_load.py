@@ -0,0 +1,85 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_contest_load import latency_stats
+
+SCRIPT = os.path.join(ROOT, "benchmarks", "bench_contest_load.py")
+
+
+def test_latency_stats_by_interaction():
+    samples = [(0.0, "add_contact", float(ms)) for ms in range(1, 101)]
+    samples.append((0.0, "edit_contact", 80.0))
+    stats = latency_stats(samples)
+    assert stats["add_contact"]["count"] == 100
+    assert (stats["add_contact"]["p50"], stats["add_contact"]["p99"]) == (50.0, 99.0)
+    assert stats["edit_contact"] == {
+        "count": 1,
+        "p50": 80.0,
+        "p95": 80.0,
+        "p99": 80.0,
+        "max": 80.0,
+    }
+
+
+def test_contest_session_queues_edits_and_deletes(tmp_path):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    python_path = [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    if importlib.util.find_spec("version") is None:
+        # src/version.py lo generan los scripts de build
+        (tmp_path / "version.py").write_text(
+            'APP_NAME = "Logger OA"\nAPP_VERSION = "0.0.0-dev"\n'
+        )
+        python_path.append(str(tmp_path))
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    report = tmp_path / "load.json"
+    output = subprocess.run(
+        [
+            sys.executable,
+            SCRIPT,
+            "--qsos",
+            "10",
+            "--rate",
+            "0",
+            "--key-interval",
+            "0",
+            "--queue-ratio",
+            "1",
+            "--edit-ratio",
+            "1",
+            "--delete-ratio",
+            "0.3",
+            "--operators",
+            "500",
+            "--report-every",
+            "0",
+            "--json",
+            str(report),
+        ],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    if output.returncode == 2:
+        pytest.skip(output.stdout.strip())
+    assert output.returncode == 0, (output.stdout + output.stderr)[-3000:]
+    result = json.loads(report.read_text(encoding="utf-8"))
+
+    assert result["added"] == 10 and result["queued"] == 10
+    assert result["edited"] == 10 and result["deleted"] >= 1
+    assert not result["dialogs"]
+    [interval] = result["intervals"]
+    assert interval["contacts"] == result["added"] - result["deleted"]
+    assert interval["qt_objects"] > 0
+    for interaction in ("add_contact", "duplicate_alert", "edit_contact"):
+        assert result["latency"][interaction]["count"] >= 1
@@ -0,0 +1,350 @@
+import json
+import os
+import sqlite3
+import tracemalloc
+
+import pdfplumber
+import pytest
+
+from application.use_cases import export_engine
+from application.use_cases.export_engine import (
+    AdifExportWriter,
+    CabrilloExportWriter,
+    CsvExportWriter,
+    ExportWriter,
+    PdfExportWriter,
+    TxtExportWriter,
+    build_table_formatters,
+    run_export,
+)
+from application.use_cases.export_log import (
+    build_log_simple_text,
+    export_log_to_simple_text,
+    iter_log_simple_text,
+)
+from domain.entities.operation import OperationLog
+from infrastructure.db import log_catalog
+
+
+class _CountingTranslations:
+    def __init__(self):
+        self.calls = 0
+
+    def get_language(self):
+        return "es"
+
+    def tr(self, key):
+        self.calls += 1
+        return key.upper()
+
+
+def _create_log(db_path, log_type, contacts):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                "log-1",
+                log_type,
+                "OA4T",
+                1_700_000_000,
+                0,
+                json.dumps({"frequency_band": "band_vhf", "mode_key": "mode_fm"}),
+            ),
+        )
+        for i in range(contacts):
+            conn.execute(
+                "INSERT INTO contacts VALUES (?, ?, ?)",
+                (
+                    f"c-{i:04d}",
+                    "log-1",
+                    json.dumps(
+                        {
+                            "callsign": f"OA4A{i}",
+                            "station": "station_base",
+                            "country": "PER",
+                            "power": "50",
+                            "rs_rx": "59",
+                            "rs_tx": "59",
+                            "exchange_sent": str(i + 1),
+                            "timestamp": 1_700_000_000 + i * 60,
+                        }
+                    ),
+                ),
+            )
+        conn.commit()
+
+
+def test_streams_all_contacts_in_chunks_for_each_format(tmp_path):
+    db_path = str(tmp_path / "ops.sqlite")
+    _create_log(db_path, "operation_log", 25)
+    translations = _CountingTranslations()
+
+    txt = run_export(
+        db_path, TxtExportWriter(str(tmp_path / "a.txt"), translations), chunk_size=4
+    )
+    lines = open(txt, encoding="utf-8").read().splitlines()
+    assert len(lines) == 26
+    assert lines[1].split("\t")[0] == "OA4A0"
+    assert lines[-1].split("\t")[0] == "OA4A24"
+    # 12 cabeceras + una traducción por valor distinto de estación/energía
+    assert translations.calls == 12 + 2
+
+    csv_path = run_export(
+        db_path, CsvExportWriter(str(tmp_path / "a.csv"), translations), chunk_size=7
+    )
+    assert len(open(csv_path, encoding="utf-8").read().splitlines()) == 26
+
+    adi = run_export(db_path, AdifExportWriter(str(tmp_path / "a.adi")), chunk_size=3)
+    content = open(adi, encoding="utf-8").read()
+    assert content.count("<EOR>") == 25
+    assert "<BAND:2>2M <MODE:2>FM <OPERATOR:4>OA4T " in content
+
+
+def test_contest_formatters_and_rejected_exports(tmp_path):
+    formatters = build_table_formatters(
+        "contest_log", ["exchange_sent", "qtr_oa"], _CountingTranslations()
+    )
+    contact = {"exchange_sent": "7", "timestamp": 1_700_000_000}
+    assert [f(contact) for f in formatters] == ["007", "17:13"]
+
+    empty = str(tmp_path / "empty.sqlite")
+    _create_log(empty, "operation_log", 0)
+    with pytest.raises(ValueError):
+        run_export(empty, TxtExportWriter(str(tmp_path / "e.txt")))
+    assert not os.path.exists(tmp_path / "e.txt")
+
+    unknown = str(tmp_path / "unknown.sqlite")
+    _create_log(unknown, "unknown_log", 2)
+    with pytest.raises(ValueError, match="no soportado"):
+        run_export(unknown, CsvExportWriter(str(tmp_path / "u.csv")))
+
+
+def test_export_writer_without_write_contacts_cannot_be_created(tmp_path):
+    class HeaderOnlyWriter(ExportWriter):
+        def begin(self, header):
+            pass
+
+    with pytest.raises(TypeError, match="write_contacts"):
+        HeaderOnlyWriter(str(tmp_path / "a.txt"))
+
+
+def test_contest_pdf_is_drawn_in_page_sized_tables(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_engine, "get_radio_operator_by_callsign", lambda c: None)
+    db_path = str(tmp_path / "contest.sqlite")
+    _create_log(db_path, "contest_log", 100)
+
+    writer = PdfExportWriter(str(tmp_path / "a.pdf"))
+    pdf_path = run_export(db_path, writer, chunk_size=9)
+
+    per_page = [writer._first_page_rows, writer._page_rows_capacity]
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = [page.extract_text().splitlines() for page in pdf.pages]
+    assert len(pages) == 1 + -(-(100 - per_page[0]) // per_page[1])
+    # Cada página repite la fila de títulos y numera los QSOs en orden
+    assert all(any(line.startswith("Nº QTR") for line in p) for p in pages)
+    assert pages[0][-1].startswith(f"{per_page[0]} ")
+    assert pages[1][1].startswith(f"{per_page[0] + 1} ")
+    assert pages[-1][-1].startswith("100 ")
+
+
+def test_contest_pdf_keeps_multi_line_observations(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_engine, "get_radio_operator_by_callsign", lambda c: None)
+    db_path = str(tmp_path / "contest.sqlite")
+    _create_log(db_path, "contest_log", 100)
+    observations = {
+        "c-0001": "Primera línea\nSegunda línea\nTercera línea",
+        # Más alta que una página: se recorta con "…"
+        "c-0050": "\n".join(f"L{n}" for n in range(100)),
+    }
+    with sqlite3.connect(db_path) as conn:
+        for contact_id, obs in observations.items():
+            row = conn.execute(
+                "SELECT data FROM contacts WHERE id = ?", (contact_id,)
+            ).fetchone()
+            data = dict(json.loads(row[0]), obs=obs)
+            conn.execute(
+                "UPDATE contacts SET data = ? WHERE id = ?",
+                (json.dumps(data), contact_id),
+            )
+
+    pdf_path = run_export(db_path, PdfExportWriter(str(tmp_path / "a.pdf")))
+
+    with pdfplumber.open(pdf_path) as pdf:
+        lines = [
+            line for page in pdf.pages for line in page.extract_text().splitlines()
+        ]
+        # Las filas altas pasan a la página siguiente en lugar de desbordar
+        assert all(
+            0 <= char["top"] and char["bottom"] <= page.height
+            for page in pdf.pages
+            for char in page.chars
+        )
+    assert "Primera línea" in lines and "Segunda línea" in lines
+    assert any(line.endswith("Tercera línea") for line in lines)
+    assert "L0" in lines and "L99" not in lines
+    assert any(line.startswith("51 ") and line.endswith(" …") for line in lines)
+    numbers = [int(line.split()[0]) for line in lines if line.split()[0].isdigit()]
+    assert numbers == list(range(1, 101))
+
+
+def test_cabrillo_export_streams_large_contest_log(tmp_path, monkeypatch):
+    operator = ("OA4T", "José Núñez", "NOVICIO", "TITULAR", "LIMA")
+    monkeypatch.setattr(
+        export_engine, "get_radio_operator_by_callsign", lambda c: operator
+    )
+    total = 50_000
+    db_path = str(tmp_path / "contest.sqlite")
+    _create_log(db_path, "contest_log", 0)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE logs SET metadata = ?",
+            (json.dumps({"contest_name_key": "contest_world_radio_day"}),),
+        )
+        conn.executemany(
+            "INSERT INTO contacts VALUES (?, ?, ?)",
+            (
+                (
+                    f"c-{i:06d}",
+                    "log-1",
+                    json.dumps(
+                        {
+                            "callsign": f"OA{i % 10}X{i:05d}",
+                            "rs_rx": "59",
+                            "rs_tx": "57",
+                            "exchange_received": str(i % 900 + 1),
+                            "exchange_sent": str(i + 1),
+                            "timestamp": 1_700_000_000 + i * 7,
+                        }
+                    ),
+                )
+                for i in range(total)
+            ),
+        )
+        conn.commit()
+
+    tracemalloc.start()
+    path = run_export(db_path, CabrilloExportWriter(str(tmp_path / "a.cbr")))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with open(path, "rb") as f:
+        lines = f.read().decode("ascii").split("\r\n")
+    assert lines[0] == "START-OF-LOG: 3.0"
+    assert "CONTEST: WORLD-RADIO-DAY" in lines
+    assert "NAME: JOSE NUNEZ" in lines
+    assert lines[-2:] == ["END-OF-LOG:", ""]
+    qsos = [line for line in lines if line.startswith("QSO:")]
+    assert len(qsos) == total
+    assert qsos[0] == (
+        "QSO:  7100 PH 2023-11-14 2213 OA4T          57  001    "
+        "OA0X00000     59  001"
+    )
+    assert qsos[-1].split()[-4:] == ["50000", "OA9X49999", "59", "500"]
+    # Los contactos se escriben por bloques: la memoria no crece con el log
+    assert peak < 8 * 1024 * 1024
+
+
+def test_cabrillo_export_rejects_contacts_without_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_engine, "get_radio_operator_by_callsign", lambda c: None)
+    db_path = str(tmp_path / "contest.sqlite")
+    _create_log(db_path, "contest_log", 3)
+    with sqlite3.connect(db_path) as conn:
+        for contact_id, timestamp in (("c-no-time", None), ("c-bad-time", "x")):
+            data = {"callsign": f"OA4{contact_id[2:].upper()}", "rs_rx": "59"}
+            if timestamp is not None:
+                data["timestamp"] = timestamp
+            conn.execute(
+                "INSERT INTO contacts VALUES (?, ?, ?)",
+                (contact_id, "log-1", json.dumps(data)),
+            )
+        conn.commit()
+
+    export_path = tmp_path / "a.cbr"
+    with pytest.raises(ValueError) as error:
+        run_export(db_path, CabrilloExportWriter(str(export_path)))
+    # Sin líneas QSO: con fecha y hora vacías: no queda un archivo inválido
+    assert "OA4NO-TIME, OA4BAD-TIME" in str(error.value)
+    assert not export_path.exists()
+
+
+def test_export_reports_progress_without_blocking_new_contacts(tmp_path):
+    db_path = str(tmp_path / "ops.sqlite")
+    _create_log(db_path, "operation_log", 25)
+    progress = []
+
+    def on_progress(done, total):
+        progress.append((done, total))
+        if len(progress) == 1:
+            # Un contacto guardado a mitad de la exportación no espera al lector
+            with sqlite3.connect(db_path, timeout=0) as conn:
+                conn.execute(
+                    "INSERT INTO contacts VALUES (?, ?, ?)",
+                    ("c-new", "log-1", json.dumps({"callsign": "OA4NEW"})),
+                )
+
+    path = run_export(
+        db_path,
+        TxtExportWriter(str(tmp_path / "a.txt"), _CountingTranslations()),
+        chunk_size=10,
+        progress_callback=on_progress,
+    )
+    assert progress == [(10, 25), (20, 25), (26, 26)]
+    with open(path, encoding="utf-8") as f:
+        assert f.read().splitlines()[-1].startswith("OA4NEW\t")
+
+
+def test_simple_text_is_built_in_one_pass_from_the_in_memory_log(tmp_path, monkeypatch):
+    catalog = str(tmp_path / "catalog.db")
+    monkeypatch.setattr(log_catalog, "get_catalog_path", lambda: catalog)
+    db_path = str(tmp_path / "ops.sqlite")
+    _create_log(db_path, "operation_log", 12)
+    log = OperationLog(
+        operator="OA4T",
+        metadata={"frequency_band": "band_vhf", "mode_key": "mode_fm"},
+        db_path=db_path,
+    )
+    log.contacts = [{"callsign": f"OA4A{i}", "name": f"Nombre {i}"} for i in range(12)]
+    # El índice cubre los 12 QSOs del archivo, pero hay una edición en memoria
+    # aún no escrita: el ancho no puede salir del índice ni del catálogo
+    from application.use_cases import qso_index
+
+    qso_index.index_log_file(db_path)
+    log.contacts[0] = {"callsign": "OA4LONG", "name": "Nombre 0"}
+
+    catalog_opened = []
+    monkeypatch.setattr(
+        log_catalog, "connect_catalog", lambda *a: catalog_opened.append(a)
+    )
+    translations = _CountingTranslations()
+
+    text = build_log_simple_text(log, translation_service=translations)
+    lines = text.split("\n")
+    assert lines[:3] == [
+        "BAND_VHF MODE_FM",
+        "OPERATOR_LABEL: OA4T",
+        "Nº  LOG_OPERATIVE_TABLE_HEADER_CALLSIGN  LOG_OPERATIVE_TABLE_HEADER_NAME",
+    ]
+    # El ancho sale de los contactos en memoria, aunque el índice esté atrasado
+    assert lines[3] == " 1  OA4LONG  Nombre 0"
+    assert lines[-1] == "12  OA4A11   Nombre 11"
+    assert len(lines) == 15
+
+    blocks = list(
+        iter_log_simple_text(log, translation_service=translations, chunk_size=5)
+    )
+    assert len(blocks) == 1 + 3
+    assert "".join(blocks) == text
+
+    path = export_log_to_simple_text(
+        log, str(tmp_path / "simple.txt"), translation_service=translations
+    )
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == text
+    assert catalog_opened == []
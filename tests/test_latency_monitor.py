@@ -0,0 +1,155 @@
+import csv
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils.latency_monitor import LatencyMonitor, percentile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+
+
+@pytest.fixture
+def monitor():
+    monitor = LatencyMonitor()
+    monitor.set_enabled(True)
+    return monitor
+
+
+def test_disabled_monitor_records_nothing():
+    monitor = LatencyMonitor()
+    monitor.begin("add_contact")
+    assert monitor.started("add_contact") is None
+    assert monitor.end("add_contact") is None
+    assert monitor.stats() == {} and monitor.sample_count() == 0
+
+
+def test_begin_end_cancel_and_restart(monitor):
+    monitor.begin("add_contact")
+    first = monitor.started("add_contact")
+    # Enter ya abrió el intervalo: el manejador del botón no lo reinicia
+    monitor.begin("add_contact", restart=False)
+    assert monitor.started("add_contact") == first
+    assert monitor.end("add_contact") >= 0
+    assert monitor.end("add_contact") is None
+
+    monitor.begin("callsign_info")
+    stale = monitor.started("callsign_info")
+    monitor.begin("callsign_info")
+    # Un repintado pendiente de una tecla anterior no cierra el nuevo intervalo
+    assert monitor.end("callsign_info", "operator_summary", stale) is None
+    assert monitor.end("callsign_info", "operator_summary") is not None
+
+    monitor.begin("duplicate_alert")
+    monitor.cancel("duplicate_alert")
+    assert monitor.end("duplicate_alert") is None
+    assert set(monitor.stats()) == {"add_contact", "operator_summary"}
+
+
+def test_stats_use_rolling_window(monitor):
+    assert percentile([], 0.5) == 0.0
+    for value in range(1, 101):
+        monitor.record("suggestion_refresh", float(value))
+    stats = monitor.stats()["suggestion_refresh"]
+    assert (stats["p50"], stats["p95"], stats["max"]) == (50.0, 95.0, 100.0)
+
+    for _ in range(200):
+        monitor.record("suggestion_refresh", 1.0)
+    stats = monitor.stats()["suggestion_refresh"]
+    assert stats["count"] == 200 and stats["total"] == 300
+    assert stats["max"] == 1.0
+    assert monitor.sample_count() == 300
+    assert monitor.samples(since=time.time() + 60) == []
+    assert len(monitor.samples()) == 300
+
+
+def test_export_csv_and_configure(monitor, tmp_path):
+    monitor.record("add_contact", 12.5)
+    monitor.record("duplicate_alert", 3.25)
+    path = monitor.export_csv(str(tmp_path / "out" / "latency.csv"))
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp_utc", "interaction", "latency_ms"]
+    assert [r[1:] for r in rows[1:]] == [
+        ["add_contact", "12.500"],
+        ["duplicate_alert", "3.250"],
+    ]
+
+    argv = ["main.py", "--perf-overlay=latency.csv", "--lang"]
+    configured = LatencyMonitor()
+    assert configured.configure(argv, environ={}) is True
+    assert argv == ["main.py", "--lang"] and configured.path == "latency.csv"
+    from_env = LatencyMonitor()
+    assert from_env.configure([], environ={"LOGGEROA_PERF_OVERLAY": "1"})
+    assert from_env.path is None and from_env.save_on_exit() is None
+    assert LatencyMonitor().configure(["main.py"], environ={}) is False
+
+
+# Panel en la ventana real y cierre de intervalos tras el repintado
+_SCRIPT = """
+import json
+from PySide6.QtWidgets import QApplication, QLabel
+app = QApplication([])
+from interface_adapters.ui.main_window import MainWindow
+from interface_adapters.ui.perf_overlay import end_after_repaint
+from utils.latency_monitor import latency_monitor
+
+window = MainWindow()
+window.show()
+app.processEvents()
+overlay = window.perf_overlay
+result = {"hidden_at_startup": not overlay.label.isVisibleTo(window)}
+overlay.toggle()
+result["enabled"] = latency_monitor.enabled
+result["timer"] = overlay._timer.isActive()
+
+label = QLabel("OA4")
+label.show()
+app.processEvents()
+latency_monitor.begin("duplicate_alert")
+end_after_repaint("duplicate_alert", label)
+for _ in range(20):
+    app.processEvents()
+result["stats"] = sorted(latency_monitor.stats())
+overlay.refresh()
+result["text"] = overlay.label.text()
+overlay.toggle()
+result["disabled"] = not latency_monitor.enabled and not overlay._timer.isActive()
+print(json.dumps(result))
+"""
+
+
+def test_overlay_measures_until_repaint(tmp_path):
+    env = dict(os.environ)
+    env.update(HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+    env.pop("LOGGEROA_PERF_OVERLAY", None)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    python_path = [SRC]
+    if importlib.util.find_spec("version") is None:
+        # src/version.py lo generan los scripts de build
+        (tmp_path / "version.py").write_text(
+            'APP_NAME = "Logger OA"\nAPP_VERSION = "0.0.0-dev"\n'
+        )
+        python_path.append(str(tmp_path))
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert output.returncode == 0, output.stderr[-2000:]
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert result["hidden_at_startup"] is True
+    assert result["enabled"] is True and result["timer"] is True
+    assert result["stats"] == ["duplicate_alert"]
+    assert result["text"].endswith(" ms")
+    assert result["disabled"] is True
@@ -0,0 +1,82 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+
+# Abre y cierra un log operativo sobre la ventana principal real
+_SCRIPT = """
+import json
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+app = QApplication([])
+from interface_adapters.ui.main_window import MainWindow
+from interface_adapters.ui.main_window_actions import action_log_close
+from interface_adapters.ui.view_manager import ViewID
+from translation.translation_service import translation_service
+
+def receivers():
+    signal = translation_service.signal
+    return signal.receivers("2language_changed()")
+
+window = MainWindow()
+window.show()
+app.processEvents()
+result = {"built_at_startup": sorted(v.value for v in window.view_manager.views)}
+baseline = receivers()
+
+window.show_view(ViewID.LOG_OPS_VIEW)
+view = window.view_manager.views[ViewID.LOG_OPS_VIEW]
+clock_timer = view.oa_clock.timer
+result["same_view"] = window.log_ops_view is view
+result["connected"] = receivers() - baseline
+result["clock_active"] = clock_timer.isActive()
+destroyed = []
+view.destroyed.connect(lambda: destroyed.append(True))
+
+action_log_close(window)
+result["clock_active_after_close"] = clock_timer.isActive()
+QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+result["destroyed"] = bool(destroyed)
+result["connected_after_close"] = receivers() - baseline
+result["built_after_close"] = sorted(v.value for v in window.view_manager.views)
+result["rebuilt"] = window.log_ops_view is not None
+print(json.dumps(result))
+"""
+
+
+def test_log_views_are_built_on_demand_and_released_on_close(tmp_path):
+    env = dict(os.environ)
+    env.update(HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    python_path = [SRC]
+    if importlib.util.find_spec("version") is None:
+        # src/version.py lo generan los scripts de build
+        (tmp_path / "version.py").write_text(
+            'APP_NAME = "Logger OA"\nAPP_VERSION = "0.0.0-dev"\n'
+        )
+        python_path.append(str(tmp_path))
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert output.returncode == 0, output.stderr[-2000:]
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert result["built_at_startup"] == ["welcome_view"]
+    assert result["same_view"] is True
+    assert result["connected"] > 0 and result["clock_active"] is True
+    # Al cerrar el log: relojes detenidos, señales globales liberadas y vista destruida
+    assert result["clock_active_after_close"] is False
+    assert result["connected_after_close"] == 0
+    assert result["destroyed"] is True
+    assert result["built_after_close"] == ["welcome_view"]
+    assert result["rebuilt"] is True
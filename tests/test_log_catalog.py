@@ -0,0 +1,151 @@
+import json
+import os
+import sqlite3
+
+from application.use_cases.log_catalog import (
+    catalog_log_file,
+    find_logs,
+    refresh_log_catalog,
+)
+from interface_adapters.ui.view_manager import LogType
+
+
+def _create_log_db(db_path, log_type, operator, start_time, metadata, contacts=0):
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        cursor.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        log_id = os.path.basename(db_path)
+        cursor.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            (log_id, log_type, operator, start_time, 0, json.dumps(metadata)),
+        )
+        for i in range(contacts):
+            cursor.execute(
+                "INSERT INTO contacts VALUES (?, ?, ?)",
+                (f"{log_id}-{i}", log_id, json.dumps({"callsign": f"OA4T{i}"})),
+            )
+        conn.commit()
+
+
+def _setup_folders(tmp_path):
+    ops = tmp_path / "logs" / "operativos"
+    contests = tmp_path / "logs" / "concursos"
+    ops.mkdir(parents=True)
+    contests.mkdir(parents=True)
+    return str(ops), str(contests)
+
+
+def test_catalog_indexes_headers_and_filters(tmp_path):
+    ops, contests = _setup_folders(tmp_path)
+    catalog = str(tmp_path / "catalog.db")
+    _create_log_db(
+        os.path.join(ops, "a.sqlite"),
+        LogType.OPERATION_LOG.value,
+        "oa4aaa",
+        1_700_000_000,
+        {
+            "operation_type": "rener",
+            "frequency_band": "band_hf",
+            "mode_key": "mode_ssb",
+        },
+        contacts=3,
+    )
+    _create_log_db(
+        os.path.join(contests, "b.sqlite"),
+        LogType.CONTEST_LOG.value,
+        "OA4BBB",
+        1_710_000_000,
+        {"contest_name_key": "contest_world_radio_day"},
+        contacts=5,
+    )
+    (tmp_path / "logs" / "operativos" / "notes.txt").write_text("x")
+
+    summary = refresh_log_catalog([ops, contests], catalog)
+    assert summary == {"scanned": 2, "updated": 2, "removed": 0, "unchanged": 0}
+
+    entries = find_logs(folders=[ops, contests], catalog_path=catalog, refresh=False)
+    assert [e.operator for e in entries] == ["OA4BBB", "OA4AAA"]
+
+    ops_entry = find_logs(
+        operator="oa4aaa", folders=[ops], catalog_path=catalog, refresh=False
+    )[0]
+    assert ops_entry.contact_count == 3
+    assert ops_entry.band == "band_hf"
+    assert ops_entry.mode == "mode_ssb"
+
+    contest_entries = find_logs(
+        contest_key="contest_world_radio_day",
+        folders=[ops, contests],
+        catalog_path=catalog,
+        refresh=False,
+    )
+    assert [e.contact_count for e in contest_entries] == [5]
+
+    in_range = find_logs(
+        start_from=1_705_000_000,
+        folders=[ops, contests],
+        catalog_path=catalog,
+        refresh=False,
+    )
+    assert [os.path.basename(e.path) for e in in_range] == ["b.sqlite"]
+
+
+def test_catalog_refresh_is_incremental(tmp_path):
+    ops, _ = _setup_folders(tmp_path)
+    catalog = str(tmp_path / "catalog.db")
+    path_a = os.path.join(ops, "a.sqlite")
+    path_b = os.path.join(ops, "b.sqlite")
+    _create_log_db(path_a, LogType.OPERATION_LOG.value, "OA4A", 1, {}, contacts=1)
+    _create_log_db(path_b, LogType.OPERATION_LOG.value, "OA4B", 2, {}, contacts=1)
+    refresh_log_catalog([ops], catalog)
+
+    assert refresh_log_catalog([ops], catalog)["updated"] == 0
+
+    with sqlite3.connect(path_a) as conn:
+        conn.execute("INSERT INTO contacts VALUES ('extra', 'a.sqlite', '{}')")
+        conn.commit()
+    os.remove(path_b)
+
+    summary = refresh_log_catalog([ops], catalog)
+    assert summary == {"scanned": 1, "updated": 1, "removed": 1, "unchanged": 0}
+    entries = find_logs(folders=[ops], catalog_path=catalog, refresh=False)
+    assert [(e.operator, e.contact_count) for e in entries] == [("OA4A", 2)]
+
+
+def test_catalog_skips_invalid_files_and_single_file_update(tmp_path):
+    ops, _ = _setup_folders(tmp_path)
+    catalog = str(tmp_path / "catalog.db")
+    with open(os.path.join(ops, "broken.sqlite"), "wb") as f:
+        f.write(b"not a database")
+    path = os.path.join(ops, "ok.sqlite")
+    _create_log_db(path, LogType.OPERATION_LOG.value, "OA4OK", 1, {})
+
+    assert [e.operator for e in find_logs(folders=[ops], catalog_path=catalog)] == [
+        "OA4OK"
+    ]
+
+    entry = catalog_log_file(path, catalog)
+    assert entry is not None and entry.error is None
+    os.remove(path)
+    assert catalog_log_file(path, catalog) is None
+    assert find_logs(folders=[ops], catalog_path=catalog, refresh=False) == []
+
+
+def test_catalog_deleted_while_running_gets_its_schema_back(tmp_path):
+    ops, _ = _setup_folders(tmp_path)
+    catalog = str(tmp_path / "catalog.db")
+    _create_log_db(
+        os.path.join(ops, "a.sqlite"), LogType.OPERATION_LOG.value, "OA4AA", 1, {}
+    )
+    assert len(find_logs(folders=[ops], catalog_path=catalog)) == 1
+
+    os.remove(catalog)
+    assert [e.operator for e in find_logs(folders=[ops], catalog_path=catalog)] == [
+        "OA4AA"
+    ]
@@ -1,12 +1,14 @@
 import json
 import sqlite3
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+import pytest
 
 from application.use_cases.open_log import open_log
 from application.use_cases.log_file_format import CURRENT_LOG_FILE_FORMAT_VERSION
 from config.paths import format_timestamp_local
 from interface_adapters.ui.view_manager import LogType
-from utils.datetime import parse_utc_timestamp
+from utils.datetime import format_qtr, parse_utc_timestamp
 
 
 def _create_legacy_log_db(db_path, log_type=LogType.OPERATION_LOG.value):
@@ -115,4 +117,22 @@ def test_open_log_accepts_legacy_string_timestamps(tmp_path):
 
 
 def test_format_timestamp_local_accepts_legacy_string_timestamp():
-    assert format_timestamp_local("2025-09-19_21-15-02") == "2025-09-19_21-15-02"
\ No newline at end of file
+    assert format_timestamp_local("2025-09-19_21-15-02") == "2025-09-19_21-15-02"
+
+
+def test_format_qtr_matches_datetime_formatting():
+    for ts in (17_999, 1_700_000_000, 951_800_399, 951_800_400, 4_102_444_799):
+        qtr = format_qtr(ts)
+        dt_utc = datetime.fromtimestamp(ts, tz=timezone.utc)
+        dt_oa = dt_utc - timedelta(hours=5)
+        assert qtr.utc_time == dt_utc.strftime("%H:%M")
+        assert qtr.utc_date == dt_utc.strftime("%d/%m/%Y")
+        assert qtr.utc_iso_date == dt_utc.strftime("%Y-%m-%d")
+        assert qtr.oa_time == dt_oa.strftime("%H:%M")
+        assert qtr.oa_date == dt_oa.strftime("%d/%m/%Y")
+        assert qtr.date_rollover == (dt_oa.date() != dt_utc.date())
+    # Texto legacy en hora de Perú: mismo minuto que su epoch
+    assert format_qtr("2024-02-29 23:59:59") == format_qtr(1_709_269_199)
+    assert format_qtr("") is None
+    with pytest.raises(ValueError):
+        parse_utc_timestamp("2025-02-29_00-00-00")
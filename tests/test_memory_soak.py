@@ -0,0 +1,110 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.memory_profiler import MemorySnapshot, memory_growth
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SCRIPT = os.path.join(ROOT, "scripts", "memory_diagnostics.py")
+
+
+def _snapshot(qsos, traced, qt, none_refs=None):
+    return MemorySnapshot(
+        label=f"{qsos} QSOs",
+        qsos=qsos,
+        elapsed=0.0,
+        traced_bytes=traced,
+        rss_bytes=None,
+        none_refs=none_refs,
+        modules={"json.decoder": traced, "utils.datetime": 4096},
+        qt_objects=qt,
+        python_objects={"builtins.dict": qsos * 2},
+    )
+
+
+def test_memory_growth_flags_steady_growth_after_warmup():
+    snapshots = [
+        # Calentamiento: se crean las vistas y se llenan las cachés
+        _snapshot(0, 0, {"QLabel": 10}, none_refs=10_000),
+        _snapshot(100, 200_000, {"QLabel": 40, "QTimer": 3}, none_refs=9_900),
+        _snapshot(200, 500_000, {"QLabel": 40, "QTimer": 4}, none_refs=9_800),
+        _snapshot(300, 800_000, {"QLabel": 40, "QTimer": 5}, none_refs=9_700),
+    ]
+    entries = {(e.kind, e.name): e for e in memory_growth(snapshots)}
+
+    decoder = entries[("module", "json.decoder")]
+    assert decoder.start == 200_000 and decoder.end == 800_000
+    assert decoder.per_1000_qsos == 3_000_000 and decoder.flagged
+    # Las QLabel del calentamiento no cuentan; los timers crecen en cada intervalo
+    assert ("qt", "QLabel") not in entries
+    assert entries[("qt", "QTimer")].flagged
+    assert entries[("python", "builtins.dict")].per_1000_qsos == 2000
+    assert ("module", "utils.datetime") not in entries
+    assert entries[("none_refs", "None")].flagged
+
+
+def _run_diagnostics(tmp_path, log_type, qsos, every, timeout):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    python_path = [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    if importlib.util.find_spec("version") is None:
+        # src/version.py lo generan los scripts de build
+        (tmp_path / "version.py").write_text(
+            'APP_NAME = "Logger OA"\nAPP_VERSION = "0.0.0-dev"\n'
+        )
+        python_path.append(str(tmp_path))
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    report = tmp_path / "memory.json"
+    output = subprocess.run(
+        [
+            sys.executable,
+            SCRIPT,
+            "--log-type",
+            log_type,
+            "--qsos",
+            str(qsos),
+            "--warmup",
+            str(every),
+            "--every",
+            str(every),
+            "--max-kib-per-qso",
+            "4",
+            "--max-qt-growth",
+            "20",
+            "--fail",
+            "--json",
+            str(report),
+        ],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if output.returncode == 2:
+        pytest.skip(output.stdout.strip())
+    assert output.returncode == 0, (output.stdout + output.stderr)[-3000:]
+    return json.loads(report.read_text(encoding="utf-8"))
+
+
+def test_short_session_memory_is_bounded(tmp_path):
+    result = _run_diagnostics(tmp_path, "contest_log", 60, 15, timeout=300)
+    assert result["added"] == 60 and not result["dialogs"]
+    assert [s["qsos"] for s in result["snapshots"]] == [15, 30, 45, 60]
+
+
+@pytest.mark.soak
+@pytest.mark.skipif(
+    not os.environ.get("LOGGEROA_SOAK"),
+    reason="Test de resistencia: se ejecuta con LOGGEROA_SOAK=1",
+)
+@pytest.mark.parametrize("log_type", ["operation_log", "contest_log"])
+def test_soak_session_memory_is_bounded(tmp_path, log_type):
+    qsos = int(os.environ.get("LOGGEROA_SOAK_QSOS", "10000"))
+    result = _run_diagnostics(tmp_path, log_type, qsos, qsos // 10, timeout=6 * 3600)
+    assert result["added"] == qsos
+    assert not result["problems"]
@@ -0,0 +1,108 @@
+import json
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from application.use_cases.log_file_format import CURRENT_LOG_FILE_FORMAT_VERSION
+from application.use_cases.migrate_logs import (
+    find_log_files,
+    format_migration_report,
+    migrate_log_archive,
+    migrate_log_file,
+)
+from interface_adapters.ui.view_manager import LogType
+from utils.parallel import create_executor
+
+
+def _create_legacy_log(db_path, log_type=LogType.CONTEST_LOG.value, contacts=3):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            ("log-1", log_type, "OA4TEST", "2025-09-19_21-15-02", "", "{}"),
+        )
+        for i in range(contacts):
+            conn.execute(
+                "INSERT INTO contacts VALUES (?, ?, ?)",
+                (
+                    f"c-{i}",
+                    "log-1",
+                    json.dumps(
+                        {"callsign": f"OA4A{i}", "timestamp": "2025-09-19_21-20-00"}
+                    ),
+                ),
+            )
+        conn.commit()
+
+
+def test_migrate_log_file_rewrites_in_one_transaction(tmp_path):
+    db_path = str(tmp_path / "legacy.sqlite")
+    _create_legacy_log(db_path)
+
+    result = migrate_log_file(db_path)
+    assert result["error"] is None
+    assert result["contacts"] == 3
+    assert result["rewritten"] == 3
+    assert result["header_updated"] is True
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == (
+            CURRENT_LOG_FILE_FORMAT_VERSION
+        )
+        start_time = conn.execute("SELECT start_time FROM logs").fetchone()[0]
+        data = json.loads(conn.execute("SELECT data FROM contacts").fetchone()[0])
+    assert isinstance(start_time, int)
+    assert isinstance(data["timestamp"], int)
+    assert data["block"] == 1
+
+    # Segunda pasada: nada que migrar
+    again = migrate_log_file(db_path)
+    assert again["rewritten"] == 0
+    assert again["header_updated"] is False
+
+
+def test_dry_run_and_failures_leave_files_untouched(tmp_path):
+    db_path = str(tmp_path / "legacy.sqlite")
+    _create_legacy_log(db_path)
+    result = migrate_log_file(db_path, dry_run=True)
+    assert result["rewritten"] == 3
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+
+    bad_path = str(tmp_path / "unknown.sqlite")
+    _create_legacy_log(bad_path, log_type="unknown_log")
+    bad = migrate_log_file(bad_path)
+    assert "Tipo de log no soportado" in bad["error"]
+
+
+def test_migrate_archive_in_parallel_reports_summary(tmp_path):
+    (tmp_path / "logs" / "concursos").mkdir(parents=True)
+    for n in range(5):
+        _create_legacy_log(str(tmp_path / "logs" / "concursos" / f"l{n}.sqlite"))
+    (tmp_path / "logs" / "broken.sqlite").write_bytes(b"not sqlite")
+
+    assert len(find_log_files(str(tmp_path))) == 6
+    seen = []
+    summary = migrate_log_archive(
+        root=str(tmp_path), max_workers=2, progress_callback=seen.append
+    )
+    assert summary["files"] == 6
+    assert summary["contacts"] == 15
+    assert summary["rewritten"] == 15
+    assert summary["failed"] == 1
+    assert len(seen) == 6
+    assert "Fallidos: 1" in format_migration_report(summary)
+
+
+def test_process_pools_spawn_and_in_app_jobs_use_threads():
+    with create_executor(2) as executor:
+        assert isinstance(executor, ProcessPoolExecutor)
+        # Sin fork: el hijo no hereda locks ni handlers de atexit de la app
+        assert executor._mp_context.get_start_method() == "spawn"
+    with create_executor(2, prefer_processes=False) as executor:
+        assert isinstance(executor, ThreadPoolExecutor)
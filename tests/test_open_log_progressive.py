@@ -0,0 +1,104 @@
+import json
+import sqlite3
+
+from application.use_cases.migrate_logs import migrate_log_file
+from application.use_cases.open_log import iter_remaining_contacts, open_log
+from interface_adapters.ui.view_manager import LogType
+from interface_adapters.ui.views.contact_table_model import ContactTableModel
+
+
+def _create_log(db_path, contacts):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE logs (id TEXT PRIMARY KEY, type TEXT, operator TEXT, "
+            "start_time INTEGER, end_time INTEGER, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            ("log-1", LogType.OPERATION_LOG.value, "OA4TEST", 1_700_000_000, 0, "{}"),
+        )
+        for i in range(contacts):
+            conn.execute(
+                "INSERT INTO contacts VALUES (?, ?, ?)",
+                (
+                    # ids no ordenados: el orden lo da la inserción
+                    f"z-{contacts - i}",
+                    "log-1",
+                    json.dumps(
+                        {"callsign": f"OA4A{i}", "timestamp": 1_700_000_000 + i}
+                    ),
+                ),
+            )
+        conn.commit()
+
+
+def test_progressive_open_loads_recent_page_then_streams_the_rest(tmp_path):
+    db_path = str(tmp_path / "big.sqlite")
+    _create_log(db_path, 1234)
+    assert migrate_log_file(db_path)["error"] is None
+
+    log = open_log(db_path, recent_limit=200)
+    assert log.contact_total == 1234
+    assert log.contacts_complete is False
+    assert [c["callsign"] for c in log.contacts] == [
+        f"OA4A{i}" for i in range(1034, 1234)
+    ]
+
+    chunks = list(iter_remaining_contacts(log, chunk_size=500))
+    assert [len(chunk) for chunk in chunks] == [500, 500, 34]
+    for chunk in chunks:
+        log.contacts[:0] = chunk
+    assert [c["callsign"] for c in log.contacts] == [f"OA4A{i}" for i in range(1234)]
+
+    full = open_log(db_path)
+    assert full.contacts_complete is True
+    assert full.contacts == log.contacts
+
+
+def test_progressive_open_of_small_or_legacy_log_is_complete(tmp_path):
+    small = str(tmp_path / "small.sqlite")
+    _create_log(small, 10)
+    # Sin migrar: se carga completo y se normaliza como antes
+    log = open_log(small, recent_limit=200)
+    assert log.contacts_complete is True
+    assert len(log.contacts) == log.contact_total == 10
+    assert list(iter_remaining_contacts(log)) == []
+
+
+def test_streaming_the_rest_does_not_block_new_contacts(tmp_path):
+    db_path = str(tmp_path / "big.sqlite")
+    _create_log(db_path, 1234)
+    assert migrate_log_file(db_path)["error"] is None
+    log = open_log(db_path, recent_limit=200)
+
+    chunks = iter_remaining_contacts(log, chunk_size=500)
+    first = next(chunks)
+    # Con el generador suspendido entre bloques, otro escritor no espera
+    with sqlite3.connect(db_path, timeout=0) as conn:
+        conn.execute(
+            "INSERT INTO contacts VALUES (?, ?, ?)",
+            ("c-new", "log-1", json.dumps({"callsign": "OA4NEW", "timestamp": 0})),
+        )
+    rest = list(chunks)
+    assert [len(chunk) for chunk in [first] + rest] == [500, 500, 34]
+    assert rest[-1][0]["callsign"] == "OA4A0"
+
+
+def test_table_model_appends_older_chunks_below_recent_contacts():
+    contacts = [{"callsign": f"OA4A{i}", "timestamp": i} for i in range(12)]
+    model = ContactTableModel([{"key": "callsign", "translation": "callsign"}])
+    model.set_contacts(contacts[8:], total=12)
+    model.prepend_older_contacts(contacts[4:8])
+    model.prepend_older_contacts(contacts[:4])
+
+    assert model.rowCount() == 12 and model.total_count() == 12
+    rows = [model.contact_at_row(row)["callsign"] for row in range(12)]
+    assert rows == [f"OA4A{i}" for i in reversed(range(12))]
+    assert model.contact_at_row(12) is None
+    assert model.contacts() == contacts
+    model.prepend_older_contacts([{"callsign": "OA4OLD"}])
+    assert model.contact_at_row(12)["callsign"] == "OA4OLD"
+    assert model.contacts()[0]["callsign"] == "OA4OLD"
@@ -0,0 +1,67 @@
+import csv
+import gzip
+import sqlite3
+
+from infrastructure.db.schema import init_radioamateur_table
+from interface_adapters.controllers import database_controller
+from interface_adapters.controllers.database_controller import DatabaseController
+from translation.translation_service import translation_service
+
+
+def _create_operators_db(db_path, count):
+    with sqlite3.connect(db_path) as conn:
+        init_radioamateur_table(conn)
+        # Inserción en orden inverso: la exportación debe ordenar por indicativo
+        conn.executemany(
+            "INSERT INTO radio_operators VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"OA4A{i:03d}",
+                    f"Operador {i}",
+                    "NOVICIO",
+                    "TITULAR",
+                    "LIMA",
+                    "MIRAFLORES",
+                    "LIMA",
+                    "LIMA",
+                    f"LIC-{i}",
+                    f"RD-{i}",
+                    str(1_700_000_000 + (i % 3) * 86400),
+                    "" if i % 2 else "1700000000",
+                    1 if i % 4 else 0,
+                    "PER",
+                    "1700000000",
+                )
+                for i in reversed(range(count))
+            ],
+        )
+        conn.commit()
+
+
+def test_operators_csv_export_streams_sorted_rows_and_supports_gzip(tmp_path):
+    db_path = str(tmp_path / "operators.db")
+    _create_operators_db(db_path, 25)
+    database_controller._csv_date.cache_clear()
+
+    plain = str(tmp_path / "operadores.csv")
+    count = DatabaseController.export_database_to_csv(
+        plain, translation_service, db_path=db_path, batch_size=4
+    )
+    assert count == 25
+    with open(plain, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 26
+    assert [r[0] for r in rows[1:]] == sorted(f"OA4A{i:03d}" for i in range(25))
+    assert rows[1][10:12] == ["14/11/2023", "14/11/2023"]
+    assert rows[2][11] == ""
+    assert rows[1][14] == "17:13:20 14/11/2023"
+    # Solo 3 vencimientos distintos + 2 fechas de corte: el resto sale de caché
+    assert database_controller._csv_date.cache_info().misses <= 5
+
+    compressed = str(tmp_path / "operadores.csv.gz")
+    DatabaseController.export_database_to_csv(
+        compressed, translation_service, db_path=db_path
+    )
+    with gzip.open(compressed, "rt", newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == rows
@@ -0,0 +1,142 @@
+import json
+import os
+import sqlite3
+import threading
+
+from application.use_cases import qso_index
+from application.use_cases.contact_management import (
+    add_contact_to_log,
+    close_contact_writer,
+    delete_contact_from_log,
+    open_contact_writer,
+    update_contact_in_log,
+)
+from domain.contact_type import ContactType
+from domain.entities.operation import OperationLog
+from domain.repositories.contact_log_repository import ContactLogRepository
+from infrastructure.db import log_catalog
+from interface_adapters.ui.view_manager import LogType
+
+
+def _create_log(db_path, operator, callsigns, band="band_hf"):
+    log = OperationLog(
+        operator=operator,
+        start_time=1_700_000_000,
+        metadata={"frequency_band": band, "mode_key": "mode_ssb"},
+    )
+    repo = ContactLogRepository(db_path)
+    repo.save_log(log, LogType.OPERATION_LOG.value)
+    with sqlite3.connect(db_path) as conn:
+        for i, callsign in enumerate(callsigns):
+            conn.execute(
+                "INSERT INTO contacts (id, log_id, data) VALUES (?, ?, ?)",
+                (
+                    f"{operator}-{i}",
+                    log.id,
+                    json.dumps({"callsign": callsign, "timestamp": 1_700_000_000 + i}),
+                ),
+            )
+        conn.commit()
+    return log
+
+
+def test_rebuild_in_parallel_and_search(tmp_path):
+    folder = tmp_path / "operativos"
+    folder.mkdir()
+    catalog = str(tmp_path / "catalog.db")
+    for n in range(6):
+        _create_log(str(folder / f"log{n}.sqlite"), f"OA4L{n}", ["oa4xyz", f"OA{n}AB"])
+
+    summary = qso_index.rebuild_qso_index([str(folder)], catalog, max_workers=2)
+    assert summary["files"] == 6
+    assert summary["extracted"] == 6
+    assert summary["qsos"] == 12
+    assert summary["failed"] == []
+
+    worked = qso_index.get_worked_before("OA4XYZ", catalog_path=catalog)
+    assert worked["qso_count"] == 6
+    assert worked["log_count"] == 6
+
+    excluded = qso_index.get_worked_before(
+        "oa4xyz", str(folder / "log0.sqlite"), catalog_path=catalog
+    )
+    assert excluded["qso_count"] == 5
+
+    rows = qso_index.search_worked_qsos("OA4XYZ", limit=2, catalog_path=catalog)
+    assert len(rows) == 2
+    assert rows[0]["band"] == "band_hf"
+    assert rows[0]["mode"] == "mode_ssb"
+
+    # Sin cambios en disco, la reconstrucción no vuelve a extraer archivos
+    assert qso_index.rebuild_qso_index([str(folder)], catalog)["extracted"] == 0
+
+    os.remove(str(folder / "log1.sqlite"))
+    qso_index.rebuild_qso_index([str(folder)], catalog)
+    assert qso_index.get_worked_before("OA4XYZ", catalog_path=catalog)["log_count"] == 5
+
+
+def test_contact_management_keeps_index_in_sync(tmp_path, monkeypatch):
+    catalog = str(tmp_path / "catalog.db")
+    monkeypatch.setattr(log_catalog, "get_catalog_path", lambda: catalog)
+    db_path = str(tmp_path / "current.sqlite")
+    log = _create_log(db_path, "OA4OP", [])
+
+    data = {
+        "id": "c-1",
+        "callsign": "OA4NEW",
+        "name": "-",
+        "station": "base",
+        "energy": "comercial",
+        "power": "100",
+        "rs_rx": "59",
+        "rs_tx": "59",
+        "timestamp": 1_700_000_100,
+    }
+    add_contact_to_log(db_path, log.id, data, ContactType.OPERATION)
+    assert qso_index.get_worked_before("OA4NEW")["qso_count"] == 1
+
+    update_contact_in_log(
+        db_path, log.id, "c-1", dict(data, callsign="OA4EDIT"), ContactType.OPERATION
+    )
+    assert qso_index.get_worked_before("OA4NEW")["qso_count"] == 0
+    assert qso_index.get_worked_before("OA4EDIT")["qso_count"] == 1
+
+    delete_contact_from_log(db_path, "c-1")
+    assert qso_index.get_worked_before("OA4EDIT")["qso_count"] == 0
+
+
+def test_open_log_updates_index_off_the_saving_thread(tmp_path, monkeypatch):
+    catalog = str(tmp_path / "catalog.db")
+    monkeypatch.setattr(log_catalog, "get_catalog_path", lambda: catalog)
+    db_path = str(tmp_path / "current.sqlite")
+    log = _create_log(db_path, "OA4OP", [])
+    index_contact = qso_index.index_contact
+    indexed = threading.Event()
+    threads = []
+
+    def record(*args):
+        threads.append(threading.current_thread().name)
+        index_contact(*args)
+        indexed.set()
+
+    monkeypatch.setattr(qso_index, "index_contact", record)
+    open_contact_writer(db_path)
+    try:
+        data = {
+            "id": "c-1",
+            "callsign": "OA4NEW",
+            "name": "-",
+            "station": "base",
+            "energy": "comercial",
+            "power": "100",
+            "rs_rx": "59",
+            "rs_tx": "59",
+            "timestamp": 1_700_000_100,
+        }
+        add_contact_to_log(db_path, log.id, data, ContactType.OPERATION)
+        # El guardado vuelve sin esperar al índice; lo actualiza el escritor
+        assert indexed.wait(5)
+        assert threads == ["contact-write-behind"]
+        assert qso_index.get_worked_before("OA4NEW")["qso_count"] == 1
+    finally:
+        close_contact_writer(db_path)
@@ -0,0 +1,105 @@
+import json
+import sqlite3
+
+import pytest
+
+from infrastructure.db.connection import connect, open_connection
+from infrastructure.db.query_trace import (
+    QueryTracer,
+    TracedConnection,
+    query_tracer,
+    summarize_trace,
+)
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    path = str(tmp_path / "sql.jsonl")
+    query_tracer.enable(path, slow_ms=0)
+    yield query_tracer
+    query_tracer.disable()
+
+
+def _records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_connect_is_plain_without_tracing(tmp_path):
+    conn = connect(str(tmp_path / "plain.db"))
+    assert type(conn) is sqlite3.Connection
+    conn.close()
+
+
+def test_open_connection_commits_and_closes(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    with open_connection(db_path) as conn:
+        conn.execute("CREATE TABLE contacts (id TEXT)")
+        conn.execute("INSERT INTO contacts VALUES ('1')")
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with pytest.raises(ValueError):
+        with open_connection(db_path) as conn:
+            conn.execute("INSERT INTO contacts VALUES ('2')")
+            raise ValueError
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with open_connection(db_path) as conn:
+        assert conn.execute("SELECT id FROM contacts").fetchall() == [("1",)]
+
+
+def test_traced_statements_have_duration_rows_and_plan(tmp_path, tracer):
+    db_path = str(tmp_path / "log.sqlite")
+    with connect(db_path) as conn:
+        assert isinstance(conn, TracedConnection)
+        conn.execute("CREATE TABLE contacts (id TEXT PRIMARY KEY, log_id TEXT)")
+        conn.executemany(
+            "INSERT INTO contacts VALUES (?, ?)", [(str(i), "a") for i in range(30)]
+        )
+    conn.execute("SELECT id FROM contacts WHERE log_id = ?", ("a",)).fetchall()
+    cursor = conn.execute("SELECT id FROM contacts WHERE id = ?", ("3",))
+    assert [row for row in cursor] == [("3",)]
+    conn.close()
+    tracer.disable()
+
+    records = _records(tracer.path)
+    by_sql = {r["sql"]: r for r in records}
+    insert = by_sql["INSERT INTO contacts VALUES (?, ?)"]
+    assert insert["rows"] == 30 and insert["statements"][0] == "BEGIN "
+    assert by_sql["COMMIT"]["duration_ms"] is not None
+    scan = by_sql["SELECT id FROM contacts WHERE log_id = ?"]
+    assert scan["rows"] == 30 and scan["full_scan"] is True
+    lookup = by_sql["SELECT id FROM contacts WHERE id = ?"]
+    assert lookup["rows"] == 1 and lookup["full_scan"] is False
+    assert lookup["caller"].startswith(__name__ + ":")
+    assert all(r["slow"] for r in records if r["duration_ms"] is not None)
+    # Plan volcado una vez por consulta que recorre la tabla completa
+    with open(tracer.path[: -len(".jsonl")] + ".slow.log", encoding="utf-8") as f:
+        slow_log = f.read()
+    assert slow_log.count("[FULL SCAN] log.sqlite") == 1
+    assert "SCAN contacts" in slow_log
+
+    summary = {row[0]: row for row in summarize_trace(tracer.path)}
+    assert summary["log.sqlite: INSERT INTO contacts VALUES (?, ?)"][4] == 30
+
+
+def test_use_case_is_recorded(tmp_path, tracer):
+    from application.use_cases.open_log import open_log
+    from benchmarks import generators
+
+    db_path = str(tmp_path / "log.sqlite")
+    generators.create_log_file(db_path, "operation_log", 5, "v2")
+    open_log(db_path)
+    tracer.disable()
+    use_cases = {r["use_case"] for r in _records(tracer.path)}
+    assert "application.use_cases.open_log:open_log" in use_cases
+
+
+def test_configure_from_argv_and_environment(tmp_path):
+    argv = ["main.py", f"--trace-sql={tmp_path / 'a.jsonl'}", "-style"]
+    tracer = QueryTracer()
+    assert tracer.configure(argv, environ={"LOGGEROA_SQL_SLOW_MS": "12"})
+    assert argv == ["main.py", "-style"]
+    assert tracer.path == str(tmp_path / "a.jsonl") and tracer.slow_ms == 12
+    tracer.disable()
+    assert not QueryTracer().configure(["main.py"], environ={})
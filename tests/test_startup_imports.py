@@ -0,0 +1,66 @@
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+
+from utils.lazy_import import LAZY_MODULES, lazy_module
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+
+# Librerías que no deben cargarse al construir la ventana principal
+HEAVY_MODULES = ("pdfplumber", "pdfminer", "reportlab", "openpyxl", "markdown")
+
+_STARTUP_SCRIPT = """
+from PySide6.QtWidgets import QApplication
+app = QApplication([])
+from interface_adapters.ui.main_window import MainWindow
+window = MainWindow()
+window.show()
+app.processEvents()
+"""
+
+
+def test_main_window_does_not_import_heavy_modules(tmp_path):
+    env = dict(os.environ)
+    env.update(HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    python_path = [SRC]
+    if importlib.util.find_spec("version") is None:
+        # src/version.py lo generan los scripts de build
+        (tmp_path / "version.py").write_text(
+            'APP_NAME = "Logger OA"\nAPP_VERSION = "0.0.0-dev"\n'
+        )
+        python_path.append(str(tmp_path))
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _STARTUP_SCRIPT],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    imported = set(re.findall(r"^import time:.*\|\s*(\S+)$", result.stderr, re.M))
+    assert "interface_adapters.ui.main_window" in imported
+    heavy = sorted(m for m in imported if m.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+    # Las vistas de log se importan y construyen al abrir un log
+    assert "interface_adapters.ui.views.log_ops_view" not in imported
+    assert "interface_adapters.ui.views.log_contest_view" not in imported
+
+
+def test_lazy_modules_load_on_first_use_and_are_bundled():
+    proxy = lazy_module("json")
+    assert not proxy.is_loaded
+    assert proxy.dumps([1]) == "[1]"
+    assert proxy.is_loaded
+
+    # PyInstaller no ve los imports diferidos: deben estar en hiddenimports
+    for spec in ("LoggerOA.spec", "LoggerOA.win7-x86.spec"):
+        with open(os.path.join(ROOT, spec), encoding="utf-8") as f:
+            hidden = re.search(r"hiddenimports=\[(.*?)\]", f.read()).group(1)
+        for name in LAZY_MODULES:
+            assert f"'{name}'" in hidden, (spec, name)
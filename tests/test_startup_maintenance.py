@@ -0,0 +1,72 @@
+import sqlite3
+import time
+
+from application.use_cases.startup_maintenance import (
+    DISABLE_EXPIRED_TASK,
+    run_daily_maintenance,
+)
+from infrastructure.db import queries
+from infrastructure.db.schema import init_radioamateur_table
+
+
+def _create_operators(db_path):
+    now = int(time.time())
+    rows = [
+        ("OA4EXP", str(now - 86400), 1),  # Vencido
+        ("OA4NUL", None, None),  # Sin fecha, enabled NULL
+        ("OA4OLD", str(now - 10 * 86400), 0),  # Vencido y ya deshabilitado
+        ("OA4FUT", str(now + 86400), 1),  # Vigente
+        ("OA4EMP", "", 1),  # Fecha vacía
+        ("OA4TXT", "  ", 1),
+    ]
+    with sqlite3.connect(db_path) as conn:
+        init_radioamateur_table(conn)
+        conn.executemany(
+            "INSERT INTO radio_operators (callsign, expiration_date, enabled) "
+            "VALUES (?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+
+
+def _enabled(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT callsign, enabled FROM radio_operators"))
+
+
+def test_daily_maintenance_disables_expired_once_per_day(tmp_path):
+    db_path = str(tmp_path / "operators.db")
+    _create_operators(db_path)
+
+    assert run_daily_maintenance(db_path, today="2026-10-19") == 1
+    assert _enabled(db_path) == {
+        "OA4EXP": 0,
+        "OA4NUL": None,
+        "OA4OLD": 0,
+        "OA4FUT": 1,
+        "OA4EMP": 1,
+        "OA4TXT": 1,
+    }
+    run = queries.get_maintenance_run(DISABLE_EXPIRED_TASK, db_path)
+    assert run["run_date"] == "2026-10-19" and run["affected"] == 1
+
+    # El mismo día no vuelve a correr, aunque haya nuevos vencidos
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE radio_operators SET enabled = 1 WHERE callsign = 'OA4EXP'")
+    assert run_daily_maintenance(db_path, today="2026-10-19") is None
+    assert _enabled(db_path)["OA4EXP"] == 1
+    assert run_daily_maintenance(db_path, today="2026-10-20") == 1
+
+
+def test_expired_update_is_a_range_scan_on_the_expiration_index(tmp_path):
+    db_path = str(tmp_path / "operators.db")
+    _create_operators(db_path)
+    with sqlite3.connect(db_path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN UPDATE radio_operators SET enabled = 0 "
+            "WHERE IFNULL(enabled, 1) = 1 "
+            "AND CAST(expiration_date AS INTEGER) > 0 "
+            "AND CAST(expiration_date AS INTEGER) < ?",
+            (int(time.time()),),
+        ).fetchall()
+    assert "USING INDEX idx_radio_operators_expiration" in plan[0][-1]
@@ -0,0 +1,74 @@
+import json
+
+from scripts.compare_startup_traces import format_comparison
+from utils.startup_trace import StartupTracer, compare_traces, load_trace_phases
+
+
+def _trace(tmp_path, name, argv_path_flag=True, extra_phase=None):
+    path = str(tmp_path / name)
+    tracer = StartupTracer()
+    argv = ["main.py", "-style", "fusion"]
+    if argv_path_flag:
+        argv.append(f"--trace-startup={path}")
+    assert tracer.configure(argv, environ={}) is True
+    assert argv == ["main.py", "-style", "fusion"]  # Qt no recibe el flag
+    with tracer.phase("MainWindow"):
+        with tracer.phase("view.LogOpsView"):
+            pass
+    if extra_phase:
+        with tracer.phase(extra_phase, lang="es"):
+            pass
+    tracer.mark("startup_done")
+    return tracer, path
+
+
+def test_tracer_is_opt_in_and_writes_chrome_trace(tmp_path):
+    disabled = StartupTracer()
+    assert disabled.configure(["main.py"], environ={}) is False
+    with disabled.phase("MainWindow"):
+        pass
+    assert disabled.events == [] and disabled.write() is None
+
+    env_tracer = StartupTracer()
+    env_tracer.configure([], environ={"LOGGEROA_STARTUP_TRACE": "1"})
+    assert env_tracer.enabled and env_tracer.path is None  # Ruta por defecto
+
+    tracer, path = _trace(tmp_path, "a.json")
+    assert tracer.write() == path
+    assert tracer.write() is None  # Se guarda una sola vez
+    with open(path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    assert [(e["name"], e["ph"]) for e in events] == [
+        ("MainWindow", "X"),
+        ("view.LogOpsView", "X"),
+        ("startup_done", "i"),
+    ]
+    outer, inner = events[0], events[1]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 0.2
+
+
+def test_compare_traces_reports_per_phase_differences(tmp_path):
+    before, before_path = _trace(tmp_path, "before.json")
+    after, after_path = _trace(tmp_path, "after.json", extra_phase="theme.load")
+    before.write()
+    after.write()
+
+    phases = load_trace_phases(after_path)
+    assert list(phases) == [
+        "MainWindow",
+        "view.LogOpsView",
+        "theme.load",
+        "startup_done",
+    ]
+    rows = compare_traces(before_path, after_path)
+    assert [r[0] for r in rows] == [
+        "MainWindow",
+        "view.LogOpsView",
+        "startup_done",
+        "theme.load",
+    ]
+    assert rows[-1][1] is None and rows[-1][3] is None  # Fase nueva
+    report = format_comparison(rows)
+    assert report.splitlines()[0].startswith("Fase")
+    assert "theme.load" in report
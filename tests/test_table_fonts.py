@@ -0,0 +1,77 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+
+# Fuentes compartidas, delegate de las tablas y hojas de estilos en caché
+_SCRIPT = """
+import json
+from PySide6.QtWidgets import QApplication, QStyleOptionViewItem
+app = QApplication([])
+from config.settings_service import ThemeValue
+from interface_adapters.ui.themes import theme_manager
+from interface_adapters.ui.views.contact_table_widget import ContactTableWidget
+from utils.fonts import build_roboto_mono_font
+
+result = {
+    "shared": build_roboto_mono_font(11) is build_roboto_mono_font(11),
+    "distinct": build_roboto_mono_font(11) is not build_roboto_mono_font(11, True),
+}
+
+manager = theme_manager.ThemeManager()
+manager.apply_theme(ThemeValue.LIGHT)
+qss = app.styleSheet()
+manager.apply_theme(ThemeValue.DARK)
+manager.apply_theme(ThemeValue.LIGHT)
+info = theme_manager._load_theme_stylesheet.cache_info()
+result["stylesheet_reads"] = info.misses
+result["same_stylesheet"] = app.styleSheet() == qss
+
+widget = ContactTableWidget()
+widget.set_contacts([{"callsign": "OA4T", "timestamp": 1700000000}])
+widget.show()
+app.processEvents()
+option = QStyleOptionViewItem()
+widget.table.itemDelegate().initStyleOption(option, widget.model.index(0, 0))
+result["cell_font"] = [option.font.family(), option.font.pointSize()]
+result["view_font"] = widget.table.font().family()
+font = build_roboto_mono_font(11)
+result["expected_font"] = [font.family(), font.pointSize()]
+print(json.dumps(result))
+"""
+
+
+def test_tables_share_fonts_and_themes_are_read_once(tmp_path):
+    env = dict(os.environ)
+    env.update(HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    python_path = [SRC]
+    if importlib.util.find_spec("version") is None:
+        # src/version.py lo generan los scripts de build
+        (tmp_path / "version.py").write_text(
+            'APP_NAME = "Logger OA"\nAPP_VERSION = "0.0.0-dev"\n'
+        )
+        python_path.append(str(tmp_path))
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert output.returncode == 0, output.stderr[-2000:]
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert result["shared"] is True and result["distinct"] is True
+    # base.qss + light.qss y base.qss + dark.qss: una lectura por tema
+    assert result["stylesheet_reads"] == 2
+    assert result["same_stylesheet"] is True
+    # La hoja global fija 'Segoe UI'; el delegate pinta las celdas en Roboto Mono
+    assert result["view_font"] == "Segoe UI"
+    assert result["cell_font"] == result["expected_font"]
@@ -0,0 +1,27 @@
+import pytest
+
+from config.settings_service import LanguageValue
+from translation.translation_service import CONTACT_VALUE_KEYS, TranslationService
+
+
+def test_snapshot_is_cached_read_only_and_per_language():
+    service = TranslationService(LanguageValue.ES)
+
+    es = service.snapshot(("yes", "no", "clave_inexistente"))
+    assert es["yes"] == "SÍ"
+    # Las claves sin traducción se devuelven tal cual, como en ``tr``
+    assert es["clave_inexistente"] == "clave_inexistente"
+    # Misma combinación de idioma y claves: mismo mapa precalculado
+    assert service.snapshot(["yes", "no", "clave_inexistente"]) is es
+    with pytest.raises(TypeError):
+        es["yes"] = "NO"
+
+    en = service.snapshot(("yes", "no"), lang=LanguageValue.EN)
+    assert en == {"yes": "YES", "no": "NO"}
+    assert service.tr("yes") == "SÍ"  # Pedir otro idioma no cambia el actual
+
+    service.set_language(LanguageValue.EN)
+    assert service.snapshot(("yes", "no")) is en
+    values = service.snapshot(CONTACT_VALUE_KEYS)
+    assert set(values) == set(CONTACT_VALUE_KEYS)
+    assert values["station_base"] == service.tr("station_base")
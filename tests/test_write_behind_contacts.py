@@ -0,0 +1,178 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import time
+
+from domain.repositories.contact_log_repository import ContactLogRepository
+from infrastructure.repositories.write_behind_contact_log_repository import (
+    WriteBehindContactLogRepository,
+    get_journal_path,
+    recover_journal,
+)
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def _contact(i):
+    return {"id": f"c-{i}", "callsign": f"OA4W{i}", "timestamp": 1_700_000_000 + i}
+
+
+def _disk_count(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+
+def _run_and_kill(db_path, body):
+    """Ejecuta ``body`` en un proceso aparte que termina con os._exit (sin cierre ordenado)."""
+    script = textwrap.dedent(f"""
+        import os, sys
+        sys.path.insert(0, {SRC!r})
+        from infrastructure.repositories.write_behind_contact_log_repository import (
+            WriteBehindContactLogRepository,
+        )
+        repo = WriteBehindContactLogRepository({db_path!r}, flush_interval=60, batch_size=1000)
+        for i in range(20):
+            repo.save_contact("log-1", {{"id": f"c-{{i}}", "callsign": f"OA4W{{i}}", "timestamp": i}})
+        """) + textwrap.dedent(body)
+    proc = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+    assert proc.returncode == 9, proc.stderr
+
+
+def test_save_is_acknowledged_in_memory_and_flushed_in_batches(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    repo = WriteBehindContactLogRepository(db_path, flush_interval=60, batch_size=1000)
+    try:
+        for i in range(5):
+            repo.save_contact("log-1", _contact(i))
+        assert repo.pending_count == 5
+        assert _disk_count(db_path) == 0
+        assert [c["id"] for c in repo.get_contacts("log-1")] == [
+            f"c-{i}" for i in range(5)
+        ]
+
+        assert repo.flush() is True
+        assert _disk_count(db_path) == 5
+        assert os.path.getsize(get_journal_path(db_path)) == 0
+    finally:
+        repo.close()
+    assert not os.path.exists(get_journal_path(db_path))
+
+
+def test_writer_persists_on_batch_size_and_interval(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    repo = WriteBehindContactLogRepository(db_path, flush_interval=0.05, batch_size=3)
+    try:
+        for i in range(7):
+            repo.save_contact("log-1", _contact(i))
+        deadline = time.time() + 5
+        while repo.pending_count and time.time() < deadline:
+            time.sleep(0.01)
+        assert _disk_count(db_path) == 7
+    finally:
+        repo.close()
+
+
+def test_close_persists_pending_and_edits_respect_order(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    repo = WriteBehindContactLogRepository(db_path, flush_interval=60, batch_size=1000)
+    repo.save_contact("log-1", _contact(1))
+    repo.save_contact("log-1", _contact(2))
+    repo.delete_contact("c-1")
+    repo.close()
+    contacts = ContactLogRepository(db_path).get_contacts("log-1")
+    assert [c["id"] for c in contacts] == ["c-2"]
+
+
+def test_recovers_journal_after_process_killed_before_flush(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    ContactLogRepository(db_path)
+    _run_and_kill(db_path, "os._exit(9)\n")
+
+    assert _disk_count(db_path) == 0
+    assert os.path.exists(get_journal_path(db_path))
+    # Una línea truncada al final (escritura interrumpida) se ignora
+    with open(get_journal_path(db_path), "a", encoding="utf-8") as f:
+        f.write('{"id": "c-partial", "log_')
+
+    assert recover_journal(db_path) == 20
+    assert _disk_count(db_path) == 20
+    assert not os.path.exists(get_journal_path(db_path))
+
+
+def test_recovers_journal_after_writer_killed_mid_batch(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    ContactLogRepository(db_path)
+    _run_and_kill(
+        db_path,
+        """
+        import sqlite3
+
+        def killed_mid_batch(batch):
+            conn = sqlite3.connect(repo.db_path)
+            conn.executemany(
+                "INSERT OR REPLACE INTO contacts (id, log_id, data) VALUES (?, ?, ?)",
+                [(cid, log_id, data) for cid, (log_id, data) in batch[:10]],
+            )
+            os._exit(9)  # muere con la transacción abierta
+
+        repo._write_batch = killed_mid_batch
+        repo.flush()
+        """,
+    )
+
+    assert _disk_count(db_path) == 0  # la transacción incompleta no quedó aplicada
+    repo = WriteBehindContactLogRepository(db_path)
+    try:
+        assert repo.recovered == 20
+        assert len(repo.get_contacts("log-1")) == 20
+    finally:
+        repo.close()
+
+
+def test_edits_and_deletes_of_unwritten_contacts_are_not_undone(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    repo = WriteBehindContactLogRepository(db_path, flush_interval=60, batch_size=1000)
+    for i in range(3):
+        repo.save_contact("log-1", _contact(i))
+
+    def disk_full(batch):
+        raise sqlite3.OperationalError("database or disk is full")
+
+    repo._write_batch = disk_full
+    assert repo.flush(timeout=1) is False
+    repo.delete_contact("c-0")
+    repo.update_contact_data("c-1", dict(_contact(1), callsign="OA4EDIT"))
+    assert [c["callsign"] for c in repo.get_contacts("log-1")] == ["OA4EDIT", "OA4W2"]
+
+    # Al reintentar el lote no vuelve el borrado ni los datos anteriores
+    del repo._write_batch
+    repo.close()
+    contacts = ContactLogRepository(db_path).get_contacts("log-1")
+    assert [c["callsign"] for c in contacts] == ["OA4EDIT", "OA4W2"]
+
+
+def test_recovered_journal_keeps_edits_and_deletes_of_pending_contacts(tmp_path):
+    db_path = str(tmp_path / "log.sqlite")
+    ContactLogRepository(db_path)
+    _run_and_kill(
+        db_path,
+        """
+        def disk_full(batch):
+            raise OSError("disk full")
+
+        repo._write_batch = disk_full
+        repo.delete_contact("c-3")
+        repo.update_contact_data("c-4", {"id": "c-4", "callsign": "OA4EDIT", "timestamp": 4})
+        os._exit(9)
+        """,
+    )
+
+    recover_journal(db_path)
+    contacts = ContactLogRepository(db_path).get_contacts("log-1")
+    assert len(contacts) == 19
+    assert "c-3" not in {c["id"] for c in contacts}
+    assert {c["id"]: c["callsign"] for c in contacts}["c-4"] == "OA4EDIT"